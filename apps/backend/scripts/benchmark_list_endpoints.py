@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""Load-test the list endpoints of a locally running backend.
+
+Sends a fixed number of GET requests at a fixed concurrency to ``/tests`` and
+``/test_results`` (or any ``--path``) and prints p50/p99 latency, throughput
+and mean response size for each path and Accept-Encoding.
+
+Run it against two builds to compare them, e.g. before and after a middleware
+or serialization change, or against one server started with
+``RESPONSE_COMPRESSION_ENABLED=true`` to compare encodings:
+
+    cd apps/backend
+    uv run python scripts/benchmark_list_endpoints.py \\
+        --base-url http://localhost:8080 --token rh-... \\
+        --requests 500 --concurrency 20 --limit 100 \\
+        --encoding identity --encoding gzip --encoding zstd
+
+The numbers are only comparable between runs on the same machine, database
+and data volume; seed the database first so the lists are not empty.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+
+import httpx
+
+DEFAULT_PATHS = ("/tests/", "/test_results/")
+
+
+@dataclass
+class Result:
+    path: str
+    encoding: str
+    latencies: list[float]
+    sizes: list[int]
+    errors: int
+    elapsed: float
+
+    def percentile(self, q: float) -> float:
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+
+async def run_path(
+    client: httpx.AsyncClient,
+    path: str,
+    encoding: str,
+    params: dict,
+    requests: int,
+    concurrency: int,
+) -> Result:
+    latencies: list[float] = []
+    sizes: list[int] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            async with client.stream(
+                "GET", path, params=params, headers={"Accept-Encoding": encoding}
+            ) as response:
+                # Raw (still encoded) body: the size on the wire, no decode cost
+                size = 0
+                async for chunk in response.aiter_raw():
+                    size += len(chunk)
+            latencies.append(time.perf_counter() - started)
+            sizes.append(size)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return Result(path, encoding, latencies, sizes, errors, time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--token", required=True, help="API token (Bearer)")
+    parser.add_argument("--path", action="append", help="Endpoint path (repeatable)")
+    parser.add_argument(
+        "--encoding", action="append", help="Accept-Encoding value (repeatable, default identity)"
+    )
+    parser.add_argument("--requests", type=int, default=200, help="Requests per path/encoding")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=100, help="Page size (?limit=)")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per path")
+    args = parser.parse_args()
+
+    paths = args.path or list(DEFAULT_PATHS)
+    encodings = args.encoding or ["identity"]
+    params = {"limit": args.limit}
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {args.token}"},
+        timeout=60,
+        limits=httpx.Limits(max_connections=args.concurrency),
+    ) as client:
+        for path in paths:
+            for _ in range(args.warmup):
+                await client.get(path, params=params)
+
+        print(
+            f"{'path':<20} {'encoding':<10} {'p50 ms':>9} {'p99 ms':>9} "
+            f"{'req/s':>9} {'bytes':>10} {'errors':>7}"
+        )
+        for path in paths:
+            for encoding in encodings:
+                result = await run_path(
+                    client, path, encoding, params, args.requests, args.concurrency
+                )
+                print(
+                    f"{path:<20} {encoding:<10} "
+                    f"{result.percentile(50) * 1000:>9.1f} "
+                    f"{result.percentile(99) * 1000:>9.1f} "
+                    f"{len(result.latencies) / result.elapsed:>9.1f} "
+                    f"{statistics.mean(result.sizes):>10.0f} "
+                    f"{result.errors:>7}"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
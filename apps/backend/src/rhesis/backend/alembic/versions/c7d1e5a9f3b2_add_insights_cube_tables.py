@@ -0,0 +1,214 @@
+"""add insights cube tables
+
+Materialised per-test-run aggregates of v_test_result_stats and
+v_metric_stats (``insights_test_result_cube``, ``insights_metric_cube``) plus
+their freshness markers (``insights_cube_state``). See
+``app/models/insights_cube.py`` and ``app/services/insights/cubes.py``.
+
+Backfill: one state row per existing (organization_id, test_run_id) in
+``test_result``, tagged with the results' project_id, with ``version = 1`` and
+``refreshed_version = 0`` -- i.e. every existing run starts stale and keeps
+being answered from the views until the refresh task builds its cube rows. No
+cube rows are built here: doing that inline would make this migration as slow
+as the queries the cubes replace.
+Refreshes are enqueued per (organisation, project) scope on the next insights
+query or test result write.
+
+RLS: all three tables get the same ``tenant_isolation`` policy as ``usage``
+(77df3dbea77d) plus the fail-closed ``project_isolation`` policy of
+b8c9d0e1f2a3, since they carry the project_id of the results they aggregate.
+Enabled after the backfill so the migration role does not need tenant GUCs to
+insert the state rows.
+
+Excluded from the generic recycle-bin routes (``routers/recycle.py``): they are
+derived data, rebuilt from test results.
+
+Revision ID: c7d1e5a9f3b2
+Revises: 88430978b358
+Create Date: 2026-09-02
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from rhesis.backend.alembic.utils.idempotency import index_exists, table_exists
+
+revision: str = "c7d1e5a9f3b2"
+down_revision: Union[str, None] = "88430978b358"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_uuid = sa.dialects.postgresql.UUID()
+
+_TABLES = ("insights_test_result_cube", "insights_metric_cube", "insights_cube_state")
+
+_TENANT_POLICY = """
+    CREATE POLICY tenant_isolation ON {table}
+        USING (
+            organization_id = NULLIF(
+                current_setting('app.current_organization', true), ''
+            )::uuid
+        )
+"""
+
+_PROJECT_POLICY = """
+    CREATE POLICY project_isolation ON {table}
+        AS RESTRICTIVE
+        FOR ALL
+        USING (
+            project_id = NULLIF(current_setting('app.current_project', true), '')::uuid
+            OR project_id IS NULL
+            OR current_setting('app.current_organization', true) = ''
+        )
+"""
+
+
+def _base_columns():
+    return [
+        sa.Column(
+            "id",
+            _uuid,
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+        sa.Column("nano_id", sa.String(), nullable=True, unique=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "organization_id",
+            _uuid,
+            sa.ForeignKey("organization.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "test_run_id",
+            _uuid,
+            sa.ForeignKey("test_run.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "project_id",
+            _uuid,
+            sa.ForeignKey("project.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+    ]
+
+
+def _counter(name: str) -> sa.Column:
+    return sa.Column(name, sa.BigInteger(), server_default=sa.text("0"), nullable=False)
+
+
+def _grain_columns():
+    return [
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Integer(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if not table_exists(conn, "insights_test_result_cube"):
+        op.create_table(
+            "insights_test_result_cube",
+            *_base_columns(),
+            sa.Column("requirement_id", _uuid, nullable=True),
+            sa.Column("category_id", _uuid, nullable=True),
+            sa.Column("topic_id", _uuid, nullable=True),
+            sa.Column("result_status_id", _uuid, nullable=True),
+            *_grain_columns(),
+            _counter("count"),
+            _counter("passed"),
+            _counter("failed"),
+        )
+
+    if not table_exists(conn, "insights_metric_cube"):
+        op.create_table(
+            "insights_metric_cube",
+            *_base_columns(),
+            sa.Column("requirement_id", _uuid, nullable=True),
+            sa.Column("metric_name", sa.String(), nullable=False),
+            *_grain_columns(),
+            _counter("count"),
+            _counter("passed"),
+            _counter("failed"),
+            _counter("automated_passed"),
+            _counter("automated_failed"),
+            _counter("human_review_count"),
+        )
+
+    if not table_exists(conn, "insights_cube_state"):
+        op.create_table(
+            "insights_cube_state",
+            *_base_columns(),
+            sa.Column("version", sa.BigInteger(), server_default=sa.text("1"), nullable=False),
+            sa.Column(
+                "refreshed_version", sa.BigInteger(), server_default=sa.text("0"), nullable=False
+            ),
+            sa.UniqueConstraint(
+                "organization_id", "test_run_id", name="uq_insights_cube_state_org_run"
+            ),
+        )
+
+    for cube in ("insights_test_result_cube", "insights_metric_cube"):
+        if not index_exists(conn, f"ix_{cube}_org_run"):
+            op.create_index(f"ix_{cube}_org_run", cube, ["organization_id", "test_run_id"])
+        if not index_exists(conn, f"ix_{cube}_org_day"):
+            op.create_index(f"ix_{cube}_org_day", cube, ["organization_id", "day"])
+
+    if not index_exists(conn, "ix_insights_cube_state_stale"):
+        op.create_index(
+            "ix_insights_cube_state_stale",
+            "insights_cube_state",
+            ["organization_id"],
+            postgresql_where=sa.text("version <> refreshed_version"),
+        )
+
+    op.execute(
+        """
+        INSERT INTO insights_cube_state (organization_id, project_id, test_run_id)
+        SELECT DISTINCT ON (trs.organization_id, trs.test_run_id)
+            trs.organization_id, trs.project_id, trs.test_run_id
+        FROM test_result trs
+        WHERE trs.organization_id IS NOT NULL AND trs.test_run_id IS NOT NULL
+        ORDER BY trs.organization_id, trs.test_run_id
+        ON CONFLICT (organization_id, test_run_id) DO NOTHING
+        """
+    )
+
+    for table in _TABLES:
+        op.execute(f"DROP POLICY IF EXISTS tenant_isolation ON {table}")
+        op.execute(_TENANT_POLICY.format(table=table))
+        op.execute(f"DROP POLICY IF EXISTS project_isolation ON {table}")
+        op.execute(_PROJECT_POLICY.format(table=table))
+        op.execute(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY")
+        op.execute(f"ALTER TABLE {table} FORCE ROW LEVEL SECURITY")
+
+
+def downgrade() -> None:
+    for table in reversed(_TABLES):
+        op.execute(f"DROP POLICY IF EXISTS project_isolation ON {table}")
+        op.execute(f"DROP POLICY IF EXISTS tenant_isolation ON {table}")
+    op.drop_index("ix_insights_cube_state_stale", table_name="insights_cube_state")
+    for cube in ("insights_metric_cube", "insights_test_result_cube"):
+        op.drop_index(f"ix_{cube}_org_day", table_name=cube)
+        op.drop_index(f"ix_{cube}_org_run", table_name=cube)
+    for table in reversed(_TABLES):
+        op.drop_table(table)
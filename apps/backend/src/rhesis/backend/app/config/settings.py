@@ -99,6 +99,9 @@ class ApplicationSettings(BaseSettings):
     json_logger_enabled: bool = Field(default=False, alias="JSON_LOGGER_ENABLED")
     api_base_url: str = Field(default="http://localhost:8080", alias="API_BASE_URL")
     enable_rhesis_key: bool = Field(default=False, alias="ENABLE_RHESIS_KEY")
+    # Opt-in gzip/zstd compression of complete responses at least this large
+    response_compression_enabled: bool = Field(default=False, alias="RESPONSE_COMPRESSION_ENABLED")
+    response_compression_min_size: int = Field(default=1024, alias="RESPONSE_COMPRESSION_MIN_SIZE")
 
     @field_validator("api_base_url")
     @classmethod
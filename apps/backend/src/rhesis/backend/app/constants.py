@@ -264,6 +264,7 @@ class EnrichedDataKeys:
     """Top-level and nested keys in Trace.enriched_data."""
 
     COSTS = "costs"
+    METRICS = "metrics"
     TOTAL_COST_USD = "total_cost_usd"
     TOTAL_COST_EUR = "total_cost_eur"
 
@@ -918,6 +918,7 @@ def get_tests(
     filter: str | None = None,
     organization_id: str = None,
     user_id: str = None,
+    cursor: str | None = None,
 ) -> List[models.Test]:
     """Get tests, minus the Explorer-owned ones (those belong to the /explorer API)."""
     # NOTE: No secondary_sort_by: Test.content sorting is a slow correlated subquery
@@ -933,6 +934,7 @@ def get_tests(
         organization_id=organization_id,
         user_id=user_id,
         exclude_explorer_rows=True,
+        cursor=cursor,
     )
 
 
@@ -1116,6 +1118,7 @@ def get_test_results(
     filter: str | None = None,
     organization_id: str = None,
     user_id: str = None,
+    cursor: str | None = None,
 ) -> List[models.TestResult]:
     """Get test_results with relationships (tags, test, test_run) eagerly loaded."""
     return (
@@ -1127,6 +1130,7 @@ def get_test_results(
         .with_odata_filter(filter)
         .with_sorting(sort_by, sort_order)
         .with_pagination(skip, limit)
+        .with_cursor(cursor)
         .all()
     )
 
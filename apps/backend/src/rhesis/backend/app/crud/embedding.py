@@ -17,7 +17,7 @@ and returns how many it touched, keeping the old vectors around instead of delet
 """
 
 import uuid
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -149,6 +149,42 @@ def get_embedding_by_hash(
     )
 
 
+def get_embedding_ids_by_hash(
+    db: Session,
+    text_hashes: Dict[str, str],
+    entity_type: str,
+    organization_id: str,
+    config_hash: str,
+    status_id: uuid.UUID,
+) -> Dict[str, str]:
+    """Batch form of :func:`get_embedding_by_hash` for many entities of one type.
+
+    Args:
+        text_hashes: ``{entity_id: text_hash}`` to look up
+
+    Returns:
+        ``{entity_id: embedding_id}`` for the entities with a matching embedding
+    """
+    if not text_hashes:
+        return {}
+    rows = (
+        db.query(models.Embedding.id, models.Embedding.entity_id, models.Embedding.text_hash)
+        .filter(
+            models.Embedding.entity_id.in_(list(text_hashes)),
+            models.Embedding.entity_type == entity_type,
+            models.Embedding.organization_id == organization_id,
+            models.Embedding.config_hash == config_hash,
+            models.Embedding.status_id == status_id,
+        )
+        .all()
+    )
+    return {
+        str(entity_id): str(embedding_id)
+        for embedding_id, entity_id, text_hash in rows
+        if text_hashes.get(str(entity_id)) == text_hash
+    }
+
+
 def mark_embeddings_stale(
     db: Session,
     entity_id: str,
@@ -16,7 +16,7 @@ from sqlalchemy import and_, desc, func, or_, select
 from sqlalchemy.orm import Session
 
 from rhesis.backend.app import models
-from rhesis.backend.app.constants import TestExecutionContext
+from rhesis.backend.app.constants import EnrichedDataKeys, TestExecutionContext
 from rhesis.backend.app.schemas.telemetry import (
     OTELSpanCreate,
     StatusCode,
@@ -188,6 +188,99 @@ def get_trace_by_id(
     return builder.with_sorting(sort_by="start_time").all()
 
 
+def _unprocessed_trace_spans(db: Session, trace_id: str, project_id: str, organization_id: str):
+    return db.query(models.Trace).filter(
+        models.Trace.trace_id == trace_id,
+        models.Trace.project_id == project_id,
+        models.Trace.organization_id == UUID(organization_id),
+        models.Trace.processed_at.is_(None),
+    )
+
+
+def has_unprocessed_trace_spans(
+    db: Session,
+    trace_id: str,
+    project_id: str,
+    organization_id: str,
+) -> bool:
+    """
+    Check whether a trace has spans that no enrichment pass has folded in yet.
+
+    Args:
+        db: Database session
+        trace_id: OpenTelemetry trace ID
+        project_id: Project ID for access control
+        organization_id: Organization ID for multi-tenant security
+
+    Returns:
+        True if at least one span has processed_at unset
+    """
+    query = _unprocessed_trace_spans(db, trace_id, project_id, organization_id)
+    return db.query(query.exists()).scalar()
+
+
+def get_unprocessed_trace_spans(
+    db: Session,
+    trace_id: str,
+    project_id: str,
+    organization_id: str,
+) -> List[models.Trace]:
+    """
+    Get the spans of a trace that no enrichment pass has folded in yet.
+
+    Args:
+        db: Database session
+        trace_id: OpenTelemetry trace ID
+        project_id: Project ID for access control
+        organization_id: Organization ID for multi-tenant security
+
+    Returns:
+        List of unprocessed Trace models ordered by start_time
+    """
+    return (
+        _unprocessed_trace_spans(db, trace_id, project_id, organization_id)
+        .order_by(models.Trace.start_time)
+        .all()
+    )
+
+
+def get_trace_enrichment_span(
+    db: Session,
+    trace_id: str,
+    project_id: str,
+    organization_id: str,
+) -> Optional[models.Trace]:
+    """
+    Get the span holding the enrichment stored by the last pass over a trace.
+
+    The trace's enrichment lives on a single span: its latest root span (the
+    one trace lists show for multi-turn conversations), or the earliest span
+    seen while no root has arrived yet.
+
+    Args:
+        db: Database session
+        trace_id: OpenTelemetry trace ID
+        project_id: Project ID for access control
+        organization_id: Organization ID for multi-tenant security
+
+    Returns:
+        The Trace row carrying enriched_data, or None if the trace was never enriched
+    """
+    return (
+        db.query(models.Trace)
+        .filter(
+            models.Trace.trace_id == trace_id,
+            models.Trace.project_id == project_id,
+            models.Trace.organization_id == UUID(organization_id),
+            models.Trace.enriched_data.has_key(EnrichedDataKeys.METRICS),
+        )
+        # Latest root span first; traces enriched before single-span storage
+        # have the enrichment on every span
+        .order_by(models.Trace.parent_span_id.isnot(None), desc(models.Trace.start_time))
+        .first()
+    )
+
+
 def get_trace_id_for_conversation(
     db: Session,
     conversation_id: str,
@@ -509,29 +602,42 @@ def mark_trace_processed(
     db: Session,
     trace_id: str,
     enriched_data: dict,
+    span_ids: List[UUID],
+    summary_span_id: UUID,
 ) -> int:
     """
-    Mark all spans in a trace as processed.
+    Store a trace's enrichment on its summary span and mark spans as processed.
+
+    Only the summary span's enriched_data is written, so a pass costs writes
+    for the spans it folded in, not for the whole trace. When the summary
+    moves (a root span arrived after its children, or a later conversation
+    turn added a newer root), the previous holder is cleared.
 
     Args:
         db: Database session
         trace_id: OpenTelemetry trace ID
-        enriched_data: Enriched attributes to store
+        enriched_data: Enrichment of the whole trace so far
+        span_ids: Database IDs of the spans folded into enriched_data. Only
+            these are marked processed, so a span stored while the pass ran
+            is picked up by the next one.
+        summary_span_id: Database ID of the span that holds enriched_data
 
     Returns:
-        Number of spans updated
+        Number of spans marked processed
     """
-    result = (
-        db.query(models.Trace)
-        .filter(models.Trace.trace_id == trace_id)
-        .update(
-            {
-                "processed_at": datetime.now(timezone.utc),
-                "enriched_data": enriched_data,
-                "updated_at": datetime.now(timezone.utc),
-            }
-        )
+    now = datetime.now(timezone.utc)
+    trace_spans = db.query(models.Trace).filter(models.Trace.trace_id == trace_id)
+
+    result = trace_spans.filter(models.Trace.id.in_(span_ids)).update(
+        {"processed_at": now, "updated_at": now}, synchronize_session=False
+    )
+    trace_spans.filter(models.Trace.id == summary_span_id).update(
+        {"enriched_data": enriched_data, "updated_at": now}, synchronize_session=False
     )
+    trace_spans.filter(
+        models.Trace.id != summary_span_id,
+        models.Trace.enriched_data.has_key(EnrichedDataKeys.METRICS),
+    ).update({"enriched_data": {}, "updated_at": now}, synchronize_session=False)
 
     db.commit()
     return result
@@ -150,6 +150,7 @@ def get_test_runs(
     has_reviews: bool | None = None,
     organization_id: str = None,
     user_id: str = None,
+    cursor: str | None = None,
 ) -> List[models.TestRun]:
     return get_items_detail(
         db,
@@ -166,6 +167,7 @@ def get_test_runs(
             db, experiment_id, parameter_version, has_experiment, has_reviews, organization_id
         ),
         hydrate_filter=_defer_endpoint_last_token,
+        cursor=cursor,
     )
 
 
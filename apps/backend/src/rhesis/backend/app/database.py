@@ -1,4 +1,5 @@
 import logging
+import os
 from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import Generator, Optional
@@ -421,6 +422,23 @@ def is_soft_delete_disabled() -> bool:
     return _soft_delete_disabled.get(False)
 
 
+def create_schema() -> None:
+    """
+    Create any missing tables for the ORM models (an explicit startup step).
+
+    Called from the API lifespan rather than at import time, so importing the
+    app (tests, workers, tooling) does not need a reachable database.
+    ``DB_CREATE_SCHEMA=false`` skips it where Alembic owns the schema.
+    """
+    if os.getenv("DB_CREATE_SCHEMA", "true").lower() not in ("1", "true", "yes"):
+        return
+
+    # Register every model on Base.metadata before creating tables
+    import rhesis.backend.app.models  # noqa: F401
+
+    Base.metadata.create_all(bind=engine)
+
+
 @contextmanager
 def get_db() -> Generator[Session, None, None]:
     """
@@ -2,14 +2,14 @@
 Main module for the FastAPI application.
 
 This module creates the FastAPI application and includes all the routers
-defined in the `routers` module. It also creates the database tables
-using the `Base` object from the `database` module.
+defined in the `routers` module. Database tables are created in the
+lifespan startup step (see ``create_schema``), not at import, so importing
+this module never touches the database.
 
 """
 
 import logging
 import os
-import time
 from contextlib import AsyncExitStack, asynccontextmanager
 
 # Initialize OpenTelemetry FIRST, before any OpenTelemetry imports
@@ -20,12 +20,12 @@ initialize_telemetry()
 # ruff: noqa: E402 - Imports must come after telemetry initialization
 from fastapi import Depends, FastAPI, Request
 from fastapi import HTTPException as FastAPIHTTPException
+from fastapi.datastructures import Default
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from rhesis.backend import __version__
@@ -40,26 +40,30 @@ from rhesis.backend.app.config.settings import (
     get_auth_settings,
     get_frontend_settings,
 )
-from rhesis.backend.app.database import Base, engine, get_db
+from rhesis.backend.app.database import create_schema, get_db
 from rhesis.backend.app.error_handlers import (
     create_validation_error_response,
     http_exception_handler,
     log_validation_error,
     unhandled_exception_handler,
 )
+from rhesis.backend.app.middleware import (
+    CompressionMiddleware,
+    HTTPSRedirectMiddleware,
+    SecurityHeadersMiddleware,
+)
 from rhesis.backend.app.quota.enforcement import QuotaExceededError, quota_exceeded_response_body
 from rhesis.backend.app.routers import routers
 from rhesis.backend.app.utils.database_exceptions import ItemDeletedException, ItemNotFoundException
 from rhesis.backend.app.utils.git_utils import get_version_info
 from rhesis.backend.app.utils.request_context import RequestIDMiddleware
+from rhesis.backend.app.utils.responses import ORJSONResponse
 from rhesis.backend.local_init import initialize_local_environment
 from rhesis.backend.logging import set_logger
 from rhesis.backend.telemetry.middleware import TelemetryMiddleware
 
 logger = logging.getLogger(__name__)
 
-Base.metadata.create_all(bind=engine)
-
 # PUBLIC_ROUTES lives in rhesis.backend.app.auth.public_routes so EE can
 # extend it from its bootstrap (e.g. to register its own public callback
 # paths) before `app.include_router` runs for the EE routers.
@@ -367,6 +371,7 @@ async def lifespan(app: FastAPI):
     # DB state is consistent before the first request is served.
     from rhesis.backend.app.startup_hooks import run_startup_hooks
 
+    create_schema()
     with get_db() as db:
         initialize_local_environment(db)
         run_startup_hooks(db)
@@ -416,6 +421,20 @@ async def lifespan(app: FastAPI):
 
     init_permission_cache()
 
+    # Initialize insights cube refresh throttle (Redis DB 7, in-memory fallback)
+    from rhesis.backend.app.services.insights.cube_refresh import (
+        initialize_cache as init_cube_refresh_cache,
+    )
+
+    init_cube_refresh_cache()
+
+    # Initialize insights result cache (Redis DB 7, in-memory fallback)
+    from rhesis.backend.app.services.insights.result_cache import (
+        initialize_cache as init_insights_result_cache,
+    )
+
+    init_insights_result_cache()
+
     # Initialize WebSocket Redis subscriber (optional, doesn't fail startup)
     from rhesis.backend.app.services.websocket import start_redis_subscriber, ws_manager
 
@@ -575,12 +594,20 @@ async def lifespan(app: FastAPI):
 
             await stop_redis_subscriber()
 
+            # Queue usage accruals still buffered in this process
+            from rhesis.backend.app.services.usage_accumulator import flush_usage_accruals
+
+            flush_usage_accruals()
+
 
 app = FastAPI(
     title="Rhesis Backend",
     description=get_api_description(),
     version=__version__,
     lifespan=lifespan,
+    # orjson for every JSON body FastAPI renders itself; Default() keeps it
+    # overridable per route like the stock JSONResponse default.
+    default_response_class=Default(ORJSONResponse),
 )
 
 # Register rate limiter for slowapi (used by auth and user routers)
@@ -702,6 +729,7 @@ app.add_exception_handler(Exception, unhandled_exception_handler)
 
 # Configure CORS
 _frontend_settings = get_frontend_settings()
+_application_settings = get_application_settings()
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_frontend_settings.cors_origins,
@@ -710,7 +738,7 @@ app.add_middleware(
     allow_headers=["*"],
     # X-Request-ID must be exposed or browser JS cannot read the id it needs
     # to quote back to support.
-    expose_headers=["X-Total-Count", "X-Test-Header", "X-Request-ID"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "X-Test-Header", "X-Request-ID"],
 )
 
 # SESSION_SECRET_KEY is a required setting (see AuthSettings), so this fails
@@ -726,37 +754,22 @@ app.add_middleware(
     session_cookie="session",
     max_age=3600,  # 1 hour session lifetime
     same_site="lax",  # Required for OAuth flows
-    https_only=get_application_settings().secure_cookies,
+    https_only=_application_settings.secure_cookies,
 )
 
 
-# Add HTTPS redirect middleware
-class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if "X-Forwarded-Proto" in request.headers:
-            request.scope["scheme"] = request.headers["X-Forwarded-Proto"]
-        return await call_next(request)
-
-
+# Scheme from X-Forwarded-Proto, so HSTS and redirects see the client's scheme
 app.add_middleware(HTTPSRedirectMiddleware)
 
 # Add telemetry middleware
 app.add_middleware(TelemetryMiddleware)
 
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["X-XSS-Protection"] = "0"
-
-        if request.scope.get("scheme") == "https":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        return response
-
+# Opt-in gzip/zstd for large complete responses; streamed bodies pass through
+if _application_settings.response_compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=_application_settings.response_compression_min_size,
+    )
 
 # Outermost middleware -- runs first on every response
 app.add_middleware(SecurityHeadersMiddleware)
@@ -765,39 +778,7 @@ app.add_middleware(SecurityHeadersMiddleware)
 # carry the request id too.
 app.add_middleware(RequestIDMiddleware)
 
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-
-        # Log request
-        logger.info(f"Request started: {request.method} {request.url}")
-
-        # Sanitize headers before logging to redact sensitive information
-        from rhesis.backend.app.services.invokers.common.headers import HeaderManager
-
-        sanitized_headers = HeaderManager.sanitize_headers(dict(request.headers))
-        logger.debug(f"Request headers: {sanitized_headers}")
-
-        try:
-            response = await call_next(request)
-
-            # Log response
-            process_time = time.time() - start_time
-            logger.info(
-                f"Request completed: {request.method} {request.url} "
-                f"- Status: {response.status_code} - Duration: {process_time:.3f}s"
-            )
-
-            return response
-        except Exception as e:
-            logger.error(
-                f"Request failed: {request.method} {request.url} - Error: {str(e)}", exc_info=True
-            )
-            raise
-
-
-# Add the middleware to the app
+# Request/response logging (rhesis.backend.app.middleware.LoggingMiddleware)
 # app.add_middleware(LoggingMiddleware)
 
 
@@ -3,4 +3,21 @@ Middleware package for the Rhesis backend application.
 
 Contains middleware components for handling cross-cutting concerns
 such as security, logging, and request processing.
+
+All middleware here is pure ASGI (a class wrapping ``app`` with an async
+``__call__``), never ``BaseHTTPMiddleware``.
 """
+
+from rhesis.backend.app.middleware.compression import CompressionMiddleware
+from rhesis.backend.app.middleware.headers import (
+    HTTPSRedirectMiddleware,
+    SecurityHeadersMiddleware,
+)
+from rhesis.backend.app.middleware.request_logging import LoggingMiddleware
+
+__all__ = [
+    "CompressionMiddleware",
+    "HTTPSRedirectMiddleware",
+    "LoggingMiddleware",
+    "SecurityHeadersMiddleware",
+]
@@ -0,0 +1,132 @@
+"""Opt-in gzip/zstd compression for large responses.
+
+Enabled with ``RESPONSE_COMPRESSION_ENABLED``; responses smaller than
+``RESPONSE_COMPRESSION_MIN_SIZE`` bytes are sent as-is. zstd is offered only
+when the ``zstandard`` package is installed, and is preferred over gzip when
+the client accepts both.
+
+Only complete bodies are compressed. A response that arrives in several
+``http.response.body`` messages (``StreamingResponse``, SSE, file downloads)
+is passed through untouched, so streaming keeps its latency and framing.
+"""
+
+import gzip
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional
+    zstandard = None
+
+DEFAULT_MINIMUM_SIZE = 1024
+
+# Content types worth compressing; everything else (images, archives, event
+# streams) is already compact or must not be buffered.
+_COMPRESSIBLE_TYPES = ("application/json", "text/html", "text/plain", "text/csv")
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Encodings this process can produce, most preferred first."""
+    return ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the preferred encoding the client accepts, or None."""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    for encoding in available_encodings():
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, gzip_level: int = 6, zstd_level: int = 3) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=zstd_level).compress(body)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """Compress complete responses of at least ``minimum_size`` bytes."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                # Held until the first body message shows whether it is complete
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or start_message is None:
+                passthrough = True
+                if start_message is not None:
+                    await send(start_message)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(scope=start_message)
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+                or not _is_compressible(headers.get("content-type", ""))
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding, self.gzip_level, self.zstd_level)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def _is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type in _COMPRESSIBLE_TYPES or media_type.endswith("+json")
@@ -0,0 +1,60 @@
+"""Pure ASGI middleware for scheme detection and security response headers.
+
+Both were ``BaseHTTPMiddleware`` subclasses. That base runs the downstream app
+in a separate task and pipes the response through a memory stream, which adds
+a hop per request and buffers streaming responses; these only touch the scope
+and the ``http.response.start`` message, so they wrap ``send`` instead.
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+FORWARDED_PROTO_HEADER = b"x-forwarded-proto"
+
+SECURITY_HEADERS = {
+    "X-Frame-Options": "DENY",
+    "X-Content-Type-Options": "nosniff",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "X-XSS-Protection": "0",
+}
+HSTS_VALUE = "max-age=31536000; includeSubDomains"
+
+
+class HTTPSRedirectMiddleware:
+    """Take the request scheme from ``X-Forwarded-Proto`` set by the proxy."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, value in scope.get("headers", []):
+                if name.lower() == FORWARDED_PROTO_HEADER:
+                    scope["scheme"] = value.decode("latin-1")
+                    break
+        await self.app(scope, receive, send)
+
+
+class SecurityHeadersMiddleware:
+    """Add the standard security headers (and HSTS over HTTPS) to every response."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in SECURITY_HEADERS.items():
+                    headers[name] = value
+                # Read at response time: the scheme is rewritten further in
+                # by HTTPSRedirectMiddleware on this same scope dict.
+                if scope.get("scheme") == "https":
+                    headers["Strict-Transport-Security"] = HSTS_VALUE
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
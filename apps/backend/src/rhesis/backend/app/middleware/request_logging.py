@@ -0,0 +1,55 @@
+"""Pure ASGI request/response logging middleware (not registered by default)."""
+
+import logging
+import time
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class LoggingMiddleware:
+    """Log each request's start, completion status and duration."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        start_time = time.time()
+
+        # Log request
+        logger.info(f"Request started: {request.method} {request.url}")
+
+        # Sanitize headers before logging to redact sensitive information
+        from rhesis.backend.app.services.invokers.common.headers import HeaderManager
+
+        sanitized_headers = HeaderManager.sanitize_headers(dict(request.headers))
+        logger.debug(f"Request headers: {sanitized_headers}")
+
+        status_code = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception as e:
+            logger.error(
+                f"Request failed: {request.method} {request.url} - Error: {str(e)}", exc_info=True
+            )
+            raise
+
+        process_time = time.time() - start_time
+        logger.info(
+            f"Request completed: {request.method} {request.url} "
+            f"- Status: {status_code} - Duration: {process_time:.3f}s"
+        )
@@ -10,6 +10,7 @@ from .endpoint import Endpoint
 from .experiment import Experiment
 from .file import File
 from .guid import GUID
+from .insights_cube import InsightsCubeState, InsightsMetricCube, InsightsTestResultCube
 from .metric import Metric, behavior_metric_association, requirement_metric_association
 from .mixins import ProjectMixin, TagsMixin
 from .model import Model
@@ -65,6 +66,9 @@ __all__ = [
     "Experiment",
     "File",
     "GUID",
+    "InsightsCubeState",
+    "InsightsMetricCube",
+    "InsightsTestResultCube",
     "Metric",
     "Model",
     "Notification",
@@ -112,3 +116,13 @@ setup_soft_delete_listener()
 from .scope_events import setup_scope_listeners
 
 setup_scope_listeners()
+
+# Set up insights cube state tracking (marks runs stale on test result writes)
+from .insights_cube_events import setup_insights_cube_listeners
+
+setup_insights_cube_listeners()
+
+# Set up insights result cache invalidation (bumps the org generation on commit)
+from .insights_cache_events import setup_insights_cache_listeners
+
+setup_insights_cache_listeners()
@@ -0,0 +1,109 @@
+"""
+SQLAlchemy event listeners that invalidate the insights result cache on writes.
+
+After each flush, the organisations whose insights inputs the flush touched
+are remembered on the session; after the transaction commits, their result
+cache generation is bumped (services/insights/result_cache.py), so the next
+insights request recomputes instead of serving a result from before the
+write. Bumping only after commit means no reader can store pre-write rows
+under the new generation.
+
+Tracked writes (insert, update or delete):
+- TestResult, which also carries the human reviews (test_reviews).
+- TestRun.
+- Test.
+
+Until the commit, the writing session itself bypasses the cache (see
+has_uncommitted_insights_writes), so it reads its own writes.
+
+Bulk Query.update()/delete() and raw SQL bypass the ORM flush and are not
+tracked; code paths doing that to these tables must call
+``get_insights_result_cache().bump_generation(organization_id)`` after
+committing.
+"""
+
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Organisations with uncommitted insights writes on this session.
+_PENDING_ORGS_KEY = "insights_cache_pending_orgs"
+
+_listeners_registered = False
+
+
+def _tracked_models():
+    from rhesis.backend.app.models.test import Test
+    from rhesis.backend.app.models.test_result import TestResult
+    from rhesis.backend.app.models.test_run import TestRun
+
+    return (TestResult, TestRun, Test)
+
+
+def _changed_orgs(session):
+    tracked = _tracked_models()
+    orgs = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, tracked) or obj.organization_id is None:
+            continue
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        orgs.add(str(obj.organization_id))
+    return orgs
+
+
+def has_uncommitted_insights_writes(session: Session, organization_id) -> bool:
+    """Whether *session* has flushed, uncommitted writes to the org's insights inputs."""
+    pending = session.info.get(_PENDING_ORGS_KEY)
+    return bool(pending) and str(organization_id) in pending
+
+
+def setup_insights_cache_listeners():
+    """
+    Register the insights result cache invalidation listeners.
+
+    Called once at import time from models/__init__.py.
+    """
+    global _listeners_registered
+
+    if _listeners_registered:
+        return
+
+    @event.listens_for(Session, "after_flush")
+    def track_insights_writes(session, flush_context):
+        orgs = _changed_orgs(session)
+        if orgs:
+            session.info.setdefault(_PENDING_ORGS_KEY, set()).update(orgs)
+
+    @event.listens_for(Session, "after_soft_rollback")
+    def forget_insights_writes(session, previous_transaction):
+        # Keep them across a savepoint rollback: earlier flushes in the outer
+        # transaction may still commit, and an extra bump only costs a miss.
+        if not session.in_transaction():
+            session.info.pop(_PENDING_ORGS_KEY, None)
+
+    @event.listens_for(Session, "after_commit")
+    def invalidate_insights_results(session):
+        orgs = session.info.pop(_PENDING_ORGS_KEY, None)
+        if not orgs:
+            return
+
+        from rhesis.backend.app.services.insights.result_cache import (
+            get_insights_result_cache,
+        )
+
+        cache = get_insights_result_cache()
+        for organization_id in sorted(orgs):
+            try:
+                cache.bump_generation(organization_id)
+            except Exception as e:
+                # Cached results then live out their TTL.
+                logger.warning(
+                    f"Could not invalidate insights results for org {organization_id}: {e}"
+                )
+
+    _listeners_registered = True
+    logger.info("Insights result cache event listeners registered")
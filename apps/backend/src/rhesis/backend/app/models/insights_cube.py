@@ -0,0 +1,120 @@
+"""Materialised aggregate tables ("cubes") backing the insights planner.
+
+Each cube row pre-aggregates the rows of one stats view for a single test run
+at a fixed grain, so that the common insights GROUP BYs read a few hundred cube
+rows instead of scanning millions of test results through the views. Cubes
+store ids only -- display names (requirement, topic, status, ...) are joined at
+query time, so renaming a requirement never leaves a cube stale.
+
+Cubes are rebuilt one test run at a time by
+``services/insights/cubes.py:refresh_run_cubes``. ``InsightsCubeState`` tracks
+which runs are current: ``version`` is bumped in the same transaction as every
+write to that run's test results (see ``insights_cube_events.py``), and
+``refreshed_version`` records the version the cube rows were last built from.
+A run is served from the cube only while the two are equal; otherwise the
+planner reads that run from the views.
+
+None of these use ``OrganizationMixin``/``ProjectMixin``: they are written
+exclusively by raw ``INSERT ... SELECT`` / ``ON CONFLICT`` statements that the
+ambient auto-filter/auto-stamp listeners do not apply to. Isolation is enforced
+in the database instead, by the same ``tenant_isolation`` and fail-closed
+``project_isolation`` RLS policies as ``test_result`` (migration
+``c7d1e5a9f3b2_add_insights_cube_tables``). ``project_id`` is copied from the
+aggregated test results, so a cube row is visible exactly when the results it
+was built from are, and cube and view answers agree under every scope.
+"""
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    text,
+)
+
+from .base import Base
+from .guid import GUID
+
+
+class InsightsTestResultCube(Base):
+    """Overall-result counts of ``v_test_result_stats`` rows per run, test
+    dimensions, result status and UTC day."""
+
+    __tablename__ = "insights_test_result_cube"
+
+    organization_id = Column(
+        GUID(), ForeignKey("organization.id", ondelete="CASCADE"), nullable=False
+    )
+    test_run_id = Column(GUID(), ForeignKey("test_run.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(GUID(), ForeignKey("project.id", ondelete="CASCADE"))
+    requirement_id = Column(GUID())
+    category_id = Column(GUID())
+    topic_id = Column(GUID())
+    result_status_id = Column(GUID())
+    day = Column(Date, nullable=False)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+    count = Column(BigInteger, nullable=False, server_default=text("0"))
+    passed = Column(BigInteger, nullable=False, server_default=text("0"))
+    failed = Column(BigInteger, nullable=False, server_default=text("0"))
+
+    __table_args__ = (
+        Index("ix_insights_test_result_cube_org_run", "organization_id", "test_run_id"),
+        Index("ix_insights_test_result_cube_org_day", "organization_id", "day"),
+    )
+
+
+class InsightsMetricCube(Base):
+    """Per-metric outcome counts of ``v_metric_stats`` rows per run, requirement
+    and UTC day."""
+
+    __tablename__ = "insights_metric_cube"
+
+    organization_id = Column(
+        GUID(), ForeignKey("organization.id", ondelete="CASCADE"), nullable=False
+    )
+    test_run_id = Column(GUID(), ForeignKey("test_run.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(GUID(), ForeignKey("project.id", ondelete="CASCADE"))
+    requirement_id = Column(GUID())
+    metric_name = Column(String, nullable=False)
+    day = Column(Date, nullable=False)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+    count = Column(BigInteger, nullable=False, server_default=text("0"))
+    passed = Column(BigInteger, nullable=False, server_default=text("0"))
+    failed = Column(BigInteger, nullable=False, server_default=text("0"))
+    automated_passed = Column(BigInteger, nullable=False, server_default=text("0"))
+    automated_failed = Column(BigInteger, nullable=False, server_default=text("0"))
+    human_review_count = Column(BigInteger, nullable=False, server_default=text("0"))
+
+    __table_args__ = (
+        Index("ix_insights_metric_cube_org_run", "organization_id", "test_run_id"),
+        Index("ix_insights_metric_cube_org_day", "organization_id", "day"),
+    )
+
+
+class InsightsCubeState(Base):
+    """Freshness marker for the cube rows of one test run."""
+
+    __tablename__ = "insights_cube_state"
+
+    organization_id = Column(
+        GUID(), ForeignKey("organization.id", ondelete="CASCADE"), nullable=False
+    )
+    test_run_id = Column(GUID(), ForeignKey("test_run.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(GUID(), ForeignKey("project.id", ondelete="CASCADE"))
+    version = Column(BigInteger, nullable=False, server_default=text("1"))
+    refreshed_version = Column(BigInteger, nullable=False, server_default=text("0"))
+
+    __table_args__ = (
+        UniqueConstraint("organization_id", "test_run_id", name="uq_insights_cube_state_org_run"),
+        Index(
+            "ix_insights_cube_state_stale",
+            "organization_id",
+            postgresql_where=text("version <> refreshed_version"),
+        ),
+    )
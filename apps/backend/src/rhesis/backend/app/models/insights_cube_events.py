@@ -0,0 +1,155 @@
+"""
+SQLAlchemy event listeners that keep insights cube state in step with writes.
+
+After each flush, the test runs whose aggregates the flush changed get their
+InsightsCubeState.version bumped, on the same connection and in the same
+transaction as the write. Runs already stale are not bumped again (see
+services.insights.cubes.pin_stale_runs), so concurrent writers to one run do
+not queue on its state row. That is what makes a run stale for the insights
+planner the instant the write commits (and never before), with no window in
+which a cube answers from outdated rows.
+
+Tracked writes:
+- TestResult insert/update/delete: the result's run, plus its previous run
+  when test_run_id changed.
+- Test update of requirement_id/category_id/topic_id/deleted_at, and Test
+  delete: every run that has a result for the test (the stats views read
+  these columns from the test).
+
+Bulk Query.update()/delete() and raw SQL bypass the ORM flush and are not
+tracked; code paths doing that to test results must call
+services.insights.cubes.mark_runs_stale themselves.
+
+After commit, a throttled refresh is scheduled for each affected
+(organization, project) scope.
+"""
+
+import logging
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Runs already bumped in the current transaction: one bump per transaction is
+# enough, since the refresher only compares versions.
+_MARKED_RUNS_KEY = "insights_cube_marked_runs"
+# (organization_id, project_id) scopes to schedule a refresh for on commit.
+_PENDING_SCOPES_KEY = "insights_cube_pending_scopes"
+
+_TEST_COLUMNS = ("requirement_id", "category_id", "topic_id", "deleted_at")
+
+_listeners_registered = False
+
+
+def _str_or_none(value):
+    return str(value) if value is not None else None
+
+
+def _history_values(obj, attribute):
+    history = inspect(obj).attrs[attribute].history
+    return [v for v in (*history.added, *history.unchanged, *history.deleted) if v is not None]
+
+
+def _changed_runs(session):
+    """(organization_id, project_id, test_run_id) of test results in this flush."""
+    from rhesis.backend.app.models.test_result import TestResult
+
+    runs = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(obj, TestResult):
+            continue
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        if obj.organization_id is None:
+            continue
+        for run_id in _history_values(obj, "test_run_id"):
+            runs.add((str(obj.organization_id), _str_or_none(obj.project_id), str(run_id)))
+    return runs
+
+
+def _changed_tests(session):
+    """Ids and (organization_id, project_id) scopes of tests changed in this flush."""
+    from rhesis.backend.app.models.test import Test
+
+    test_ids, scopes = set(), set()
+    for obj in (*session.dirty, *session.deleted):
+        if not isinstance(obj, Test) or obj.id is None:
+            continue
+        state = inspect(obj)
+        if obj in session.deleted or any(
+            state.attrs[column].history.has_changes() for column in _TEST_COLUMNS
+        ):
+            test_ids.add(str(obj.id))
+            if obj.organization_id is not None:
+                scopes.add((str(obj.organization_id), _str_or_none(obj.project_id)))
+    return test_ids, scopes
+
+
+def setup_insights_cube_listeners():
+    """
+    Register the cube state tracking listeners.
+
+    Called once at import time from models/__init__.py.
+    """
+    global _listeners_registered
+
+    if _listeners_registered:
+        return
+
+    @event.listens_for(Session, "after_flush")
+    def mark_insights_cubes_stale(session, flush_context):
+        from rhesis.backend.app.services.insights.cubes import (
+            mark_runs_stale,
+            mark_runs_stale_for_tests,
+            pin_stale_runs,
+        )
+
+        marked = session.info.setdefault(_MARKED_RUNS_KEY, set())
+        runs = {run for run in _changed_runs(session) if run not in marked}
+        test_ids, test_scopes = _changed_tests(session)
+        if not runs and not test_ids:
+            return
+
+        connection = session.connection()
+        if runs:
+            pinned = pin_stale_runs(connection, runs)
+            mark_runs_stale(
+                connection,
+                [run for run in runs if (run[0], run[2]) not in pinned],
+            )
+            marked.update(runs)
+        if test_ids:
+            mark_runs_stale_for_tests(connection, test_ids)
+
+        pending = session.info.setdefault(_PENDING_SCOPES_KEY, set())
+        pending.update((org_id, project_id) for org_id, project_id, _ in runs)
+        pending.update(test_scopes)
+
+    @event.listens_for(Session, "after_soft_rollback")
+    def forget_marked_runs(session, previous_transaction):
+        # A rolled-back savepoint may have undone bumps we remembered.
+        session.info.pop(_MARKED_RUNS_KEY, None)
+        if not session.in_transaction():
+            session.info.pop(_PENDING_SCOPES_KEY, None)
+
+    @event.listens_for(Session, "after_commit")
+    def schedule_insights_cube_refresh(session):
+        session.info.pop(_MARKED_RUNS_KEY, None)
+        scopes = session.info.pop(_PENDING_SCOPES_KEY, None)
+        if not scopes:
+            return
+
+        from rhesis.backend.app.services.insights.cube_refresh import schedule_cube_refresh
+
+        for organization_id, project_id in sorted(scopes, key=lambda s: (s[0], s[1] or "")):
+            try:
+                schedule_cube_refresh(organization_id, project_id)
+            except Exception as e:
+                # Stale runs are served from the views until the next refresh.
+                logger.warning(
+                    f"Could not schedule insights cube refresh for org {organization_id}: {e}"
+                )
+
+    _listeners_registered = True
+    logger.info("Insights cube event listeners registered")
@@ -152,10 +152,11 @@ def query_insights(
 
     The body is the map of label -> query directly (no wrapping `queries` key).
     Each entry is validated and executed independently against
-    services/insights/registry.py, same as GET /insights. This only batches
-    the round trips -- results from different entities are never merged into
-    one row set (see services/insights/query_builder.py:run_queries), so the
-    caller still assembles per-entity results into whatever shape it needs.
+    services/insights/registry.py, same as GET /insights. Labels found in the
+    insights result cache are served from it and the rest run concurrently.
+    Results from different entities are never merged into one row set (see
+    services/insights/query_builder.py:run_queries), so the caller still
+    assembles per-entity results into whatever shape it needs.
 
     Example:
         POST /insights/query
@@ -165,6 +166,11 @@ def query_insights(
                      "measures": ["count", "passed", "pass_rate"]}}
     """
     try:
-        return run_queries(db, queries, organization_id=current_user.organization_id)
+        return run_queries(
+            db,
+            queries,
+            organization_id=current_user.organization_id,
+            user_id=str(current_user.id),
+        )
     except InsightsValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -42,7 +42,19 @@ router = RhesisRouter(prefix="/recycle", tags=["recycle"], resource="recycle")
 # would keep updating invisibly (the ORM soft-delete filter hides it from
 # GET /usage's SELECT while accrual still lands on it). There is no
 # legitimate soft-delete/restore workflow for a counter row.
-RECYCLE_EXCLUDED_TABLES = frozenset({"usage"})
+#
+# insights_*_cube / insights_cube_state: derived aggregates rebuilt wholesale
+# by services/insights/cubes.py. The planner reads them with Core statements
+# that never look at deleted_at, so a "soft-deleted" cube row would still be
+# counted, and restoring or hard-deleting one would silently skew dashboards.
+RECYCLE_EXCLUDED_TABLES = frozenset(
+    {
+        "usage",
+        "insights_test_result_cube",
+        "insights_metric_cube",
+        "insights_cube_state",
+    }
+)
 
 
 def get_all_models() -> Dict[str, type]:
@@ -35,10 +35,6 @@ from rhesis.backend.app.services.test_config_generator import TestConfigGenerato
 from rhesis.backend.app.services.test_generation_pipeline import (
     test_generation_pipeline_stream,
 )
-from rhesis.backend.app.services.tool.mcp import (
-    handle_mcp_exception,
-    query_mcp,
-)
 from rhesis.backend.app.utils.execution_validation import validate_generation_model
 from rhesis.backend.app.utils.model_errors import (
     EmbeddingProviderNotConfigured,
@@ -557,6 +553,10 @@ async def query_mcp_server(
             "max_iterations": 15
         }
     """
+    # The MCP service loads the SDK's MCP client stack; import it per request
+    # rather than with the API.
+    from rhesis.backend.app.services.tool.mcp import handle_mcp_exception, query_mcp
+
     try:
         organization_id, user_id = tenant_context
         ctx = EndpointContext(
@@ -594,7 +594,9 @@ def get_trace(
 
         # Extract costs from enriched data
         total_cost = 0.0
-        costs = (spans[0].enriched_data or {}).get(EnrichedDataKeys.COSTS, {})
+        # Enrichment is stored on one span of the trace, normally the root
+        enriched_data = next((span.enriched_data for span in spans if span.enriched_data), {})
+        costs = enriched_data.get(EnrichedDataKeys.COSTS, {})
         if costs:
             total_cost = costs.get(EnrichedDataKeys.TOTAL_COST_USD, 0.0)
 
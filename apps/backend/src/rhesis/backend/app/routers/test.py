@@ -27,6 +27,7 @@ from rhesis.backend.app.services.test import (
     extract_test_from_conversation,
     resolve_test_entity_names,
 )
+from rhesis.backend.app.utils.cursor_pagination import CURSOR_HEADER, next_cursor
 from rhesis.backend.app.utils.database_exceptions import handle_database_exceptions
 from rhesis.backend.app.utils.decorators import with_count_header
 from rhesis.backend.app.utils.execution_validation import (
@@ -197,6 +198,11 @@ def read_tests(
     limit: int = 100,
     sort_by: str = "created_at",
     sort_order: str = "desc",
+    cursor: str | None = Query(
+        None,
+        description="Keyset pagination cursor: the previous page's X-Next-Cursor header. "
+        "Use instead of skip for deep pages.",
+    ),
     filter: str | None = Query(None, alias="$filter", description="OData filter expression"),
     select: str | None = Query(
         None,
@@ -222,7 +228,11 @@ def read_tests(
         filter=filter,
         organization_id=organization_id,
         user_id=user_id,
+        cursor=cursor,
     )
+    page_cursor = next_cursor(tests, limit, sort_by, sort_order)
+    if page_cursor:
+        response.headers[CURSOR_HEADER] = page_cursor
     if select:
         serialized = jsonable_encoder(tests)
         return JSONResponse(content=apply_select(serialized, select))
@@ -263,6 +273,36 @@ def get_test_test_sets(
     return items
 
 
+@router.get("/{test_id}/similar", response_model=List[schemas.SimilarTest])
+def get_similar_tests(
+    test_id: UUID,
+    limit: int = Query(10, ge=1, le=100),
+    test_set_id: Optional[UUID] = Query(None, description="Only search this test set"),
+    db: Session = Depends(get_tenant_db_session),
+    tenant_context=Depends(get_tenant_context),
+    current_user: User = Depends(require_current_user_or_token),
+):
+    """Get the tests whose embeddings are most similar to this test's.
+
+    Empty when the test has no embedding yet.
+    """
+    from rhesis.backend.app.services.embedding.similarity import find_similar_tests
+
+    organization_id, user_id = tenant_context
+    db_test = crud.get_test(db, test_id=test_id, organization_id=organization_id, user_id=user_id)
+    if db_test is None:
+        raise HTTPException(status_code=404, detail="Test not found")
+
+    return find_similar_tests(
+        db,
+        str(test_id),
+        organization_id,
+        user_id=user_id,
+        limit=limit,
+        test_set_id=str(test_set_id) if test_set_id else None,
+    )
+
+
 @router.get("/{test_id}", response_model=schemas.TestDetail)
 def read_test(
     test_id: UUID,
@@ -29,6 +29,7 @@ from rhesis.backend.app.utils.odata import apply_select
 from rhesis.backend.tasks import task_launcher
 from rhesis.backend.tasks.enums import RunStatus
 from rhesis.backend.tasks.execution.run import create_test_run, update_test_run_status
+from rhesis.backend.tasks.execution.scheduling import schedule_test_run
 from rhesis.backend.tasks.test_configuration import execute_test_configuration
 
 router = RhesisRouter(
@@ -240,6 +241,8 @@ def execute_test_configuration_endpoint(
             task_info={"id": celery_task_id},
             current_user_id=str(current_user.id) if current_user else None,
         )
+        # Priority from run size and the tenant's runs already in flight
+        priority = schedule_test_run(db, test_run)
         db.commit()
 
         # Dispatch the task using the same pre-generated ID so Celery
@@ -252,6 +255,7 @@ def execute_test_configuration_endpoint(
                 current_user=current_user,
                 task_id=celery_task_id,
                 db=db,
+                priority=priority,
             )
         except Exception as exc:
             # Mark the queued test run as failed so it doesn't stay stuck. The
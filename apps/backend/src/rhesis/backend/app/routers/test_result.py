@@ -31,6 +31,7 @@ from rhesis.backend.app.services.review_override import (
     apply_review_override,
     revert_override,
 )
+from rhesis.backend.app.utils.cursor_pagination import CURSOR_HEADER, next_cursor
 from rhesis.backend.app.utils.database_exceptions import handle_database_exceptions
 from rhesis.backend.app.utils.decorators import with_count_header
 from rhesis.backend.app.utils.odata import apply_select
@@ -105,6 +106,11 @@ def read_test_results(
     limit: int = 100,
     sort_by: str = "created_at",
     sort_order: str = "desc",
+    cursor: str | None = Query(
+        None,
+        description="Keyset pagination cursor: the previous page's X-Next-Cursor header. "
+        "Use instead of skip for deep pages.",
+    ),
     filter: str | None = Query(None, alias="$filter", description="OData filter expression"),
     select: str | None = Query(
         None,
@@ -126,7 +132,11 @@ def read_test_results(
         filter=filter,
         organization_id=organization_id,
         user_id=user_id,
+        cursor=cursor,
     )
+    page_cursor = next_cursor(results, limit, sort_by, sort_order)
+    if page_cursor:
+        response.headers[CURSOR_HEADER] = page_cursor
     if select:
         serialized = jsonable_encoder(results)
         return JSONResponse(content=apply_select(serialized, select))
@@ -21,11 +21,13 @@ from rhesis.backend.app.dependencies import (
 from rhesis.backend.app.models.user import User
 from rhesis.backend.app.routers.base import RhesisRouter
 from rhesis.backend.app.schemas.telemetry import TraceListResponse, TraceSource, TraceSummary
-from rhesis.backend.app.services.test_run import (
-    get_test_results_for_test_run,
-    rescore_test_run,
-    test_run_results_to_csv,
+from rhesis.backend.app.services.test_run import rescore_test_run
+from rhesis.backend.app.services.test_run_export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    stream_test_run_results,
 )
+from rhesis.backend.app.utils.cursor_pagination import CURSOR_HEADER, next_cursor
 from rhesis.backend.app.utils.database_exceptions import handle_database_exceptions
 from rhesis.backend.app.utils.decorators import with_count_header
 from rhesis.backend.app.utils.odata import apply_select
@@ -73,6 +75,11 @@ def read_test_runs(
     limit: int = 100,
     sort_by: str = "created_at",
     sort_order: str = "desc",
+    cursor: str | None = Query(
+        None,
+        description="Keyset pagination cursor: the previous page's X-Next-Cursor header. "
+        "Use instead of skip for deep pages.",
+    ),
     filter: str | None = Query(None, alias="$filter", description="OData filter expression"),
     select: str | None = Query(
         None,
@@ -106,7 +113,11 @@ def read_test_runs(
         has_reviews=has_reviews,
         organization_id=str(current_user.organization_id),
         user_id=str(current_user.id),
+        cursor=cursor,
     )
+    page_cursor = next_cursor(results, limit, sort_by, sort_order)
+    if page_cursor:
+        response.headers[CURSOR_HEADER] = page_cursor
     if select:
         serialized = jsonable_encoder(results)
         return JSONResponse(content=apply_select(serialized, select))
@@ -248,6 +259,10 @@ def delete_test_run(
         task_id = (db_test_run.attributes or {}).get("task_id")
         if task_id:
             celery_app.control.revoke(task_id)
+        # Sharded runs also execute in one task per shard
+        shard_task_ids = (db_test_run.attributes or {}).get("shard_task_ids")
+        if shard_task_ids:
+            celery_app.control.revoke(shard_task_ids)
 
     return test_run_crud.delete_test_run(
         db=db, test_run_id=test_run_id, organization_id=organization_id, user_id=user_id
@@ -298,6 +313,12 @@ def cancel_test_run(
         # check at the top of execute_test_configuration.
         celery_app.control.revoke(task_id)
 
+    # Sharded runs: revoke every shard; queued shards are skipped and running
+    # ones are cancelled by their own watchdog.
+    shard_task_ids = (db_test_run.attributes or {}).get("shard_task_ids")
+    if shard_task_ids:
+        celery_app.control.revoke(shard_task_ids)
+
     update_test_run_status(db, db_test_run, RunStatus.CANCELLED.value)
 
     return test_run_crud.get_test_run(
@@ -356,11 +377,14 @@ def rescore_test_run_endpoint(
 @router.get("/{test_run_id}/download", response_class=StreamingResponse)
 def download_test_run_results(
     test_run_id: UUID,
+    export_format: ExportFormat = Query(
+        ExportFormat.CSV, alias="format", description="Export format: csv, jsonl or parquet"
+    ),
     db: Session = Depends(get_tenant_db_session),
     tenant_context=Depends(get_tenant_context),
     current_user: User = Depends(require_current_user_or_token),
 ):
-    """Download test run results as CSV"""
+    """Download test run results as CSV, JSONL or Parquet, streamed in batches"""
     try:
         organization_id, user_id = tenant_context
         # Check if test run exists and user has access
@@ -370,23 +394,22 @@ def download_test_run_results(
         if db_test_run is None:
             raise HTTPException(status_code=404, detail="Test run not found")
 
-        # Get test results data
-        test_results_data = get_test_results_for_test_run(
-            db, test_run_id, organization_id=str(current_user.organization_id)
-        )
-
-        # Convert to CSV
-        csv_data = test_run_results_to_csv(test_results_data)
-
-        # Create response
-        response = StreamingResponse(iter([csv_data]), media_type="text/csv")
-        response.headers["Content-Disposition"] = (
-            f"attachment; filename=test_run_{test_run_id}_results.csv"
+        chunks = stream_test_run_results(
+            db,
+            test_run_id,
+            export_format,
+            organization_id=str(current_user.organization_id),
         )
-        return response
-
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
+    except ImportError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    response = StreamingResponse(chunks, media_type=EXPORT_MEDIA_TYPES[export_format])
+    response.headers["Content-Disposition"] = (
+        f"attachment; filename=test_run_{test_run_id}_results.{export_format.value}"
+    )
+    return response
 
 
 @router.get("/{test_run_id}/traces", response_model=TraceListResponse)
@@ -52,7 +52,7 @@ from rhesis.backend.app.utils.execution_validation import (
 from rhesis.backend.app.utils.odata import apply_select
 from rhesis.backend.tasks import task_launcher
 from rhesis.backend.tasks.embedding.graph import compute_test_set_graph_task
-from rhesis.backend.tasks.test_set import generate_and_save_test_set
+from rhesis.backend.tasks.test_set import deduplicate_test_set, generate_and_save_test_set
 
 logger = logging.getLogger(__name__)
 
@@ -687,6 +687,39 @@ def disassociate_tests_from_test_set(
     )
 
 
+@router.post(
+    "/{test_set_identifier}/deduplicate",
+    response_model=schemas.TestSetDeduplicateResponse,
+    **capability(Permission.TestSet.UPDATE),
+)
+def deduplicate_test_set_tests(
+    test_set_identifier: str,
+    dry_run: bool = False,
+    use_embeddings: bool = True,
+    db: Session = Depends(get_tenant_db_session),
+    current_user: User = Depends(require_current_user_or_token),
+):
+    """
+    Queue removal of near-duplicate tests from a test set.
+
+    The worker compares prompts lexically (MinHash/LSH) and, with
+    ``use_embeddings``, by stored embeddings, then disassociates every test
+    that duplicates an earlier one. With ``dry_run`` it only reports them.
+    """
+    db_test_set = resolve_test_set_or_raise(
+        test_set_identifier, db, str(current_user.organization_id)
+    )
+    task = task_launcher(
+        deduplicate_test_set,
+        str(db_test_set.id),
+        dry_run=dry_run,
+        use_embeddings=use_embeddings,
+        current_user=current_user,
+        db=db,
+    )
+    return schemas.TestSetDeduplicateResponse(task_id=str(task.id))
+
+
 @router.get("/{test_set_identifier}/metrics", response_model=list[schemas.Metric])
 def get_test_set_metrics(
     test_set_identifier: str,
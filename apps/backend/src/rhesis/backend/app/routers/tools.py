@@ -40,11 +40,6 @@ from rhesis.backend.app.services.tool.azure_devops import (
     normalize_azure_devops_org,
     prepare_azure_devops_credentials,
 )
-from rhesis.backend.app.services.tool.mcp import (
-    handle_mcp_exception,
-    mcp_extract,
-    mcp_health_check,
-)
 from rhesis.backend.app.services.tool.rest import (
     create_jira_ticket_from_task,
     get_rest_client,
@@ -52,7 +47,6 @@ from rhesis.backend.app.services.tool.rest import (
 )
 from rhesis.backend.app.services.tool.rest.config import validate_base_url
 from rhesis.backend.app.utils.decorators import with_count_header
-from rhesis.sdk.agents.mcp.exceptions import MCPError
 
 logger = logging.getLogger(__name__)
 
@@ -449,6 +443,8 @@ async def extract_tool_item(
     (REST providers only).
     Either ``id`` or ``url`` (or both) must be provided in the request body.
     """
+    from rhesis.backend.app.services.tool.mcp import handle_mcp_exception, mcp_extract
+
     try:
         organization_id, user_id = tenant_context
         provider = resolve_provider(db, organization_id, tool_id=str(tool_id), user_id=user_id)
@@ -504,6 +500,9 @@ async def test_tool_connection(
     current_user: User = Depends(require_current_user_or_token),
 ):
     """Test a tool's credentials via a lightweight connection check."""
+    from rhesis.backend.app.services.tool.mcp import handle_mcp_exception, mcp_health_check
+    from rhesis.sdk.agents.mcp.exceptions import MCPError
+
     try:
         organization_id, user_id = tenant_context
         effective_tool_id = request.tool_id
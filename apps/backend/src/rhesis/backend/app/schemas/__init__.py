@@ -26,6 +26,7 @@ from .embedding import (
     EmbeddingGraphPendingResponse,
     EmbeddingGraphReadyResponse,
     EmbeddingUpdate,
+    SimilarTest,
 )
 from .emoji_reaction import CommentEmojis, EmojiReaction
 from .endpoint import (
@@ -159,6 +160,7 @@ from .test_set import (
     TestSetBulkDisassociateResponse,
     TestSetBulkResponse,
     TestSetCreate,
+    TestSetDeduplicateResponse,
     TestSetDetail,
     TestSetExecutionRequest,
     TestSetUpdate,
@@ -257,6 +259,7 @@ __all__ = [
     "TestRunRescoreRequest",
     "TestSetBulkDisassociateResponse",
     "TestSetBulkDisassociateRequest",
+    "TestSetDeduplicateResponse",
     "TestRun",
     "TestRunBase",
     "TestRunCreate",
@@ -285,6 +288,7 @@ __all__ = [
     "EmbeddingGraphPendingResponse",
     "EmbeddingGraphReadyResponse",
     "EmbeddingUpdate",
+    "SimilarTest",
     "TypeLookup",
     "TypeLookupBase",
     "TypeLookupCreate",
@@ -42,6 +42,13 @@ class Embedding(EmbeddingBase):
     embedding: Optional[List[float]] = None
 
 
+class SimilarTest(Base):
+    """A test and its embedding's cosine similarity to the queried test."""
+
+    test_id: UUID4
+    similarity: float
+
+
 class Point(Base):
     embedding_id: UUID4
     entity_id: UUID4
@@ -1,5 +1,6 @@
 """Pydantic schemas for trace enrichment data."""
 
+from datetime import datetime
 from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -52,6 +53,20 @@ class TraceMetrics(BaseModel):
     error_count: int = Field(..., ge=0, description="Number of error spans")
 
 
+class EnrichmentSummary(BaseModel):
+    """
+    Running state needed to fold newly arrived spans into a trace's enrichment.
+
+    Everything else in EnrichedTraceData merges from its published fields;
+    this holds what doesn't, so each enrichment pass only has to load the
+    spans it hasn't seen yet.
+    """
+
+    root_start_time: Optional[datetime] = Field(
+        None, description="Start time of the span root_operation was taken from"
+    )
+
+
 class EnrichedTraceData(BaseModel):
     """
     Enriched trace data structure.
@@ -69,6 +84,10 @@ class EnrichedTraceData(BaseModel):
     operation_types: Optional[List[str]] = Field(None, description="List of operation types")
     root_operation: Optional[str] = Field(None, description="Root span operation name")
 
+    summary: Optional[EnrichmentSummary] = Field(
+        None, description="Incremental enrichment state (see EnrichmentSummary)"
+    )
+
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
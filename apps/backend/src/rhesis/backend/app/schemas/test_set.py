@@ -269,6 +269,13 @@ class TestSetBulkDisassociateResponse(BaseModel):
     message: str
 
 
+class TestSetDeduplicateResponse(BaseModel):
+    """Response when a background task to deduplicate a test set has been queued."""
+
+    status: str = "pending"
+    task_id: str
+
+
 class ExecutionMetric(BaseModel):
     """Metric specification for execution-time metric override.
 
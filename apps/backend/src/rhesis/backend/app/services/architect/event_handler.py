@@ -9,13 +9,19 @@ from rhesis.backend.app.schemas.websocket import (
     WebSocketMessage,
 )
 from rhesis.backend.app.services.websocket.publisher import publish_event
-from rhesis.sdk.agents.errors import format_user_facing_error
 
 logger = logging.getLogger(__name__)
 
 _tool_labels: Optional[Dict[str, str]] = None
 
 
+def format_user_facing_error(error: Any) -> str:
+    """SDK error formatter, imported on first use: ``rhesis.sdk.agents`` loads MCP."""
+    from rhesis.sdk.agents.errors import format_user_facing_error as _format
+
+    return _format(error)
+
+
 def _get_tool_labels() -> Dict[str, str]:
     """Load tool labels from YAML, cached after first call."""
     global _tool_labels
@@ -18,7 +18,6 @@ from rhesis.backend.app.database import get_db_with_tenant_variables
 from rhesis.backend.app.schemas.websocket import EventType
 from rhesis.backend.app.services.architect.attachments import process_attachments
 from rhesis.backend.app.services.architect.event_handler import WebSocketEventHandler
-from rhesis.backend.app.services.tool.mcp.agents import get_agent_event_handlers
 from rhesis.backend.app.utils import observability as _observability  # noqa: F401
 from rhesis.sdk.context import EndpointContext
 from rhesis.sdk.decorators import endpoint, observe
@@ -164,6 +163,7 @@ async def build_agent(
     from rhesis.backend.app.crud import user as user_crud
     from rhesis.backend.app.main import app as fastapi_app
     from rhesis.backend.app.mcp_server.local_tools import LocalToolProvider
+    from rhesis.backend.app.services.tool.mcp.agents import get_agent_event_handlers
     from rhesis.backend.app.utils.user_model_utils import get_user_generation_model
     from rhesis.sdk.agents.architect.agent import ArchitectAgent
     from rhesis.sdk.agents.architect.state import ArchitectAgentStateSnapshot
@@ -162,6 +162,26 @@ class RedisBackedCache:
             self._memory_timestamps[key] = time.monotonic()
             self._evict_stale()
 
+    def _set_nx(self, key: str, value: str, ttl: Optional[int] = None) -> bool:
+        """Set a key only if it does not exist yet. Returns True if it was set."""
+        ex = ttl if ttl is not None else self._ttl
+        if self._using_redis:
+            try:
+                return bool(self._redis.set(key, value, ex=ex, nx=True))
+            except Exception as exc:
+                logger.warning(
+                    f"{self._cache_name}: Redis write failed for _set_nx, "
+                    f"falling back to memory: {exc}"
+                )
+
+        with self._lock:
+            self._evict_stale()
+            if key in self._memory:
+                return False
+            self._memory[key] = value
+            self._memory_timestamps[key] = time.monotonic()
+            return True
+
     def _disable_read_replica(self) -> None:
         """Disable the read replica, falling back to primary for reads."""
         if self._has_separate_read and self._redis_read is not None:
@@ -190,6 +210,21 @@ class RedisBackedCache:
             self._evict_stale()
             return self._memory.get(key)
 
+    def _get_primary(self, key: str) -> Optional[str]:
+        """Get a value by key from the Redis primary, bypassing the read replica.
+
+        For keys whose latest write must be seen, such as invalidation tokens.
+        """
+        if self._using_redis:
+            try:
+                return self._redis.get(key)
+            except Exception as exc:
+                logger.warning(f"{self._cache_name}: Redis read failed for _get_primary: {exc}")
+
+        with self._lock:
+            self._evict_stale()
+            return self._memory.get(key)
+
     def _delete(self, *keys: str) -> None:
         """Delete one or more keys from Redis or in-memory fallback."""
         if not keys:
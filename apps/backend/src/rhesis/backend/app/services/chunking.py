@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
 import tiktoken
 from fastapi import HTTPException
@@ -9,9 +12,11 @@ from rhesis.backend.app import schemas
 from rhesis.backend.app.constants import EntityType
 from rhesis.backend.app.crud import source as source_crud
 from rhesis.backend.app.utils.crud_utils import get_or_create_status
-from rhesis.sdk.services.chunker import ChunkingService as SDKChunkingService
-from rhesis.sdk.services.chunker import ChunkingStrategy, RecursiveChunker
-from rhesis.sdk.services.extractor import ExtractedSource, SourceType
+
+# The SDK chunker pulls in chonkie (and openai through it) and the extractor
+# pulls in markitdown; both are imported where chunking runs, not at API import.
+if TYPE_CHECKING:
+    from rhesis.sdk.services.chunker import ChunkingStrategy
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +58,9 @@ class ChunkingService:
             logger.warning(f"Skipping chunking for source {source_id} - no content available")
             return []
 
+        from rhesis.sdk.services.chunker import ChunkingService as SDKChunkingService
+        from rhesis.sdk.services.extractor import ExtractedSource, SourceType
+
         # Content already extracted; wrap in ExtractedSource to satisfy SDK interface
         extracted_source = ExtractedSource(
             type=SourceType.DOCUMENT,  # TODO: map from source type; does not affect chunking
@@ -112,7 +120,10 @@ def auto_chunk_source(
     strategy: ChunkingStrategy | None = None,
 ) -> list:
     """Run chunking for a source; logs and swallows failures so callers are not blocked."""
-    strategy = strategy or RecursiveChunker(chunk_size=1500)
+    if strategy is None:
+        from rhesis.sdk.services.chunker import RecursiveChunker
+
+        strategy = RecursiveChunker(chunk_size=1500)
     try:
         # Create a sub-transaction to protect the main session from errors inside this block
         with db.begin_nested():
@@ -3,7 +3,7 @@
 import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from sqlalchemy.orm import Session
 
@@ -12,6 +12,7 @@ from rhesis.backend.app.crud import model as model_crud
 from rhesis.backend.app.crud.embedding import (
     create_embedding,
     get_embedding_by_hash,
+    get_embedding_ids_by_hash,
     mark_embeddings_stale,
 )
 from rhesis.backend.app.models.embedding import EmbeddingConfig
@@ -27,6 +28,10 @@ from rhesis.sdk.models.factory import get_model
 
 logger = logging.getLogger(__name__)
 
+# Texts per provider request in generate_batch; providers cap the inputs (and
+# tokens) a single embedding request may carry
+DEFAULT_BATCH_SIZE = 32
+
 
 class _NoEmbeddingProviderConfigured(Exception):
     """Raised internally when the embedder resolves to the Rhesis native provider.
@@ -159,6 +164,102 @@ class EmbeddingGenerator:
         logger.info("Embedding already exists for %s:%s%s", entity_type, entity_id, suffix)
         return {"status": "success", "embedding_id": str(existing.id)}
 
+    def _store_embedding(
+        self,
+        *,
+        entity_id: str,
+        entity_type: str,
+        organization_id: str,
+        user_id: str,
+        model_id: str,
+        db_model: models.Model,
+        searchable_text: str,
+        text_hash: str,
+        embedding_vector: Sequence[float],
+        active_status: Any,
+        stale_status: Any,
+    ) -> Dict[str, Any]:
+        """Persist a generated vector as the entity's active embedding."""
+        vec_dim = len(embedding_vector)
+        if vec_dim not in EmbeddingConfig.SUPPORTED_DIMENSIONS:
+            supported = sorted(EmbeddingConfig.SUPPORTED_DIMENSIONS.keys())
+            raise ValueError(
+                f"Embedding length {vec_dim} is not supported for persistence "
+                f"(supported dimensions: {supported})"
+            )
+
+        # Persisted config uses actual vector length so storage matches embedding_* columns.
+        config = self._embedding_config_dict(db_model, model_id, vec_dim)
+        config_hash = self._compute_hash(config)
+
+        duplicate = self._return_if_embedding_exists(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            organization_id=organization_id,
+            config_hash=config_hash,
+            text_hash=text_hash,
+            status_id=active_status.id,
+        )
+        if duplicate is not None:
+            return duplicate
+
+        # Mark old embeddings as stale (different text/config)
+        stale_count = mark_embeddings_stale(
+            self.db,
+            entity_id=entity_id,
+            entity_type=entity_type,
+            organization_id=organization_id,
+            active_status_id=active_status.id,
+            stale_status_id=stale_status.id,
+        )
+
+        if stale_count > 0:
+            logger.info(f"Marked {stale_count} old embeddings as stale")
+
+        # Create and store the embedding
+        embedding_create = schemas.EmbeddingCreate(
+            entity_id=entity_id,
+            entity_type=entity_type,
+            model_id=model_id,
+            embedding_config=config,
+            config_hash=config_hash,
+            searchable_text=searchable_text,
+            text_hash=text_hash,
+            status_id=active_status.id,
+            embedding=embedding_vector,
+        )
+
+        from sqlalchemy.exc import IntegrityError
+
+        try:
+            with self.db.begin_nested():
+                new_embedding = create_embedding(
+                    self.db,
+                    embedding=embedding_create,
+                    organization_id=organization_id,
+                    user_id=user_id,
+                )
+        except IntegrityError:
+            # Race condition: another process might have created it
+            raced = self._return_if_embedding_exists(
+                entity_id=entity_id,
+                entity_type=entity_type,
+                organization_id=organization_id,
+                config_hash=config_hash,
+                text_hash=text_hash,
+                status_id=active_status.id,
+                after_race=True,
+            )
+            if raced is not None:
+                return raced
+            raise
+
+        logger.info(
+            f"Successfully generated embedding for {entity_type}:{entity_id}, dimension={vec_dim}"
+        )
+
+        return {"status": "success", "embedding_id": str(new_embedding.id)}
+
     def generate(
         self,
         entity_id: str,
@@ -261,82 +362,172 @@ class EmbeddingGenerator:
                 )
             raise ValueError(f"Failed to generate embedding: {e}")
 
-        vec_dim = len(embedding_vector)
-        if vec_dim not in EmbeddingConfig.SUPPORTED_DIMENSIONS:
-            supported = sorted(EmbeddingConfig.SUPPORTED_DIMENSIONS.keys())
-            raise ValueError(
-                f"Embedding length {vec_dim} is not supported for persistence "
-                f"(supported dimensions: {supported})"
-            )
-
-        # Persisted config uses actual vector length so storage matches embedding_* columns.
-        config = self._embedding_config_dict(db_model, model_id, vec_dim)
-        config_hash = self._compute_hash(config)
-
-        duplicate = self._return_if_embedding_exists(
+        return self._store_embedding(
             entity_id=entity_id,
             entity_type=entity_type,
             organization_id=organization_id,
-            config_hash=config_hash,
+            user_id=user_id,
+            model_id=model_id,
+            db_model=db_model,
+            searchable_text=searchable_text,
             text_hash=text_hash,
-            status_id=active_status.id,
+            embedding_vector=embedding_vector,
+            active_status=active_status,
+            stale_status=stale_status,
         )
-        if duplicate is not None:
-            return duplicate
 
-        # Mark old embeddings as stale (different text/config)
-        stale_count = mark_embeddings_stale(
-            self.db,
-            entity_id=entity_id,
-            entity_type=entity_type,
-            organization_id=organization_id,
-            active_status_id=active_status.id,
-            stale_status_id=stale_status.id,
-        )
+    def generate_batch(
+        self,
+        entity_ids: Sequence[str],
+        entity_type: str,
+        organization_id: str,
+        user_id: str,
+        model_id: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        embedder: Optional[Any] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate embeddings for many entities of one type with batched provider calls.
 
-        if stale_count > 0:
-            logger.info(f"Marked {stale_count} old embeddings as stale")
+        Same outcome per entity as :meth:`generate`, but the model row, embedder
+        and statuses are resolved once, the entities are loaded in one query and
+        their texts go to ``embedder.generate_batch`` ``batch_size`` at a time
+        instead of one provider request per entity. Entities whose current text
+        is already embedded are found with one query and not re-embedded.
 
-        # Create and store the embedding
-        embedding_create = schemas.EmbeddingCreate(
-            entity_id=entity_id,
-            entity_type=entity_type,
-            model_id=model_id,
-            embedding_config=config,
-            config_hash=config_hash,
-            searchable_text=searchable_text,
-            text_hash=text_hash,
-            status_id=active_status.id,
-            embedding=embedding_vector,
-        )
+        Args:
+            entity_ids: IDs of the entities to embed
+            entity_type: Type of entity (Test, Chunk, etc.)
+            organization_id: Organization context
+            user_id: User context
+            model_id: ID of the embedding model to use
+            batch_size: Texts per provider request
+            embedder: Optional pre-resolved embedder. If missing, it is resolved from user settings.
 
-        from sqlalchemy.exc import IntegrityError
+        Returns:
+            ``{entity_id: result}`` where each result is one of the dicts
+            :meth:`generate` returns, or ``{"status": "failed", "embedding_id":
+            None}`` when the entity was not found or its batch could not be
+            embedded or stored.
+
+        Raises:
+            ModelConfigurationError: The provider rejected a request permanently
+                (bad key, unknown model); later batches would fail the same way.
+        """
+        results: Dict[str, Dict[str, Any]] = {
+            str(entity_id): {"status": "failed", "embedding_id": None} for entity_id in entity_ids
+        }
+        if not results:
+            return results
 
         try:
-            with self.db.begin_nested():
-                new_embedding = create_embedding(
-                    self.db,
-                    embedding=embedding_create,
-                    organization_id=organization_id,
-                    user_id=user_id,
-                )
-        except IntegrityError:
-            # Race condition: another process might have created it
-            raced = self._return_if_embedding_exists(
-                entity_id=entity_id,
+            model_class = getattr(models, entity_type)
+        except AttributeError:
+            raise ValueError(f"Entity type {entity_type} not found")
+        if not hasattr(model_class, "to_searchable_text"):
+            raise ValueError(f"Entity {entity_type} does not support embedding")
+
+        db_model = model_crud.get_model(self.db, model_id=model_id, organization_id=organization_id)
+        if not db_model:
+            raise ValueError(f"Model not found: {model_id}")
+
+        try:
+            embedder = self._resolve_embedder(user_id=user_id, db_model=db_model, embedder=embedder)
+        except _NoEmbeddingProviderConfigured as e:
+            logger.warning("Skipping %s %s embeddings: %s", len(results), entity_type, e)
+            return {
+                entity_id: {"status": "skipped_no_provider", "embedding_id": None}
+                for entity_id in results
+            }
+
+        active_status = self._get_status(EmbeddingStatus.ACTIVE, organization_id, user_id)
+        stale_status = self._get_status(EmbeddingStatus.STALE, organization_id, user_id)
+
+        from rhesis.backend.app.utils.query_utils import QueryBuilder
+
+        wanted = list(results)
+        entities = (
+            QueryBuilder(self.db, model_class)
+            .with_organization_filter(organization_id)
+            .with_visibility_filter()
+            .with_custom_filter(lambda q: q.filter(model_class.id.in_(wanted)))
+            .all()
+        )
+
+        texts: Dict[str, str] = {}
+        for entity in entities:
+            entity_id = str(entity.id)
+            searchable_text = entity.to_searchable_text()
+            if not (searchable_text or "").strip():
+                results[entity_id] = {"status": "skipped_empty_text", "embedding_id": None}
+            else:
+                texts[entity_id] = searchable_text
+        text_hashes = {entity_id: self._compute_hash(text) for entity_id, text in texts.items()}
+
+        # As in generate(): when model.dimension is set, entities whose text
+        # is already embedded with this config are not sent to the provider.
+        if db_model.dimension is not None:
+            preview_config = self._embedding_config_dict(db_model, model_id, db_model.dimension)
+            existing = get_embedding_ids_by_hash(
+                self.db,
+                text_hashes,
                 entity_type=entity_type,
                 organization_id=organization_id,
-                config_hash=config_hash,
-                text_hash=text_hash,
+                config_hash=self._compute_hash(preview_config),
                 status_id=active_status.id,
-                after_race=True,
             )
-            if raced is not None:
-                return raced
-            raise
-
-        logger.info(
-            f"Successfully generated embedding for {entity_type}:{entity_id}, dimension={vec_dim}"
-        )
-
-        return {"status": "success", "embedding_id": str(new_embedding.id)}
+            for entity_id, embedding_id in existing.items():
+                results[entity_id] = {"status": "success", "embedding_id": embedding_id}
+            if existing:
+                logger.info(
+                    "Embeddings already exist for %s of %s %s entities",
+                    len(existing),
+                    len(texts),
+                    entity_type,
+                )
+        else:
+            existing = {}
+        pending = [
+            (entity_id, text) for entity_id, text in texts.items() if entity_id not in existing
+        ]
+
+        for start in range(0, len(pending), max(1, batch_size)):
+            batch = pending[start : start + max(1, batch_size)]
+            try:
+                vectors = embedder.generate_batch([text for _, text in batch])
+                if len(vectors) != len(batch):
+                    raise ValueError(f"Got {len(vectors)} embeddings for {len(batch)} texts")
+            except Exception as e:
+                if is_permanent_model_error(e):
+                    raise ModelConfigurationError(
+                        f"Failed to generate embedding: {e}", original_error=e
+                    )
+                logger.warning(
+                    "Failed to generate %s %s embeddings in one batch: %s",
+                    len(batch),
+                    entity_type,
+                    e,
+                )
+                continue
+
+            for (entity_id, searchable_text), vector in zip(batch, vectors):
+                try:
+                    results[entity_id] = self._store_embedding(
+                        entity_id=entity_id,
+                        entity_type=entity_type,
+                        organization_id=organization_id,
+                        user_id=user_id,
+                        model_id=model_id,
+                        db_model=db_model,
+                        searchable_text=searchable_text,
+                        text_hash=text_hashes[entity_id],
+                        embedding_vector=vector,
+                        active_status=active_status,
+                        stale_status=stale_status,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Failed to store embedding for %s:%s: %s", entity_type, entity_id, e
+                    )
+
+        return results
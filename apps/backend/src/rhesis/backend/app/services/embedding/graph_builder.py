@@ -1,25 +1,104 @@
-"""Build graph structures from stored embeddings (UMAP, clustering, etc.)."""
+"""Build graph structures from stored embeddings (UMAP, clustering, etc.).
+
+A full build fits UMAP and HDBSCAN over every embedding and asks the user's
+generation model to name each cluster. ``refresh_2d_graph`` keeps what that
+fit produced (``GraphModel``, pickled to storage by the graph tasks) and on
+the next refresh only projects the new points into it with
+``UMAP.transform`` and ``hdbscan.approximate_predict``; it refits once
+enough points were added or removed, or once new points stop landing in the
+fitted clusters.
+"""
 
 import logging
+import os
+import pickle
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID
 
 import numpy as np
-from hdbscan import HDBSCAN
 from sqlalchemy.orm import Session
-from umap import UMAP
 
 from rhesis.backend.app import models
 from rhesis.backend.app.crud.embedding import get_active_embeddings_for_entities
 from rhesis.backend.app.models.test import Test
 from rhesis.backend.app.models.user import User
 from rhesis.backend.app.schemas.embedding import Cluster, Scatter2DGraph, ScatterPoint2D
+from rhesis.backend.app.services.storage_service import StorageService
 from rhesis.backend.app.utils.user_model_utils import get_user_generation_model
 from rhesis.sdk.models.factory import get_model
 
 logger = logging.getLogger(__name__)
 
+# Bump when GraphModel changes shape; stored models of another version are refit
+GRAPH_MODEL_VERSION = 1
+# Smaller graphs are refit every time; fitting them takes about as long as projecting
+GRAPH_MODEL_MIN_POINTS = int(os.getenv("EMBEDDING_GRAPH_MODEL_MIN_POINTS", "50"))
+# Refit once points added + removed since the fit exceed this fraction of it
+GRAPH_REFIT_FRACTION = float(os.getenv("EMBEDDING_GRAPH_REFIT_FRACTION", "0.2"))
+# Refit once at least GRAPH_DRIFT_MIN_POINTS projected points land in noise this
+# much more often than the fitted points did
+GRAPH_DRIFT_TOLERANCE = float(os.getenv("EMBEDDING_GRAPH_DRIFT_TOLERANCE", "0.15"))
+GRAPH_DRIFT_MIN_POINTS = int(os.getenv("EMBEDDING_GRAPH_DRIFT_MIN_POINTS", "20"))
+
+
+@dataclass
+class GraphModel:
+    """What a full graph fit produced, kept to place later points without refitting."""
+
+    config_hash: str
+    reducer: Any  # UMAP into the clustering space
+    reducer_2d: Any  # UMAP from there to 2D; None when the clustering space is 2D
+    clusterer: Any  # HDBSCAN fitted with prediction_data
+    labels: dict[int, str]
+    fitted_ids: frozenset[UUID]  # embedding IDs the fit saw
+    noise_rate: float  # share of fitted points HDBSCAN left as noise
+    # embedding ID -> (cluster index, x, y), fitted and projected points
+    points: dict[UUID, tuple[int, float, float]] = field(default_factory=dict)
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = GRAPH_MODEL_VERSION
+
+
+_storage_service: StorageService | None = None
+
+
+def _get_storage() -> StorageService:
+    global _storage_service
+    if _storage_service is None:
+        _storage_service = StorageService()
+    return _storage_service
+
+
+def load_graph_model(path: str) -> GraphModel | None:
+    """Read a model saved by ``save_graph_model``; None if missing or unreadable."""
+    raw = _get_storage().get_object_bytes(path)
+    if raw is None:
+        return None
+    try:
+        # Only ever written by save_graph_model into the backend's own storage
+        model = pickle.loads(raw)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable embedding graph model at {path}: {e}")
+        return None
+    if not isinstance(model, GraphModel) or model.version != GRAPH_MODEL_VERSION:
+        return None
+    return model
+
+
+def save_graph_model(path: str, model: GraphModel) -> None:
+    """Store *model* at *path*; a failure only costs the next refresh a full fit."""
+    try:
+        payload = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        _get_storage().put_object_bytes(payload, path, "application/octet-stream")
+    except Exception as e:
+        logger.warning(
+            "Failed to persist embedding graph model to %s (%s); next refresh refits",
+            path,
+            e,
+        )
+
 
 def _embedding_entity_type_key(model_or_name: type | str) -> str:
     return model_or_name if isinstance(model_or_name, str) else model_or_name.__name__
@@ -44,8 +123,25 @@ def fetch_embeddings(
     )
 
 
-def _reduce_dimensions(X: np.ndarray, purpose: str) -> np.ndarray:
-    """Reduce the dimensions of the embeddings (requires n_samples >= 3)."""
+def ambiguous_embeddings(embeddings: Sequence[models.Embedding]) -> tuple[bool, bool]:
+    """Return (mixed_config, duplicate_entity) for a set of active embeddings.
+
+    Either one means the vectors do not share one space per entity and must
+    not be compared with each other.
+    """
+    config_hashes = {e.config_hash for e in embeddings}
+    seen_entity_ids: set[UUID] = set()
+    duplicate_entity = False
+    for e in embeddings:
+        if e.entity_id in seen_entity_ids:
+            duplicate_entity = True
+            break
+        seen_entity_ids.add(e.entity_id)
+    return len(config_hashes) > 1, duplicate_entity
+
+
+def _fit_reducer(X: np.ndarray, purpose: str) -> Any:
+    """Fit UMAP on the embeddings (requires n_samples >= 3); ``.embedding_`` holds the result."""
     n_samples = X.shape[0]
 
     max_neighbors = max(1, n_samples - 1)
@@ -65,12 +161,15 @@ def _reduce_dimensions(X: np.ndarray, purpose: str) -> np.ndarray:
     else:
         raise ValueError(f"Invalid purpose: {purpose}")
 
+    # umap-learn pulls in numba and pynndescent; import it only when a graph is built
+    from umap import UMAP
+
     umap = UMAP(n_components=n_components, n_neighbors=n_neighbors, random_state=42, init="random")
-    return umap.fit_transform(X)
+    return umap.fit(X)
 
 
-def _cluster_with_hdbscan(X: np.ndarray) -> tuple[np.ndarray, dict[int, np.ndarray]]:
-    """Cluster the embeddings with HDBSCAN."""
+def _fit_clusterer(X: np.ndarray) -> Any:
+    """Fit HDBSCAN on the reduced embeddings; ``.labels_`` holds the cluster IDs."""
     n_samples = X.shape[0]
 
     # 5-10% of dataset, min 3, max 20, never exceeding n_samples
@@ -82,22 +181,35 @@ def _cluster_with_hdbscan(X: np.ndarray) -> tuple[np.ndarray, dict[int, np.ndarr
     min_samples = max(2, min_cluster_size // 2)
     min_samples = min(min_samples, n_samples)
 
+    from hdbscan import HDBSCAN
+
+    # prediction_data lets approximate_predict place new points without a refit
     clusterer = HDBSCAN(
         min_cluster_size=min_cluster_size,
         min_samples=min_samples,
         metric="euclidean",
         cluster_selection_epsilon=0.5,
+        prediction_data=True,
     )
-    cluster_ids = clusterer.fit_predict(X)
+    return clusterer.fit(X)
+
+
+def _predict_clusters(clusterer: Any, X: np.ndarray) -> np.ndarray:
+    """Assign new reduced points to the clusters of a fitted HDBSCAN (-1: noise)."""
+    from hdbscan import approximate_predict
+
+    cluster_ids, _strengths = approximate_predict(clusterer, X)
+    return cluster_ids
 
+
+def _cluster_centroids(X: np.ndarray, cluster_ids: np.ndarray) -> dict[int, np.ndarray]:
     centroids = {}
     for cluster_id in np.unique(cluster_ids):
         if cluster_id == -1:  # Skip noise points
             continue
         mask = cluster_ids == cluster_id
         centroids[int(cluster_id)] = X[mask].mean(axis=0)
-
-    return cluster_ids, centroids
+    return centroids
 
 
 _CLUSTER_LABEL_PROMPT = """\
@@ -217,6 +329,152 @@ def _trivial_two_point_graph(
     )
 
 
+def _assemble_graph(
+    embeddings: list[models.Embedding],
+    cluster_ids: Sequence[int],
+    coords_2d: Sequence[Sequence[float]],
+    cluster_labels: dict[int, str],
+    now_utc: datetime,
+) -> Scatter2DGraph:
+    # Build scatter points
+    points = []
+    for embedding, cluster_id, coords in zip(embeddings, cluster_ids, coords_2d):
+        points.append(
+            _scatter_point(
+                embedding,
+                int(cluster_id),
+                float(coords[0]),
+                float(coords[1]),
+            )
+        )
+
+    # Build clusters
+    cluster_counts = {}
+    for cluster_id in cluster_ids:
+        cluster_id = int(cluster_id)
+        if cluster_id == -1:
+            continue
+        cluster_counts[cluster_id] = cluster_counts.get(cluster_id, 0) + 1
+
+    clusters = [
+        Cluster(
+            cluster_index=cluster_id,
+            label=cluster_labels.get(cluster_id, "Unlabeled"),
+            size=cluster_counts[cluster_id],
+        )
+        for cluster_id in sorted(cluster_counts.keys())
+    ]
+
+    return Scatter2DGraph(
+        computed_at=now_utc,
+        clusters=clusters,
+        points=points,
+    )
+
+
+def _fit_graph(
+    embeddings: list[models.Embedding],
+    db: Session,
+    user: User,
+    now_utc: datetime,
+) -> tuple[Scatter2DGraph, GraphModel | None]:
+    """Fit UMAP, HDBSCAN and the cluster labels over every embedding."""
+    X = np.array([e.embedding for e in embeddings], dtype=np.float32)
+
+    reducer = _fit_reducer(X, purpose="clustering")
+    umap_50d = reducer.embedding_
+    reducer_2d = None if umap_50d.shape[1] == 2 else _fit_reducer(umap_50d, purpose="visualization")
+    umap_2d = umap_50d if reducer_2d is None else reducer_2d.embedding_
+
+    clusterer = _fit_clusterer(umap_50d)
+    cluster_ids = np.asarray(clusterer.labels_)
+    centroids = _cluster_centroids(umap_50d, cluster_ids)
+
+    cluster_labels = _generate_cluster_labels(
+        embeddings, cluster_ids, umap_50d, centroids, db, user
+    )
+
+    graph = _assemble_graph(embeddings, cluster_ids, umap_2d, cluster_labels, now_utc)
+    if len(embeddings) < GRAPH_MODEL_MIN_POINTS:
+        return graph, None
+
+    model = GraphModel(
+        config_hash=embeddings[0].config_hash,
+        reducer=reducer,
+        reducer_2d=reducer_2d,
+        clusterer=clusterer,
+        labels=cluster_labels,
+        fitted_ids=frozenset(e.id for e in embeddings),
+        noise_rate=float(np.mean(cluster_ids == -1)),
+        points={
+            e.id: (int(cluster_id), float(xy[0]), float(xy[1]))
+            for e, cluster_id, xy in zip(embeddings, cluster_ids, umap_2d)
+        },
+        updated_at=now_utc,
+    )
+    return graph, model
+
+
+def _project_onto_model(
+    model: GraphModel,
+    embeddings: list[models.Embedding],
+    now_utc: datetime,
+) -> Scatter2DGraph | None:
+    """Lay out *embeddings* with *model*, or None when it is due for a refit."""
+    if model.version != GRAPH_MODEL_VERSION or model.config_hash != embeddings[0].config_hash:
+        logger.info("Refitting embedding graph: embedding configuration changed")
+        return None
+
+    current = {e.id for e in embeddings}
+    added = sum(1 for embedding_id in current if embedding_id not in model.fitted_ids)
+    removed = len(model.fitted_ids - current)
+    if added + removed > GRAPH_REFIT_FRACTION * len(model.fitted_ids):
+        logger.info(
+            "Refitting embedding graph: %s added and %s removed since a fit of %s",
+            added,
+            removed,
+            len(model.fitted_ids),
+        )
+        return None
+
+    new = [e for e in embeddings if e.id not in model.points]
+    if new:
+        X = np.array([e.embedding for e in new], dtype=np.float32)
+        reduced = model.reducer.transform(X)
+        coords_2d = reduced if model.reducer_2d is None else model.reducer_2d.transform(reduced)
+        cluster_ids = _predict_clusters(model.clusterer, reduced)
+        for embedding, cluster_id, xy in zip(new, cluster_ids, coords_2d):
+            model.points[embedding.id] = (int(cluster_id), float(xy[0]), float(xy[1]))
+
+    projected = [model.points[e.id][0] for e in embeddings if e.id not in model.fitted_ids]
+    if len(projected) >= GRAPH_DRIFT_MIN_POINTS:
+        noise_rate = projected.count(-1) / len(projected)
+        if noise_rate > model.noise_rate + GRAPH_DRIFT_TOLERANCE:
+            logger.info(
+                "Refitting embedding graph: %.0f%% of projected points are noise (fit: %.0f%%)",
+                100 * noise_rate,
+                100 * model.noise_rate,
+            )
+            return None
+
+    # Projected points that left the graph are forgotten; fitted ones stay
+    # so that removals keep counting towards the refit threshold
+    stale = [i for i in model.points if i not in current and i not in model.fitted_ids]
+    for embedding_id in stale:
+        del model.points[embedding_id]
+    if new or stale:
+        model.updated_at = now_utc
+
+    layout = [model.points[e.id] for e in embeddings]
+    return _assemble_graph(
+        embeddings,
+        [cluster_id for cluster_id, _x, _y in layout],
+        [(x, y) for _cluster_id, x, y in layout],
+        model.labels,
+        now_utc,
+    )
+
+
 def build_2d_graph(
     db: Session,
     entity_ids: Sequence[UUID],
@@ -225,6 +483,29 @@ def build_2d_graph(
     embedded_entity: type | str = Test,
 ) -> Scatter2DGraph:
     """Build a graph from embeddings for visualization and clustering."""
+    graph, _model = refresh_2d_graph(db, entity_ids, user, embedded_entity=embedded_entity)
+    return graph
+
+
+def refresh_2d_graph(
+    db: Session,
+    entity_ids: Sequence[UUID],
+    user: User,
+    *,
+    embedded_entity: type | str = Test,
+    model: GraphModel | None = None,
+) -> tuple[Scatter2DGraph, GraphModel | None]:
+    """Build the graph, reusing *model* from an earlier refresh when it still fits.
+
+    Points the model has seen keep their layout and cluster; new ones are
+    projected into it. UMAP, HDBSCAN and the cluster labels are refit only
+    without a usable model, or once the points changed past
+    ``GRAPH_REFIT_FRACTION`` or drifted away from the clusters.
+
+    Returns:
+        The graph and the model to keep for the next refresh (``None`` when
+        the graph is too small to be worth one).
+    """
 
     requested_count = len(entity_ids)
 
@@ -254,81 +535,30 @@ def build_2d_graph(
         )
 
     if not embeddings:
-        return Scatter2DGraph(computed_at=datetime.now(timezone.utc), clusters=[], points=[])
-
-    config_hashes = {e.config_hash for e in embeddings}
-    seen_entity_ids: set[UUID] = set()
-    duplicate_entity = False
-    for e in embeddings:
-        if e.entity_id in seen_entity_ids:
-            duplicate_entity = True
-            break
-        seen_entity_ids.add(e.entity_id)
+        return Scatter2DGraph(computed_at=datetime.now(timezone.utc), clusters=[], points=[]), None
 
-    if len(config_hashes) > 1 or duplicate_entity:
+    mixed_config, duplicate_entity = ambiguous_embeddings(embeddings)
+    if mixed_config or duplicate_entity:
         logger.warning(
             "Skipping embedding graph: ambiguous active embeddings "
             "(entity_type=%s mixed_config=%s duplicate_entity=%s)",
             entity_type_key,
-            len(config_hashes) > 1,
+            mixed_config,
             duplicate_entity,
         )
-        return Scatter2DGraph(computed_at=datetime.now(timezone.utc), clusters=[], points=[])
+        return Scatter2DGraph(computed_at=datetime.now(timezone.utc), clusters=[], points=[]), None
 
     now_utc = datetime.now(timezone.utc)
     n_samples = len(embeddings)
 
     if n_samples == 1:
-        return _trivial_single_point_graph(embeddings[0], now_utc)
+        return _trivial_single_point_graph(embeddings[0], now_utc), None
     if n_samples == 2:
-        return _trivial_two_point_graph(embeddings, now_utc)
-
-    X = np.array([e.embedding for e in embeddings], dtype=np.float64)
-
-    umap_50d = _reduce_dimensions(X, purpose="clustering")
-    umap_2d = (
-        umap_50d
-        if umap_50d.shape[1] == 2
-        else _reduce_dimensions(umap_50d, purpose="visualization")
-    )
+        return _trivial_two_point_graph(embeddings, now_utc), None
 
-    cluster_ids, centroids = _cluster_with_hdbscan(umap_50d)
+    if model is not None:
+        graph = _project_onto_model(model, embeddings, now_utc)
+        if graph is not None:
+            return graph, model
 
-    cluster_labels = _generate_cluster_labels(
-        embeddings, cluster_ids, umap_50d, centroids, db, user
-    )
-
-    # Build scatter points
-    points = []
-    for embedding, cluster_id, coords_2d in zip(embeddings, cluster_ids, umap_2d):
-        points.append(
-            _scatter_point(
-                embedding,
-                int(cluster_id),
-                float(coords_2d[0]),
-                float(coords_2d[1]),
-            )
-        )
-
-    # Build clusters
-    cluster_counts = {}
-    for cluster_id in cluster_ids:
-        cluster_id = int(cluster_id)
-        if cluster_id == -1:
-            continue
-        cluster_counts[cluster_id] = cluster_counts.get(cluster_id, 0) + 1
-
-    clusters = [
-        Cluster(
-            cluster_index=cluster_id,
-            label=cluster_labels.get(cluster_id, "Unlabeled"),
-            size=cluster_counts[cluster_id],
-        )
-        for cluster_id in sorted(cluster_counts.keys())
-    ]
-
-    return Scatter2DGraph(
-        computed_at=now_utc,
-        clusters=clusters,
-        points=points,
-    )
+    return _fit_graph(embeddings, db, user, now_utc)
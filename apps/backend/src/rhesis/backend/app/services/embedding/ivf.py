@@ -0,0 +1,125 @@
+"""In-process IVF (inverted file) index for cosine nearest-neighbour search.
+
+Fallback for ``similarity.py`` when the database has no pgvector: vectors are
+partitioned by spherical k-means into ~sqrt(n) lists, and a query scans only
+the ``n_probe`` lists whose centroids are closest to it instead of every row.
+Plain numpy, no FAISS; small inputs get a single list, i.e. exact search.
+"""
+
+import math
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Below this many vectors a single list (exact search) is as fast as probing
+MIN_VECTORS_PER_LIST = 64
+# k-means trains on at most this many vectors per list, like FAISS
+MAX_TRAINING_PER_LIST = 256
+# Rows per block when assigning vectors to lists, bounding the n x lists matrix
+_ASSIGN_BLOCK = 4096
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def _assign(unit: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    return np.concatenate(
+        [
+            np.argmax(unit[start : start + _ASSIGN_BLOCK] @ centroids.T, axis=1)
+            for start in range(0, len(unit), _ASSIGN_BLOCK)
+        ]
+    )
+
+
+class IVFIndex:
+    """Cosine-similarity IVF index over a fixed set of vectors.
+
+    Args:
+        vectors: ``(n, d)`` array-like of embeddings
+        ids: One identifier per vector, returned by ``search`` (default: row index)
+        n_lists: Number of inverted lists (default: ~sqrt(n), 1 for small n)
+        n_probe: Lists scanned per query (default: ~sqrt(n_lists)); more
+            probes trade speed for recall
+        iterations: k-means iterations
+        seed: Seed for the k-means initialisation and training sample
+    """
+
+    def __init__(
+        self,
+        vectors: Any,
+        ids: Optional[Sequence[Any]] = None,
+        *,
+        n_lists: Optional[int] = None,
+        n_probe: Optional[int] = None,
+        iterations: int = 10,
+        seed: int = 0,
+    ):
+        unit = _normalize(np.asarray(vectors, dtype=np.float64))
+        if unit.ndim != 2:
+            raise ValueError("vectors must be a 2D array")
+        n = len(unit)
+        ids = list(range(n)) if ids is None else list(ids)
+        if len(ids) != n:
+            raise ValueError(f"Got {len(ids)} ids for {n} vectors")
+
+        if n_lists is None:
+            n_lists = int(math.sqrt(n)) if n >= MIN_VECTORS_PER_LIST * 4 else 1
+        self.n_lists = max(1, min(n_lists, n))
+        self.n_probe = n_probe or max(1, round(math.sqrt(self.n_lists)))
+
+        rng = np.random.default_rng(seed)
+        if self.n_lists == 1:
+            centroids = _normalize(unit.mean(axis=0, keepdims=True)) if n else unit[:0]
+            assignment = np.zeros(n, dtype=np.int64)
+        else:
+            centroids = self._train(unit, rng, iterations)
+            assignment = _assign(unit, centroids)
+
+        # Store rows grouped by list so each list is one contiguous slice
+        order = np.argsort(assignment, kind="stable")
+        self._unit = unit[order]
+        self._ids = [ids[i] for i in order]
+        self._offsets = np.searchsorted(assignment[order], np.arange(self.n_lists + 1))
+        self.centroids = centroids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _train(self, unit: np.ndarray, rng: np.random.Generator, iterations: int) -> np.ndarray:
+        sample_size = min(len(unit), self.n_lists * MAX_TRAINING_PER_LIST)
+        sample = unit[rng.choice(len(unit), size=sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, size=self.n_lists, replace=False)]
+        for _ in range(iterations):
+            assignment = _assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            # A list that lost all its vectors keeps its previous centroid
+            empty = ~sums.any(axis=1)
+            sums[empty] = centroids[empty]
+            centroids = _normalize(sums)
+        return centroids
+
+    def search(
+        self, query: Any, k: int = 10, n_probe: Optional[int] = None
+    ) -> List[Tuple[Any, float]]:
+        """Return up to *k* ``(id, cosine similarity)`` pairs, most similar first."""
+        if not len(self) or k <= 0:
+            return []
+        q = _normalize(np.asarray(query, dtype=np.float64))
+        probe = min(n_probe or self.n_probe, self.n_lists)
+
+        if probe >= self.n_lists:
+            rows = np.arange(len(self))
+        else:
+            lists = np.argpartition(-(self.centroids @ q), probe - 1)[:probe]
+            rows = np.concatenate(
+                [np.arange(self._offsets[i], self._offsets[i + 1]) for i in lists]
+            )
+
+        scores = self._unit[rows] @ q
+        k = min(k, len(rows))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._ids[rows[i]], float(scores[i])) for i in top]
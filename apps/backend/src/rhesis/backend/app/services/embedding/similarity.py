@@ -0,0 +1,216 @@
+"""Nearest-neighbour queries over stored embeddings.
+
+On PostgreSQL with the ``vector`` extension the search runs in SQL: rows are
+ordered by pgvector's cosine distance (``<=>``) on the dimension's
+``embedding_*`` column, which the partial HNSW indexes from the embedding
+table migration serve, so only ``limit`` rows leave the database.  The
+organization/status filters are applied to the index scan's candidates, so
+a narrow filter can return fewer than ``limit`` rows unless pgvector's
+iterative scans (``hnsw.iterative_scan``, pgvector >= 0.8) are enabled.
+
+Without pgvector (another dialect, or the extension missing) the candidate
+vectors are loaded once into an in-process ``IVFIndex`` (``ivf.py``) that is
+cached per query and rebuilt only when the candidate rows change.
+
+Only embeddings produced with the same configuration (``config_hash``) are
+compared: vectors from different models don't share a space.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from rhesis.backend.app import models
+from rhesis.backend.app.models.embedding import EmbeddingConfig
+from rhesis.backend.app.models.enums import EmbeddingStatus
+from rhesis.backend.app.models.status import Status
+from rhesis.backend.app.models.test import test_test_set_association
+from rhesis.backend.app.services.embedding.ivf import IVFIndex
+
+logger = logging.getLogger(__name__)
+
+# Fallback indexes kept per process: (query, params) -> ((count, updated_at), index)
+MAX_CACHED_INDEXES = 16
+_index_cache: "OrderedDict[Tuple[Any, ...], Tuple[Tuple[Any, ...], IVFIndex]]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+_pgvector_by_url: Dict[str, bool] = {}
+
+
+def pgvector_available(db: Session) -> bool:
+    """True when the session's database can run pgvector queries (cached per URL)."""
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    key = str(bind.url)
+    if key not in _pgvector_by_url:
+        try:
+            found = db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'vector'"))
+            _pgvector_by_url[key] = found.first() is not None
+        except Exception as e:
+            logger.warning(f"Could not check for the pgvector extension: {e}")
+            return False
+    return _pgvector_by_url[key]
+
+
+def _candidates(
+    db: Session,
+    column: Any,
+    *,
+    organization_id: str,
+    entity_type: str,
+    config_hash: Optional[str],
+    entity_ids: Any,
+):
+    query = (
+        db.query(models.Embedding)
+        .join(Status, Status.id == models.Embedding.status_id)
+        .filter(
+            column.isnot(None),
+            models.Embedding.organization_id == UUID(str(organization_id)),
+            models.Embedding.entity_type == entity_type,
+            models.Embedding.deleted_at.is_(None),
+            Status.name == EmbeddingStatus.ACTIVE.value,
+        )
+    )
+    if config_hash:
+        query = query.filter(models.Embedding.config_hash == config_hash)
+    if entity_ids is not None:
+        query = query.filter(models.Embedding.entity_id.in_(entity_ids))
+    return query
+
+
+def _fallback_index(db: Session, candidates, column: Any) -> IVFIndex:
+    """Build, or reuse while its rows are unchanged, the IVF index for *candidates*."""
+    statement = candidates.statement.compile(dialect=db.get_bind().dialect)
+    key = (str(statement), tuple(sorted((k, str(v)) for k, v in statement.params.items())))
+    version = tuple(
+        candidates.with_entities(
+            func.count(models.Embedding.id), func.max(models.Embedding.updated_at)
+        ).one()
+    )
+
+    with _index_cache_lock:
+        cached = _index_cache.get(key)
+        if cached is not None and cached[0] == version:
+            _index_cache.move_to_end(key)
+            return cached[1]
+
+    rows = candidates.with_entities(models.Embedding.entity_id, column).all()
+    index = IVFIndex([vector for _, vector in rows], [entity_id for entity_id, _ in rows])
+    with _index_cache_lock:
+        _index_cache[key] = (version, index)
+        _index_cache.move_to_end(key)
+        while len(_index_cache) > MAX_CACHED_INDEXES:
+            _index_cache.popitem(last=False)
+    return index
+
+
+def find_similar_embeddings(
+    db: Session,
+    vector: Sequence[float],
+    *,
+    organization_id: str,
+    entity_type: str = "Test",
+    config_hash: Optional[str] = None,
+    entity_ids: Any = None,
+    exclude_entity_ids: Sequence[Any] = (),
+    limit: int = 10,
+) -> List[Tuple[UUID, float]]:
+    """Find the entities whose active embeddings are closest to *vector*.
+
+    Args:
+        db: Database session
+        vector: Query embedding; its length selects the ``embedding_*`` column
+        organization_id: Organization whose embeddings are searched
+        entity_type: Embedded entity type (e.g. ``"Test"``)
+        config_hash: Only compare embeddings made with this configuration
+        entity_ids: Optional list or subquery of entity IDs to search within
+        exclude_entity_ids: Entity IDs never returned (e.g. the query's own)
+        limit: Maximum number of results
+
+    Returns:
+        ``(entity_id, cosine similarity)`` pairs, most similar first
+    """
+    dimension = len(vector)
+    EmbeddingConfig.validate_dimension(dimension)
+    column = getattr(models.Embedding, EmbeddingConfig.SUPPORTED_DIMENSIONS[dimension])
+    candidates = _candidates(
+        db,
+        column,
+        organization_id=organization_id,
+        entity_type=entity_type,
+        config_hash=config_hash,
+        entity_ids=entity_ids,
+    )
+    excluded = {UUID(str(entity_id)) for entity_id in exclude_entity_ids}
+
+    if pgvector_available(db):
+        distance = column.cosine_distance(list(vector))
+        if excluded:
+            candidates = candidates.filter(models.Embedding.entity_id.notin_(excluded))
+        rows = (
+            candidates.with_entities(models.Embedding.entity_id, distance.label("distance"))
+            .order_by(distance)
+            .limit(limit)
+            .all()
+        )
+        return [(entity_id, 1.0 - float(distance)) for entity_id, distance in rows]
+
+    index = _fallback_index(db, candidates, column)
+    matches = index.search(vector, limit + len(excluded))
+    return [(entity_id, score) for entity_id, score in matches if entity_id not in excluded][:limit]
+
+
+def find_similar_tests(
+    db: Session,
+    test_id: str,
+    organization_id: str,
+    user_id: Optional[str] = None,
+    limit: int = 10,
+    test_set_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Find the tests most similar to *test_id* by their stored embeddings.
+
+    Searches the organization's live tests, or only those in *test_set_id*.
+    A test without an active embedding has no neighbours.
+
+    Returns:
+        ``{"test_id", "similarity"}`` dicts, most similar first
+    """
+    from rhesis.backend.app.crud.embedding import get_active_embeddings_for_entities
+
+    seeds = get_active_embeddings_for_entities(
+        db,
+        entity_ids=[UUID(str(test_id))],
+        entity_type="Test",
+        organization_id=organization_id,
+        user_id=user_id,
+    )
+    seed = next((e for e in seeds if e.active_dimension), None)
+    if seed is None:
+        return []
+
+    Test = models.Test
+    scope = db.query(Test.id).filter(
+        Test.organization_id == UUID(str(organization_id)), Test.deleted_at.is_(None)
+    )
+    if test_set_id:
+        scope = scope.join(
+            test_test_set_association, test_test_set_association.c.test_id == Test.id
+        ).filter(test_test_set_association.c.test_set_id == UUID(str(test_set_id)))
+
+    matches = find_similar_embeddings(
+        db,
+        list(getattr(seed, seed.embedding_column_name)),
+        organization_id=organization_id,
+        config_hash=seed.config_hash,
+        entity_ids=scope.statement,
+        exclude_entity_ids=[seed.entity_id],
+        limit=limit,
+    )
+    return [{"test_id": entity_id, "similarity": score} for entity_id, score in matches]
@@ -0,0 +1,242 @@
+"""Judge-result cache — Redis DB 8, opt-in per test run.
+
+Re-scoring a run (``reference_test_run_id``) or re-running unchanged tests
+against a stable endpoint evaluates the same metric on the same inputs
+again, and every LLM-judge metric pays for its calls again. With the cache
+enabled, a metric whose result for those exact inputs is already known is
+not evaluated at all.
+
+Cache key format::
+
+    evalcache:v1:{org_id}:{fingerprint}
+
+``fingerprint`` is a hash of the metric config (class, backend, threshold,
+parameters, ...), the judge (provider and model), and the normalised evaluation inputs:
+input, output, expected output, context, and the conversation history,
+metadata and tool calls when there are any. Changing any of them is a miss.
+
+Design decisions:
+
+* **Opt-in.** Judges are not deterministic, so reusing a result is a choice
+  the run makes: ``evaluation_cache: true`` in the test configuration
+  attributes. ``EVALUATION_CACHE=1`` turns it on for every run of a
+  deployment that does not set the attribute; an explicit ``false`` wins.
+* **Fresh evaluation still writes.** ``fresh_evaluation: true`` skips the
+  lookups but stores what it computes, so it doubles as a cache refresh.
+* **Only clean results are stored.** Errors and timeouts are worth
+  retrying, so a result carrying ``error`` is never cached.
+* **Long TTL (7 days, ``EVALUATION_CACHE_TTL``).** The key already covers
+  everything the result depends on; the TTL only bounds storage.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from rhesis.backend.app.services.cache import RedisBackedCache
+from rhesis.backend.app.services.redis_constants import RedisDatabase
+from rhesis.sdk.metrics import MetricConfig
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TTL = 7 * 24 * 3600  # seconds
+_PREFIX = "evalcache:v1"
+
+
+def _ttl() -> int:
+    try:
+        return int(os.getenv("EVALUATION_CACHE_TTL", _DEFAULT_TTL))
+    except ValueError:
+        return _DEFAULT_TTL
+
+
+def _normalise_text(value: Optional[str]) -> Optional[str]:
+    return value.strip() if isinstance(value, str) else value
+
+
+def _judge_identity(judge: Any) -> Optional[str]:
+    if judge is None or isinstance(judge, str):
+        return judge
+    # The same model name can be served by different providers (e.g. OpenAI
+    # and Azure OpenAI), whose judges do not score identically.
+    provider = getattr(judge, "PROVIDER", None) or type(judge).__name__
+    get_model_name = getattr(judge, "get_model_name", None)
+    if callable(get_model_name):
+        return f"{provider}:{get_model_name()}"
+    return provider
+
+
+def evaluation_fingerprint(
+    metric_config: MetricConfig,
+    judge: Any,
+    input_text: Optional[str],
+    output_text: Optional[str],
+    expected_output: Optional[str],
+    context: Optional[List[str]],
+    *,
+    conversation_history: Any = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    tool_calls: Optional[List[Dict[str, Any]]] = None,
+) -> str:
+    """Stable hash of one metric evaluation: what is evaluated, how, and by whom."""
+    if hasattr(conversation_history, "model_dump"):
+        conversation_history = conversation_history.model_dump(mode="json")
+    payload = {
+        "metric": asdict(metric_config),
+        "judge": _judge_identity(judge),
+        "input": _normalise_text(input_text),
+        "output": _normalise_text(output_text),
+        "expected_output": _normalise_text(expected_output),
+        "context": [_normalise_text(c) for c in context or []],
+        "conversation_history": conversation_history,
+        "metadata": metadata,
+        "tool_calls": tool_calls,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class EvaluationResultCache(RedisBackedCache):
+    """Redis-backed metric result store with in-memory fallback."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            redis_db=RedisDatabase.EVALUATION_CACHE,
+            cache_name="EvaluationResultCache",
+            ttl=_ttl(),
+        )
+
+    @staticmethod
+    def _key(organization_id: str, fingerprint: str) -> str:
+        return f"{_PREFIX}:{organization_id}:{fingerprint}"
+
+    def get(self, organization_id: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        raw = self._get(self._key(str(organization_id), fingerprint))
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            logger.warning("EvaluationResultCache: dropping undecodable entry")
+            return None
+
+    def set(self, organization_id: str, fingerprint: str, result: Dict[str, Any]) -> None:
+        self._set(
+            self._key(str(organization_id), fingerprint),
+            json.dumps(result, separators=(",", ":"), default=str),
+        )
+
+
+@dataclass
+class EvaluationCacheStats:
+    """Lookups made by one run."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class RunEvaluationCache:
+    """One run's view of the cache: its organisation, its override, its hit rate."""
+
+    def __init__(
+        self,
+        store: EvaluationResultCache,
+        organization_id: str,
+        *,
+        fresh: bool = False,
+    ) -> None:
+        self._store = store
+        self._organization_id = str(organization_id)
+        self.fresh = fresh
+        self._lock = threading.Lock()
+        self._stats = EvaluationCacheStats()
+
+    def lookup(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """The cached result, or None on a miss (always None for a fresh run)."""
+        result = None
+        if not self.fresh:
+            try:
+                result = self._store.get(self._organization_id, fingerprint)
+            except Exception as e:
+                logger.warning(f"Evaluation cache lookup failed: {e}")
+        with self._lock:
+            if result is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        return result
+
+    def store(self, fingerprint: str, result: Optional[Dict[str, Any]]) -> None:
+        """Cache *result* unless it is an error or timeout."""
+        if not result or result.get("error") is not None:
+            return
+        try:
+            self._store.set(self._organization_id, fingerprint, result)
+        except Exception as e:
+            logger.warning(f"Evaluation cache write failed: {e}")
+
+    async def a_lookup(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """``lookup`` off the event loop (the Redis client is synchronous)."""
+        if self.fresh:
+            return self.lookup(fingerprint)
+        return await asyncio.to_thread(self.lookup, fingerprint)
+
+    async def a_store(self, fingerprint: str, result: Optional[Dict[str, Any]]) -> None:
+        """``store`` off the event loop (the Redis client is synchronous)."""
+        if not result or result.get("error") is not None:
+            return
+        await asyncio.to_thread(self.store, fingerprint, result)
+
+    def stats(self) -> EvaluationCacheStats:
+        with self._lock:
+            return EvaluationCacheStats(hits=self._stats.hits, misses=self._stats.misses)
+
+
+def _is_enabled(value: Any) -> bool:
+    # Attributes come from JSON and env vars, so "false" must not count as set
+    return str(value).strip().lower() in ("1", "true", "yes")
+
+
+def evaluation_cache_requested(attributes: Optional[Dict[str, Any]]) -> bool:
+    """Whether a run with these test configuration attributes uses the cache.
+
+    The run's own ``evaluation_cache`` attribute decides, including an
+    explicit false; ``EVALUATION_CACHE`` is only the default for runs that
+    do not set it.
+    """
+    requested = (attributes or {}).get("evaluation_cache")
+    if requested is None:
+        requested = os.getenv("EVALUATION_CACHE", False)
+    return _is_enabled(requested)
+
+
+def fresh_evaluation_requested(attributes: Optional[Dict[str, Any]]) -> bool:
+    """Whether a run with these test configuration attributes skips cache lookups."""
+    return _is_enabled((attributes or {}).get("fresh_evaluation", False))
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+
+_result_cache = EvaluationResultCache()
+
+
+def initialize_cache() -> None:
+    """Initialize the evaluation result cache (call at worker startup)."""
+    _result_cache.initialize()
+
+
+def get_evaluation_result_cache() -> EvaluationResultCache:
+    """Return the process-global evaluation result cache instance."""
+    return _result_cache
@@ -3,22 +3,30 @@ Garak integration service module.
 
 This module provides integration with NVIDIA's Garak LLM vulnerability scanner,
 allowing users to import Garak probes as Rhesis test sets.
+
+The exported classes are imported lazily: ``GarakImporter`` pulls in the CRUD
+layer and with it the database engine, which the build-time probe snapshot
+(``snapshot.py``) and its enumeration worker processes must not need. They
+import ``cache``/``probes`` directly.
 """
 
-from .cache import GarakProbeCache
-from .dynamic import GarakDynamicGenerator
-from .importer import GarakImporter
-from .probes import GarakProbeService
-from .sync import GarakSyncService
-from .tag_catalog import GarakTagCatalog
-from .taxonomy import GarakTaxonomy
+import importlib as _importlib
+
+_LAZY_MAP = {
+    "GarakDynamicGenerator": "rhesis.backend.app.services.garak.dynamic",
+    "GarakProbeCache": "rhesis.backend.app.services.garak.cache",
+    "GarakProbeService": "rhesis.backend.app.services.garak.probes",
+    "GarakImporter": "rhesis.backend.app.services.garak.importer",
+    "GarakSyncService": "rhesis.backend.app.services.garak.sync",
+    "GarakTagCatalog": "rhesis.backend.app.services.garak.tag_catalog",
+    "GarakTaxonomy": "rhesis.backend.app.services.garak.taxonomy",
+}
+
+__all__ = list(_LAZY_MAP)
+
 
-__all__ = [
-    "GarakDynamicGenerator",
-    "GarakProbeCache",
-    "GarakProbeService",
-    "GarakImporter",
-    "GarakSyncService",
-    "GarakTagCatalog",
-    "GarakTaxonomy",
-]
+def __getattr__(name: str):
+    if name in _LAZY_MAP:
+        mod = _importlib.import_module(_LAZY_MAP[name])
+        return getattr(mod, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,11 +7,17 @@ This module implements a two-level cache for Garak probe data:
 
 The cache is version-aware: keys include the garak version, so upgrading
 garak automatically invalidates the cache.
+
+Images also ship a probe snapshot generated at build time (see
+``snapshot.py``). When its garak and schema versions match the installed
+ones, it seeds L1 at startup, so no process ever has to enumerate.
 """
 
 import json
 import logging
+import os
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, ClassVar, Dict, List, Optional
 from urllib.parse import urlparse, urlunparse
 
@@ -22,6 +28,13 @@ from rhesis.backend.app.services.redis_constants import RedisDatabase
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SNAPSHOT_PATH = Path(__file__).with_name("probe_snapshot.json")
+
+
+def snapshot_path() -> Path:
+    """Location of the build-time probe snapshot (``GARAK_PROBE_SNAPSHOT_PATH``)."""
+    return Path(os.getenv("GARAK_PROBE_SNAPSHOT_PATH") or DEFAULT_SNAPSHOT_PATH)
+
 
 class GarakProbeCache:
     """
@@ -52,6 +65,7 @@ class GarakProbeCache:
     _redis_read_client: ClassVar[Optional[redis.Redis]] = None
     _has_separate_read: ClassVar[bool] = False
     _initialized: ClassVar[bool] = False
+    _snapshot_checked: ClassVar[bool] = False
 
     @classmethod
     async def initialize(cls) -> None:
@@ -177,6 +191,55 @@ class GarakProbeCache:
             cls._redis_client = None
             logger.info("Garak probe cache: Redis connection closed")
         cls._initialized = False
+        cls._snapshot_checked = False
+
+    @classmethod
+    def load_snapshot(cls, garak_version: str, path: Optional[Path] = None) -> bool:
+        """
+        Seed the memory cache from the build-time snapshot, if it matches.
+
+        Only the first call per process reads the file. A snapshot for another
+        garak version or schema version is ignored, and callers fall back to
+        Redis or live enumeration as before.
+
+        Args:
+            garak_version: The installed garak version string
+            path: Snapshot file (defaults to ``snapshot_path()``)
+
+        Returns:
+            True if the snapshot was loaded into the memory cache
+        """
+        if cls._snapshot_checked:
+            return False
+        cls._snapshot_checked = True
+
+        path = path or snapshot_path()
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Garak probe snapshot unreadable ({path}): {e}")
+            return False
+
+        if (
+            data.get("garak_version") != garak_version
+            or data.get("schema_version") != cls.SCHEMA_VERSION
+        ):
+            logger.info(
+                f"Garak probe snapshot ignored: built for garak "
+                f"{data.get('garak_version')} / schema {data.get('schema_version')}, "
+                f"running garak {garak_version} / schema {cls.SCHEMA_VERSION}"
+            )
+            return False
+
+        cls._memory_cache[cls._cache_key(garak_version)] = data
+        logger.info(
+            f"Garak probe cache loaded from snapshot: {len(data.get('modules', []))} "
+            f"modules (v{garak_version}, generated {data.get('cached_at')})"
+        )
+        return True
 
     @classmethod
     def _cache_key(cls, garak_version: str) -> str:
@@ -245,6 +308,16 @@ class GarakProbeCache:
         # Cache miss - caller will log this at INFO level
         return None
 
+    @classmethod
+    def with_metadata(cls, garak_version: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Probe data as stored: versions and generation time added."""
+        return {
+            **data,
+            "garak_version": garak_version,
+            "schema_version": cls.SCHEMA_VERSION,
+            "cached_at": datetime.now(timezone.utc).isoformat(),
+        }
+
     @classmethod
     async def set(cls, garak_version: str, data: Dict[str, Any]) -> None:
         """
@@ -255,14 +328,7 @@ class GarakProbeCache:
             data: The probe data to cache (modules, probes, metadata)
         """
         cache_key = cls._cache_key(garak_version)
-
-        # Add cache metadata
-        cache_data = {
-            **data,
-            "garak_version": garak_version,
-            "schema_version": cls.SCHEMA_VERSION,
-            "cached_at": datetime.now(timezone.utc).isoformat(),
-        }
+        cache_data = cls.with_metadata(garak_version, data)
 
         # L1: Store in memory cache
         cls._memory_cache[cache_key] = cache_data
@@ -3,13 +3,25 @@ Garak probe enumeration service.
 
 This module provides the main service class for discovering and
 extracting Garak probes for import into Rhesis as test sets.
+
+A cold enumeration imports every ``garak.probes.*`` module and instantiates
+its probes, which is slow and leaves all of those imports resident. It is
+therefore spread over a pool of spawned processes (``GARAK_ENUMERATION_WORKERS``,
+default up to 4; ``0`` enumerates in-process in a thread as before), so none
+of that lands in the API process, which only receives the serialised results.
 """
 
 import asyncio
+import concurrent.futures
+import contextlib
 import importlib
+import io
 import logging
+import multiprocessing
+import os
 import pkgutil
-from typing import Any, Dict, List, Optional
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional, Tuple
 
 from rhesis.backend.app.services.garak import compat
 
@@ -47,6 +59,61 @@ def _get_enumeration_lock() -> asyncio.Lock:
     return lock
 
 
+DEFAULT_ENUMERATION_WORKERS = 4
+
+
+def enumeration_workers() -> int:
+    """Size of the enumeration process pool; 0 means enumerate in-process."""
+    try:
+        return max(
+            0,
+            int(
+                os.getenv(
+                    "GARAK_ENUMERATION_WORKERS",
+                    min(DEFAULT_ENUMERATION_WORKERS, os.cpu_count() or 1),
+                )
+            ),
+        )
+    except ValueError:
+        return DEFAULT_ENUMERATION_WORKERS
+
+
+@contextlib.contextmanager
+def _quiet_garak():
+    """Silence garak's print statements and logging while probes are loaded.
+
+    Only garak's own logger is raised: the root logger is shared with every
+    concurrent request.
+    """
+    null_output = io.StringIO()
+    garak_logger = logging.getLogger("garak")
+    original_level = garak_logger.level
+    try:
+        garak_logger.setLevel(logging.CRITICAL)
+        with contextlib.redirect_stdout(null_output), contextlib.redirect_stderr(null_output):
+            yield
+    finally:
+        garak_logger.setLevel(original_level)
+
+
+def _discover_in_subprocess() -> List[str]:
+    """Process-pool entry point: the probe module names."""
+    return GarakProbeService()._discover_probe_modules()
+
+
+def _enumerate_module_in_subprocess(
+    module_name: str,
+) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    """Process-pool entry point: one module's info and probes, as plain dicts."""
+    service = GarakProbeService()
+    with _quiet_garak():
+        module_info = service._get_module_info(module_name)
+        if module_info is None:
+            return None
+        probes = service.extract_probes_from_module(module_name)
+    return asdict(module_info), [asdict(probe) for probe in probes]
+
+
 class GarakProbeService:
     """Service for enumerating and extracting Garak probes."""
 
@@ -507,6 +574,94 @@ class GarakProbeService:
 
         return all_probes
 
+    def enumerate_in_subprocesses(
+        self, max_workers: Optional[int] = None
+    ) -> tuple[List[GarakModuleInfo], Dict[str, List[GarakProbeInfo]]]:
+        """
+        Enumerate every probe module in a pool of spawned processes.
+
+        Each module is imported and its probes instantiated in a child process,
+        in parallel; only the serialised results come back. Results are also
+        stored in this instance's caches, as a sequential enumeration would.
+
+        Args:
+            max_workers: Pool size (defaults to ``enumeration_workers()``)
+
+        Returns:
+            Tuple of (modules, probes_by_module), modules in name order
+
+        Raises:
+            RuntimeError: If garak package is not installed
+        """
+        workers = max_workers or enumeration_workers() or 1
+        # Spawned, not forked: a forked child would start with a copy of
+        # the whole API process, and anything it imported would die with it
+        # anyway; spawn keeps the children small and the parent untouched.
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            try:
+                module_names = pool.submit(_discover_in_subprocess).result()
+            except ImportError as e:
+                logger.error(f"Garak package not installed: {e}")
+                raise RuntimeError("Garak package is not installed") from e
+
+            futures = {
+                name: pool.submit(_enumerate_module_in_subprocess, name) for name in module_names
+            }
+            modules: List[GarakModuleInfo] = []
+            probes_by_module: Dict[str, List[GarakProbeInfo]] = {}
+            for name, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to enumerate probe module {name}: {e}")
+                    continue
+                if result is None:
+                    continue
+                module_dict, probe_dicts = result
+                module_info = GarakModuleInfo(**module_dict)
+                probes = [GarakProbeInfo(**p) for p in probe_dicts]
+                modules.append(module_info)
+                self._probe_cache[name] = module_info
+                self._probe_info_cache[name] = probes
+                if probes:
+                    probes_by_module[name] = probes
+
+        return modules, probes_by_module
+
+    def generate_probe_data(
+        self,
+    ) -> tuple[List[GarakModuleInfo], Dict[str, List[GarakProbeInfo]]]:
+        """
+        Enumerate all modules and their probes, uncached.
+
+        Uses the process pool unless ``GARAK_ENUMERATION_WORKERS=0``, and
+        falls back to enumerating in-process if the pool breaks.
+
+        Returns:
+            Tuple of (modules, probes_by_module)
+        """
+        workers = enumeration_workers()
+        if workers > 0:
+            try:
+                return self.enumerate_in_subprocesses(workers)
+            except (concurrent.futures.process.BrokenProcessPool, OSError) as e:
+                # A worker that cannot be spawned or dies mid-import (e.g. OOM
+                # killed) must not leave the probe list empty.
+                logger.warning(f"Garak enumeration pool failed, enumerating in-process: {e}")
+
+        with _quiet_garak():
+            modules = self.enumerate_probe_modules()
+
+            probes_by_module: Dict[str, List[GarakProbeInfo]] = {}
+            for module in modules:
+                probes = self.extract_probes_from_module(module.name)
+                if probes:
+                    probes_by_module[module.name] = probes
+
+        return modules, probes_by_module
+
     async def enumerate_probe_modules_cached(
         self,
     ) -> tuple[List[GarakModuleInfo], Dict[str, List[GarakProbeInfo]]]:
@@ -530,6 +685,9 @@ class GarakProbeService:
         # Ensure Redis is connected — idempotent, safe to call outside app lifespan
         # (e.g. tests, management commands, workers).
         await GarakProbeCache.initialize()
+        # A build-time snapshot for this garak version, if the image has one,
+        # makes the cache warm without enumerating at all. Also idempotent.
+        GarakProbeCache.load_snapshot(self.garak_version)
 
         # Check cache first
         cached_data = await GarakProbeCache.get(self.garak_version)
@@ -569,49 +727,16 @@ class GarakProbeService:
                 )
                 return deserialize_probe_data(cached_data)
 
-            # Suppress verbose output during enumeration (print statements and garak
-            # logging)
-            import contextlib
-            import io
-            import logging
-
             import anyio
 
             logger.info(f"Garak probe cache MISS: generating probe data (v{self.garak_version})...")
 
-            def _enumerate() -> tuple[List[GarakModuleInfo], Dict[str, List[GarakProbeInfo]]]:
-                # Enumerating/instantiating every Garak probe class is CPU-bound
-                # and can take many seconds. Run it in a worker thread so this
-                # does not block the event loop and starve every other request on
-                # the worker while the lock above is held.
-                null_output = io.StringIO()
-
-                # Only suppress garak-specific loggers to avoid affecting
-                # concurrent requests. DO NOT suppress root logger -- it would
-                # affect all loggers in the async app.
-                garak_logger = logging.getLogger("garak")
-                original_garak_level = garak_logger.level
-
-                try:
-                    garak_logger.setLevel(logging.CRITICAL)
-
-                    with (
-                        contextlib.redirect_stdout(null_output),
-                        contextlib.redirect_stderr(null_output),
-                    ):
-                        modules = self.enumerate_probe_modules()
-
-                        probes_by_module: Dict[str, List[GarakProbeInfo]] = {}
-                        for module in modules:
-                            probes = self.extract_probes_from_module(module.name)
-                            if probes:
-                                probes_by_module[module.name] = probes
-                finally:
-                    garak_logger.setLevel(original_garak_level)
-
-                return modules, probes_by_module
-
-            modules, probes_by_module = await anyio.to_thread.run_sync(_enumerate)
+            # Enumerating/instantiating every Garak probe class is CPU-bound
+            # and can take many seconds. Run it (or wait for the process pool
+            # running it) in a worker thread so this does not block the event
+            # loop and starve every other request on the worker while the lock
+            # above is held.
+            modules, probes_by_module = await anyio.to_thread.run_sync(self.generate_probe_data)
 
             # Store in cache
             cache_data = serialize_probe_data(modules, probes_by_module)
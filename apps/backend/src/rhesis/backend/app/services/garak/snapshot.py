@@ -0,0 +1,102 @@
+"""Build-time Garak probe snapshot.
+
+Enumerates every Garak probe (in a process pool, see ``probes/service.py``)
+and writes the result, stamped with the garak and cache schema versions, to
+the file ``GarakProbeCache.load_snapshot`` reads at startup. The backend
+image runs this once at build time, so API processes start with a warm probe
+cache instead of each importing all of ``garak.probes``.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from .cache import GarakProbeCache, serialize_probe_data, snapshot_path
+from .probes import GarakProbeService
+
+logger = logging.getLogger(__name__)
+
+
+def write_snapshot(path: Path, workers: Optional[int] = None) -> int:
+    """
+    Enumerate all probes and write the snapshot to *path*.
+
+    Args:
+        path: Destination file, replaced atomically
+        workers: Enumeration pool size (defaults to ``GARAK_ENUMERATION_WORKERS``)
+
+    Returns:
+        Number of probe modules written
+
+    Raises:
+        RuntimeError: If garak package is not installed
+    """
+    service = GarakProbeService()
+    if workers is not None:
+        modules, probes_by_module = service.enumerate_in_subprocesses(workers)
+    else:
+        modules, probes_by_module = service.generate_probe_data()
+
+    data = GarakProbeCache.with_metadata(
+        service.garak_version, serialize_probe_data(modules, probes_by_module)
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(modules)
+
+
+def main():
+    """CLI entry point for generating the Garak probe snapshot."""
+    parser = argparse.ArgumentParser(description="Write the Garak probe snapshot")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Snapshot file (default: GARAK_PROBE_SNAPSHOT_PATH or the bundled location)",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=None,
+        help="Enumeration processes (default: GARAK_ENUMERATION_WORKERS)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    path = args.output or snapshot_path()
+    try:
+        count = write_snapshot(path, workers=args.workers)
+    except Exception as e:
+        print(f"\nError: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote {count} Garak probe modules to {path}")
+
+
+if __name__ == "__main__":
+    main()
+
+
+"""
+Usage examples:
+
+1. Write the snapshot where the backend loads it from:
+python -m rhesis.backend.app.services.garak.snapshot
+
+2. Write it elsewhere with 8 enumeration processes:
+python -m rhesis.backend.app.services.garak.snapshot --output /tmp/probes.json --workers 8
+"""
@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 import asyncio
 import logging
 from functools import partial
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
@@ -11,9 +13,13 @@ from rhesis.backend.app.models.user import User
 from rhesis.backend.app.schemas.services import GenerationConfig, SourceData
 from rhesis.backend.app.usage_attribution import with_usage_attribution
 from rhesis.backend.app.utils.user_model_utils import get_generation_model_with_override
-from rhesis.sdk.services.extractor import SourceSpecification, SourceType
 from rhesis.sdk.synthesizers import ConfigSynthesizer
 
+# The extractor pulls in markitdown (and pandas through it); it is only
+# needed once sources are converted, so it is not imported with the API.
+if TYPE_CHECKING:
+    from rhesis.sdk.services.extractor import SourceSpecification
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +48,8 @@ def get_source_specifications(
     Raises:
         HTTPException: If source not found
     """
+    from rhesis.sdk.services.extractor import SourceSpecification, SourceType
+
     if not sources:
         return []
 
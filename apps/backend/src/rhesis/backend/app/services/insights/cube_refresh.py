@@ -0,0 +1,94 @@
+"""Throttled scheduling of insights cube refreshes.
+
+Every committed write to test results marks the touched runs stale and calls
+schedule_cube_refresh for the organisation. A test run that writes thousands
+of results must not enqueue thousands of refresh tasks, so scheduling is
+throttled per (organisation, project) scope: the first call in a window claims
+a Redis key (SET NX with the window as TTL) and enqueues one delayed task;
+later calls in the same window are no-ops. The delayed task refreshes every
+stale run visible in that scope, including the ones marked after it was
+scheduled.
+
+Stale runs are still answered correctly from the views in the meantime, so a
+lost or skipped refresh only costs speed, never correctness.
+"""
+
+import logging
+import os
+from typing import Optional
+
+from rhesis.backend.app.services.cache import RedisBackedCache
+from rhesis.backend.app.services.redis_constants import RedisDatabase
+
+logger = logging.getLogger(__name__)
+
+_PREFIX = "insights:cube_refresh:"
+
+DEFAULT_REFRESH_DELAY_SECONDS = 30
+
+
+def _refresh_delay() -> int:
+    return int(os.getenv("INSIGHTS_CUBE_REFRESH_DELAY", str(DEFAULT_REFRESH_DELAY_SECONDS)))
+
+
+class CubeRefreshThrottle(RedisBackedCache):
+    """Claims one refresh slot per (organisation, project) per delay window."""
+
+    def __init__(self, delay: int) -> None:
+        super().__init__(
+            redis_db=RedisDatabase.INSIGHTS_CUBE_REFRESH,
+            cache_name="insights-cube-refresh",
+            ttl=delay,
+        )
+
+    @staticmethod
+    def _key(organization_id: str, project_id: Optional[str]) -> str:
+        return f"{_PREFIX}{organization_id}:{project_id or '-'}"
+
+    def claim(self, organization_id: str, project_id: Optional[str]) -> bool:
+        """Return True if the caller should schedule the refresh for this window."""
+        return self._set_nx(self._key(organization_id, project_id), "1")
+
+    def release(self, organization_id: str, project_id: Optional[str]) -> None:
+        self._delete(self._key(organization_id, project_id))
+
+
+# ---------------------------------------------------------------
+# Module-level singleton and public API
+# ---------------------------------------------------------------
+
+_throttle = CubeRefreshThrottle(_refresh_delay())
+
+
+def initialize_cache() -> None:
+    """Initialize the cube refresh throttle (call at app/worker startup)."""
+    _throttle.initialize()
+
+
+def schedule_cube_refresh(organization_id: str, project_id: Optional[str] = None) -> bool:
+    """Enqueue a delayed cube refresh for a scope unless one is pending.
+
+    Returns True if a task was enqueued.
+    """
+    organization_id = str(organization_id)
+    project_id = str(project_id) if project_id else None
+    if not _throttle.claim(organization_id, project_id):
+        return False
+
+    from rhesis.backend.tasks.insights import refresh_insights_cubes
+
+    try:
+        refresh_insights_cubes.apply_async(
+            args=[organization_id, project_id], countdown=_throttle._ttl
+        )
+    except Exception:
+        # Let the next write retry instead of waiting out the window.
+        _throttle.release(organization_id, project_id)
+        raise
+
+    logger.debug(
+        f"[INSIGHTS_CUBES] Scheduled cube refresh for org {organization_id} "
+        f"project {project_id} "
+        f"(countdown={_throttle._ttl}s)"
+    )
+    return True
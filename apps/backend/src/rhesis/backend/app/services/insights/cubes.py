@@ -0,0 +1,569 @@
+"""Materialised insights cubes: incremental refresh and query planning.
+
+The registry views (v_test_result_stats, v_metric_stats) join and classify every
+test result on each request. For the common GROUP BYs that is wasted work: the
+answer only changes when a test result is written or reviewed. The cubes in
+models/insights_cube.py pre-aggregate each test run once, at a grain fine enough
+to answer every dimension/measure/filter combination listed in CUBES below.
+
+Refresh is incremental per test run. Writes bump InsightsCubeState.version for
+the runs they touch (models/insights_cube_events.py, same transaction as the
+write); refresh_run_cubes rebuilds that run's rows and records the version it
+built from. A run whose versions differ is "stale".
+
+Planning (plan_cube_query) never trades correctness for speed. A covered
+request is answered as one UNION ALL of
+
+  - cube rows of current runs, restricted to the whole UTC days inside the
+    requested date window, and
+  - view rows of stale runs, plus view rows in the partial first/last day of
+    the window (the cube has day granularity),
+
+re-aggregated in an outer query that also joins display names. A request the
+cube can't express (e.g. a test_ids filter, or the `test` entity) returns None
+and build_query falls back to the plain view query.
+
+RHESIS_DISABLE_INSIGHTS_CUBES=1 turns the planner off without a deploy; write
+tracking keeps running so re-enabling it needs no rebuild.
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    Text,
+    and_,
+    cast,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from rhesis.backend.app.models.category import Category
+from rhesis.backend.app.models.insights_cube import (
+    InsightsCubeState,
+    InsightsMetricCube,
+    InsightsTestResultCube,
+)
+from rhesis.backend.app.models.requirement import Requirement
+from rhesis.backend.app.models.stats_views import MetricStatsView, TestResultStatsView
+from rhesis.backend.app.models.status import Status
+from rhesis.backend.app.models.test_result import TestResult
+from rhesis.backend.app.models.topic import Topic
+
+from .registry import REGISTRY, _rate
+
+logger = logging.getLogger(__name__)
+
+STATE = InsightsCubeState.__table__
+REFRESH_BATCH_SIZE = 50
+
+
+def cubes_enabled() -> bool:
+    return os.environ.get("RHESIS_DISABLE_INSIGHTS_CUBES", "").lower() not in ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class _Dimension:
+    """A registry dimension expressed over the cube grain.
+
+    key    -- grain column carried through the UNION (same name in view and cube)
+    lookup -- optional (table, column) joined on `key` to display a name instead
+    """
+
+    key: str
+    lookup: Optional[Tuple[object, str]] = None
+
+
+@dataclass(frozen=True)
+class CubeSpec:
+    entity: str
+    table: object
+    view: object
+    # grain column name -> view expression it is built from
+    grain: Dict[str, object]
+    # stored measure name -> zero-arg factory over the view (registry measures)
+    stored: Dict[str, Callable]
+    dimensions: Dict[str, _Dimension]
+    # registry measure name -> builder over the UNION subquery of stored measures
+    measures: Dict[str, Callable]
+    # registry filter key -> grain column name
+    filters: Dict[str, str] = field(default_factory=dict)
+
+
+def _sum(column):
+    # SUM(bigint) is numeric in Postgres; cast back so both paths return ints.
+    return cast(func.coalesce(func.sum(column), 0), BigInteger)
+
+
+def _summed(name: str) -> Callable:
+    return lambda u: _sum(u.c[name])
+
+
+def _rate_of(passed: str, failed: str) -> Callable:
+    return lambda u: _rate(lambda: _sum(u.c[passed]), lambda: _sum(u.c[failed]))()
+
+
+def _utc_day(column):
+    return cast(func.timezone("UTC", column), Date)
+
+
+TR = TestResultStatsView
+ME = MetricStatsView
+
+CUBES: Dict[str, CubeSpec] = {
+    "test_result": CubeSpec(
+        entity="test_result",
+        table=InsightsTestResultCube.__table__,
+        view=TR,
+        grain={
+            "test_run_id": TR.test_run_id,
+            "requirement_id": TR.requirement_id,
+            "category_id": TR.category_id,
+            "topic_id": TR.topic_id,
+            "result_status_id": TR.result_status_id,
+            "day": _utc_day(TR.created_at),
+            "year": TR.year,
+            "month": TR.month,
+        },
+        stored={
+            name: REGISTRY["test_result"]["measures"][name]
+            for name in ("count", "passed", "failed")
+        },
+        dimensions={
+            "requirement": _Dimension("requirement_id", (Requirement.__table__, "name")),
+            "requirement_id": _Dimension("requirement_id"),
+            "category": _Dimension("category_id", (Category.__table__, "name")),
+            "category_id": _Dimension("category_id"),
+            "topic": _Dimension("topic_id", (Topic.__table__, "name")),
+            "topic_id": _Dimension("topic_id"),
+            "test_run": _Dimension("test_run_id"),
+            "status": _Dimension("result_status_id", (Status.__table__, "name")),
+            "year": _Dimension("year"),
+            "month": _Dimension("month"),
+        },
+        measures={
+            "count": _summed("count"),
+            "passed": _summed("passed"),
+            "failed": _summed("failed"),
+            "pass_rate": _rate_of("passed", "failed"),
+        },
+        filters={
+            "test_run_ids": "test_run_id",
+            "requirement_ids": "requirement_id",
+            "category_ids": "category_id",
+            "topic_ids": "topic_id",
+            "status_ids": "result_status_id",
+        },
+    ),
+    "metric": CubeSpec(
+        entity="metric",
+        table=InsightsMetricCube.__table__,
+        view=ME,
+        grain={
+            "test_run_id": ME.test_run_id,
+            "requirement_id": ME.requirement_id,
+            "metric_name": ME.metric_name,
+            "day": _utc_day(ME.created_at),
+            "year": ME.year,
+            "month": ME.month,
+        },
+        stored={
+            name: REGISTRY["metric"]["measures"][name]
+            for name in (
+                "count",
+                "passed",
+                "failed",
+                "automated_passed",
+                "automated_failed",
+                "human_review_count",
+            )
+        },
+        dimensions={
+            "metric_name": _Dimension("metric_name"),
+            "requirement_id": _Dimension("requirement_id"),
+            "year": _Dimension("year"),
+            "month": _Dimension("month"),
+        },
+        measures={
+            "count": _summed("count"),
+            "passed": _summed("passed"),
+            "failed": _summed("failed"),
+            "pass_rate": _rate_of("passed", "failed"),
+            "automated_passed": _summed("automated_passed"),
+            "automated_failed": _summed("automated_failed"),
+            "human_review_count": _summed("human_review_count"),
+        },
+        filters={
+            "test_run_ids": "test_run_id",
+            "requirement_ids": "requirement_id",
+            "metric_names": "metric_name",
+        },
+    ),
+}
+
+
+# ---------------------------------------------------------------------------
+# Write tracking
+# ---------------------------------------------------------------------------
+
+
+def _refresh_lock_key(test_run_id):
+    """Advisory lock key serialising refreshes of a run (a value or a column)."""
+    return func.hashtextextended(func.concat("insights_cube:", cast(test_run_id, Text)), 0)
+
+
+def _bump_versions(stmt):
+    return stmt.on_conflict_do_update(
+        index_elements=[STATE.c.organization_id, STATE.c.test_run_id],
+        set_={"version": STATE.c.version + 1, "updated_at": func.now()},
+    )
+
+
+def mark_runs_stale(connection, runs) -> None:
+    """Bump the cube version of each (organization_id, project_id, test_run_id)
+    in *runs*. project_id is recorded when the state row is created only.
+
+    Sorted so concurrent writers touching overlapping runs take the row locks
+    in the same order instead of deadlocking.
+    """
+    rows = {}
+    for org_id, project_id, run_id in runs:
+        rows.setdefault(
+            (str(org_id), str(run_id)),
+            {
+                "organization_id": str(org_id),
+                "project_id": str(project_id) if project_id else None,
+                "test_run_id": str(run_id),
+            },
+        )
+    rows = [rows[key] for key in sorted(rows)]
+    if rows:
+        connection.execute(_bump_versions(pg_insert(STATE).values(rows)))
+
+
+def pin_stale_runs(connection, runs) -> set:
+    """(organization_id, test_run_id) of the runs in *runs* that need no bump.
+
+    Every write to a run used to bump its state row, so a batch persisting
+    results serialised on that row's lock. A run that is already stale needs
+    no bump, provided no refresh of it is in progress: that refresh records
+    the version it read before rebuilding and would hide this write. Holding
+    the refresh lock shared until commit rules that out (a refresh starting
+    meanwhile skips the run), so only runs that are stale *and* whose lock
+    was taken are returned. Takes no row locks.
+    """
+    keys = sorted({(str(org_id), str(run_id)) for org_id, _, run_id in runs})
+    if not keys:
+        return set()
+    pinned = connection.execute(
+        select(STATE.c.organization_id, STATE.c.test_run_id).where(
+            tuple_(STATE.c.organization_id, STATE.c.test_run_id).in_(keys),
+            STATE.c.version != STATE.c.refreshed_version,
+            func.pg_try_advisory_xact_lock_shared(_refresh_lock_key(STATE.c.test_run_id)),
+        )
+    )
+    return {(str(org_id), str(run_id)) for org_id, run_id in pinned}
+
+
+def mark_runs_stale_for_tests(connection, test_ids) -> None:
+    """Bump the cube version of every run containing one of *test_ids*.
+
+    v_test_result_stats reads requirement/category/topic from the test and
+    hides results of deleted tests, so editing a test changes the aggregates
+    of every run it appears in.
+    """
+    if not test_ids:
+        return
+    results = TestResult.__table__
+    runs = (
+        select(results.c.organization_id, results.c.project_id, results.c.test_run_id)
+        .where(
+            results.c.test_id.in_([str(t) for t in test_ids]),
+            results.c.test_run_id.is_not(None),
+            results.c.organization_id.is_not(None),
+        )
+        .distinct(results.c.organization_id, results.c.test_run_id)
+        .order_by(results.c.organization_id, results.c.test_run_id)
+    )
+    columns = ["organization_id", "project_id", "test_run_id"]
+    connection.execute(_bump_versions(pg_insert(STATE).from_select(columns, runs)))
+
+
+# ---------------------------------------------------------------------------
+# Refresh
+# ---------------------------------------------------------------------------
+
+
+def refresh_run_cubes(db: Session, organization_id: str, test_run_id: str) -> bool:
+    """Rebuild every cube's rows for one test run, inside the caller's transaction.
+
+    Serialised per run with a transaction-scoped advisory lock; returns False
+    without doing anything when another worker is already refreshing the run.
+    The version is read before the rebuild, so a write that lands meanwhile
+    leaves the run stale for the next pass rather than being lost.
+
+    Runs under the caller's RLS scope, like any read of test results: bind the
+    run's project (see refresh_stale_cubes) so all of its results are visible.
+    """
+    lock_key = _refresh_lock_key(literal(str(test_run_id)))
+    if not db.execute(select(func.pg_try_advisory_xact_lock(lock_key))).scalar():
+        return False
+
+    version = db.execute(
+        select(STATE.c.version).where(
+            STATE.c.organization_id == organization_id,
+            STATE.c.test_run_id == test_run_id,
+        )
+    ).scalar()
+    if version is None:
+        return True
+
+    results = TestResult.__table__
+    for spec in CUBES.values():
+        db.execute(
+            delete(spec.table).where(
+                spec.table.c.organization_id == organization_id,
+                spec.table.c.test_run_id == test_run_id,
+            )
+        )
+        grain_cols = [expr.label(name) for name, expr in spec.grain.items()]
+        stored_cols = [build().label(name) for name, build in spec.stored.items()]
+        source = (
+            select(spec.view.organization_id, results.c.project_id, *grain_cols, *stored_cols)
+            .join(results, results.c.id == spec.view.test_result_id)
+            .where(
+                spec.view.organization_id == organization_id,
+                spec.view.test_run_id == test_run_id,
+            )
+            .group_by(spec.view.organization_id, results.c.project_id, *spec.grain.values())
+        )
+        columns = ["organization_id", "project_id", *spec.grain, *spec.stored]
+        db.execute(spec.table.insert().from_select(columns, source))
+
+    db.execute(
+        update(STATE)
+        .where(
+            STATE.c.organization_id == organization_id,
+            STATE.c.test_run_id == test_run_id,
+        )
+        .values(refreshed_version=version, updated_at=func.now())
+    )
+    return True
+
+
+def stale_runs(
+    db: Session, organization_id: str, limit: Optional[int] = None
+) -> List[Tuple[str, Optional[str]]]:
+    """(test_run_id, project_id) of stale runs visible under the session's scope."""
+    q = select(STATE.c.test_run_id, STATE.c.project_id).where(
+        STATE.c.organization_id == organization_id,
+        STATE.c.version != STATE.c.refreshed_version,
+    )
+    if limit is not None:
+        q = q.limit(limit)
+    return [
+        (str(run_id), str(project_id) if project_id else None)
+        for run_id, project_id in db.execute(q)
+    ]
+
+
+def refresh_stale_cubes(
+    db: Session,
+    organization_id: str,
+    project_id: Optional[str] = None,
+    limit: int = REFRESH_BATCH_SIZE,
+) -> Dict[str, int]:
+    """Refresh up to *limit* stale runs of one organisation and project scope.
+
+    Commits per run. Each run is rebuilt under its own project scope, since
+    project_isolation hides a project's test results from any other scope.
+    """
+    from rhesis.backend.app.database import bind_scope_to_session
+
+    refreshed = skipped = 0
+    for run_id, run_project_id in stale_runs(db, organization_id, limit):
+        bind_scope_to_session(db, organization_id, project_id=run_project_id or "")
+        if refresh_run_cubes(db, organization_id, run_id):
+            refreshed += 1
+        else:
+            skipped += 1
+        db.commit()
+
+    bind_scope_to_session(db, organization_id, project_id=project_id or "")
+    remaining = len(stale_runs(db, organization_id, limit=1))
+    return {"refreshed": refreshed, "skipped": skipped, "remaining": remaining}
+
+
+# ---------------------------------------------------------------------------
+# Planning
+# ---------------------------------------------------------------------------
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Naive bounds are taken as UTC, like the rest of the stats code.
+    value = value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+    return value.astimezone(timezone.utc)
+
+
+def _day_window(
+    start_date: Optional[datetime], end_date: Optional[datetime]
+) -> Tuple[Optional[date], Optional[date]]:
+    """Whole UTC days [first_day, end_day) fully inside [start_date, end_date]."""
+    first_day = end_day = None
+    if start_date is not None:
+        start = _as_utc(start_date)
+        first_day = start.date()
+        if start.time() != time(0):
+            first_day += timedelta(days=1)
+    if end_date is not None:
+        end_day = _as_utc(end_date).date()
+    return first_day, end_day
+
+
+def _utc_midnight(day: date) -> datetime:
+    return datetime.combine(day, time(0), tzinfo=timezone.utc)
+
+
+def covers(
+    entity: str,
+    group_by: List[str],
+    measures: List[str],
+    filters: Optional[Dict[str, list]],
+) -> bool:
+    """True if the cube of *entity* can answer this request exactly."""
+    spec = CUBES.get(entity)
+    if spec is None:
+        return False
+    active_filters = {key for key, values in (filters or {}).items() if values}
+    return (
+        set(group_by) <= set(spec.dimensions)
+        and set(measures) <= set(spec.measures)
+        and active_filters <= set(spec.filters)
+    )
+
+
+def plan_cube_query(
+    db: Session,
+    view_query,
+    entity: str,
+    group_by: List[str],
+    measures: List[str],
+    filters: Optional[Dict[str, list]],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    organization_id: Optional[str],
+):
+    """Return a cube-backed query equivalent to the view query, or None.
+
+    *view_query* is the filtered (not yet grouped) view query from
+    query_builder._base_query; it supplies the stale-run and partial-day part.
+    """
+    if organization_id is None or not cubes_enabled():
+        return None
+    if not covers(entity, group_by, measures, filters):
+        return None
+
+    # Self-healing: picks up runs left stale by the migration backfill or by a
+    # schedule that was lost. Throttled, so at most one task per org per window.
+    try:
+        from rhesis.backend.app.database import scope_project_id
+        from rhesis.backend.app.services.insights.cube_refresh import schedule_cube_refresh
+
+        schedule_cube_refresh(organization_id, scope_project_id(db) or None)
+    except Exception as e:
+        logger.debug(f"Could not schedule insights cube refresh: {e}")
+
+    spec = CUBES[entity]
+    view, cube = spec.view, spec.table
+
+    keys: List[str] = []
+    for g in group_by:
+        if spec.dimensions[g].key not in keys:
+            keys.append(spec.dimensions[g].key)
+
+    current_runs = select(STATE.c.test_run_id).where(
+        STATE.c.organization_id == organization_id,
+        STATE.c.version == STATE.c.refreshed_version,
+    )
+    first_day, end_day = _day_window(start_date, end_date)
+
+    # Cube part: current runs, whole days only.
+    cube_conditions = [
+        cube.c.organization_id == organization_id,
+        cube.c.test_run_id.in_(current_runs),
+    ]
+    for key, values in (filters or {}).items():
+        if values:
+            cube_conditions.append(cube.c[spec.filters[key]].in_(values))
+    if first_day is not None:
+        cube_conditions.append(cube.c.day >= first_day)
+    if end_day is not None:
+        cube_conditions.append(cube.c.day < end_day)
+    cube_part = (
+        select(
+            *(cube.c[k] for k in keys),
+            *(_sum(cube.c[name]).label(name) for name in spec.stored),
+        )
+        .where(and_(*cube_conditions))
+        .group_by(*(cube.c[k] for k in keys))
+    )
+
+    # View part: everything the cube part leaves out -- stale runs, runs
+    # without a state row yet, results without a run, and partial days.
+    leftovers = [~view.test_run_id.in_(current_runs), view.test_run_id.is_(None)]
+    if first_day is not None:
+        leftovers.append(view.created_at < _utc_midnight(first_day))
+    if end_day is not None:
+        leftovers.append(view.created_at >= _utc_midnight(end_day))
+    view_part = (
+        view_query.filter(or_(*leftovers))
+        .with_entities(
+            *(spec.grain[k].label(k) for k in keys),
+            *(build().label(name) for name, build in spec.stored.items()),
+        )
+        .group_by(*(spec.grain[k] for k in keys))
+    )
+
+    u = union_all(view_part.statement, cube_part).subquery("insights_cube_union")
+
+    lookups: Dict[str, object] = {}
+    q = db.query(u)
+    for key in keys:
+        lookup = next(
+            (spec.dimensions[g].lookup for g in group_by if spec.dimensions[g].key == key),
+            None,
+        )
+        if lookup is not None:
+            table = lookup[0].alias(f"{key}_lookup")
+            lookups[key] = table
+            q = q.outerjoin(table, table.c.id == u.c[key])
+
+    group_cols = []
+    for g in group_by:
+        dim = spec.dimensions[g]
+        if dim.lookup is not None:
+            group_cols.append(lookups[dim.key].c[dim.lookup[1]])
+        else:
+            group_cols.append(u.c[dim.key])
+
+    measure_cols = [spec.measures[m](u).label(m) for m in measures]
+    q = q.with_entities(
+        *(col.label(g) for col, g in zip(group_cols, group_by)),
+        *measure_cols,
+    )
+    if group_cols:
+        q = q.group_by(*group_cols)
+    return q
@@ -3,18 +3,32 @@
 Every param is checked against the registry before it touches SQL: an
 unknown entity, group_by, measure, or filter raises InsightsValidationError
 (400) instead of reaching the database.
+
+Results are served from the insights result cache (result_cache.py) when the
+organisation has had no tracked write since they were stored.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
+from rhesis.backend.app.database import get_db_with_tenant_variables, scope_project_id
+from rhesis.backend.app.models.insights_cache_events import has_uncommitted_insights_writes
+from rhesis.backend.app.schemas.insights import InsightsResponse
 from rhesis.backend.app.services.stats.common import parse_date_range
+from rhesis.backend.app.usage_attribution import with_usage_attribution
 
+from .cubes import plan_cube_query
 from .registry import REGISTRY
+from .result_cache import cache_enabled, get_insights_result_cache, request_fingerprint
 
 MAX_BATCH_QUERIES = 10
+# Cache misses of one run_queries batch run on this many sessions at once.
+# Each holds a pooled connection (pool_size=10, max_overflow=20).
+DEFAULT_QUERY_CONCURRENCY = 4
 VALID_OUTCOMES = frozenset({"pass", "fail", "all"})
 
 
@@ -109,6 +123,13 @@ def build_query(
             f"Available: {sorted(entry['measures'])}"
         )
 
+    # Served from the materialised cubes when they cover the request exactly.
+    cube_query = plan_cube_query(
+        db, q, entity, group_by, measures, filters, start_date, end_date, organization_id
+    )
+    if cube_query is not None:
+        return cube_query
+
     group_cols = [entry["dimensions"][g].label(g) for g in group_by]
     measure_cols = [entry["measures"][m]().label(m) for m in measures]
     q = q.with_entities(*group_cols, *measure_cols)
@@ -118,7 +139,21 @@ def build_query(
     return q
 
 
-def run_query(
+def _query_concurrency() -> int:
+    return max(1, int(os.getenv("INSIGHTS_QUERY_CONCURRENCY", str(DEFAULT_QUERY_CONCURRENCY))))
+
+
+def _use_cache(db: Session, organization_id: Optional[str]) -> bool:
+    # A session with uncommitted insights writes must read them, not the
+    # committed state the cache holds.
+    return (
+        organization_id is not None
+        and cache_enabled()
+        and not has_uncommitted_insights_writes(db, organization_id)
+    )
+
+
+def _execute_query(
     db: Session,
     entity: str,
     group_by: List[str],
@@ -152,11 +187,112 @@ def run_query(
     }
 
 
+def _execute_queries(
+    db: Session,
+    requests: Dict[str, Dict[str, Any]],
+    organization_id: Optional[str],
+    user_id: Optional[str],
+) -> Dict[str, Dict[str, Any]]:
+    """Run several requests, each on its own tenant session when there are several.
+
+    The caller's session can't be shared across threads, so concurrent
+    requests open their own, carrying the caller's org, user and project
+    scope. Without a user, or with uncommitted writes on the caller's
+    session that other sessions couldn't see, they run one after another on
+    *db* instead.
+    """
+    workers = min(len(requests), _query_concurrency())
+    if (
+        workers <= 1
+        or not user_id
+        or organization_id is None
+        or has_uncommitted_insights_writes(db, organization_id)
+    ):
+        return {
+            label: _execute_query(db, organization_id=organization_id, **params)
+            for label, params in requests.items()
+        }
+
+    project_id = scope_project_id(db)
+
+    def execute(params: Dict[str, Any]) -> Dict[str, Any]:
+        with get_db_with_tenant_variables(
+            str(organization_id), str(user_id), project_id
+        ) as query_db:
+            return _execute_query(query_db, organization_id=organization_id, **params)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="insights-query") as pool:
+        futures = {
+            label: pool.submit(with_usage_attribution(execute), params)
+            for label, params in requests.items()
+        }
+        return {label: future.result() for label, future in futures.items()}
+
+
+def _run_cached(
+    db: Session,
+    requests: Dict[str, Dict[str, Any]],
+    organization_id: Optional[str],
+    user_id: Optional[str] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Serve requests from the result cache, executing and storing only the misses."""
+    if not _use_cache(db, organization_id):
+        return _execute_queries(db, requests, organization_id, user_id)
+
+    cache = get_insights_result_cache()
+    project_id = scope_project_id(db) or None
+    fingerprints = {label: request_fingerprint(**params) for label, params in requests.items()}
+    generation, envelopes = cache.get_many(organization_id, project_id, fingerprints)
+
+    missing = {label: params for label, params in requests.items() if label not in envelopes}
+    if missing:
+        # Stored in the response's JSON form, so hits and misses serialise alike.
+        computed = {
+            label: InsightsResponse.model_validate(envelope).model_dump(mode="json")
+            for label, envelope in _execute_queries(db, missing, organization_id, user_id).items()
+        }
+        cache.set_many(organization_id, project_id, generation, computed, fingerprints)
+        envelopes.update(computed)
+
+    return {label: envelopes[label] for label in requests}
+
+
+def run_query(
+    db: Session,
+    entity: str,
+    group_by: List[str],
+    measures: List[str],
+    filters: Optional[Dict[str, list]] = None,
+    months: Optional[int] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    organization_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Execute the query (or serve it from cache) as one uniform insights envelope."""
+    request = dict(
+        entity=entity,
+        group_by=group_by,
+        measures=measures,
+        filters=filters,
+        months=months,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    return _run_cached(db, {entity: request}, organization_id)[entity]
+
+
 def run_queries(
-    db: Session, queries: Dict[str, Any], organization_id: Optional[str] = None
+    db: Session,
+    queries: Dict[str, Any],
+    organization_id: Optional[str] = None,
+    user_id: Optional[str] = None,
 ) -> Dict[str, Dict[str, Any]]:
     """Run several named sub-queries in one call and return one envelope per label.
 
+    Labels found in the result cache are served from it; the rest run
+    concurrently on their own sessions when *user_id* is given (needed to
+    open them with the caller's scope), sequentially otherwise.
+
     Callers combine the per-label envelopes themselves (e.g. zipping a test_result-grain
     breakdown with a metric-grain one by a shared dimension like requirement).
     """
@@ -167,9 +303,8 @@ def run_queries(
             f"Too many queries ({len(queries)}); max {MAX_BATCH_QUERIES} per request"
         )
 
-    return {
-        label: run_query(
-            db,
+    requests = {
+        label: dict(
             entity=q.entity,
             group_by=q.group_by,
             measures=q.measures,
@@ -177,10 +312,10 @@ def run_queries(
             months=q.months,
             start_date=q.start_date,
             end_date=q.end_date,
-            organization_id=organization_id,
         )
         for label, q in queries.items()
     }
+    return _run_cached(db, requests, organization_id, user_id)
 
 
 def run_ids(
@@ -0,0 +1,220 @@
+"""Insights query-result cache — Redis DB 7, with write-driven invalidation.
+
+Every user opening a dashboard issues the same handful of insights requests;
+this caches their envelopes so only the first one reaches the database.
+
+Cache key format::
+
+    insights:result:v1:{org_id}:{project_id_or_-}:{generation}:{request_fp}
+
+``request_fp`` is a hash of the normalised request (entity, group_by,
+measures, filters, months/start_date/end_date). The project is part of the key
+because RLS narrows every insights view to the caller's project scope: the
+same request returns different rows in different projects.
+
+Invalidation is by generation, not by deleting keys. Each organisation has
+one generation token (``insights:generation:v1:{org_id}``) that is part of
+every result key; a committed write to test results, reviews, tests or test
+runs replaces it (see ``models/insights_cache_events.py``), which makes every
+cached result of the organisation unreachable at once. Orphaned entries age
+out with their TTL.
+
+Design decisions:
+
+* **Token, not counter.** A bump writes a fresh random token rather than
+  ``INCR``-ing a number. A generation key that expired or was evicted (e.g. in
+  the in-memory fallback) can then never come back with a value that an old,
+  still-live result entry was stored under.
+* **Short result TTL (5 min).** ``months=N`` windows are relative to now, and
+  lookups (requirement, topic, status names) can be renamed without touching
+  the tracked tables; the TTL bounds both drifts.
+* **Envelopes are stored in their JSON response form**
+  (``InsightsResponse.model_dump(mode="json")``), so a hit serialises to
+  exactly the same response body as a miss.
+* **Generation read from the primary.** The token is the source of truth for
+  invalidation: a lagging read replica could still return the generation a
+  write just replaced. Result payloads are read from the replica; they are
+  only reachable through the current generation.
+* **Bypassed on a session with uncommitted insights writes**, which must read
+  its own writes rather than the committed state the cache holds.
+
+``RHESIS_DISABLE_INSIGHTS_RESULT_CACHE=1`` turns the cache off.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from rhesis.backend.app.services.cache import RedisBackedCache
+from rhesis.backend.app.services.redis_constants import RedisDatabase
+
+logger = logging.getLogger(__name__)
+
+_RESULT_TTL = 300  # seconds
+_GENERATION_TTL = 86400  # seconds; an expired generation only costs one miss
+_RESULT_PREFIX = "insights:result:v1"
+_GENERATION_PREFIX = "insights:generation:v1"
+
+
+def cache_enabled() -> bool:
+    """Whether insights results may be served from / stored in the cache."""
+    return os.getenv("RHESIS_DISABLE_INSIGHTS_RESULT_CACHE", "").lower() not in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
+def request_fingerprint(
+    entity: str,
+    group_by: List[str],
+    measures: List[str],
+    filters: Optional[Dict[str, list]] = None,
+    months: Optional[int] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> str:
+    """Stable hash of one insights request.
+
+    group_by and measures keep their order (it is the order of the envelope's
+    ``dimensions``/``measures``); filter values are sets and are sorted, and
+    empty filters are dropped, as ``_apply_filters`` ignores them.
+    """
+    payload = {
+        "entity": entity,
+        "group_by": list(group_by),
+        "measures": list(measures),
+        "filters": {
+            key: sorted(str(value) for value in values)
+            for key, values in sorted((filters or {}).items())
+            if values
+        },
+        "months": months,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+class InsightsResultCache(RedisBackedCache):
+    """Redis-backed insights envelope cache with in-memory fallback."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            redis_db=RedisDatabase.INSIGHTS_RESULT_CACHE,
+            cache_name="InsightsResultCache",
+            ttl=_RESULT_TTL,
+        )
+
+    # ------------------------------------------------------------------
+    # Key helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _generation_key(organization_id: str) -> str:
+        return f"{_GENERATION_PREFIX}:{organization_id}"
+
+    @staticmethod
+    def _result_key(
+        organization_id: str, project_id: Optional[str], generation: str, fingerprint: str
+    ) -> str:
+        return f"{_RESULT_PREFIX}:{organization_id}:{project_id or '-'}:{generation}:{fingerprint}"
+
+    def _generation(self, organization_id: str) -> Optional[str]:
+        """Return the organisation's current generation, creating one if missing.
+
+        Read from the Redis primary, never the replica. None when it can't be
+        read back (e.g. it expired right after another process created it);
+        the caller then skips the cache.
+        """
+        key = self._generation_key(organization_id)
+        generation = self._get_primary(key)
+        if generation is None:
+            token = uuid.uuid4().hex
+            if self._set_nx(key, token, ttl=_GENERATION_TTL):
+                return token
+            generation = self._get_primary(key)
+        return generation
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_many(
+        self,
+        organization_id: str,
+        project_id: Optional[str],
+        fingerprints: Dict[str, str],
+    ) -> Tuple[Optional[str], Dict[str, Dict[str, Any]]]:
+        """Look up several requests at once.
+
+        Args:
+            fingerprints: label -> request_fingerprint(...)
+
+        Returns:
+            (generation, {label: envelope}) for the labels that hit. Pass the
+            generation back to :meth:`set_many` so results computed now are
+            stored under the generation they were read against.
+        """
+        generation = self._generation(str(organization_id))
+        if generation is None:
+            return None, {}
+        labels = list(fingerprints)
+        keys = [
+            self._result_key(str(organization_id), project_id, generation, fingerprints[label])
+            for label in labels
+        ]
+        hits = {}
+        for label, raw in zip(labels, self._mget(keys)):
+            if raw is None:
+                continue
+            try:
+                hits[label] = json.loads(raw)
+            except ValueError:
+                logger.warning(f"InsightsResultCache: dropping undecodable entry for '{label}'")
+        return generation, hits
+
+    def set_many(
+        self,
+        organization_id: str,
+        project_id: Optional[str],
+        generation: Optional[str],
+        envelopes: Dict[str, Dict[str, Any]],
+        fingerprints: Dict[str, str],
+    ) -> None:
+        """Store envelopes (already in JSON form) under *generation*."""
+        if generation is None:
+            return
+        self._pipeline_set(
+            {
+                self._result_key(
+                    str(organization_id), project_id, generation, fingerprints[label]
+                ): json.dumps(envelope, separators=(",", ":"))
+                for label, envelope in envelopes.items()
+            }
+        )
+
+    def bump_generation(self, organization_id: str) -> None:
+        """Invalidate every cached result of *organization_id*."""
+        self._set(self._generation_key(str(organization_id)), uuid.uuid4().hex, ttl=_GENERATION_TTL)
+
+
+# ---------------------------------------------------------------------------
+# Module-level singleton
+# ---------------------------------------------------------------------------
+
+_result_cache = InsightsResultCache()
+
+
+def initialize_cache() -> None:
+    """Initialize the insights result cache (call at app/worker startup)."""
+    _result_cache.initialize()
+
+
+def get_insights_result_cache() -> InsightsResultCache:
+    """Return the process-global insights result cache instance."""
+    return _result_cache
@@ -22,3 +22,6 @@ class RedisDatabase:
     CHATBOT_SESSIONS = 4
     PERMISSION_CACHE = 5  # authorization PDP decision cache (SP5)
     OWASP_SECTIONS_CACHE = 6
+    INSIGHTS_CUBE_REFRESH = 7  # throttles insights cube refresh scheduling per org
+    INSIGHTS_RESULT_CACHE = 7  # shares DB with cube refresh throttle (different key prefixes)
+    EVALUATION_CACHE = 8  # opt-in judge-result cache for repeated evaluations
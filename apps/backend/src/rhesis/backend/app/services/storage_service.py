@@ -252,6 +252,22 @@ class StorageService:
         """
         return f"owasp/{cache_key}.json"
 
+    @staticmethod
+    def get_embedding_graph_model_path(
+        organization_id: str,
+        project_id: Optional[str],
+        parent_type: str,
+        parent_id: str,
+    ) -> str:
+        """embedding_graphs/{org_id}/{project_id|org}/{parent_type}/{parent_id}.pkl
+
+        Fitted UMAP/HDBSCAN model behind one embedding graph (see
+        ``services/embedding/graph_builder.py``); ``org`` stands in for
+        entities not scoped to a project.
+        """
+        project = project_id or "org"
+        return f"embedding_graphs/{organization_id}/{project}/{parent_type}/{parent_id}.pkl"
+
     # ------------------------------------------------------------------
     # Streaming primitives
     # ------------------------------------------------------------------
@@ -5,7 +5,8 @@ and extracting metadata from traces.
 """
 
 import logging
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import litellm
 from rhesis.telemetry.attributes import AIAttributes
@@ -26,6 +27,46 @@ for _logger_name in ("LiteLLM", "LiteLLM Router", "LiteLLM Proxy"):
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _flat_token_prices(model_name: str) -> Optional[Tuple[float, float]]:
+    """
+    Per-token (input, output) USD prices for a model, looked up once per process.
+
+    Returns None when the model isn't in LiteLLM's pricing database or its
+    price depends on the token count (``*_above_*`` tiers); those spans are
+    priced by ``litellm.cost_per_token`` directly.
+    """
+    try:
+        info = litellm.get_model_info(model_name)
+    except Exception:
+        return None
+    if any("_above_" in key and value for key, value in info.items() if "cost" in key):
+        return None
+    input_price = info.get("input_cost_per_token")
+    output_price = info.get("output_cost_per_token")
+    if input_price is None or output_price is None:
+        return None
+    return float(input_price), float(output_price)
+
+
+def token_cost_usd(model_name: str, input_tokens: int, output_tokens: int) -> Tuple[float, float]:
+    """
+    (input, output) USD cost of one LLM call.
+
+    Uses the memoised per-model price when the model has flat pricing, and
+    falls back to ``litellm.cost_per_token`` (which raises for unknown
+    models) otherwise.
+    """
+    prices = _flat_token_prices(model_name)
+    if prices is not None:
+        return input_tokens * prices[0], output_tokens * prices[1]
+    return litellm.cost_per_token(
+        model=model_name,
+        prompt_tokens=input_tokens,
+        completion_tokens=output_tokens,
+    )
+
+
 def calculate_token_costs(spans: List[Trace]) -> Optional[TokenCosts]:
     """
     Calculate token costs for LLM spans using LiteLLM's pricing database.
@@ -76,13 +117,11 @@ def calculate_token_costs(spans: List[Trace]) -> Optional[TokenCosts]:
                 f"Available attributes: {list(span.attributes.keys())}"
             )
 
-        # Use LiteLLM's cost_per_token (maintains up-to-date pricing for all providers)
+        # Use LiteLLM's pricing database (maintains up-to-date pricing for all providers)
         try:
             # Returns tuple: (prompt_cost_usd, completion_cost_usd)
-            input_cost_usd, output_cost_usd = litellm.cost_per_token(
-                model=model_name,
-                prompt_tokens=input_tokens,
-                completion_tokens=output_tokens,
+            input_cost_usd, output_cost_usd = token_cost_usd(
+                model_name, input_tokens, output_tokens
             )
 
             span_cost_usd = input_cost_usd + output_cost_usd
@@ -2,17 +2,34 @@
 
 Provides enrichment logic for calculating costs, detecting anomalies,
 and extracting metadata from traces. Used by both sync and async paths.
+
+Enrichment is incremental: long traces arrive in many chunks, so each pass
+loads only the spans no earlier pass has processed and folds them into the
+enrichment stored by the previous pass, instead of recomputing the whole
+trace every time a chunk lands. That enrichment is kept on one span of the
+trace (the root), so a pass writes only the spans it folded in.
 """
 
 import logging
 from typing import List, Optional
 
 from rhesis.telemetry.schemas import StatusCode
+from sqlalchemy import func, literal, select
 from sqlalchemy.orm import Session
 
-from rhesis.backend.app.crud.telemetry import get_trace_by_id, mark_trace_processed
+from rhesis.backend.app.crud.telemetry import (
+    get_trace_enrichment_span,
+    get_unprocessed_trace_spans,
+    has_unprocessed_trace_spans,
+    mark_trace_processed,
+)
 from rhesis.backend.app.models.trace import Trace
-from rhesis.backend.app.schemas.enrichment import EnrichedTraceData, TraceMetrics
+from rhesis.backend.app.schemas.enrichment import (
+    EnrichedTraceData,
+    EnrichmentSummary,
+    TokenCosts,
+    TraceMetrics,
+)
 from rhesis.backend.app.services.telemetry.enrichment.core import (
     calculate_token_costs,
     detect_anomalies,
@@ -22,6 +39,12 @@ from rhesis.backend.app.services.telemetry.enrichment.core import (
 logger = logging.getLogger(__name__)
 
 
+def _union(previous: Optional[List[str]], new: Optional[List[str]]) -> Optional[List[str]]:
+    merged = list(previous or [])
+    merged.extend(item for item in new or [] if item not in merged)
+    return merged or None
+
+
 class TraceEnricher:
     """Service for trace enrichment."""
 
@@ -40,8 +63,9 @@ class TraceEnricher:
         """
         Enrich a trace with costs, anomalies, and metadata.
 
-        First checks if enrichment is already cached. If not, calculates
-        and caches the results.
+        Returns the stored enrichment when no new spans have arrived since
+        the last pass. Otherwise folds just the new spans into it and stores
+        the result.
 
         This method is used by both:
         - Async Celery tasks (production with workers)
@@ -55,57 +79,77 @@ class TraceEnricher:
         Returns:
             EnrichedTraceData Pydantic model
         """
-        # Fetch all spans for this trace
-        spans = get_trace_by_id(
-            self.db, trace_id=trace_id, project_id=project_id, organization_id=organization_id
-        )
+        scope = dict(trace_id=trace_id, project_id=project_id, organization_id=organization_id)
+
+        # `processed_at` is set on each span once a pass has folded it in.
+        # Newly stored spans default to processed_at=None.
+        if not has_unprocessed_trace_spans(self.db, **scope):
+            summary_span = get_trace_enrichment_span(self.db, **scope)
+            if summary_span is None:
+                logger.warning(f"No spans found for trace {trace_id}")
+                return None
+            logger.debug(f"Using cached enrichment for trace {trace_id} (no new spans)")
+            return EnrichedTraceData(**summary_span.enriched_data)
+
+        # Passes over the same trace must not both fold onto the same stored
+        # enrichment, so serialise them and read the new spans under the lock.
+        lock_key = func.hashtextextended(literal(f"trace_enrichment:{trace_id}"), 0)
+        self.db.execute(select(func.pg_advisory_xact_lock(lock_key)))
+        spans = get_unprocessed_trace_spans(self.db, **scope)
+        summary_span = get_trace_enrichment_span(self.db, **scope)
+        previous = EnrichedTraceData(**summary_span.enriched_data) if summary_span else None
 
         if not spans:
-            logger.warning(f"No spans found for trace {trace_id}")
-            return None
-
-        # Smart cache: return cached enrichment only when no new spans have
-        # arrived since the last enrichment pass.  This allows progressive
-        # re-enrichment as child spans (LLM calls, costs, etc.) arrive after
-        # the root span, while avoiding redundant work once everything is
-        # processed.
-        #
-        # `processed_at` is set on every span row by mark_trace_processed.
-        # Newly stored spans default to processed_at=None, so any span with
-        # processed_at=None means new data has arrived that warrants a re-run.
-        root_span = spans[0]  # ordered by start_time asc, so this is the root
-        if root_span.enriched_data and root_span.processed_at:
-            unprocessed = [s for s in spans if s.processed_at is None]
-            if not unprocessed:
-                logger.debug(
-                    f"Using cached enrichment for trace {trace_id} "
-                    f"(all {len(spans)} spans processed)"
-                )
-                return EnrichedTraceData(**root_span.enriched_data)
-            logger.debug(
-                f"Re-enriching trace {trace_id}: "
-                f"{len(unprocessed)} new span(s) since last enrichment"
-            )
-
-        # Calculate enrichment (returns Pydantic model)
-        logger.debug(f"Enriching trace {trace_id}")
-        enriched_model = self._calculate_enrichment(spans)
+            # A concurrent pass folded them in first; end the transaction to
+            # release the lock
+            self.db.commit()
+            return previous
+
+        logger.debug(
+            f"Enriching trace {trace_id}: {len(spans)} new span(s)"
+            + (" since last enrichment" if previous else "")
+        )
+        enriched_model = self._calculate_enrichment(spans, previous)
 
         # Convert to dict for database storage only
         enriched_data = enriched_model.model_dump(mode="json", exclude_none=True)
 
+        # The enrichment lives on the latest root span, which is the one trace
+        # lists show; until a root arrives, on the earliest span seen
+        new_roots = [span for span in spans if span.parent_span_id is None]
+        latest_root = max(new_roots, key=lambda span: span.start_time) if new_roots else None
+        if latest_root is not None and (
+            summary_span is None
+            or summary_span.parent_span_id is not None
+            or latest_root.start_time > summary_span.start_time
+        ):
+            summary_span_id = latest_root.id
+        elif summary_span is not None:
+            summary_span_id = summary_span.id
+        else:
+            summary_span_id = spans[0].id
+
         # Cache enrichment in database
-        mark_trace_processed(self.db, trace_id=trace_id, enriched_data=enriched_data)
+        mark_trace_processed(
+            self.db,
+            trace_id=trace_id,
+            enriched_data=enriched_data,
+            span_ids=[span.id for span in spans],
+            summary_span_id=summary_span_id,
+        )
 
         # Return the Pydantic model (not the dict)
         return enriched_model
 
-    def _calculate_enrichment(self, spans: List[Trace]) -> EnrichedTraceData:
+    def _calculate_enrichment(
+        self, spans: List[Trace], previous: Optional[EnrichedTraceData] = None
+    ) -> EnrichedTraceData:
         """
         Calculate enrichment for trace spans.
 
         Args:
-            spans: List of spans in the trace
+            spans: Spans to enrich, ordered by start_time
+            previous: Enrichment of the trace's earlier spans to fold them into
 
         Returns:
             EnrichedTraceData Pydantic model
@@ -126,8 +170,11 @@ class TraceEnricher:
             error_count=sum(1 for span in spans if span.status_code == StatusCode.ERROR.value),
         )
 
+        root_span = next((span for span in spans if span.parent_span_id is None), None)
+        summary = EnrichmentSummary(root_start_time=root_span.start_time if root_span else None)
+
         # Build EnrichedTraceData model
-        return EnrichedTraceData(
+        enriched = EnrichedTraceData(
             costs=cost_data,
             anomalies=anomalies,
             metrics=metrics,
@@ -135,4 +182,49 @@ class TraceEnricher:
             tools_used=metadata.get("tools_used"),
             operation_types=metadata.get("operation_types"),
             root_operation=metadata.get("root_operation"),
+            summary=summary,
+        )
+        return self._merge(previous, enriched) if previous else enriched
+
+    @staticmethod
+    def _merge(previous: EnrichedTraceData, new: EnrichedTraceData) -> EnrichedTraceData:
+        """Fold the enrichment of newly arrived spans into a trace's stored enrichment."""
+        costs = previous.costs or new.costs
+        if previous.costs and new.costs:
+            costs = TokenCosts(
+                total_cost_usd=round(previous.costs.total_cost_usd + new.costs.total_cost_usd, 6),
+                total_cost_eur=round(previous.costs.total_cost_eur + new.costs.total_cost_eur, 6),
+                breakdown=previous.costs.breakdown + new.costs.breakdown,
+            )
+
+        anomalies = (previous.anomalies or []) + (new.anomalies or [])
+
+        metrics = TraceMetrics(
+            total_duration_ms=previous.metrics.total_duration_ms + new.metrics.total_duration_ms,
+            span_count=previous.metrics.span_count + new.metrics.span_count,
+            error_count=previous.metrics.error_count + new.metrics.error_count,
+        )
+
+        # The root operation is the earliest root span's, which may arrive
+        # after its children. Enrichment stored before summaries existed
+        # has no start time to compare, so its root operation is kept.
+        summary = previous.summary or EnrichmentSummary()
+        root_operation = previous.root_operation
+        new_root_start = new.summary.root_start_time if new.summary else None
+        if new_root_start is not None and (
+            root_operation is None
+            or (summary.root_start_time is not None and new_root_start < summary.root_start_time)
+        ):
+            root_operation = new.root_operation
+            summary = EnrichmentSummary(root_start_time=new_root_start)
+
+        return EnrichedTraceData(
+            costs=costs,
+            anomalies=anomalies or None,
+            metrics=metrics,
+            models_used=_union(previous.models_used, new.models_used),
+            tools_used=_union(previous.tools_used, new.tools_used),
+            operation_types=_union(previous.operation_types, new.operation_types),
+            root_operation=root_operation,
+            summary=summary,
         )
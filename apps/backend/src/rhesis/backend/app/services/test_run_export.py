@@ -0,0 +1,283 @@
+"""
+Streaming export of a test run's results as CSV, JSONL or Parquet.
+
+Rows are read through a server-side cursor (``yield_per``) and encoded one
+batch at a time, so memory stays flat however many results a run has and
+the first bytes go out as soon as the first batch is read. Columns are the
+base result fields followed by one ``<requirement>_<metric>`` column per
+requirement metric of the run, in a fixed order known before any row is
+read.
+"""
+
+import csv
+import io
+import json
+import logging
+import uuid
+from enum import Enum
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from rhesis.backend.app import models
+from rhesis.backend.app.crud.metric import get_requirement_metrics
+from rhesis.backend.app.crud.test_run import get_test_run, get_test_run_requirements
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per cursor round trip and encoded per chunk / Parquet row group.
+EXPORT_BATCH_SIZE = 500
+
+BASE_COLUMNS = ["test_id", "prompt_content", "response", "created_at"]
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+    PARQUET = "parquet"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.JSONL: "application/x-ndjson",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+def get_metric_columns(db: Session, test_run: models.TestRun) -> List[Tuple[str, str]]:
+    """
+    Metric columns of a test run's export, as sorted (column name, metric name) pairs.
+
+    Args:
+        db: Database session
+        test_run: The exported test run
+
+    Returns:
+        One entry per requirement metric, named ``<requirement>_<metric>``
+    """
+    # SECURITY: organization_id from the test run prevents cross-tenant access
+    organization_id = str(test_run.organization_id)
+    columns: Dict[str, str] = {}
+    for requirement in get_test_run_requirements(db, test_run.id, organization_id=organization_id):
+        for metric in get_requirement_metrics(db, requirement.id, organization_id=organization_id):
+            columns[f"{requirement.name}_{metric.name}"] = metric.name
+    return sorted(columns.items())
+
+
+def format_metric_result(metric_result: Optional[Dict[str, Any]]) -> str:
+    """Render one metric result as ``Pass (score/threshold) - reason``."""
+    if not metric_result:
+        return "N/A"
+
+    status = "Pass" if metric_result.get("is_successful") else "Fail"
+    score = metric_result.get("score", "N/A")
+    threshold = metric_result.get("threshold")
+    reference_score = metric_result.get("reference_score")
+    reason = metric_result.get("reason", "")
+
+    if reference_score is not None:
+        # Binary/categorical metric
+        value = f"{status} ({score} vs {reference_score})"
+    elif threshold is not None:
+        # Numeric metric
+        value = f"{status} ({score}/{threshold})"
+    else:
+        # Generic metric
+        value = f"{status} ({score})"
+
+    if reason:
+        value += f" - {reason}"
+    return value
+
+
+def iter_result_rows(
+    db: Session,
+    test_run_id: uuid.UUID,
+    metric_columns: List[Tuple[str, str]],
+    organization_id: Optional[str] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one export row per test result, newest first.
+
+    Only the exported columns are selected (no ORM objects, so nothing
+    accumulates in the session) and the prompt is joined in rather than
+    fetched per result.
+    """
+    TestResult = models.TestResult
+    Prompt = models.Prompt
+    query = (
+        db.query(
+            TestResult.test_id,
+            TestResult.test_output,
+            TestResult.test_metrics,
+            TestResult.created_at,
+            Prompt.content,
+        )
+        .outerjoin(
+            Prompt,
+            (Prompt.id == TestResult.prompt_id)
+            & (Prompt.organization_id == TestResult.organization_id),
+        )
+        .filter(TestResult.test_run_id == test_run_id)
+    )
+    if organization_id:
+        query = query.filter(TestResult.organization_id == organization_id)
+    query = query.order_by(TestResult.created_at.desc(), TestResult.id).execution_options(
+        yield_per=batch_size
+    )
+
+    for test_id, test_output, test_metrics, created_at, prompt_content in query:
+        row: Dict[str, Any] = {
+            "test_id": str(test_id) if test_id else "N/A",
+            "prompt_content": prompt_content if prompt_content is not None else "N/A",
+            "response": test_output.get("output", "N/A") if test_output else "N/A",
+            "created_at": created_at.isoformat() if created_at else "N/A",
+        }
+        metrics = test_metrics.get("metrics", {}) if test_metrics else {}
+        for column, metric_name in metric_columns:
+            row[column] = format_metric_result(metrics.get(metric_name))
+        yield row
+
+
+def _batched(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def encode_csv(
+    rows: Iterable[Dict[str, Any]], columns: List[str], batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Encode rows as CSV, one chunk per batch (header first)."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    for batch in _batched(rows, batch_size):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header only; callers check for results before streaming
+        yield buffer.getvalue().encode("utf-8")
+
+
+def encode_jsonl(
+    rows: Iterable[Dict[str, Any]], batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Encode rows as JSON Lines, one chunk per batch."""
+    for batch in _batched(rows, batch_size):
+        yield "".join(json.dumps(row, default=str) + "\n" for row in batch).encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back whatever was written since the last drain."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def encode_parquet(
+    rows: Iterable[Dict[str, Any]], columns: List[str], batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[bytes]:
+    """Encode rows as Parquet (all columns strings), one row group per batch."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(column, pa.string()) for column in columns])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for batch in _batched(rows, batch_size):
+            table = pa.Table.from_pydict(
+                {
+                    column: [None if row.get(column) is None else str(row[column]) for row in batch]
+                    for column in columns
+                },
+                schema=schema,
+            )
+            writer.write_table(table, row_group_size=len(batch))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def stream_test_run_results(
+    db: Session,
+    test_run_id: uuid.UUID,
+    export_format: ExportFormat = ExportFormat.CSV,
+    organization_id: Optional[str] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[bytes]:
+    """
+    Stream a test run's results in the requested format.
+
+    Everything that can fail is checked before the first chunk, so errors
+    surface as a normal HTTP error rather than a truncated download.
+
+    Args:
+        db: Database session (must stay open while the stream is consumed)
+        test_run_id: UUID of the test run
+        export_format: CSV, JSONL or Parquet
+        organization_id: Organization ID for security filtering
+        batch_size: Rows per cursor fetch and per encoded chunk
+
+    Returns:
+        Iterator of encoded chunks
+
+    Raises:
+        ValueError: If the test run does not exist or has no results
+        ImportError: If Parquet is requested and pyarrow is not installed
+    """
+    test_run = get_test_run(db, test_run_id, organization_id=organization_id)
+    if not test_run:
+        raise ValueError("Test Run not found")
+
+    results_query = db.query(models.TestResult.id).filter(
+        models.TestResult.test_run_id == test_run_id
+    )
+    if organization_id:
+        results_query = results_query.filter(models.TestResult.organization_id == organization_id)
+    if results_query.first() is None:
+        raise ValueError("No test results found for this test run")
+
+    if export_format == ExportFormat.PARQUET:
+        try:
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as e:
+            raise ImportError("Parquet export requires pyarrow to be installed") from e
+
+    metric_columns = get_metric_columns(db, test_run)
+    columns = BASE_COLUMNS + [column for column, _ in metric_columns]
+    rows = iter_result_rows(db, test_run_id, metric_columns, organization_id, batch_size)
+    logger.info(
+        f"Exporting test run {test_run_id} as {export_format.value} "
+        f"({len(columns)} columns, {batch_size} rows per chunk)"
+    )
+
+    if export_format == ExportFormat.JSONL:
+        return encode_jsonl(rows, batch_size)
+    if export_format == ExportFormat.PARQUET:
+        return encode_parquet(rows, columns, batch_size)
+    return encode_csv(rows, columns, batch_size)
@@ -613,6 +613,89 @@ def update_test_set_attributes(
     # Transaction commit is handled by the session context manager
 
 
+def find_duplicate_tests(
+    db: Session,
+    test_set_id: str,
+    organization_id: str,
+    user_id: str = None,
+    use_embeddings: bool = True,
+) -> Dict[str, Any]:
+    """
+    Find near-duplicate tests in a test set.
+
+    Tests are compared on their prompt (or multi-turn goal) with the SDK's
+    MinHash/LSH deduplicator, oldest first, so the earliest test of each
+    duplicate group is kept. With ``use_embeddings`` the tests' stored active
+    embeddings add a cosine pass for paraphrases; tests without one are only
+    compared lexically. The cosine pass is skipped when the embeddings mix
+    configurations or an entity has more than one, as for the embedding graph.
+
+    Args:
+        db: Database session
+        test_set_id: UUID string of the test set
+        organization_id: Organization ID for security filtering
+        user_id: User ID for tenant context
+        use_embeddings: Also compare stored embeddings
+
+    Returns:
+        Dict with ``total_tests``, ``duplicate_test_ids`` and ``duplicate_of``
+        (duplicate test ID -> kept test ID)
+    """
+    from rhesis.backend.app.services.embedding.graph_builder import (
+        ambiguous_embeddings,
+        fetch_embeddings,
+    )
+    from rhesis.sdk.synthesizers.dedup import TestDeduplicator
+
+    Test = models.Test
+    rows = (
+        db.query(Test.id, Test.test_configuration["goal"].astext, Prompt.content)
+        .join(test_test_set_association, test_test_set_association.c.test_id == Test.id)
+        .outerjoin(Prompt, Prompt.id == Test.prompt_id)
+        .filter(
+            test_test_set_association.c.test_set_id == UUID(test_set_id),
+            Test.organization_id == UUID(organization_id),
+            Test.deleted_at.is_(None),
+        )
+        .order_by(Test.created_at, Test.id)
+        .all()
+    )
+    test_ids = [row[0] for row in rows]
+    texts = [goal or content or "" for _, goal, content in rows]
+
+    embeddings = None
+    if use_embeddings and test_ids:
+        stored = fetch_embeddings(db, test_ids, organization_id=organization_id, user_id=user_id)
+        mixed_config, duplicate_entity = ambiguous_embeddings(stored)
+        if mixed_config or duplicate_entity:
+            logger.warning(
+                f"Skipping semantic deduplication of test set {test_set_id}: ambiguous "
+                f"active embeddings (mixed_config={mixed_config} "
+                f"duplicate_entity={duplicate_entity})"
+            )
+        elif stored:
+            vectors = {embedding.entity_id: embedding.embedding for embedding in stored}
+            embeddings = [vectors.get(test_id) for test_id in test_ids]
+
+    result = TestDeduplicator().find_duplicates(texts, embeddings=embeddings)
+    duplicate_of = {
+        str(test_ids[duplicate]): str(test_ids[kept])
+        for duplicate, kept in result.duplicates.items()
+    }
+    logger.info(
+        f"Found {len(duplicate_of)} near-duplicate tests in test set {test_set_id} "
+        f"({result.lexical_duplicates} lexical, {result.semantic_duplicates} semantic) "
+        f"out of {len(test_ids)}"
+    )
+    return {
+        "total_tests": len(test_ids),
+        "duplicate_test_ids": list(duplicate_of),
+        "duplicate_of": duplicate_of,
+        "lexical_duplicates": result.lexical_duplicates,
+        "semantic_duplicates": result.semantic_duplicates,
+    }
+
+
 def get_last_completed_test_run(
     db: Session,
     test_set_identifier: str,
@@ -1056,6 +1139,7 @@ def _submit_test_configuration_for_execution(
     from rhesis.backend.app import crud
     from rhesis.backend.tasks import task_launcher
     from rhesis.backend.tasks.execution.run import create_test_run
+    from rhesis.backend.tasks.execution.scheduling import schedule_test_run
     from rhesis.backend.tasks.test_configuration import execute_test_configuration
 
     logger.debug(
@@ -1078,6 +1162,7 @@ def _submit_test_configuration_for_execution(
         db_test_config,
         current_user_id=str(current_user.id),
     )
+    priority = schedule_test_run(db, test_run)
     db.commit()
 
     test_run_id = str(test_run.id)
@@ -1090,6 +1175,7 @@ def _submit_test_configuration_for_execution(
             test_run_id=test_run_id,
             current_user=current_user,
             db=db,
+            priority=priority,
         )
     except Exception:
         # Mark the queued test run as failed so it doesn't stay stuck
@@ -1,9 +1,13 @@
 """Agent factory helpers for MCP operations."""
 
+from __future__ import annotations
+
 import logging
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from rhesis.sdk.agents.events import AgentEventHandler
+if TYPE_CHECKING:
+    # rhesis.sdk.agents loads the MCP client stack; only the handlers need it
+    from rhesis.sdk.agents.events import AgentEventHandler
 
 logger = logging.getLogger(__name__)
 
@@ -99,10 +99,22 @@ def dispatch_accrual(
 
     A queued task also gets Celery's retry policy, which an inline write in
     someone else's transaction never had.
+
+    Accruals are buffered per process and queued in aggregate (see
+    :mod:`rhesis.backend.app.services.usage_accumulator`), so a burst of LLM
+    calls costs a few broker messages rather than one each. The billing
+    period is fixed here, at accrual time.
     """
     if amount <= 0 or not organization_id:
         return
 
+    from rhesis.backend.app.services.usage_accumulator import get_usage_accumulator
+
+    accumulator = get_usage_accumulator()
+    if accumulator is not None:
+        accumulator.add(organization_id, resource, amount, _current_period()[0])
+        return
+
     # Imported lazily, not at module scope: `tasks/__init__.py` eagerly
     # imports every task module, and `tasks.usage` imports this module back
     # for `increment_usage`. A module-scope import here would be circular,
@@ -123,7 +135,11 @@ def dispatch_accrual(
 
 
 def increment_usage(
-    db: Session, org_id: Optional[str], resource: QuotaResource, amount: int = 1
+    db: Session,
+    org_id: Optional[str],
+    resource: QuotaResource,
+    amount: int = 1,
+    period_start: Optional[date] = None,
 ) -> None:
     """Atomically add *amount* to the org's counter for *resource* in the current period.
 
@@ -154,11 +170,14 @@ def increment_usage(
     tenant context never resolved) -- silently skipping is correct here:
     there is no organization to attribute the usage to, and casting an
     empty string to ``uuid`` would raise.
+
+    *period_start* picks the billing period to add to, for accruals that
+    were buffered before being queued; it defaults to the current one.
     """
     if amount <= 0 or not org_id:
         return
 
-    period_start, period_end = _current_period()
+    period_start, period_end = _current_period(period_start)
     stmt = (
         pg_insert(Usage.__table__)
         .values(
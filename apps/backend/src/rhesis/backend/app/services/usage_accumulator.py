@@ -0,0 +1,195 @@
+"""Per-process buffer that coalesces usage accruals before they are queued.
+
+:func:`~rhesis.backend.app.services.usage.dispatch_accrual` used to publish
+one ``accrue_usage`` task per accrual, and the model-token sink accrues
+after every single LLM call. A 10k-test run with three judge metrics
+turned into tens of thousands of broker messages and upserts, all to bump
+a handful of counters.
+
+Accruals are now summed in memory by ``(organization, resource, period)``,
+and a daemon thread queues one ``accrue_usage`` task per key every
+``USAGE_ACCRUAL_FLUSH_INTERVAL`` seconds (default 5). The period is fixed
+when the accrual happens, not when the task runs, so a flush that straddles
+midnight on the last day of a month still bills each call to its own month.
+
+The guarantees of ``dispatch_accrual`` still hold:
+
+- *Never raises.* :meth:`UsageAccumulator.add` swallows and logs anything
+  that goes wrong; so does the flusher. A flush whose publish fails puts
+  its deltas back so the next one retries them.
+- *Never blocks.* Adding is a dict update under a lock that is only ever
+  held for dict operations. Publishing happens on the flusher thread.
+
+What is still pending is flushed at shutdown: from the API lifespan, from
+the Celery worker shutdown signals, and from ``atexit`` for anything else.
+A process that is killed outright loses at most one interval of accruals.
+
+Set ``USAGE_ACCRUAL_FLUSH_INTERVAL=0`` to queue every accrual immediately,
+as before.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from rhesis.backend.app.quota import QuotaResource
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+
+# (organization_id, resource value, period_start)
+_Key = Tuple[str, str, date]
+
+
+def flush_interval() -> float:
+    """Seconds between flushes; 0 means accruals are not buffered at all."""
+    try:
+        return max(
+            0.0,
+            float(os.getenv("USAGE_ACCRUAL_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL_SECONDS)),
+        )
+    except ValueError:
+        return DEFAULT_FLUSH_INTERVAL_SECONDS
+
+
+def _queue_accrual(
+    organization_id: str, resource: str, amount: int, period_start: Optional[date] = None
+) -> None:
+    # Imported lazily for the same reason as in dispatch_accrual: tasks.usage
+    # imports the usage service, which imports this module.
+    from rhesis.backend.tasks.usage import accrue_usage
+
+    if period_start is None:
+        accrue_usage.delay(organization_id, resource, amount)
+    else:
+        accrue_usage.delay(organization_id, resource, amount, period_start.isoformat())
+
+
+class UsageAccumulator:
+    """Sums accruals by (organization, resource, period) and flushes them in batches."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._pending: Dict[_Key, int] = defaultdict(int)
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(
+        self, organization_id: str, resource: QuotaResource, amount: int, period_start: date
+    ) -> None:
+        """Buffer *amount*; never raises and never waits on I/O."""
+        try:
+            with self._lock:
+                self._pending[(str(organization_id), resource.value, period_start)] += amount
+            self._ensure_flusher()
+        except Exception:
+            logger.warning(
+                "Failed to buffer %s accrual (amount=%s) for org %s",
+                resource.value,
+                amount,
+                organization_id,
+                exc_info=True,
+            )
+
+    def flush(self) -> int:
+        """Queue one accrual task per buffered key; returns how many were queued."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+
+        queued = 0
+        for (organization_id, resource, period_start), amount in pending.items():
+            try:
+                _queue_accrual(organization_id, resource, amount, period_start)
+                queued += 1
+            except Exception:
+                logger.warning(
+                    "Failed to queue %s accrual (amount=%s) for org %s; will retry",
+                    resource,
+                    amount,
+                    organization_id,
+                    exc_info=True,
+                )
+                with self._lock:
+                    self._pending[(organization_id, resource, period_start)] += amount
+        return queued
+
+    def pending(self) -> Dict[_Key, int]:
+        """Snapshot of what has not been flushed yet."""
+        with self._lock:
+            return dict(self._pending)
+
+    def _ensure_flusher(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="usage-accrual-flusher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.warning("Usage accrual flush failed", exc_info=True)
+
+    def _reset_after_fork(self) -> None:
+        # The child inherits the parent's pending sums (the parent flushes
+        # those) and a lock that may have been held mid-update, but not the
+        # flusher thread.
+        self._lock = threading.Lock()
+        self._pending = defaultdict(int)
+        self._wakeup = threading.Event()
+        self._thread = None
+
+
+_accumulator: Optional[UsageAccumulator] = None
+_accumulator_lock = threading.Lock()
+
+
+def get_usage_accumulator() -> Optional[UsageAccumulator]:
+    """The process's accumulator, or None when buffering is disabled."""
+    global _accumulator
+    interval = flush_interval()
+    if interval <= 0:
+        return None
+    if _accumulator is None:
+        with _accumulator_lock:
+            if _accumulator is None:
+                _accumulator = UsageAccumulator(interval)
+    return _accumulator
+
+
+def flush_usage_accruals() -> None:
+    """Queue everything still buffered. Called at shutdown; never raises."""
+    if _accumulator is None:
+        return
+    try:
+        queued = _accumulator.flush()
+        if queued:
+            logger.info("Flushed %s buffered usage accrual(s)", queued)
+    except Exception:
+        logger.warning("Failed to flush buffered usage accruals", exc_info=True)
+
+
+def _reset_after_fork() -> None:
+    if _accumulator is not None:
+        _accumulator._reset_after_fork()
+
+
+atexit.register(flush_usage_accruals)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -19,7 +19,6 @@ from rhesis.backend.app.schemas.websocket import (
 if TYPE_CHECKING:
     from rhesis.backend.app.services.websocket.manager import WebSocketManager
 
-from rhesis.sdk.agents.errors import format_user_facing_error
 
 logger = logging.getLogger(__name__)
 
@@ -174,6 +173,9 @@ async def handle_architect_message(
 
     except Exception as e:
         logger.error(f"Error handling architect message: {e}", exc_info=True)
+        # rhesis.sdk.agents loads the MCP client stack; not needed until an error
+        from rhesis.sdk.agents.errors import format_user_facing_error
+
         await _send_architect_error(
             manager,
             conn_id,
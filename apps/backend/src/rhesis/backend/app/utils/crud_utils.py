@@ -443,6 +443,7 @@ def get_items_detail(
     exclude_explorer_rows: bool = False,
     extra_filter: Callable[[Query], Query] | None = None,
     hydrate_filter: Callable[[Query], Query] | None = None,
+    cursor: str | None = None,
 ) -> List[T]:
     """
     Get multiple items with explicitly declared relationships eagerly loaded,
@@ -475,6 +476,10 @@ def get_items_detail(
             deferring ``Endpoint.last_token``. Applying a loader option like
             this to the id-only phase-1 query would be meaningless (or emit
             SQLAlchemy warnings), since that query never loads the relationship.
+        cursor: Keyset pagination cursor from ``cursor_pagination.next_cursor``
+            for the previous page, used instead of ``skip``. The phase-1 id
+            query then seeks past the cursor's row rather than OFFSETting
+            over every earlier one, so deep pages cost the same as the first.
 
     Runs as two queries rather than one: a joinless query picks the page's IDs
     (filter + sort + LIMIT/OFFSET), then a second query eager-loads
@@ -505,6 +510,7 @@ def get_items_detail(
             secondary_sort_order=secondary_sort_order,
         )
         .with_pagination(skip, limit)
+        .with_cursor(cursor)
         .ids()
     )
     if not ordered_ids:
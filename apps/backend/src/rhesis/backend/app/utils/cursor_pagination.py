@@ -0,0 +1,178 @@
+"""Keyset (cursor) pagination for QueryBuilder-based list queries.
+
+OFFSET pagination makes Postgres produce and discard every row before the
+page, so page N costs O(N * limit). A cursor instead records the sort-key
+values of the last row returned, and the next page starts with a
+``WHERE (sort_key, id) > (last values)`` predicate whose leading-key range
+an index on the sort column can seek to: every page costs about the same as
+the first.
+
+A cursor is an opaque, URL-safe token encoding the sort spec it was issued
+for (primary sort, optional secondary sort, and the ``id`` tiebreaker
+QueryBuilder always appends) plus the last row's values for each of them.
+Presenting it with a different sort is rejected with a 400 rather than
+silently skipping or repeating rows.
+
+NULLs follow Postgres ordering: last for ASC, first for DESC.
+
+Only plain column sorts can be keyset-paginated; virtual count and
+relationship sorts (``count_sort`` / ``relationship_sort``) sort on computed
+expressions that a row does not carry.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Sequence, Tuple, Type
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy import and_, false, or_
+
+# (field name, "asc" | "desc") for each ordering key, tiebreaker last.
+SortKey = List[Tuple[str, str]]
+
+CURSOR_HEADER = "X-Next-Cursor"
+
+
+def sort_key(
+    sort_by: Optional[str],
+    sort_order: str = "asc",
+    secondary_sort_by: Optional[str] = None,
+    secondary_sort_order: str = "asc",
+) -> SortKey:
+    """The full ordering QueryBuilder applies for these sort params, id last."""
+    keys = []
+    if sort_by:
+        keys.append((sort_by, sort_order.lower()))
+    if secondary_sort_by:
+        keys.append((secondary_sort_by, secondary_sort_order.lower()))
+    keys.append(("id", "asc"))
+    return keys
+
+
+def is_keyset_sortable(field: Optional[str]) -> bool:
+    """Whether *field* is a plain column sort (not a virtual count/relationship sort)."""
+    from rhesis.backend.app.utils.count_sort import is_virtual_count_sort
+    from rhesis.backend.app.utils.relationship_sort import is_virtual_relationship_sort
+
+    return not field or not (is_virtual_count_sort(field) or is_virtual_relationship_sort(field))
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    raise TypeError(f"Cannot encode a {type(value).__name__} sort value into a cursor")
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "u" in value:
+            return UUID(value["u"])
+        if "n" in value:
+            return Decimal(value["n"])
+        raise ValueError("unknown cursor value tag")
+    return value
+
+
+def encode_cursor(item: Any, key: SortKey) -> str:
+    """Cursor pointing just past *item* in the ordering *key*."""
+    payload = {
+        "k": [list(k) for k in key],
+        "v": [_encode_value(getattr(item, field)) for field, _ in key],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, key: SortKey) -> List[Any]:
+    """Return the last-row values in *cursor*, checking it was issued for *key*."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        issued_for = [tuple(k) for k in payload["k"]]
+        values = [_decode_value(v) for v in payload["v"]]
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeEncodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if issued_for != list(key) or len(values) != len(key):
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor does not match the requested sort; restart without a cursor",
+        )
+    return values
+
+
+def _after(column, value, direction: str):
+    """Rows strictly after *value* in *column*'s direction (NULLS LAST asc / FIRST desc)."""
+    if direction == "desc":
+        return column.isnot(None) if value is None else column < value
+    return false() if value is None else or_(column > value, column.is_(None))
+
+
+def _same(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def _at_or_after(column, value, direction: str):
+    """Range on the leading key alone; implied by the full predicate, but sargable."""
+    if value is None:
+        return column.is_(None) if direction == "asc" else None
+    if direction == "desc":
+        return column <= value
+    return or_(column >= value, column.is_(None))
+
+
+def keyset_filter(model: Type, key: SortKey, values: Sequence[Any]):
+    """Lexicographic ``(k1, k2, ..., id) > (v1, v2, ..., vid)`` honouring each direction.
+
+    Expanded as ``k1 > v1 OR (k1 = v1 AND (k2 > v2 OR (k2 = v2 AND ...)))``
+    rather than a row-value comparison, which only matches this ordering when
+    every key sorts in the same direction and none is NULL. The OR form alone
+    can't use an index range, so it is ANDed with the (redundant) range on
+    the leading key, ``k1 >= v1``, which can.
+    """
+    clause = None
+    for (field, direction), value in reversed(list(zip(key, values))):
+        column = getattr(model, field)
+        after = _after(column, value, direction)
+        clause = after if clause is None else or_(after, and_(_same(column, value), clause))
+
+    (leading_field, leading_direction), leading_value = key[0], values[0]
+    bound = _at_or_after(getattr(model, leading_field), leading_value, leading_direction)
+    return clause if bound is None else and_(bound, clause)
+
+
+def next_cursor(
+    items: Sequence[Any],
+    limit: Optional[int],
+    sort_by: Optional[str],
+    sort_order: str = "asc",
+    secondary_sort_by: Optional[str] = None,
+    secondary_sort_order: str = "asc",
+) -> Optional[str]:
+    """Cursor for the page after *items*, or None when there is none to give.
+
+    None when the page was short (the last one) or the sort can't be keyset-
+    paginated. Works for pages fetched by OFFSET too, so a client can switch
+    to cursors from any page.
+    """
+    if not items or not limit or len(items) < limit:
+        return None
+    if not (is_keyset_sortable(sort_by) and is_keyset_sortable(secondary_sort_by)):
+        return None
+    key = sort_key(sort_by, sort_order, secondary_sort_by, secondary_sort_order)
+    return encode_cursor(items[-1], key)
@@ -2,6 +2,7 @@ import logging
 from typing import Callable, List, Optional, Type, TypeVar
 from uuid import UUID
 
+from fastapi import HTTPException
 from sqlalchemy import desc, inspect, or_
 from sqlalchemy.orm import Query, Session, joinedload, selectinload
 
@@ -103,6 +104,7 @@ class QueryBuilder:
         self._sort_order = "asc"
         self._secondary_sort_by = None
         self._secondary_sort_order = "asc"
+        self._cursor = None
         # Track eager-load count so we can warn callers who request an
         # unreasonably large number of relationships on a single query. Not
         # split by strategy (joined vs. selectin) -- that decision happens
@@ -296,6 +298,17 @@ class QueryBuilder:
         self._limit = limit
         return self
 
+    def with_cursor(self, cursor: Optional[str]) -> "QueryBuilder":
+        """Start the page just after the row *cursor* points at (keyset pagination).
+
+        Replaces OFFSET: the page starts with a WHERE on the sort keys, so its
+        cost doesn't grow with depth. The cursor must have been issued (see
+        ``cursor_pagination.next_cursor``) for the same sorting; only plain
+        column sorts are supported. No-op when *cursor* is None.
+        """
+        self._cursor = cursor
+        return self
+
     def with_sorting(
         self,
         sort_by: Optional[str] = None,
@@ -370,9 +383,37 @@ class QueryBuilder:
                 self.query = self.query.order_by(secondary_column)
         # Always append id ASC as a final unique tiebreaker so results are
         # strictly deterministic even when all other sort keys are equal.
-        if self._sort_by and hasattr(self.model, "id"):
+        # Keyset pagination relies on it too.
+        if (self._sort_by or self._cursor) and hasattr(self.model, "id"):
             self.query = self.query.order_by(self.model.id)
 
+    def _apply_cursor(self):
+        """Apply the keyset predicate for the configured cursor, if any."""
+        if not self._cursor:
+            return
+        from rhesis.backend.app.utils.cursor_pagination import (
+            decode_cursor,
+            is_keyset_sortable,
+            keyset_filter,
+            sort_key,
+        )
+
+        for field in (self._sort_by, self._secondary_sort_by):
+            if not is_keyset_sortable(field):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Cursor pagination is not supported when sorting by {field}",
+                )
+        if self._skip:
+            raise HTTPException(status_code=400, detail="skip cannot be combined with a cursor")
+
+        key = sort_key(
+            self._sort_by, self._sort_order, self._secondary_sort_by, self._secondary_sort_order
+        )
+        self.query = self.query.filter(
+            keyset_filter(self.model, key, decode_cursor(self._cursor, key))
+        )
+
     def _apply_pagination(self):
         """Apply pagination if configured"""
         if self._skip:
@@ -382,6 +423,7 @@ class QueryBuilder:
 
     def build(self) -> Query:
         """Return the final query"""
+        self._apply_cursor()
         self._apply_sorting()
         self._apply_pagination()
         return self.query
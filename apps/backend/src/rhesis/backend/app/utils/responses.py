@@ -0,0 +1,20 @@
+"""orjson-backed default JSON response class."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """``JSONResponse`` that renders with orjson instead of the stdlib encoder.
+
+    Set as the app's ``default_response_class`` wrapped in ``Default``, so
+    FastAPI versions that serialize response models straight to JSON bytes
+    still take that path. Everything else -- the ``jsonable_encoder``-ed
+    content of list endpoints and plain dict returns -- is rendered here
+    instead of by ``json.dumps``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
@@ -2,6 +2,17 @@ from rhesis.backend.app.config.settings import get_redis_settings
 
 redis_settings = get_redis_settings()
 
+# Redis emulates message priorities with one list per step (0 = highest);
+# test runs are dispatched with a fairness priority from
+# tasks/execution/scheduling.py. Messages sent without a priority are
+# consumed as highest, so other tasks keep their current ordering.
+# Publisher (web) and worker must agree on these, hence shared by both.
+PRIORITY_TRANSPORT_OPTIONS = {
+    "priority_steps": list(range(10)),
+    "sep": ":",
+    "queue_order_strategy": "priority",
+}
+
 # Worker-context config: retry aggressively to ensure task delivery
 CELERY_CONFIG = {
     # Redis configuration
@@ -27,6 +38,7 @@ CELERY_CONFIG = {
     # max_connections limits the underlying redis-py ConnectionPool so that
     # slow operations under Redis contention don't cause unbounded growth.
     "broker_transport_options": {
+        **PRIORITY_TRANSPORT_OPTIONS,
         "retry_on_timeout": True,
         "connection_pool_kwargs": {
             "max_connections": 10,
@@ -62,7 +74,8 @@ CELERY_CONFIG = {
         "interval_step": 0.2,
         "interval_max": 1.0,
     },
-    # Task tracking for monitoring
+    # Task tracking for monitoring. Queue wait is measured without sent events,
+    # from the enqueue-time header stamped in celery/metrics.py.
     "task_send_sent_event": False,  # Disable for performance
     "worker_send_task_events": False,  # Disable for performance
     # Reduce verbose task result logging
@@ -74,6 +87,11 @@ CELERY_CONFIG = {
             "soft_time_limit": 3600,
             "time_limit": 3900,
         },
+        # Each shard of a sharded test run gets the full batch budget
+        "rhesis.backend.tasks.execution.shards.execute_test_shard": {
+            "soft_time_limit": 3600,
+            "time_limit": 3900,
+        },
         "rhesis.backend.tasks.telemetry.evaluate.evaluate_turn_trace_metrics": {
             "max_retries": 3,
             "soft_time_limit": 300,
@@ -93,6 +111,7 @@ CELERY_CONFIG = {
         "rhesis.backend.tasks.example_task",
         "rhesis.backend.tasks.test_set",
         "rhesis.backend.tasks.execution.results",
+        "rhesis.backend.tasks.execution.shards",
         "rhesis.backend.tasks.telemetry.enrich",
         "rhesis.backend.tasks.architect.chat",
         "rhesis.backend.tasks.telemetry.evaluate",
@@ -108,6 +127,7 @@ WEB_CELERY_OVERRIDES = {
     # Web processes only publish tasks — they need fewer connections than workers.
     "broker_pool_limit": 5,
     "broker_transport_options": {
+        **PRIORITY_TRANSPORT_OPTIONS,
         "retry_on_timeout": False,
         "connection_pool_kwargs": {
             "max_connections": 5,
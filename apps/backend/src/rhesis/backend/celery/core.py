@@ -2,6 +2,9 @@ import logging
 
 from celery import Celery
 
+# Registers the enqueue-time stamp for every publisher (web and worker) and
+# the queue-wait/run-time signal handlers
+import rhesis.backend.celery.metrics  # noqa: F401
 from rhesis.backend.celery.config import CELERY_CONFIG
 
 logger = logging.getLogger(__name__)
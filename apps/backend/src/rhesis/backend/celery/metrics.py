@@ -0,0 +1,194 @@
+"""Per-queue wait and run-time histograms for Celery tasks.
+
+``task_send_sent_event`` is off (see ``celery/config.py``), so nothing records
+how long a task sat in the broker before a worker started it. Instead every
+published message is stamped with its enqueue time in the
+``rhesis_enqueued_at`` header (``before_task_publish``, which fires in the
+web process and in workers that publish follow-up tasks), and the worker
+observes:
+
+- ``rhesis_celery_task_queue_wait_seconds``: enqueue to ``task_prerun``
+- ``rhesis_celery_task_run_seconds``: ``task_prerun`` to ``task_postrun``
+
+both labelled by queue. Each worker process serves them in the Prometheus
+text format on ``CELERY_METRICS_PORT`` (unset: no server). The workers run
+the threads pool, so one process holds every task's observations; under
+prefork each child would keep its own.
+
+Wait times compare the publisher's clock with the worker's, so they are only
+as accurate as the hosts' clock sync; negative values are clamped to zero.
+"""
+
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from celery.signals import before_task_publish, task_postrun, task_prerun, worker_ready
+
+logger = logging.getLogger(__name__)
+
+ENQUEUED_AT_HEADER = "rhesis_enqueued_at"
+METRICS_PORT_ENV = "CELERY_METRICS_PORT"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans sub-second telemetry tasks up to hour-long test runs
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+
+class Histogram:
+    """Thread-safe cumulative histogram keyed by queue, rendered as Prometheus text."""
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # queue -> [per-bucket counts..., +Inf count], sum
+        self._counts: Dict[str, List[int]] = {}
+        self._sums: Dict[str, float] = {}
+
+    def observe(self, queue: str, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.setdefault(queue, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._sums[queue] = self._sums.get(queue, 0.0) + value
+
+    def snapshot(self, queue: str) -> Tuple[int, float]:
+        """``(count, sum)`` observed for *queue*."""
+        with self._lock:
+            return sum(self._counts.get(queue, ())), self._sums.get(queue, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = {queue: list(counts) for queue, counts in self._counts.items()}
+            sums = dict(self._sums)
+        for queue in sorted(series):
+            label = _escape(queue)
+            cumulative = 0
+            for bound, count in zip(self.buckets, series[queue]):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{queue="{label}",le="{bound:g}"}} {cumulative}')
+            cumulative += series[queue][-1]
+            lines.append(f'{self.name}_bucket{{queue="{label}",le="+Inf"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{queue="{label}"}} {sums[queue]}')
+            lines.append(f'{self.name}_count{{queue="{label}"}} {cumulative}')
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+
+QUEUE_WAIT = Histogram(
+    "rhesis_celery_task_queue_wait_seconds",
+    "Time from publishing a task to a worker starting it.",
+)
+RUN_TIME = Histogram(
+    "rhesis_celery_task_run_seconds",
+    "Time from a worker starting a task to it finishing.",
+)
+
+# (queue, perf_counter at prerun) by task id; a dict because thread-pool
+# workers run several tasks at once in this process.
+_running: Dict[str, Tuple[str, float]] = {}
+
+
+def render_metrics() -> str:
+    return "\n".join(QUEUE_WAIT.render() + RUN_TIME.render()) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _task_queue(request) -> str:
+    delivery_info = getattr(request, "delivery_info", None) or {}
+    return delivery_info.get("routing_key") or "celery"
+
+
+def _enqueued_at(request) -> Optional[float]:
+    value = getattr(request, ENQUEUED_AT_HEADER, None)
+    if value is None:
+        headers = getattr(request, "headers", None) or {}
+        value = headers.get(ENQUEUED_AT_HEADER) if hasattr(headers, "get") else None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@before_task_publish.connect
+def stamp_enqueue_time(headers=None, **kwargs):
+    """Record when the message was published; a retry is a fresh publish."""
+    if headers is not None:
+        headers[ENQUEUED_AT_HEADER] = time.time()
+
+
+@task_prerun.connect
+def observe_queue_wait(task_id=None, task=None, **kwargs):
+    request = getattr(task, "request", None)
+    if not task_id or request is None or getattr(request, "is_eager", False):
+        return
+
+    queue = _task_queue(request)
+    enqueued_at = _enqueued_at(request)
+    if enqueued_at is not None:
+        QUEUE_WAIT.observe(queue, max(0.0, time.time() - enqueued_at))
+    _running[task_id] = (queue, time.perf_counter())
+
+
+@task_postrun.connect
+def observe_run_time(task_id=None, **kwargs):
+    started = _running.pop(task_id, None)
+    if started is not None:
+        queue, start = started
+        RUN_TIME.observe(queue, time.perf_counter() - start)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_metrics().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scraped every few seconds; not worth a log line each time
+        pass
+
+
+def start_metrics_server(port: int, host: str = "") -> ThreadingHTTPServer:
+    """Serve ``/metrics`` from a daemon thread; returns the server."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="celery-metrics", daemon=True)
+    thread.start()
+    return server
+
+
+@worker_ready.connect
+def start_worker_metrics_server(sender=None, **kwargs):
+    port = os.getenv(METRICS_PORT_ENV)
+    if not port:
+        return
+    try:
+        start_metrics_server(int(port))
+    except (OSError, ValueError) as e:
+        logger.error("Could not start Celery metrics server on port %s: %s", port, e)
+        return
+    logger.info("Celery task metrics served on :%s/metrics", port)
@@ -9,6 +9,7 @@ from celery.signals import (
     task_prerun,
     task_revoked,
     worker_process_init,
+    worker_process_shutdown,
     worker_ready,
     worker_shutdown,
 )
@@ -272,6 +273,20 @@ def handle_worker_shutdown(sender=None, **kw):
         logger.debug(f"Could not close thread-local HTTP client on shutdown: {e}")
 
 
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def flush_worker_usage_accruals(**kwargs):
+    """Queue usage accruals still buffered in this process before it exits.
+
+    ``worker_shutdown`` covers the threads pool this deployment runs;
+    ``worker_process_shutdown`` covers prefork children, which exit without
+    running ``atexit`` handlers.
+    """
+    from rhesis.backend.app.services.usage_accumulator import flush_usage_accruals
+
+    flush_usage_accruals()
+
+
 @task_revoked.connect
 def handle_task_revoked(sender=None, request=None, **kw):
     if request:
@@ -5,7 +5,9 @@ from typing import Any, Dict, List, Optional, Union
 from sqlalchemy.orm import Session
 
 from rhesis.backend.app.models.metric import Metric as MetricModel
+from rhesis.backend.app.services.evaluation_cache import RunEvaluationCache
 from rhesis.backend.metrics.metric_config import validate_metric_configs
+from rhesis.backend.metrics.metric_pool import MetricPool
 from rhesis.backend.metrics.score_evaluator import ScoreEvaluator
 from rhesis.backend.metrics.strategies.base import MetricStrategy
 from rhesis.backend.metrics.strategies.connector import (
@@ -40,6 +42,8 @@ class MetricEvaluator:
         connector_metric_sender: Optional[ConnectorMetricSender] = None,
         extra_strategies: Optional[List[MetricStrategy]] = None,
         metric_models: Optional[Dict[str, Any]] = None,
+        metric_pool: Optional[MetricPool] = None,
+        evaluation_cache: Optional[RunEvaluationCache] = None,
     ) -> None:
         """
         Initialize evaluator with optional backend strategy overrides.
@@ -57,6 +61,10 @@ class MetricEvaluator:
             metric_models: Judge models already resolved by `model_id`, for callers
                 that have no live session to resolve them with. Required in the batch
                 path, which runs after its session is closed; see `prepare_metrics`.
+            metric_pool: Optional batch-scoped pool that local metric instances are
+                checked out of instead of being constructed for every evaluation.
+            evaluation_cache: Optional per-run judge-result cache that local metrics
+                are looked up in before they are evaluated.
         """
         score_evaluator = ScoreEvaluator()
 
@@ -66,6 +74,8 @@ class MetricEvaluator:
             organization_id=organization_id,
             score_evaluator=score_evaluator,
             metric_models=metric_models,
+            metric_pool=metric_pool,
+            evaluation_cache=evaluation_cache,
         )
 
         self._connector_strategy: MetricStrategy = ConnectorStrategy(
@@ -0,0 +1,134 @@
+"""
+Batch-scoped pool of constructed metric instances.
+
+``prepare_metrics`` runs once per test, and building a metric is not free:
+judge metrics set up a Jinja environment, the DeepEval and Ragas wrappers
+build their upstream metric objects, and Garak detector metrics load their
+detector. Across a batch the configs are the same for every test, so that
+work is repeated thousands of times for identical results.
+
+Instances are checked out rather than shared. Several wrappers keep the
+score and reason of the call in progress on the instance, so two tests must
+never evaluate through the same object at once. A test acquires an idle
+instance for each of its configs (constructing one only when none is idle)
+and releases it once its evaluation has finished. The pool therefore never
+holds more instances per config than the batch runs tests concurrently.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from rhesis.sdk.metrics import BaseMetric
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[Hashable, ...]
+
+
+def _model_identity(model: Any) -> Hashable:
+    """Stable identity of a judge model: its class, provider, name and endpoint.
+
+    ``id()`` is not used: ids of collected objects are reused, and equal
+    models resolved separately should share instances anyway. The API key
+    is part of the identity (hashed), since the instance keeps using it.
+    """
+    if model is None or isinstance(model, str):
+        return model
+    api_key = getattr(model, "api_key", None)
+    return (
+        f"{type(model).__module__}.{type(model).__qualname__}",
+        getattr(model, "PROVIDER", None),
+        getattr(model, "model_name", None),
+        getattr(model, "api_base", None),
+        getattr(model, "api_version", None),
+        hashlib.sha256(str(api_key).encode("utf-8")).hexdigest() if api_key else None,
+    )
+
+
+def metric_pool_key(backend: str, class_name: str, factory_params: Dict[str, Any]) -> PoolKey:
+    """Identity of a metric config: everything it is constructed from."""
+    params = {k: v for k, v in factory_params.items() if k != "model"}
+    return (
+        backend,
+        class_name,
+        json.dumps(params, sort_keys=True, default=str),
+        _model_identity(factory_params.get("model")),
+    )
+
+
+@dataclass
+class MetricPoolStats:
+    """Construction work done and avoided by a pool."""
+
+    constructed: int = 0
+    reused: int = 0
+    construction_seconds: float = 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated construction time avoided by reusing instances."""
+        if not self.constructed:
+            return 0.0
+        return self.reused * self.construction_seconds / self.constructed
+
+
+class MetricPool:
+    """Thread-safe checkout pool of metric instances, keyed by config identity."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: Dict[PoolKey, List[BaseMetric]] = defaultdict(list)
+        # id(instance) -> key, for instances currently checked out.
+        self._checked_out: Dict[int, PoolKey] = {}
+        self._stats = MetricPoolStats()
+
+    def acquire(self, key: PoolKey, factory: Callable[[], BaseMetric]) -> BaseMetric:
+        """Check out an idle instance for *key*, or construct one with *factory*.
+
+        Exceptions from *factory* propagate to the caller.
+        """
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                metric = idle.pop()
+                self._checked_out[id(metric)] = key
+                self._stats.reused += 1
+                return metric
+
+        # Construct outside the lock so slow constructors don't serialise
+        # the tests that only need an idle instance.
+        started = time.perf_counter()
+        metric = factory()
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self._checked_out[id(metric)] = key
+            self._stats.constructed += 1
+            self._stats.construction_seconds += elapsed
+        return metric
+
+    def release(self, metric: BaseMetric) -> None:
+        """Return a checked-out instance so another test can use it.
+
+        Only release an instance once nothing is evaluating through it any
+        more. Releasing an instance this pool did not hand out is a no-op.
+        """
+        with self._lock:
+            key = self._checked_out.pop(id(metric), None)
+            if key is not None:
+                self._idle[key].append(metric)
+
+    def stats(self) -> MetricPoolStats:
+        """Snapshot of the pool's counters."""
+        with self._lock:
+            return MetricPoolStats(
+                constructed=self._stats.constructed,
+                reused=self._stats.reused,
+                construction_seconds=self._stats.construction_seconds,
+            )
@@ -22,8 +22,13 @@ from tenacity import (
     wait_exponential,
 )
 
+from rhesis.backend.app.services.evaluation_cache import (
+    RunEvaluationCache,
+    evaluation_fingerprint,
+)
 from rhesis.backend.app.usage_attribution import with_usage_attribution
 from rhesis.backend.metrics.metric_config import build_metric_evaluate_params
+from rhesis.backend.metrics.metric_pool import MetricPool, metric_pool_key
 from rhesis.backend.metrics.result_builder import MetricResultBuilder
 from rhesis.backend.metrics.score_evaluator import ScoreEvaluator
 from rhesis.sdk.metrics import BaseMetric, MetricConfig, MetricResult
@@ -57,12 +62,16 @@ class LocalStrategy:
         organization_id: Optional[str] = None,
         score_evaluator: Optional[ScoreEvaluator] = None,
         metric_models: Optional[Dict[str, Any]] = None,
+        metric_pool: Optional[MetricPool] = None,
+        evaluation_cache: Optional[RunEvaluationCache] = None,
     ) -> None:
         self._model = model
         self._db = db
         self._organization_id = organization_id
         self._score_evaluator = score_evaluator or ScoreEvaluator()
         self._metric_models = metric_models
+        self._metric_pool = metric_pool
+        self._evaluation_cache = evaluation_cache
 
     def backend_value(self) -> str:
         return "__local__"
@@ -89,6 +98,7 @@ class LocalStrategy:
             db=self._db,
             organization_id=self._organization_id,
             metric_models=self._metric_models,
+            metric_pool=self._metric_pool,
         )
         return self._execute_metrics_in_parallel(
             metric_tasks,
@@ -119,6 +129,8 @@ class LocalStrategy:
 
         Mirrors the sync path's resilience: bounded concurrency via semaphore,
         per-metric retry for transient failures, and an overall timeout.
+        With an evaluation cache, metrics whose result is cached are not
+        evaluated, and fresh results are stored for the next run.
         """
         metric_tasks = prepare_metrics(
             configs,
@@ -128,12 +140,25 @@ class LocalStrategy:
             db=self._db,
             organization_id=self._organization_id,
             metric_models=self._metric_models,
+            metric_pool=self._metric_pool,
         )
         if not metric_tasks:
             logger.warning("No metrics to evaluate (async)")
             return {}
 
         metric_keys, results = self._generate_unique_metric_keys(metric_tasks)
+        pending, fingerprints = await self._a_apply_cached_results(
+            metric_tasks,
+            metric_keys,
+            results,
+            input_text,
+            output_text,
+            expected_output,
+            context,
+            conversation_history=conversation_history,
+            metadata=metadata,
+            tool_calls=tool_calls,
+        )
         sem = asyncio.Semaphore(max_workers)
 
         async def _eval_one(
@@ -143,25 +168,35 @@ class LocalStrategy:
             metric_config: MetricConfig,
             backend: str,
         ) -> Tuple[str, Dict[str, Any]]:
-            async with sem:
-                return await self._a_eval_one_with_retry(
-                    unique_key,
-                    class_name,
-                    metric,
-                    metric_config,
-                    backend,
-                    input_text,
-                    output_text,
-                    expected_output,
-                    context,
-                    conversation_history=conversation_history,
-                    metadata=metadata,
-                    tool_calls=tool_calls,
-                )
-
-        coros = [
-            _eval_one(key, cn, m, mc, b) for (cn, m, mc, b), key in zip(metric_tasks, metric_keys)
-        ]
+            started = cancelled = False
+            try:
+                async with sem:
+                    started = True
+                    return await self._a_eval_one_with_retry(
+                        unique_key,
+                        class_name,
+                        metric,
+                        metric_config,
+                        backend,
+                        input_text,
+                        output_text,
+                        expected_output,
+                        context,
+                        conversation_history=conversation_history,
+                        metadata=metadata,
+                        tool_calls=tool_calls,
+                    )
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                # Not released when cancelled by the overall timeout mid-
+                # evaluation: work it started in a thread may still be using
+                # the instance.
+                if not (started and cancelled):
+                    self._release_metric(metric)
+
+        coros = [_eval_one(key, cn, m, mc, b) for (cn, m, mc, b), key in pending]
 
         try:
             eval_results = await asyncio.wait_for(
@@ -179,6 +214,14 @@ class LocalStrategy:
             key, val = item
             results[key] = val
 
+        if self._evaluation_cache is not None and fingerprints:
+            await asyncio.gather(
+                *(
+                    self._evaluation_cache.a_store(fingerprint, results[key])
+                    for key, fingerprint in fingerprints.items()
+                )
+            )
+
         self._handle_incomplete_metrics(results, metric_keys, metric_tasks)
         self._log_evaluation_summary(results)
         return results
@@ -326,25 +369,38 @@ class LocalStrategy:
     ) -> Dict[concurrent.futures.Future, Tuple[str, str, MetricConfig, str]]:
         future_to_metric: Dict[concurrent.futures.Future, Tuple[str, str, MetricConfig, str]] = {}
 
-        for (class_name, metric, metric_config, backend), unique_key in zip(
-            metric_tasks, metric_keys
-        ):
-            # ThreadPoolExecutor does not carry contextvars into its workers
-            # the way asyncio.to_thread does, and an LLM judge running here
-            # emits token usage that has to name an org. Without this the
-            # judge's tokens land in the unattributed bucket.
-            future = executor.submit(
-                with_usage_attribution(self._evaluate_metric_with_retry),
-                metric,
-                input_text,
-                output_text,
-                expected_output,
-                context,
-                conversation_history=conversation_history,
-                metadata=metadata,
-                tool_calls=tool_calls,
-            )
-            future_to_metric[future] = (unique_key, class_name, metric_config, backend)
+        submitted = 0
+        try:
+            for (class_name, metric, metric_config, backend), unique_key in zip(
+                metric_tasks, metric_keys
+            ):
+                # ThreadPoolExecutor does not carry contextvars into its workers
+                # the way asyncio.to_thread does, and an LLM judge running here
+                # emits token usage that has to name an org. Without this the
+                # judge's tokens land in the unattributed bucket.
+                future = executor.submit(
+                    with_usage_attribution(self._evaluate_metric_with_retry),
+                    metric,
+                    input_text,
+                    output_text,
+                    expected_output,
+                    context,
+                    conversation_history=conversation_history,
+                    metadata=metadata,
+                    tool_calls=tool_calls,
+                )
+                submitted += 1
+                # Released once the future is done: after the evaluation has
+                # stopped using the instance, or when it is cancelled before
+                # it started.
+                future.add_done_callback(
+                    lambda _future, metric=metric: self._release_metric(metric)
+                )
+                future_to_metric[future] = (unique_key, class_name, metric_config, backend)
+        except BaseException:
+            for _, metric, _, _ in metric_tasks[submitted:]:
+                self._release_metric(metric)
+            raise
 
         return future_to_metric
 
@@ -449,6 +505,73 @@ class LocalStrategy:
             f"{failed} failed/timed out (total: {len(results)})"
         )
 
+    # ============================================================================
+    # EVALUATION CACHE
+    # ============================================================================
+
+    async def _a_apply_cached_results(
+        self,
+        metric_tasks: List[Tuple[str, BaseMetric, MetricConfig, str]],
+        metric_keys: List[str],
+        results: Dict[str, Any],
+        input_text: str,
+        output_text: str,
+        expected_output: str,
+        context: List[str],
+        *,
+        conversation_history: Any = None,
+        metadata: Dict[str, Any] | None = None,
+        tool_calls: List[Dict[str, Any]] | None = None,
+    ) -> Tuple[List[Tuple[Tuple[str, BaseMetric, MetricConfig, str], str]], Dict[str, str]]:
+        """Fill *results* from the evaluation cache.
+
+        The lookups run concurrently in worker threads, so a slow Redis does
+        not block the event loop. Returns the (task, key) pairs that still
+        need evaluating, and the fingerprint of each of them to store its
+        result under.
+        """
+        if self._evaluation_cache is None:
+            return list(zip(metric_tasks, metric_keys)), {}
+
+        task_fingerprints = [
+            evaluation_fingerprint(
+                metric_config,
+                getattr(metric, "model", None),
+                input_text,
+                output_text,
+                expected_output,
+                context,
+                conversation_history=conversation_history,
+                metadata=metadata,
+                tool_calls=tool_calls,
+            )
+            for _, metric, metric_config, _ in metric_tasks
+        ]
+        cached_results = await asyncio.gather(
+            *(self._evaluation_cache.a_lookup(fingerprint) for fingerprint in task_fingerprints)
+        )
+
+        pending = []
+        fingerprints: Dict[str, str] = {}
+        for task, key, fingerprint, cached in zip(
+            metric_tasks, metric_keys, task_fingerprints, cached_results
+        ):
+            if cached is not None:
+                results[key] = cached
+                self._release_metric(task[1])
+            else:
+                pending.append((task, key))
+                fingerprints[key] = fingerprint
+        return pending, fingerprints
+
+    # ============================================================================
+    # METRIC POOL
+    # ============================================================================
+
+    def _release_metric(self, metric: BaseMetric) -> None:
+        if self._metric_pool is not None:
+            self._metric_pool.release(metric)
+
     # ============================================================================
     # RETRY WRAPPER
     # ============================================================================
@@ -765,6 +888,7 @@ def prepare_metrics(
     db: Optional[Session] = None,
     organization_id: Optional[str] = None,
     metric_models: Optional[Dict[str, Any]] = None,
+    metric_pool: Optional[MetricPool] = None,
 ) -> List[Tuple[str, BaseMetric, MetricConfig, str]]:
     """Instantiate metric objects via SDK factory, resolving models from DB.
 
@@ -779,6 +903,9 @@ def prepare_metrics(
             session (the batch path). Key present with a value means resolved; key
             present with `None` means resolution was attempted and failed; key absent
             means not attempted, so fall back to resolving against `db`.
+        metric_pool: Optional batch-scoped pool to check instances out of instead
+            of constructing them. The caller releases each returned instance once
+            it has been evaluated.
 
     Returns:
         List of tuples containing (class_name, metric_instance, metric_config, backend).
@@ -792,6 +919,7 @@ def prepare_metrics(
         threshold = metric_config.threshold
         parameters = metric_config.parameters or {}
         model_id = parameters.get("model_id")
+        metric = None
 
         try:
             metric_params: Dict[str, Any] = {"threshold": threshold, **parameters}
@@ -835,7 +963,13 @@ def prepare_metrics(
             factory_params.pop("parameters", None)
 
             try:
-                metric = MetricFactory.create(backend, class_name, **factory_params)
+                if metric_pool is not None:
+                    metric = metric_pool.acquire(
+                        metric_pool_key(backend, class_name, factory_params),
+                        lambda: MetricFactory.create(backend, class_name, **factory_params),
+                    )
+                else:
+                    metric = MetricFactory.create(backend, class_name, **factory_params)
             except Exception as create_error:
                 logger.error(
                     f"[SDK_DIRECT] Failed to create metric "
@@ -851,11 +985,15 @@ def prepare_metrics(
                     f"Skipping metric '{class_name}' as it requires "
                     f"ground truth which is not provided"
                 )
+                if metric_pool is not None:
+                    metric_pool.release(metric)
                 continue
 
             metric_tasks.append((class_name, metric, metric_config, backend))
 
         except Exception as e:
+            if metric is not None and metric_pool is not None:
+                metric_pool.release(metric)
             metric_name = metric_config.name or class_name
             error_msg = (
                 f"Error preparing metric '{metric_name or class_name}' "
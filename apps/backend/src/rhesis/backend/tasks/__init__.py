@@ -14,6 +14,7 @@ from rhesis.backend.tasks import (
     execution,  # noqa: F401
     file,  # noqa: F401
     garak,  # noqa: F401
+    insights,  # noqa: F401
     task_notifications,  # noqa: F401
     test_configuration,  # noqa: F401
     test_set,  # noqa: F401
@@ -48,6 +49,7 @@ from rhesis.backend.tasks.example_task import (
     process_data,
 )
 from rhesis.backend.tasks.execution.results import collect_results
+from rhesis.backend.tasks.insights import refresh_insights_cubes
 from rhesis.backend.tasks.test_configuration import execute_test_configuration
 from rhesis.backend.tasks.test_set import count_test_sets
 from rhesis.backend.tasks.usage import accrue_usage
@@ -86,6 +88,7 @@ __all__ = [
     "email_notification_test",
     "process_data",
     "accrue_usage",
+    "refresh_insights_cubes",
     # Constants
     "DEFAULT_METRIC_WORKERS",
     "DEFAULT_RESULT_STATUS",
@@ -101,6 +104,7 @@ def task_launcher(
     current_user=None,
     task_id: Optional[str] = None,
     db=None,
+    priority: Optional[int] = None,
     **kwargs: Any,
 ):
     """
@@ -119,6 +123,8 @@ def task_launcher(
         db: Optional SQLAlchemy Session. When supplied, project_id is read from
             db.info['_scope'] which is reliable for both sync and async route
             handlers. If omitted, falls back to the ContextVar (Celery / scripts).
+        priority: Optional Celery message priority (0 = highest); see
+            tasks/execution/scheduling.py for how test runs are prioritised.
         **kwargs: Keyword arguments to pass to the task
 
     Returns:
@@ -158,8 +164,10 @@ def task_launcher(
         apply_kwargs["headers"] = headers
     if task_id:
         apply_kwargs["task_id"] = task_id
+    if priority is not None:
+        apply_kwargs["priority"] = priority
 
-    if apply_kwargs.get("headers") or apply_kwargs.get("task_id"):
+    if any(option in apply_kwargs for option in ("headers", "task_id", "priority")):
         return task.apply_async(**apply_kwargs)
     else:
         return task.delay(*args, **kwargs)
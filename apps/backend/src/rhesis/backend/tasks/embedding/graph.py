@@ -25,7 +25,11 @@ def _ensure_embeddings_for_entities(
     user,
     embedded_entity: type | str,
 ) -> None:
-    """Generate and persist active embeddings for entities that do not have one yet."""
+    """Generate and persist active embeddings for entities that do not have one yet.
+
+    The missing entities are embedded in one batched pass
+    (``EmbeddingGenerator.generate_batch``) rather than one provider call each.
+    """
     if not entity_ids:
         return
 
@@ -64,40 +68,29 @@ def _ensure_embeddings_for_entities(
         )
         return
 
-    generator = EmbeddingGenerator(db)
-    generated = 0
-    skipped_empty = 0
-    skipped_no_provider = 0
-    failed = 0
-    for entity_id in missing_ids:
-        try:
-            result = generator.generate(
-                entity_id=str(entity_id),
-                entity_type=entity_type,
-                organization_id=org_id,
-                user_id=user_id,
-                model_id=model_id,
-            )
-        except Exception as exc:
-            failed += 1
-            logger.warning(
-                "Embedding backfill failed for %s:%s: %s",
-                entity_type,
-                entity_id,
-                exc,
-                exc_info=True,
-            )
-            continue
-
-        status = result.get("status")
-        if status == "success":
-            generated += 1
-        elif status == "skipped_empty_text":
-            skipped_empty += 1
-        elif status == "skipped_no_provider":
-            skipped_no_provider += 1
-        else:
-            failed += 1
+    try:
+        results = EmbeddingGenerator(db).generate_batch(
+            entity_ids=[str(entity_id) for entity_id in missing_ids],
+            entity_type=entity_type,
+            organization_id=org_id,
+            user_id=user_id,
+            model_id=model_id,
+        )
+    except Exception as exc:
+        logger.warning(
+            "Embedding backfill failed for %s %s entities: %s",
+            len(missing_ids),
+            entity_type,
+            exc,
+            exc_info=True,
+        )
+        return
+
+    statuses = [result.get("status") for result in results.values()]
+    generated = statuses.count("success")
+    skipped_empty = statuses.count("skipped_empty_text")
+    skipped_no_provider = statuses.count("skipped_no_provider")
+    failed = len(statuses) - generated - skipped_empty - skipped_no_provider
 
     logger.info(
         "Embedding backfill for %s: missing=%s generated=%s skipped_empty=%s "
@@ -166,9 +159,15 @@ def _run_embedding_graph(
     load_parent: Callable[[Any, Any], Any | None],
     persist_graph: Callable[[Any, Any], None],
     parent_name: str,
+    parent_type: str,
 ) -> None:
     from rhesis.backend.app.crud import user as user_crud
-    from rhesis.backend.app.services.embedding.graph_builder import build_2d_graph
+    from rhesis.backend.app.services.embedding.graph_builder import (
+        load_graph_model,
+        refresh_2d_graph,
+        save_graph_model,
+    )
+    from rhesis.backend.app.services.storage_service import StorageService
     from rhesis.backend.app.utils.database_exceptions import ItemDeletedException
 
     user = user_crud.get_user_by_id(db, user_id)
@@ -192,7 +191,23 @@ def _run_embedding_graph(
         user=user,
         embedded_entity=embedded_entity,
     )
-    graph = build_2d_graph(db, entity_ids, user, embedded_entity=embedded_entity)
+
+    # The fitted UMAP/HDBSCAN model from the last refresh, so that only new
+    # points need placing unless the graph changed enough to refit
+    model_path = StorageService.get_embedding_graph_model_path(
+        str(user.organization_id),
+        str(parent.project_id) if parent.project_id else None,
+        parent_type,
+        str(parent.id),
+    )
+    model = load_graph_model(model_path)
+    stored_at = model.updated_at if model is not None else None
+    graph, model = refresh_2d_graph(
+        db, entity_ids, user, embedded_entity=embedded_entity, model=model
+    )
+    if model is not None and model.updated_at != stored_at:
+        save_graph_model(model_path, model)
+
     persist_graph(parent, graph)
     db.add(parent)
     db.commit()
@@ -227,6 +242,7 @@ def _run_test_set_embedding_graph(db, *, test_set_id: str, user_id: str) -> None
         load_parent=load_parent,
         persist_graph=persist_graph,
         parent_name="test set",
+        parent_type="test_set",
     )
 
 
@@ -260,6 +276,7 @@ def _run_source_embedding_graph(db, *, source_id: str, user_id: str) -> None:
         load_parent=load_parent,
         persist_graph=persist_graph,
         parent_name="source",
+        parent_type="source",
     )
 
 
@@ -7,6 +7,7 @@ One Celery task = one worker slot per test set.
 
 Public API:
     execute_tests_as_batch  — called from orchestration.py
+    run_tests               — one batch of tests, also run by each shard task
     ExecutionContext         — re-exported for type hints
 """
 
@@ -31,8 +32,12 @@ from rhesis.backend.tasks.execution.batch.profiling import (
     log_batch_report,
 )
 from rhesis.backend.tasks.execution.batch.runner import run_batch
+from rhesis.backend.tasks.execution.batch.sharding import (
+    execute_tests_sharded,
+    get_shard_size,
+)
 
-__all__ = ["execute_tests_as_batch", "ExecutionContext"]
+__all__ = ["execute_tests_as_batch", "run_tests", "ExecutionContext"]
 
 logger = logging.getLogger(__name__)
 
@@ -121,33 +126,69 @@ def _persist_failed_results(ctx: "ExecutionContext", results: List[Dict[str, Any
             logger.warning(f"[BATCH] Failed to persist error record for {tid}: {e}")
 
 
-def execute_tests_as_batch(
+def _persist_batch_profile(
+    ctx: "ExecutionContext", profile: Dict[str, Any], shard_index: Optional[int] = None
+) -> None:
+    """Store the batch's phase/concurrency summary on the test run.
+
+    Whole-run batches write ``attributes["batch_profile"]``; a shard writes
+    ``attributes["shards"][<index>]["batch_profile"]``.  The row is locked
+    like ``update_shard_status`` so concurrent shards don't overwrite each
+    other.  Best effort: a failure here never fails the run.
+    """
+    from uuid import UUID
+
+    from sqlalchemy.orm.attributes import flag_modified
+
+    from rhesis.backend.app.database import get_db_with_tenant_variables
+
+    try:
+        with get_db_with_tenant_variables(
+            ctx.organization_id, ctx.user_id or "", ctx.project_id or ""
+        ) as db:
+            test_run = (
+                db.query(TestRun)
+                .filter(TestRun.id == UUID(str(ctx.test_run.id)))
+                .with_for_update()
+                .populate_existing()
+                .one()
+            )
+            attributes = dict(test_run.attributes or {})
+            if shard_index is None:
+                attributes["batch_profile"] = profile
+            else:
+                shards = dict(attributes.get("shards") or {})
+                shard = dict(shards.get(str(shard_index)) or {})
+                shard["batch_profile"] = profile
+                shards[str(shard_index)] = shard
+                attributes["shards"] = shards
+            test_run.attributes = attributes
+            flag_modified(test_run, "attributes")
+            db.commit()
+    except Exception as e:
+        logger.warning(f"[BATCH] Could not store batch profile: {e}")
+
+
+def run_tests(
     session: Session,
     test_config: TestConfiguration,
     test_run: TestRun,
     tests: List[Test],
+    celery_task_id: Optional[str] = None,
     reference_test_run_id: Optional[str] = None,
     trace_id: Optional[str] = None,
-) -> Dict[str, Any]:
-    """Three-phase batch execution: pre-fetch, asyncio.gather, trigger results."""
-    from rhesis.backend.tasks.execution.shared import (
-        create_execution_result,
-        trigger_results_collection,
-        update_test_run_start,
-    )
-
+    shard_index: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Pre-fetch, run and report one batch of tests; returns per-test results.
+
+    Closes *session* after the pre-fetch. Shared by whole-run batches and
+    by the shards of a sharded run (``sharding.py``), each of which passes
+    the Celery task ID whose revocation cancels it and its *shard_index*,
+    under which its batch profile is stored.
+    """
     start_time = datetime.now(timezone.utc)
     total_tests = len(tests)
 
-    update_test_run_start(
-        session,
-        test_run,
-        ExecutionMode.PARALLEL,
-        total_tests,
-        start_time,
-        batch_mode=True,
-    )
-
     # Phase 1: Pre-fetch all shared data while we still have a DB session.
     ctx = prefetch_execution_context(
         session,
@@ -158,7 +199,7 @@ def execute_tests_as_batch(
         trace_id=trace_id,
     )
     # Capture the Celery task ID for cooperative cancellation in the async loop.
-    ctx.celery_task_id = (test_run.attributes or {}).get("task_id")
+    ctx.celery_task_id = celery_task_id
 
     # Flush any pending writes (e.g. auth token refresh) and release the DB
     # connection back to the pool.  All needed data lives in ctx (models are
@@ -179,13 +220,13 @@ def execute_tests_as_batch(
     results = _run_async(run_batch(ctx, test_ids))
 
     # Write error TestResult rows for tests that failed without being persisted
-    # (e.g. invocation exceptions, timeouts).  Must run before trigger_results_collection
+    # (e.g. invocation exceptions, timeouts).  Must run before results collection
     # so the DB count includes those rows.
     _persist_failed_results(ctx, results)
 
-    # Phase 3: Trigger results collection.
     wall_time_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
     snap_after = ResourceSnapshot.take()
+    profile = ctx.profiler.summary(ctx.batch_concurrency)
 
     log_batch_report(
         before=snap_before,
@@ -195,7 +236,70 @@ def execute_tests_as_batch(
         results=results,
         concurrency=ctx.batch_concurrency,
         test_run_id=str(test_run.id),
+        metric_pool_stats=ctx.metric_pool.stats() if ctx.metric_pool else None,
+        evaluation_cache_stats=ctx.evaluation_cache.stats() if ctx.evaluation_cache else None,
+        profile=profile,
     )
+    if ctx.profiler.phases:
+        _persist_batch_profile(ctx, profile, shard_index)
+    return results
+
+
+def execute_tests_as_batch(
+    session: Session,
+    test_config: TestConfiguration,
+    test_run: TestRun,
+    tests: List[Test],
+    reference_test_run_id: Optional[str] = None,
+    trace_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Three-phase batch execution: pre-fetch, asyncio.gather, trigger results.
+
+    Runs with more tests than the configured shard size (``sharding.py``)
+    are instead dispatched as shard tasks and collected by a chord callback.
+    """
+    from rhesis.backend.tasks.execution.shared import (
+        create_execution_result,
+        trigger_results_collection,
+        update_test_run_start,
+    )
+
+    start_time = datetime.now(timezone.utc)
+    total_tests = len(tests)
+
+    # Opt-in sharding: split large runs across Celery workers instead of
+    # running every test inside this one task.
+    shard_size = get_shard_size(test_config.attributes)
+    if shard_size and total_tests > shard_size:
+        return execute_tests_sharded(
+            session,
+            test_config,
+            test_run,
+            tests,
+            shard_size,
+            reference_test_run_id=reference_test_run_id,
+            trace_id=trace_id,
+        )
+
+    update_test_run_start(
+        session,
+        test_run,
+        ExecutionMode.PARALLEL,
+        total_tests,
+        start_time,
+        batch_mode=True,
+    )
+
+    results = run_tests(
+        session,
+        test_config,
+        test_run,
+        tests,
+        celery_task_id=(test_run.attributes or {}).get("task_id"),
+        reference_test_run_id=reference_test_run_id,
+        trace_id=trace_id,
+    )
+    wall_time_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
 
     # Skip results collection if the entire run was cancelled or the batch was
     # empty — there are no persisted test results to aggregate and calling
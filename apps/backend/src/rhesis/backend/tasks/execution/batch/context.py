@@ -19,7 +19,12 @@ from rhesis.backend.app.models.test_configuration import TestConfiguration
 from rhesis.backend.app.models.test_run import TestRun
 from rhesis.backend.app.models.test_set import TestSet
 from rhesis.backend.app.quota.enforcement import QuotaExceededError
+from rhesis.backend.app.services.evaluation_cache import (
+    evaluation_cache_requested,
+    fresh_evaluation_requested,
+)
 from rhesis.backend.metrics.metric_config import metric_model_to_config
+from rhesis.backend.tasks.execution.batch.profiling import BatchProfiler
 from rhesis.sdk.metrics import MetricConfig
 
 logger = logging.getLogger(__name__)
@@ -76,6 +81,17 @@ class ExecutionContext:
     # Snapshot of test_data taken before the main pass, used to persist error
     # records after the batch for tests that failed without a DB row.
     test_data_snapshot: Dict[str, Any] = field(default_factory=dict)
+    # Batch-scoped MetricPool set by run_batch; its stats go into the batch report.
+    metric_pool: Any = None
+    # Judge-result cache (test_config.attributes "evaluation_cache" / env
+    # EVALUATION_CACHE). "fresh_evaluation" skips lookups but still stores.
+    use_evaluation_cache: bool = False
+    fresh_evaluation: bool = False
+    # The run's RunEvaluationCache, set by run_batch when the cache is in use.
+    evaluation_cache: Any = None
+    # Per-phase timings and in-flight counts for this batch, across recovery
+    # passes; summarized into the batch report and the run's attributes.
+    profiler: BatchProfiler = field(default_factory=BatchProfiler)
 
     def get_metric_configs_for_test(self, test_id: str) -> List[MetricConfig]:
         """Return metric configs for a specific test.
@@ -418,6 +434,8 @@ def prefetch_execution_context(
     recovery_rounds = int(
         os.environ.get("RECOVERY_ROUNDS", attrs.get("recovery_rounds", DEFAULT_RECOVERY_ROUNDS))
     )
+    use_evaluation_cache = evaluation_cache_requested(attrs)
+    fresh_evaluation = fresh_evaluation_requested(attrs)
 
     # Expunge models for safe cross-context use
     session.expunge(endpoint)
@@ -454,4 +472,6 @@ def prefetch_execution_context(
         invoke_retry_min_wait=invoke_retry_min_wait,
         invoke_retry_max_wait=invoke_retry_max_wait,
         recovery_rounds=recovery_rounds,
+        use_evaluation_cache=use_evaluation_cache,
+        fresh_evaluation=fresh_evaluation,
     )
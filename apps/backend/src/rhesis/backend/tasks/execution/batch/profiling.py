@@ -1,24 +1,41 @@
 """
-Lightweight process-level profiling for batch execution.
+Lightweight profiling for batch execution.
 
-Uses ``resource.getrusage(RUSAGE_SELF)`` — zero overhead, no dependencies,
-works on Linux (production) and macOS (development).
+Process level: ``resource.getrusage(RUSAGE_SELF)`` — zero overhead, no
+dependencies, works on Linux (production) and macOS (development).
 
 Note: ``ru_maxrss`` is a high-water mark that only grows within a process
 lifetime.  The *growth* between two snapshots still tells you how much a
 given batch contributed to peak memory.
+
+Per test: ``BatchProfiler`` times each phase of ``_execute_single_test``
+(semaphore wait, endpoint invocation, metric evaluation, persistence) with
+``time.monotonic`` into log-linear histograms, and tracks how many tests are
+in flight over time.  Its ``summary()`` is stored on the test run under
+``attributes["batch_profile"]`` so concurrency can be tuned from data.
 """
 
 import logging
+import math
 import resource
 import sys
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
 _RSS_DIVISOR = 1024 * 1024 if sys.platform == "darwin" else 1024
 
+# Latency buckets keep this many significant bits of the value in microseconds,
+# as HdrHistogram does: exact below 64us, within 1/32 (~3%) of the true value
+# at any magnitude above, 32 buckets per doubling.
+_SIGNIFICANT_BITS = 6
+
+# Order of the phases in summaries; "total" spans invoke through persist.
+PHASES = ("queue", "invoke", "evaluate", "persist", "total")
+
 
 @dataclass
 class ResourceSnapshot:
@@ -42,6 +59,134 @@ class ResourceSnapshot:
         )
 
 
+class LatencyHistogram:
+    """Log-linear latency histogram with bounded relative error."""
+
+    def __init__(self) -> None:
+        # bucket lower bound (us) -> count
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        value = max(0, int(seconds * 1_000_000))
+        shift = max(0, value.bit_length() - _SIGNIFICANT_BITS)
+        bucket = value >> shift << shift
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.min_us = value if not self.count else min(self.min_us, value)
+        self.max_us = max(self.max_us, value)
+        self.count += 1
+        self.total_us += value
+
+    def percentile(self, q: float) -> float:
+        """Value in ms at or below which *q* percent of samples fall."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                width = 1 << max(0, bucket.bit_length() - _SIGNIFICANT_BITS)
+                # Upper edge of the bucket, never past the largest sample
+                return min(bucket + width - 1, self.max_us) / 1000
+        return self.max_us / 1000
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "n": self.count,
+            "mean_ms": round(self.total_us / (self.count or 1) / 1000, 1),
+            "p50_ms": round(self.percentile(50), 1),
+            "p90_ms": round(self.percentile(90), 1),
+            "p99_ms": round(self.percentile(99), 1),
+            "max_ms": round(self.max_us / 1000, 1),
+        }
+
+
+class BatchProfiler:
+    """Per-phase latency histograms and in-flight concurrency for one batch.
+
+    Only touched from the batch's event loop (``persist_result`` runs in a
+    thread, but is timed from the awaiting coroutine), so it needs no lock.
+    """
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, LatencyHistogram] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        # in-flight level -> seconds spent at it, from the first test start on
+        self._seconds_at: Dict[int, float] = {}
+        self._since: Optional[float] = None
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.phases.setdefault(phase, LatencyHistogram()).record(seconds)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the block as *name*, whether it returns or raises."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, time.monotonic() - start)
+
+    def _advance(self) -> None:
+        now = time.monotonic()
+        if self._since is not None:
+            self._seconds_at[self.in_flight] = (
+                self._seconds_at.get(self.in_flight, 0.0) + now - self._since
+            )
+        self._since = now
+
+    def test_started(self) -> None:
+        self._advance()
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def test_finished(self) -> None:
+        self._advance()
+        self.in_flight -= 1
+
+    def concurrency_summary(self, limit: int) -> Dict[str, Any]:
+        """Time-weighted in-flight distribution against the semaphore *limit*."""
+        elapsed = sum(self._seconds_at.values())
+        if not elapsed:
+            return {"limit": limit, "peak": self.peak_in_flight}
+
+        def level_at(q: float) -> int:
+            seen = 0.0
+            for level in sorted(self._seconds_at):
+                seen += self._seconds_at[level]
+                if seen >= q / 100 * elapsed:
+                    return level
+            return self.peak_in_flight
+
+        return {
+            "limit": limit,
+            "peak": self.peak_in_flight,
+            "mean": round(sum(lvl * s for lvl, s in self._seconds_at.items()) / elapsed, 2),
+            "p50": level_at(50),
+            "p90": level_at(90),
+            # Share of the time every slot was taken: high together with long
+            # "queue" waits means the limit, not the endpoint, is the bottleneck
+            "saturated_pct": round(
+                sum(s for lvl, s in self._seconds_at.items() if lvl >= limit) / elapsed * 100, 1
+            ),
+        }
+
+    def summary(self, limit: int) -> Dict[str, Any]:
+        """Compact JSON-serializable summary of the batch."""
+        ordered = [p for p in PHASES if p in self.phases] + sorted(
+            p for p in self.phases if p not in PHASES
+        )
+        return {
+            "phases": {name: self.phases[name].summary() for name in ordered},
+            "in_flight": self.concurrency_summary(limit),
+        }
+
+
 def log_batch_report(
     *,
     before: ResourceSnapshot,
@@ -51,6 +196,9 @@ def log_batch_report(
     results: List[Dict[str, Any]],
     concurrency: int,
     test_run_id: str = "",
+    metric_pool_stats: Optional[Any] = None,
+    evaluation_cache_stats: Optional[Any] = None,
+    profile: Optional[Dict[str, Any]] = None,
 ) -> None:
     """Emit a structured batch profiling report via the standard logger."""
     failed = sum(1 for r in results if isinstance(r, dict) and r.get("status") == "failed")
@@ -88,3 +236,33 @@ def log_batch_report(
         vol_cs,
         invol_cs,
     )
+
+    if metric_pool_stats is not None:
+        logger.info(
+            "[BATCH] run=%s metrics: constructed=%d reused=%d | construction=%ss saved=~%ss",
+            test_run_id,
+            metric_pool_stats.constructed,
+            metric_pool_stats.reused,
+            round(metric_pool_stats.construction_seconds, 2),
+            round(metric_pool_stats.saved_seconds, 2),
+        )
+
+    if evaluation_cache_stats is not None:
+        logger.info(
+            "[BATCH] run=%s evaluation cache: hits=%d misses=%d hit_rate=%s%%",
+            test_run_id,
+            evaluation_cache_stats.hits,
+            evaluation_cache_stats.misses,
+            round(evaluation_cache_stats.hit_rate * 100, 1),
+        )
+
+    if profile:
+        logger.info(
+            "[BATCH] run=%s phases: %s | in_flight: %s",
+            test_run_id,
+            " ".join(
+                f"{name}=p50:{stats['p50_ms']}ms/p99:{stats['p99_ms']}ms"
+                for name, stats in profile.get("phases", {}).items()
+            ),
+            " ".join(f"{key}={value}" for key, value in profile.get("in_flight", {}).items()),
+        )
@@ -183,16 +183,33 @@ async def run_batch(
         await penelope_agent.model.warmup()
 
     # Create a single MetricEvaluator for the batch (stateless, safe to share).
+    # Metric instances are checked out of a batch-scoped pool so each test
+    # reuses ones an earlier test already constructed.
     evaluator = None
     if ctx.has_metrics:
         from rhesis.backend.metrics.evaluator import MetricEvaluator
+        from rhesis.backend.metrics.metric_pool import MetricPool
 
+        ctx.metric_pool = MetricPool()
+        if ctx.use_evaluation_cache:
+            from rhesis.backend.app.services.evaluation_cache import (
+                RunEvaluationCache,
+                get_evaluation_result_cache,
+            )
+
+            ctx.evaluation_cache = RunEvaluationCache(
+                get_evaluation_result_cache(),
+                ctx.organization_id,
+                fresh=ctx.fresh_evaluation,
+            )
         evaluator = MetricEvaluator(
             model=ctx.evaluation_model,
             connector_metric_sender=ctx.connector_metric_sender,
             # No `db` here on purpose: the session closed before this point. Judge
             # models for per-metric `model_id` overrides were resolved in prefetch.
             metric_models=ctx.metric_models,
+            metric_pool=ctx.metric_pool,
+            evaluation_cache=ctx.evaluation_cache,
         )
 
     # Snapshot test data before the main pass so recovery rounds can restore it
@@ -269,7 +286,9 @@ async def _execute_single_test(
     evaluator: Any = None,
 ) -> Dict[str, Any]:
     """Unified coroutine for both single-turn and multi-turn tests."""
+    queued_at = time.monotonic()
     async with semaphore:
+        ctx.profiler.record("queue", time.monotonic() - queued_at)
         if test_id in ctx.existing_result_ids:
             logger.info(f"[BATCH] Skipping test {test_id}: result already exists")
             return {"test_id": test_id, "status": "skipped", "execution_time": 0}
@@ -301,6 +320,7 @@ async def _execute_single_test(
         penelope_metrics: Dict[str, Any] = {}
         metrics_results: Dict[str, Any] = {}
 
+        ctx.profiler.test_started()
         try:
             # --- Run the test ---
             try:
@@ -314,7 +334,8 @@ async def _execute_single_test(
                     deferred_traces,
                     penelope_agent,
                 )
-                result = await asyncio.wait_for(coro, timeout=ctx.per_test_timeout)
+                with ctx.profiler.phase("invoke"):
+                    result = await asyncio.wait_for(coro, timeout=ctx.per_test_timeout)
                 output = result.get("output", {})
                 penelope_metrics = result.get("penelope_metrics", {})
                 deferred_traces = result.get("deferred_traces", deferred_traces)
@@ -342,17 +363,18 @@ async def _execute_single_test(
                 metrics_results = {}
                 logger.info(f"[BATCH] HTTP error for test {test_id}; skipping metrics")
             elif evaluator and ctx.get_metric_configs_for_test(test_id):
-                metrics_results = await evaluate_metrics(
-                    ctx,
-                    evaluator,
-                    test,
-                    test_id,
-                    output,
-                    prompt_content,
-                    expected_response,
-                    is_multi_turn,
-                    penelope_metrics,
-                )
+                with ctx.profiler.phase("evaluate"):
+                    metrics_results = await evaluate_metrics(
+                        ctx,
+                        evaluator,
+                        test,
+                        test_id,
+                        output,
+                        prompt_content,
+                        expected_response,
+                        is_multi_turn,
+                        penelope_metrics,
+                    )
             else:
                 metrics_results = dict(penelope_metrics)
 
@@ -362,17 +384,18 @@ async def _execute_single_test(
             try:
                 from rhesis.backend.tasks.execution.batch.persist import persist_result
 
-                await asyncio.to_thread(
-                    persist_result,
-                    ctx,
-                    test_id,
-                    test,
-                    output,
-                    metrics_results,
-                    deferred_traces,
-                    execution_time,
-                    is_multi_turn,
-                )
+                with ctx.profiler.phase("persist"):
+                    await asyncio.to_thread(
+                        persist_result,
+                        ctx,
+                        test_id,
+                        test,
+                        output,
+                        metrics_results,
+                        deferred_traces,
+                        execution_time,
+                        is_multi_turn,
+                    )
             except Exception as e:
                 logger.error(f"[BATCH] Persist failed for {test_id}: {e}", exc_info=True)
                 return {
@@ -389,6 +412,8 @@ async def _execute_single_test(
                 "metrics": metrics_results,
             }
         finally:
+            ctx.profiler.record("total", time.monotonic() - start_time)
+            ctx.profiler.test_finished()
             ctx.test_data.pop(test_id, None)
             ctx.input_files.pop(test_id, None)
             deferred_traces.clear()
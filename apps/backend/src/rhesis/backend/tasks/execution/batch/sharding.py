@@ -0,0 +1,186 @@
+"""
+Sharded batch execution: one test run spread over several Celery workers.
+
+A normal batch runs every test of a run inside one Celery task, so a very
+large run is bound to one worker thread and the task's hard time limit.
+When ``shard_size`` is set (test_config.attributes, env ``BATCH_SHARD_SIZE``
+overrides; 0 = off) and a run has more tests than that, the run is split
+into shards that execute as independent ``execute_test_shard`` tasks on any
+available worker, joined by a chord whose callback (``finalize_sharded_run``)
+triggers the usual single ``collect_results`` aggregation.
+
+Shard progress lives in ``test_run.attributes["shards"]`` (one entry per
+shard, updated under a row lock since shards finish concurrently), shard
+task IDs in ``shard_task_ids`` so cancelling the run revokes every shard,
+and each shard retries through BaseTask; tests persisted by an earlier
+attempt are skipped by the usual existing-result check.
+"""
+
+import logging
+import math
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
+
+from rhesis.backend.app.models.test import Test
+from rhesis.backend.app.models.test_configuration import TestConfiguration
+from rhesis.backend.app.models.test_run import TestRun
+from rhesis.backend.tasks.enums import ExecutionMode, RunStatus
+
+logger = logging.getLogger(__name__)
+
+# Tests per shard; 0 disables sharding (the whole run is one batch task).
+DEFAULT_SHARD_SIZE = 0
+
+_FINISHED_SHARD_STATUSES = frozenset(
+    {RunStatus.COMPLETED.value, RunStatus.FAILED.value, RunStatus.CANCELLED.value}
+)
+
+
+def get_shard_size(attrs: Optional[Dict[str, Any]]) -> int:
+    """Shard size for a run: env BATCH_SHARD_SIZE, else test_config.attributes."""
+    attrs = attrs or {}
+    return int(os.environ.get("BATCH_SHARD_SIZE", attrs.get("shard_size", DEFAULT_SHARD_SIZE)))
+
+
+def plan_shards(test_ids: List[str], shard_size: int) -> List[List[str]]:
+    """Split test IDs into ``ceil(len / shard_size)`` shards of near-equal size.
+
+    Tests are dealt out round-robin rather than in contiguous chunks, so a
+    run of slow tests (e.g. multi-turn tests grouped together in the set)
+    is spread across shards instead of landing in one.
+    """
+    if not test_ids:
+        return []
+    shard_count = math.ceil(len(test_ids) / max(shard_size, 1))
+    return [test_ids[i::shard_count] for i in range(shard_count)]
+
+
+def update_shard_status(
+    session: Session,
+    test_run_id: str,
+    shard_index: int,
+    status: str,
+    **fields: Any,
+) -> Dict[str, Any]:
+    """Record one shard's status on the run and commit.
+
+    Locks the test run row (``SELECT ... FOR UPDATE``) so shards finishing
+    at the same time don't overwrite each other's entries.
+
+    Returns:
+        The run's updated ``shards`` mapping.
+    """
+    test_run = (
+        session.query(TestRun)
+        .filter(TestRun.id == UUID(str(test_run_id)))
+        .with_for_update()
+        .populate_existing()
+        .one()
+    )
+    attributes = dict(test_run.attributes or {})
+    shards = dict(attributes.get("shards") or {})
+    shard = dict(shards.get(str(shard_index)) or {})
+    shard.update(status=status, updated_at=datetime.now(timezone.utc).isoformat(), **fields)
+    shards[str(shard_index)] = shard
+    attributes["shards"] = shards
+    attributes["shards_completed"] = sum(
+        1 for s in shards.values() if s.get("status") in _FINISHED_SHARD_STATUSES
+    )
+    test_run.attributes = attributes
+    flag_modified(test_run, "attributes")
+    session.commit()
+    return shards
+
+
+def execute_tests_sharded(
+    session: Session,
+    test_config: TestConfiguration,
+    test_run: TestRun,
+    tests: List[Test],
+    shard_size: int,
+    reference_test_run_id: Optional[str] = None,
+    trace_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Dispatch a run as shard tasks joined by a results chord; returns at once.
+
+    The run stays in Progress until ``finalize_sharded_run`` has collected
+    every shard's results.
+    """
+    from celery import chord
+
+    from rhesis.backend.tasks.execution.scheduling import run_priority
+    from rhesis.backend.tasks.execution.shards import execute_test_shard, finalize_sharded_run
+    from rhesis.backend.tasks.execution.shared import (
+        create_execution_result,
+        update_test_run_start,
+    )
+
+    start_time = datetime.now(timezone.utc)
+    test_ids = [str(t.id) for t in tests]
+    shards = plan_shards(test_ids, shard_size)
+    shard_task_ids = [str(uuid.uuid4()) for _ in shards]
+
+    # Task IDs are chosen up front and stored before anything is queued, so
+    # a cancel that arrives mid-dispatch can still revoke every shard.
+    update_test_run_start(
+        session,
+        test_run,
+        ExecutionMode.PARALLEL,
+        len(tests),
+        start_time,
+        batch_mode=True,
+        sharded=True,
+        shard_count=len(shards),
+        shard_task_ids=shard_task_ids,
+        shards={
+            str(i): {"status": RunStatus.QUEUED.value, "tests": len(ids)}
+            for i, ids in enumerate(shards)
+        },
+        shards_completed=0,
+    )
+
+    headers = {
+        "organization_id": str(test_config.organization_id)
+        if test_config.organization_id
+        else None,
+        "user_id": str(test_config.user_id) if test_config.user_id else None,
+        "project_id": str(test_config.project_id) if test_config.project_id else None,
+        "test_run_id": str(test_run.id),
+    }
+    # Shards keep the run's scheduling priority (see execution/scheduling.py)
+    priority = run_priority(test_run.attributes)
+    shard_tasks = [
+        execute_test_shard.s(
+            str(test_config.id),
+            str(test_run.id),
+            ids,
+            index,
+            reference_test_run_id=reference_test_run_id,
+            trace_id=trace_id,
+        ).set(task_id=task_id, headers=headers, priority=priority)
+        for index, (ids, task_id) in enumerate(zip(shards, shard_task_ids))
+    ]
+    chord(shard_tasks)(
+        finalize_sharded_run.s(str(test_config.id), str(test_run.id)).set(headers=headers)
+    )
+
+    logger.info(
+        f"[BATCH] Dispatched test run {test_run.id} as {len(shards)} shards "
+        f"of up to {shard_size} tests ({len(tests)} tests)"
+    )
+
+    return create_execution_result(
+        test_run,
+        test_config,
+        len(tests),
+        ExecutionMode.PARALLEL,
+        batch_mode=True,
+        sharded=True,
+        shard_count=len(shards),
+    )
@@ -0,0 +1,238 @@
+"""
+Fair scheduling for test-run execution tasks.
+
+Every test run is dispatched with a Celery message priority (Redis transport,
+0 = highest, see ``broker_transport_options`` in ``celery/config.py``) so
+workers pick small runs from quiet tenants before bulk runs from busy ones,
+instead of strictly first-in-first-out:
+
+- size tier: larger runs get a lower priority (``SIZE_TIERS``)
+- tenant load: each run the same organisation or project already has
+  queued or in progress lowers the priority further, on a log scale, so a
+  tenant launching fifty large runs cannot starve another tenant's smoke
+  test; ``EXECUTION_TENANT_WEIGHTS`` (JSON mapping of organisation or
+  project ID to weight) gives a tenant a proportionally larger share.
+
+Priorities only reorder waiting messages; nothing is preempted. The chosen
+priority and the time each run waited in the queue are recorded on the test
+run (``attributes["scheduling"]``) and logged with its tenant, for queue
+wait per organisation and project.
+"""
+
+import json
+import logging
+import math
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from rhesis.backend.app.models.status import Status
+from rhesis.backend.app.models.test_run import TestRun
+from rhesis.backend.tasks.enums import RunStatus
+
+logger = logging.getLogger(__name__)
+
+# Celery message priorities used for execution tasks (0 = highest).
+HIGHEST_PRIORITY = 0
+LOWEST_PRIORITY = 9
+
+# (max tests, priority offset): smoke tests first, bulk runs last.
+SIZE_TIERS = ((50, 0), (500, 1), (5000, 2))
+LARGEST_SIZE_OFFSET = 3
+
+# Tenant load offset is log2(1 + weighted in-flight runs), capped here.
+MAX_LOAD_OFFSET = 5
+
+_ACTIVE_STATUSES = (RunStatus.QUEUED.value, RunStatus.PROGRESS.value)
+
+
+@lru_cache(maxsize=1)
+def _tenant_weights(raw: str) -> Dict[str, float]:
+    try:
+        weights = json.loads(raw) if raw else {}
+        return {str(k): float(v) for k, v in weights.items() if float(v) > 0}
+    except (ValueError, TypeError, AttributeError) as e:
+        logger.warning(f"Ignoring invalid EXECUTION_TENANT_WEIGHTS: {e}")
+        return {}
+
+
+def tenant_weight(tenant_id: Optional[str]) -> float:
+    """Scheduling weight of an organisation or project (default 1)."""
+    if not tenant_id:
+        return 1.0
+    weights = _tenant_weights(os.getenv("EXECUTION_TENANT_WEIGHTS", ""))
+    return weights.get(str(tenant_id), 1.0)
+
+
+def size_offset(total_tests: int) -> int:
+    """Priority offset for a run of *total_tests* tests."""
+    for max_tests, offset in SIZE_TIERS:
+        if total_tests <= max_tests:
+            return offset
+    return LARGEST_SIZE_OFFSET
+
+
+def load_offset(
+    organization_in_flight: int,
+    project_in_flight: int = 0,
+    organization_weight: float = 1.0,
+    project_weight: float = 1.0,
+) -> int:
+    """Priority offset for a tenant's runs already queued or in progress."""
+    load = organization_in_flight / organization_weight + project_in_flight / project_weight
+    return min(MAX_LOAD_OFFSET, int(math.log2(1 + load)))
+
+
+def execution_priority(
+    total_tests: int,
+    organization_in_flight: int = 0,
+    project_in_flight: int = 0,
+    organization_weight: float = 1.0,
+    project_weight: float = 1.0,
+) -> int:
+    """Celery priority for a test run (0 = picked first)."""
+    priority = size_offset(total_tests) + load_offset(
+        organization_in_flight, project_in_flight, organization_weight, project_weight
+    )
+    return max(HIGHEST_PRIORITY, min(LOWEST_PRIORITY, priority))
+
+
+def count_in_flight_runs(
+    db: Session,
+    organization_id: Optional[str],
+    project_id: Optional[str] = None,
+    exclude_test_run_id: Optional[str] = None,
+) -> int:
+    """Queued or in-progress runs of an organisation (or one of its projects)."""
+    query = (
+        db.query(func.count(TestRun.id))
+        .join(Status, TestRun.status_id == Status.id)
+        .filter(Status.name.in_(_ACTIVE_STATUSES))
+    )
+    if organization_id:
+        query = query.filter(TestRun.organization_id == organization_id)
+    if project_id:
+        query = query.filter(TestRun.project_id == project_id)
+    if exclude_test_run_id:
+        query = query.filter(TestRun.id != exclude_test_run_id)
+    return query.scalar() or 0
+
+
+def tenant_priority(
+    db: Session,
+    organization_id: Optional[str],
+    project_id: Optional[str],
+    total_tests: int,
+    exclude_test_run_id: Optional[str] = None,
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Priority for a run of *total_tests* tests from the given tenant.
+
+    Returns:
+        Tuple of (priority, scheduling info with the in-flight counts used)
+    """
+    try:
+        organization_in_flight = count_in_flight_runs(
+            db, organization_id, exclude_test_run_id=exclude_test_run_id
+        )
+        project_in_flight = (
+            count_in_flight_runs(
+                db, organization_id, project_id, exclude_test_run_id=exclude_test_run_id
+            )
+            if project_id
+            else 0
+        )
+    except Exception as e:
+        # Scheduling must never block a run from being submitted.
+        logger.warning(f"Could not count in-flight runs for scheduling: {e}")
+        organization_in_flight = project_in_flight = 0
+
+    priority = execution_priority(
+        total_tests,
+        organization_in_flight,
+        project_in_flight,
+        tenant_weight(organization_id),
+        tenant_weight(project_id),
+    )
+    logger.info(
+        f"Scheduling {total_tests} tests at priority {priority}: "
+        f"organization {organization_id} has {organization_in_flight} runs in flight, "
+        f"project {project_id} has {project_in_flight}"
+    )
+    return priority, {
+        "priority": priority,
+        "organization_in_flight": organization_in_flight,
+        "project_in_flight": project_in_flight,
+    }
+
+
+def schedule_test_run(db: Session, test_run: TestRun, total_tests: Optional[int] = None) -> int:
+    """
+    Choose the dispatch priority for a queued test run and record it on the run.
+
+    The caller commits (the run is usually committed just before dispatch).
+
+    Args:
+        db: Tenant-scoped database session
+        test_run: The run about to be dispatched
+        total_tests: Run size (defaults to ``attributes["total_tests"]``)
+
+    Returns:
+        int: Celery priority to dispatch with
+    """
+    attributes = dict(test_run.attributes or {})
+    if total_tests is None:
+        total_tests = int(attributes.get("total_tests") or 0)
+
+    priority, scheduling = tenant_priority(
+        db,
+        str(test_run.organization_id) if test_run.organization_id else None,
+        str(test_run.project_id) if test_run.project_id else None,
+        total_tests,
+        exclude_test_run_id=test_run.id,
+    )
+    scheduling["queued_at"] = datetime.now(timezone.utc).isoformat()
+    attributes["scheduling"] = scheduling
+    test_run.attributes = attributes
+    return priority
+
+
+def record_queue_wait(test_run: TestRun) -> Optional[float]:
+    """
+    Record how long a run waited between dispatch and a worker starting it.
+
+    Stores ``attributes["scheduling"]["queue_wait_seconds"]`` (the caller
+    commits) and logs it with the run's tenant and priority.
+
+    Returns:
+        Optional[float]: Seconds waited, or None if the run was not scheduled
+    """
+    attributes = dict(test_run.attributes or {})
+    scheduling = dict(attributes.get("scheduling") or {})
+    queued_at = scheduling.get("queued_at")
+    if not queued_at:
+        return None
+
+    wait = (datetime.now(timezone.utc) - datetime.fromisoformat(queued_at)).total_seconds()
+    scheduling["queue_wait_seconds"] = round(wait, 3)
+    attributes["scheduling"] = scheduling
+    test_run.attributes = attributes
+    logger.info(
+        f"Test run {test_run.id} waited {wait:.1f}s in queue",
+        extra={
+            "organization_id": str(test_run.organization_id),
+            "project_id": str(test_run.project_id) if test_run.project_id else None,
+            "priority": scheduling.get("priority"),
+            "queue_wait_seconds": round(wait, 3),
+        },
+    )
+    return wait
+
+
+def run_priority(test_run_attributes: Optional[Dict[str, Any]]) -> Optional[int]:
+    """Priority a run was dispatched with, for its follow-up tasks (e.g. shards)."""
+    return ((test_run_attributes or {}).get("scheduling") or {}).get("priority")
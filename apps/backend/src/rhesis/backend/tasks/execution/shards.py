@@ -0,0 +1,174 @@
+"""
+Tasks for sharded test-run execution (see execution/batch/sharding.py).
+
+``execute_test_shard`` runs one shard of a run as an ordinary batch and
+returns its per-test results; ``finalize_sharded_run`` is the chord callback
+that hands all shards' results to ``collect_results``.
+"""
+
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from rhesis.backend.app.crud.test_run import get_test_run
+from rhesis.backend.app.database import get_db_with_tenant_variables
+from rhesis.backend.app.models.test import Test
+from rhesis.backend.celery.core import app
+from rhesis.backend.tasks.base import SilentTask
+from rhesis.backend.tasks.enums import RunStatus
+from rhesis.backend.tasks.execution.batch import run_tests
+from rhesis.backend.tasks.execution.batch.sharding import update_shard_status
+from rhesis.backend.tasks.execution.config import get_test_configuration
+from rhesis.backend.tasks.execution.shared import (
+    create_failure_result,
+    trigger_results_collection,
+)
+
+
+def _summarize(results: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Per-status test counts of a shard, stored on its progress entry."""
+    counts: Dict[str, int] = {}
+    for result in results:
+        status = result.get("status", "unknown")
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+@app.task(base=SilentTask, bind=True, display_name="Test Run Shard Execution")
+def execute_test_shard(
+    self,
+    test_configuration_id: str,
+    test_run_id: str,
+    test_ids: List[str],
+    shard_index: int,
+    reference_test_run_id: Optional[str] = None,
+    trace_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Execute one shard of a sharded test run.
+
+    Retries through BaseTask like any other task; tests whose results an
+    earlier attempt already persisted are skipped. Once retries are
+    exhausted the shard reports its tests as failed instead of raising, so
+    the chord still completes and the run is finalized.
+
+    Args:
+        test_configuration_id: Test configuration of the run
+        test_run_id: The sharded test run
+        test_ids: Tests in this shard
+        shard_index: Position of the shard in test_run.attributes["shards"]
+        reference_test_run_id: Optional previous test run ID for re-scoring
+        trace_id: Optional trace ID for trace-based evaluation
+
+    Returns:
+        Per-test results (chord input for finalize_sharded_run)
+    """
+    org_id, user_id, project_id = self.get_tenant_context()
+    retries = getattr(self.request, "retries", 0)
+
+    self.log_with_context(
+        "info",
+        f"Starting shard {shard_index} of test run {test_run_id}",
+        tests=len(test_ids),
+        attempt=retries + 1,
+    )
+
+    try:
+        with get_db_with_tenant_variables(org_id or "", user_id or "", project_id or "") as db:
+            test_run = get_test_run(db, UUID(test_run_id), organization_id=org_id)
+            current_status = test_run.status.name if test_run and test_run.status else None
+            if test_run is None or current_status == RunStatus.CANCELLED.value:
+                self.log_with_context(
+                    "info", f"Test run {test_run_id} cancelled or deleted, skipping shard"
+                )
+                if test_run is not None:
+                    update_shard_status(db, test_run_id, shard_index, RunStatus.CANCELLED.value)
+                return [
+                    {"test_id": tid, "status": "cancelled", "execution_time": 0} for tid in test_ids
+                ]
+
+            test_config = get_test_configuration(db, test_configuration_id, org_id)
+            update_shard_status(
+                db,
+                test_run_id,
+                shard_index,
+                RunStatus.PROGRESS.value,
+                task_id=self.request.id,
+                attempt=retries + 1,
+            )
+            tests = db.query(Test).filter(Test.id.in_([UUID(tid) for tid in test_ids])).all()
+
+            # Closes db after the pre-fetch; this task's ID is what the
+            # cancellation watchdog checks against the revoke set.
+            results = run_tests(
+                db,
+                test_config,
+                test_run,
+                tests,
+                celery_task_id=self.request.id,
+                reference_test_run_id=reference_test_run_id,
+                trace_id=trace_id,
+                shard_index=shard_index,
+            )
+    except Exception as e:
+        is_non_retryable = isinstance(e, tuple(self.dont_autoretry_for or ()))
+        if retries < self.max_retries and not is_non_retryable:
+            # Re-raise so BaseTask retries the shard
+            raise
+
+        self.log_with_context(
+            "error",
+            f"Shard {shard_index} of test run {test_run_id} failed after {retries + 1} attempts",
+            error=str(e),
+        )
+        results = [create_failure_result(tid, e) for tid in test_ids]
+        status = RunStatus.FAILED.value
+    else:
+        cancelled = results and all(r.get("status") == "cancelled" for r in results)
+        status = RunStatus.CANCELLED.value if cancelled else RunStatus.COMPLETED.value
+
+    with get_db_with_tenant_variables(org_id or "", user_id or "", project_id or "") as db:
+        update_shard_status(db, test_run_id, shard_index, status, results=_summarize(results))
+
+    self.log_with_context(
+        "info", f"Shard {shard_index} of test run {test_run_id}: {status}", tests=len(results)
+    )
+    return results
+
+
+@app.task(base=SilentTask, bind=True, display_name="Sharded Test Run Finalization")
+def finalize_sharded_run(
+    self,
+    shard_results: List[List[Dict[str, Any]]],
+    test_configuration_id: str,
+    test_run_id: str,
+) -> Dict[str, Any]:
+    """
+    Chord callback: collect a sharded run's results once every shard is done.
+
+    Args:
+        shard_results: Per-test results of each shard (provided by the chord)
+        test_configuration_id: Test configuration of the run
+        test_run_id: The sharded test run
+
+    Returns:
+        Dict with the run's test and shard counts
+    """
+    results = [result for shard in shard_results or [] for result in shard or []]
+    org_id, user_id, project_id = self.get_tenant_context()
+
+    # As in a whole-run batch: nothing to aggregate if every test was
+    # cancelled, and collect_results would overwrite the Cancelled status.
+    skip_collection = not results or all(r.get("status") == "cancelled" for r in results)
+    if skip_collection:
+        self.log_with_context("info", f"Test run {test_run_id} cancelled, skipping collection")
+    else:
+        with get_db_with_tenant_variables(org_id or "", user_id or "", project_id or "") as db:
+            test_config = get_test_configuration(db, test_configuration_id, org_id)
+            trigger_results_collection(test_config, test_run_id, results)
+
+    return {
+        "test_run_id": test_run_id,
+        "shard_count": len(shard_results or []),
+        "total_tests": len(results),
+        "collected": not skip_collection,
+    }
@@ -0,0 +1,51 @@
+"""Celery task that rebuilds stale insights cubes for one organisation.
+
+Scheduled (throttled, delayed) by
+``app.services.insights.cube_refresh.schedule_cube_refresh`` after writes
+commit. Refreshes at most one batch of runs per invocation and re-schedules
+itself while stale runs remain, so a large backlog never turns into one
+long-running task.
+"""
+
+import logging
+from typing import Optional
+
+from rhesis.backend.app.database import SessionLocal, bind_scope_to_session
+from rhesis.backend.app.services.insights.cubes import refresh_stale_cubes
+from rhesis.backend.celery.core import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(bind=True, max_retries=3, default_retry_delay=30)
+def refresh_insights_cubes(self, organization_id: str, project_id: Optional[str] = None) -> dict:
+    """Refresh up to one batch of stale test-run cubes visible in the given scope."""
+    db = SessionLocal()
+    try:
+        # The cube tables carry FORCE'd tenant/project isolation RLS policies.
+        bind_scope_to_session(db, organization_id, project_id=project_id or "")
+        result = refresh_stale_cubes(db, organization_id, project_id)
+    except Exception as e:
+        db.rollback()
+        logger.warning(
+            "Failed to refresh insights cubes for org %s project %s",
+            organization_id,
+            project_id,
+            exc_info=True,
+        )
+        raise self.retry(exc=e)
+    finally:
+        db.close()
+
+    logger.info(
+        "Refreshed insights cubes for org %s project %s: %s",
+        organization_id,
+        project_id,
+        result,
+    )
+    if result["remaining"]:
+        from rhesis.backend.app.services.insights.cube_refresh import schedule_cube_refresh
+
+        # Runs locked by another refresher or marked stale meanwhile.
+        schedule_cube_refresh(organization_id, project_id)
+    return result
@@ -19,6 +19,7 @@ from rhesis.backend.tasks.execution.run import (
     create_test_run,
     update_test_run_status,
 )
+from rhesis.backend.tasks.execution.scheduling import record_queue_wait
 from rhesis.backend.tasks.utils import (
     create_task_result,
     get_test_run_by_task_id,
@@ -109,6 +110,7 @@ def execute_test_configuration(self, test_configuration_id: str, test_run_id: st
                 # confirm it here as a no-op safety net.
                 test_run.attributes = dict(test_run.attributes or {})
                 test_run.attributes["task_id"] = self.request.id
+                record_queue_wait(test_run)
                 update_test_run_status(db, test_run, RunStatus.PROGRESS.value)
                 db.commit()
                 self.log_with_context(
@@ -1,5 +1,6 @@
 import logging
-from typing import Any, List, Optional, Union
+import os
+from typing import Any, Dict, List, Optional, Union
 
 from rhesis.backend.app import crud
 from rhesis.backend.app.constants import TestSetType
@@ -37,6 +38,17 @@ from rhesis.backend.tasks.base import (
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Synthesizer batches generated between checkpoints when attaching to a
+# pre-created test set. Each checkpoint's tests are committed together with
+# the generation cursor, so a retried task resumes after the last one
+# instead of paying for the whole generation again.
+GENERATION_CHECKPOINT_BATCHES = 5
+
+# Drop near-duplicate tests (MinHash/LSH over prompts, or goals for multi-turn)
+# from each generated batch before it is saved, and across checkpoints once a
+# checkpointed generation is done; TEST_GENERATION_DEDUP=false turns it off.
+GENERATION_DEDUP = True
+
 
 @app.task(
     base=BaseTask,
@@ -114,6 +126,62 @@ def count_test_sets(self):
         raise
 
 
+@app.task(
+    base=BaseTask,
+    name="rhesis.backend.tasks.deduplicate_test_set",
+    bind=True,
+    display_name="Test Set Deduplication",
+)
+def deduplicate_test_set(
+    self, test_set_id: str, dry_run: bool = False, use_embeddings: bool = True
+):
+    """
+    Remove near-duplicate tests from an existing test set.
+
+    Duplicates are found with ``find_duplicate_tests`` (lexical MinHash/LSH,
+    plus stored embeddings when available) and disassociated from the test
+    set; the tests themselves are kept, since other test sets may use them.
+
+    Args:
+        test_set_id: UUID string of the test set
+        dry_run: Only report duplicates, do not remove them
+        use_embeddings: Also compare stored test embeddings
+
+    Returns:
+        dict: Duplicates found (duplicate -> kept test ID) and associations removed
+    """
+    from rhesis.backend.app.services.test_set import (
+        find_duplicate_tests,
+        remove_test_set_associations,
+    )
+
+    org_id, user_id, _ = self.get_tenant_context()
+    self.log_with_context("info", "Starting test set deduplication", test_set_id=test_set_id)
+
+    with self.get_db_session() as db:
+        duplicates = find_duplicate_tests(
+            db, test_set_id, org_id, user_id, use_embeddings=use_embeddings
+        )
+        removed = 0
+        if duplicates["duplicate_test_ids"] and not dry_run:
+            outcome = remove_test_set_associations(
+                db, test_set_id, duplicates["duplicate_test_ids"], org_id, user_id
+            )
+            if not outcome["success"]:
+                raise ValueError(outcome["message"])
+            removed = outcome["removed_associations"]
+
+    self.log_with_context(
+        "info",
+        "Test set deduplication completed",
+        test_set_id=test_set_id,
+        duplicates_found=len(duplicates["duplicate_test_ids"]),
+        removed_associations=removed,
+        dry_run=dry_run,
+    )
+    return {**duplicates, "test_set_id": test_set_id, "removed": removed, "dry_run": dry_run}
+
+
 # Helper functions for test set generation and saving
 
 
@@ -260,6 +328,90 @@ def _build_task_result(
     }
 
 
+def _to_test_data(tests) -> list:
+    """Convert SDK Test objects/dicts to TestData schemas."""
+    from rhesis.backend.app.schemas.test_set import TestData
+
+    converted_tests = []
+    for test in tests:
+        if isinstance(test, dict):
+            test_dict = test.copy()
+        else:
+            test_dict = test.model_dump(exclude={"id", "endpoint"})
+        test_dict["requirement"] = test_dict.get("requirement") or ""
+        test_dict["category"] = test_dict.get("category") or ""
+        test_dict["topic"] = test_dict.get("topic") or ""
+        converted_tests.append(TestData(**test_dict))
+    return converted_tests
+
+
+def _load_pre_created_test_set(db, test_set_id: str) -> TestSet:
+    """Fetch the TestSet row the router created before dispatching the task."""
+    import uuid as _uuid
+
+    from rhesis.backend.app.scope import bypass_tenant_filter
+
+    test_set_uuid = _uuid.UUID(test_set_id)
+    with bypass_tenant_filter():
+        # ItemDeletedException is in BaseTask.dont_autoretry_for, so a
+        # soft-deleted row fails this task immediately instead of retrying
+        # against a row that will never come back.
+        test_set_query = QueryBuilder(db, TestSet).with_deleted().filter_by_id(test_set_uuid)
+        db_test_set = _check_and_raise_if_deleted(test_set_query, TestSet, test_set_uuid, False)
+    if db_test_set is None:
+        raise ValueError(f"TestSet with id {test_set_id!r} not found in database")
+    return db_test_set
+
+
+def _update_generation_metadata(db_test_set: TestSet, **fields) -> None:
+    """Merge *fields* into the test set's ``metadata.generation`` attributes."""
+    attrs = dict(db_test_set.attributes or {})
+    metadata = dict(attrs.get("metadata", {}))
+    metadata["generation"] = {**metadata.get("generation", {}), **fields}
+    attrs["metadata"] = metadata
+    db_test_set.attributes = attrs
+
+
+def _complete_generated_test_set(
+    db,
+    db_test_set: TestSet,
+    org_id: str,
+    user_id: str,
+    extra_metadata: Optional[dict] = None,
+) -> None:
+    """Recompute a generated test set's attributes from its tests and mark it completed."""
+    defaults = load_defaults()
+
+    db.refresh(db_test_set)
+
+    from rhesis.backend.app.utils.crud_utils import get_or_create_type_lookup
+
+    license_type = get_or_create_type_lookup(
+        db=db,
+        type_name="LicenseType",
+        type_value=defaults["test_set"]["license_type"],
+        organization_id=org_id,
+        user_id=user_id,
+    )
+
+    new_attributes = generate_test_set_attributes(
+        db=db,
+        test_set=db_test_set,
+        defaults=defaults,
+        license_type=license_type,
+    )
+
+    # Preserve and update generation metadata
+    existing_generation = (db_test_set.attributes or {}).get("metadata", {}).get("generation", {})
+    merged_generation = {**existing_generation, "status": "completed"}
+    new_attributes.setdefault("metadata", {})["generation"] = merged_generation
+
+    if extra_metadata:
+        new_attributes["metadata"] = {**new_attributes.get("metadata", {}), **extra_metadata}
+
+    db_test_set.attributes = new_attributes
+
+
 def _attach_tests_to_existing_test_set(
     self,
     sdk_test_set,
@@ -267,6 +419,7 @@ def _attach_tests_to_existing_test_set(
     org_id: str,
     user_id: str,
     extra_metadata: Optional[dict] = None,
+    checkpoint: Optional[Dict[str, Any]] = None,
 ):
     """Attach generated tests to a pre-created TestSet row.
 
@@ -277,12 +430,17 @@ def _attach_tests_to_existing_test_set(
     3. Recomputes the test set's attributes from its tests
     4. Stamps generation.status = 'completed'
 
+    With *checkpoint* (incremental generation) steps 3-4 are skipped and the
+    checkpoint is stored as ``generation.checkpoint`` in the same transaction
+    as the tests, so the cursor never runs ahead of or behind what is saved.
+
     Args:
         sdk_test_set: The SDK TestSet containing generated tests
         test_set_id: UUID string of the pre-created TestSet row
         org_id: Organization UUID string
         user_id: User UUID string
         extra_metadata: Optional additional metadata to merge
+        checkpoint: Optional generation cursor to store with these tests
 
     Returns:
         The updated TestSet ORM model
@@ -290,8 +448,6 @@ def _attach_tests_to_existing_test_set(
     if not sdk_test_set.tests:
         raise ValueError("No tests to save. Please add tests to the test set first.")
 
-    from rhesis.backend.app.schemas.test_set import TestData
-
     # Resolve test_set_type string
     if sdk_test_set.test_set_type:
         test_set_type_value = TestSetType.get_value(
@@ -300,33 +456,10 @@ def _attach_tests_to_existing_test_set(
     else:
         test_set_type_value = TestSetType.SINGLE_TURN.value
 
-    converted_tests = []
-    for test in sdk_test_set.tests:
-        if isinstance(test, dict):
-            test_dict = test.copy()
-        else:
-            test_dict = test.model_dump(exclude={"id", "endpoint"})
-        test_dict["requirement"] = test_dict.get("requirement") or ""
-        test_dict["category"] = test_dict.get("category") or ""
-        test_dict["topic"] = test_dict.get("topic") or ""
-        converted_tests.append(TestData(**test_dict))
-
-    defaults = load_defaults()
+    converted_tests = _to_test_data(sdk_test_set.tests)
 
-    import uuid as _uuid
-
-    from rhesis.backend.app.scope import bypass_tenant_filter
-
-    test_set_uuid = _uuid.UUID(test_set_id)
     with self.get_db_session() as db:
-        with bypass_tenant_filter():
-            # ItemDeletedException is in BaseTask.dont_autoretry_for, so a
-            # soft-deleted row fails this task immediately instead of retrying
-            # against a row that will never come back.
-            test_set_query = QueryBuilder(db, TestSet).with_deleted().filter_by_id(test_set_uuid)
-            db_test_set = _check_and_raise_if_deleted(test_set_query, TestSet, test_set_uuid, False)
-        if db_test_set is None:
-            raise ValueError(f"TestSet with id {test_set_id!r} not found in database")
+        db_test_set = _load_pre_created_test_set(db, test_set_id)
 
         bulk_create_tests(
             db=db,
@@ -337,43 +470,152 @@ def _attach_tests_to_existing_test_set(
             test_type_value=test_set_type_value,
         )
 
-        db.refresh(db_test_set)
+        if checkpoint is not None:
+            _update_generation_metadata(db_test_set, checkpoint=checkpoint)
+        else:
+            _complete_generated_test_set(db, db_test_set, org_id, user_id, extra_metadata)
+
+    self.log_with_context(
+        "info",
+        "Tests attached to existing test set successfully",
+        test_set_id=str(db_test_set.id),
+        tests_attached=len(sdk_test_set.tests),
+        checkpoint=checkpoint,
+    )
+    return db_test_set
+
 
-        from rhesis.backend.app.utils.crud_utils import get_or_create_type_lookup
+def _load_generation_checkpoint(self, test_set_id: str) -> Dict[str, Any]:
+    """Generation cursor saved on the pre-created test set by an earlier attempt."""
+    with self.get_db_session() as db:
+        db_test_set = _load_pre_created_test_set(db, test_set_id)
+        generation = (db_test_set.attributes or {}).get("metadata", {}).get("generation", {})
+        return dict(generation.get("checkpoint") or {})
 
-        license_type = get_or_create_type_lookup(
-            db=db,
-            type_name="LicenseType",
-            type_value=defaults["test_set"]["license_type"],
-            organization_id=org_id,
-            user_id=user_id,
-        )
 
-        new_attributes = generate_test_set_attributes(
-            db=db,
-            test_set=db_test_set,
-            defaults=defaults,
-            license_type=license_type,
+def _generate_with_checkpoints(
+    self,
+    synthesizer,
+    num_tests: int,
+    checkpoint_size: int,
+    test_set_id: str,
+    org_id: str,
+    user_id: str,
+) -> int:
+    """Generate into a pre-created test set in checkpoints of *checkpoint_size* tests.
+
+    Each checkpoint is generated with its own ``synthesizer.generate()`` call
+    and committed with the cursor (tests requested and saved so far), so a
+    retry skips every checkpoint an earlier attempt already committed and
+    the UI sees tests arrive while generation is still running.
+
+    Returns:
+        int: Tests saved to the test set, including earlier attempts'
+    """
+    cursor = _load_generation_checkpoint(self, test_set_id)
+    requested = int(cursor.get("tests_requested", 0))
+    saved = int(cursor.get("tests_saved", 0))
+    completed = int(cursor.get("checkpoints_completed", 0))
+    if requested:
+        self.log_with_context(
+            "info",
+            "Resuming test set generation from checkpoint",
+            test_set_id=test_set_id,
+            tests_requested=requested,
+            tests_saved=saved,
         )
 
-        # Preserve and update generation metadata
-        existing_generation = (
-            (db_test_set.attributes or {}).get("metadata", {}).get("generation", {})
+    while requested < num_tests:
+        size = min(checkpoint_size, num_tests - requested)
+        self.update_state(
+            state="PROGRESS",
+            meta={
+                "status": f"Generating tests {requested + 1}-{requested + size} of {num_tests}",
+                "tests_saved": saved,
+            },
         )
-        merged_generation = {**existing_generation, "status": "completed"}
-        new_attributes.setdefault("metadata", {})["generation"] = merged_generation
+        test_set = synthesizer.generate(num_tests=size)
+
+        requested += size
+        saved += len(test_set.tests)
+        completed += 1
+        checkpoint = {
+            "tests_requested": requested,
+            "tests_saved": saved,
+            "checkpoints_completed": completed,
+        }
+        if test_set.tests:
+            _attach_tests_to_existing_test_set(
+                self,
+                test_set,
+                test_set_id=test_set_id,
+                org_id=org_id,
+                user_id=user_id,
+                checkpoint=checkpoint,
+            )
+        else:
+            with self.get_db_session() as db:
+                db_test_set = _load_pre_created_test_set(db, test_set_id)
+                _update_generation_metadata(db_test_set, checkpoint=checkpoint)
+
+    return saved
+
+
+def _remove_checkpoint_duplicates(self, test_set_id: str, org_id: str, user_id: str) -> int:
+    """Drop near-duplicates between checkpoints from a checkpointed generation.
+
+    The synthesizer's deduplicator only sees the tests of one ``generate()``
+    call, and a retry starts a fresh one, so duplicates across checkpoints are
+    found on the saved set instead. They were generated for this set only, so
+    they are soft-deleted rather than just disassociated.
+
+    Returns:
+        int: Tests removed
+    """
+    import uuid as _uuid
+    from datetime import datetime, timezone
 
-        if extra_metadata:
-            new_attributes["metadata"] = {**new_attributes.get("metadata", {}), **extra_metadata}
+    from rhesis.backend.app.models.test import Test
+    from rhesis.backend.app.services.test_set import (
+        find_duplicate_tests,
+        remove_test_set_associations,
+    )
 
-        db_test_set.attributes = new_attributes
+    with self.get_db_session() as db:
+        duplicates = find_duplicate_tests(db, test_set_id, org_id, user_id, use_embeddings=False)
+        duplicate_ids = duplicates["duplicate_test_ids"]
+        if not duplicate_ids:
+            return 0
+
+        outcome = remove_test_set_associations(db, test_set_id, duplicate_ids, org_id, user_id)
+        if not outcome["success"]:
+            raise ValueError(outcome["message"])
+        now = datetime.now(timezone.utc)
+        db.query(Test).filter(
+            Test.id.in_([_uuid.UUID(test_id) for test_id in duplicate_ids]),
+            Test.organization_id == _uuid.UUID(org_id),
+        ).update({"deleted_at": now, "updated_at": now}, synchronize_session=False)
 
     self.log_with_context(
         "info",
-        "Tests attached to existing test set successfully",
-        test_set_id=str(db_test_set.id),
-        tests_attached=len(sdk_test_set.tests),
+        "Removed near-duplicate tests across checkpoints",
+        test_set_id=test_set_id,
+        duplicates_removed=len(duplicate_ids),
     )
+    return len(duplicate_ids)
+
+
+def _finish_checkpointed_generation(
+    self,
+    test_set_id: str,
+    org_id: str,
+    user_id: str,
+    extra_metadata: Optional[dict] = None,
+):
+    """Mark a checkpointed generation completed once every checkpoint is saved."""
+    with self.get_db_session() as db:
+        db_test_set = _load_pre_created_test_set(db, test_set_id)
+        _complete_generated_test_set(db, db_test_set, org_id, user_id, extra_metadata)
     return db_test_set
 
 
@@ -515,8 +757,18 @@ def generate_and_save_test_set(
             raise ValueError(f"Unsupported test_type {test_type!r}. Valid values: {valid}")
         test_type = resolved_type.value
 
-        from rhesis.sdk.synthesizers import ConfigSynthesizer, MultiTurnSynthesizer
+        from rhesis.sdk.synthesizers import (
+            ConfigSynthesizer,
+            MultiTurnSynthesizer,
+            TestDeduplicator,
+        )
 
+        dedup_enabled = os.environ.get("TEST_GENERATION_DEDUP", str(GENERATION_DEDUP)).lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        deduplicator = TestDeduplicator() if dedup_enabled else None
         # Create synthesizer with full config
         if test_type == TestSetType.SINGLE_TURN.value:
             synthesizer = ConfigSynthesizer(
@@ -524,11 +776,13 @@ def generate_and_save_test_set(
                 batch_size=batch_size,
                 model=model,
                 sources=source_specifications if source_specifications else None,
+                deduplicator=deduplicator,
             )
         elif test_type == TestSetType.MULTI_TURN.value:
             synthesizer = MultiTurnSynthesizer(
                 config=generation_config,
                 model=model,
+                deduplicator=deduplicator,
             )
         else:
             raise ValueError(f"Unsupported test_type {test_type!r}")
@@ -544,13 +798,37 @@ def generate_and_save_test_set(
         import time
 
         gen_start = time.time()
-        test_set = synthesizer.generate(num_tests=num_tests)
+        if test_set_id:
+            # Source-grounded generation plans chunk coverage over the whole
+            # request, so it is checkpointed as a single unit.
+            checkpoint_size = (
+                num_tests
+                if source_specifications
+                else batch_size
+                * int(
+                    os.environ.get(
+                        "TEST_GENERATION_CHECKPOINT_BATCHES", GENERATION_CHECKPOINT_BATCHES
+                    )
+                )
+            )
+            tests_generated = _generate_with_checkpoints(
+                self,
+                synthesizer,
+                num_tests,
+                max(1, checkpoint_size),
+                test_set_id=test_set_id,
+                org_id=org_id,
+                user_id=user_id,
+            )
+        else:
+            test_set = synthesizer.generate(num_tests=num_tests)
+            tests_generated = len(test_set.tests)
         gen_elapsed = time.time() - gen_start
 
         self.log_with_context(
             "info",
             "Test set generated",
-            actual_tests_generated=len(test_set.tests),
+            actual_tests_generated=tests_generated,
             requested_tests=num_tests,
             generation_time_seconds=round(gen_elapsed, 1),
         )
@@ -562,10 +840,15 @@ def generate_and_save_test_set(
         self.update_state(state="PROGRESS", meta={"status": "Saving to database"})
 
         if test_set_id:
-            # Attach tests to the pre-created row
-            db_test_set = _attach_tests_to_existing_test_set(
+            # Tests are already attached checkpoint by checkpoint
+            if dedup_enabled and tests_generated:
+                tests_generated -= _remove_checkpoint_duplicates(
+                    self, test_set_id=test_set_id, org_id=org_id, user_id=user_id
+                )
+            if not tests_generated:
+                raise ValueError("No tests to save. Please add tests to the test set first.")
+            db_test_set = _finish_checkpointed_generation(
                 self,
-                test_set,
                 test_set_id=test_set_id,
                 org_id=org_id,
                 user_id=user_id,
@@ -592,20 +875,20 @@ def generate_and_save_test_set(
             batch_size,
             org_id,
             user_id,
-            tests_generated=len(test_set.tests),
+            tests_generated=tests_generated,
         )
 
         # No session needed here any more -- the accrual is queued and the
         # worker task opens its own. dispatch_accrual no-ops on a count of
         # zero, so the guard that used to protect the session checkout is
         # gone too.
-        dispatch_accrual(org_id, QuotaResource.TEST_GENERATION, len(test_set.tests))
+        dispatch_accrual(org_id, QuotaResource.TEST_GENERATION, tests_generated)
 
         self.log_with_context(
             "info",
             "Task completed successfully",
             test_set_id=str(db_test_set.id),
-            tests_generated=len(test_set.tests),
+            tests_generated=tests_generated,
         )
 
         return result
@@ -8,6 +8,8 @@ accrual is queued rather than written inline by its callers.
 """
 
 import logging
+from datetime import date
+from typing import Optional
 
 from rhesis.backend.app.database import SessionLocal, bind_scope_to_session
 from rhesis.backend.app.quota import QuotaResource
@@ -18,9 +20,14 @@ logger = logging.getLogger(__name__)
 
 
 @app.task(bind=True, max_retries=3, default_retry_delay=30)
-def accrue_usage(self, organization_id: str, resource: str, amount: int) -> None:
+def accrue_usage(
+    self, organization_id: str, resource: str, amount: int, period_start: Optional[str] = None
+) -> None:
     """Add *amount* to *organization_id*'s counter for *resource*.
 
+    *period_start* (ISO date) is the billing period the accrual belongs to,
+    fixed when it was buffered; without it, the current period is used.
+
     *resource* arrives as a plain string because task arguments are JSON
     over the broker; it is converted back to :class:`QuotaResource` here so
     an unknown value fails loudly instead of quietly creating a counter
@@ -29,6 +36,7 @@ def accrue_usage(self, organization_id: str, resource: str, amount: int) -> None
     will not make it a good one.
     """
     quota_resource = QuotaResource(resource)
+    period = date.fromisoformat(period_start) if period_start else None
 
     db = SessionLocal()
     try:
@@ -38,7 +46,7 @@ def accrue_usage(self, organization_id: str, resource: str, amount: int) -> None
         # FORCE'd `tenant_isolation` RLS policy rejects the upsert outright
         # when `app.current_organization` is unset.
         bind_scope_to_session(db, organization_id)
-        increment_usage(db, organization_id, quota_resource, amount)
+        increment_usage(db, organization_id, quota_resource, amount, period_start=period)
     except Exception as e:
         logger.warning(
             "Failed to accrue %s usage (amount=%s) for org %s",
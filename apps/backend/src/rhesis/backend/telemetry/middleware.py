@@ -4,10 +4,9 @@ Middleware for handling telemetry context in FastAPI.
 
 import logging
 import time
-from typing import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from rhesis.backend.app.config.settings import get_telemetry_settings
 from rhesis.backend.telemetry.instrumentation import (
@@ -20,9 +19,9 @@ from rhesis.backend.telemetry.instrumentation import (
 logger = logging.getLogger(__name__)
 
 
-class TelemetryMiddleware(BaseHTTPMiddleware):
+class TelemetryMiddleware:
     """
-    Middleware that:
+    Pure ASGI middleware that:
     1. Checks user's telemetry preference
     2. Sets telemetry context for the request
     3. Tracks API endpoint usage
@@ -35,25 +34,32 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
     # and avoids tracking high-frequency infra endpoints).
     EXCLUDED_PREFIXES = ("/files/", "/telemetry/traces", "/mcp/", "/healthz")
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and track telemetry if enabled"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Skip telemetry entirely for high-frequency / infra paths to prevent
         # the OTel self-export loop (e.g. /files/ download redirects, trace ingest).
-        path = request.url.path
-        for prefix in self.EXCLUDED_PREFIXES:
-            if path.startswith(prefix):
-                return await call_next(request)
+        if scope["path"].startswith(self.EXCLUDED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
 
         # Check if telemetry is globally enabled (based on deployment type + env var)
         telemetry_enabled = get_telemetry_settings().is_telemetry_enabled
 
         if not telemetry_enabled:
             # Telemetry disabled, just process request normally
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Start timing
         start_time = time.time()
+        request = Request(scope)
 
         # Try to get user from an earlier middleware/dependency if it's already set
         user = getattr(request.state, "user", None)
@@ -69,8 +75,16 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
                 org_id=str(org_id) if org_id else None,
             )
 
+        status_code = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         # Process the request (this runs route handlers where track_feature_usage() is called)
-        response = await call_next(request)
+        await self.app(scope, receive, send_with_status)
 
         # Check again if user was set during request processing
         user = getattr(request.state, "user", None)
@@ -91,12 +105,10 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
             )
 
             # Track endpoint usage
-            await self._track_endpoint(request, response, start_time, user_id, org_id)
-
-        return response
+            await self._track_endpoint(request, status_code, start_time, user_id, org_id)
 
     async def _track_endpoint(
-        self, request: Request, response: Response, start_time: float, user_id, org_id
+        self, request: Request, status_code: int | None, start_time: float, user_id, org_id
     ):
         """Track API endpoint usage after request is completed"""
         try:
@@ -118,7 +130,8 @@ class TelemetryMiddleware(BaseHTTPMiddleware):
                 span.set_attribute("http.method", method)
                 span.set_attribute("http.route", route)
                 span.set_attribute("http.url", str(request.url))
-                span.set_attribute("http.status_code", response.status_code)
+                if status_code is not None:
+                    span.set_attribute("http.status_code", status_code)
                 span.set_attribute("duration_ms", duration_ms)
 
                 # Set user context (use hashed IDs from context)
@@ -7,6 +7,15 @@ load_dotenv()
 
 # Import signals so that they are registered
 import rhesis.backend.celery.signals  # noqa: E402, F401
+from rhesis.backend.app.services.evaluation_cache import (  # noqa: E402
+    initialize_cache as init_evaluation_cache_parent,
+)
+from rhesis.backend.app.services.insights.cube_refresh import (  # noqa: E402
+    initialize_cache as init_cube_refresh_cache_parent,
+)
+from rhesis.backend.app.services.insights.result_cache import (  # noqa: E402
+    initialize_cache as init_insights_result_cache_parent,
+)
 from rhesis.backend.app.services.telemetry.conversation_linking import (  # noqa: E402
     initialize_cache as init_conv_cache_parent,
 )
@@ -18,6 +27,9 @@ from rhesis.backend.celery.core import app  # noqa: E402
 # Initialize caches in parent worker (needed for master process state)
 init_conv_cache_parent()
 init_metrics_cache_parent()
+init_cube_refresh_cache_parent()
+init_insights_result_cache_parent()
+init_evaluation_cache_parent()
 
 # Pre-warm the exchange rate cache so the first enrichment task
 # does not block on an HTTP call to the exchange rate API.
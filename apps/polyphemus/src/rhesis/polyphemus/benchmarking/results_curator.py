@@ -3,14 +3,22 @@ Results Curator for Polyphemus Benchmarking
 
 This module provides functionality to curate and analyze all benchmarking results
 across multiple test sets and models, generating comprehensive reports.
+
+Statistics, correlations and regressions are computed with NumPy over whole
+columns of values rather than element by element in Python.
 """
 
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from statistics import mean, median, stdev
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
+# Upper bounds (inclusive) of the input-length buckets; the last is open-ended
+_INPUT_LENGTH_BUCKET_EDGES = [100, 500, 1000, 2000]
+_INPUT_LENGTH_BUCKET_NAMES = ["0-100", "100-500", "500-1000", "1000-2000", "2000+"]
+
 
 @dataclass
 class MetricStatistics:
@@ -248,14 +256,15 @@ class ResultsCurator:
         if not values:
             return None
 
+        array = np.asarray(values, dtype=float)
         return MetricStatistics(
             name="",
-            mean=mean(values),
-            median=median(values),
-            std_dev=stdev(values) if len(values) > 1 else None,
-            min=min(values),
-            max=max(values),
-            count=len(values),
+            mean=float(array.mean()),
+            median=float(np.median(array)),
+            std_dev=float(array.std(ddof=1)) if array.size > 1 else None,
+            min=float(array.min()),
+            max=float(array.max()),
+            count=int(array.size),
         )
 
     def _compute_correlation(self, x: List[float], y: List[float]) -> Optional[float]:
@@ -277,18 +286,18 @@ class ResultsCurator:
         if not x or not y or len(x) != len(y) or len(x) < 2:
             return None
 
-        n = len(x)
-        mean_x = mean(x)
-        mean_y = mean(y)
+        dx = np.asarray(x, dtype=float)
+        dy = np.asarray(y, dtype=float)
+        dx = dx - dx.mean()
+        dy = dy - dy.mean()
 
-        numerator = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-        denominator_x = sum((x[i] - mean_x) ** 2 for i in range(n))
-        denominator_y = sum((y[i] - mean_y) ** 2 for i in range(n))
+        denominator_x = np.dot(dx, dx)
+        denominator_y = np.dot(dy, dy)
 
         if denominator_x == 0 or denominator_y == 0:
             return None
 
-        return numerator / (denominator_x * denominator_y) ** 0.5
+        return float(np.dot(dx, dy) / np.sqrt(denominator_x * denominator_y))
 
     def _compute_linear_regression(
         self, x: List[float], y: List[float]
@@ -311,20 +320,21 @@ class ResultsCurator:
         if not x or not y or len(x) != len(y) or len(x) < 2:
             return None
 
-        n = len(x)
-        mean_x = mean(x)
-        mean_y = mean(y)
+        ax = np.asarray(x, dtype=float)
+        ay = np.asarray(y, dtype=float)
+        mean_x = ax.mean()
+        mean_y = ay.mean()
+        dx = ax - mean_x
 
-        numerator = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-        denominator = sum((x[i] - mean_x) ** 2 for i in range(n))
+        denominator = np.dot(dx, dx)
 
         if denominator == 0:
             return None
 
-        slope = numerator / denominator
+        slope = np.dot(dx, ay - mean_y) / denominator
         intercept = mean_y - slope * mean_x
 
-        return slope, intercept
+        return float(slope), float(intercept)
 
     def _compute_input_length_performance(
         self, data_points: List[Tuple[int, float]]
@@ -362,35 +372,21 @@ class ResultsCurator:
         # Note: This is different from input tokens - we'll compute it if we have output token data
         # For now, skip this as it requires output tokens
 
-        # Bucketed analysis - group by input token ranges
-        buckets = {
-            "0-100": [],
-            "100-500": [],
-            "500-1000": [],
-            "1000-2000": [],
-            "2000+": [],
-        }
-
-        for input_tok, gen_time in data_points:
-            if input_tok <= 100:
-                buckets["0-100"].append(gen_time)
-            elif input_tok <= 500:
-                buckets["100-500"].append(gen_time)
-            elif input_tok <= 1000:
-                buckets["500-1000"].append(gen_time)
-            elif input_tok <= 2000:
-                buckets["1000-2000"].append(gen_time)
-            else:
-                buckets["2000+"].append(gen_time)
+        # Bucketed analysis - group by input token ranges (upper bounds inclusive)
+        times = np.asarray(gen_times, dtype=float)
+        bucket_ids = np.searchsorted(
+            _INPUT_LENGTH_BUCKET_EDGES, np.asarray(input_tokens, dtype=float), side="left"
+        )
 
         # Compute statistics for each bucket
-        for bucket_name, times in buckets.items():
-            if times:
+        for bucket_id, bucket_name in enumerate(_INPUT_LENGTH_BUCKET_NAMES):
+            bucket_times = times[bucket_ids == bucket_id]
+            if bucket_times.size:
                 perf.buckets[bucket_name] = {
-                    "count": len(times),
-                    "avg_time_seconds": round(mean(times), 4),
-                    "min_time_seconds": round(min(times), 4),
-                    "max_time_seconds": round(max(times), 4),
+                    "count": int(bucket_times.size),
+                    "avg_time_seconds": round(float(bucket_times.mean()), 4),
+                    "min_time_seconds": round(float(bucket_times.min()), 4),
+                    "max_time_seconds": round(float(bucket_times.max()), 4),
                 }
 
         # Store sample points for visualization
@@ -1,20 +1,30 @@
+import asyncio
 import json
+import time
+from collections import defaultdict
 from dataclasses import asdict
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from tqdm import tqdm
 
+from rhesis.sdk.async_utils import run_sync
 from rhesis.sdk.models import BaseLLM
 
 from .utils import (
     Test,
     TestResult,
+    invocation_key,
     read_results_json,
     read_tests_json,
     update_if_result_matches_test,
 )
 
+# Requests in flight per model during generation
+DEFAULT_GENERATION_CONCURRENCY = 8
+# Completed responses between checkpoint saves during generation
+DEFAULT_CHECKPOINT_EVERY = 25
+
 
 class TestSetEvaluator:
     """
@@ -24,7 +34,12 @@ class TestSetEvaluator:
     evaluation logic.
     """
 
-    def __init__(self, json_path: Path):
+    def __init__(
+        self,
+        json_path: Path,
+        concurrency: int = DEFAULT_GENERATION_CONCURRENCY,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    ):
         """
         Initialize the test set with a name and JSON file for loading tests.
 
@@ -32,7 +47,16 @@ class TestSetEvaluator:
         ----------
         child__file__ : Path
             Path to the Python file of the child class. Used to resolve the JSON test set file.
+        concurrency : int
+            Maximum concurrent generation requests per model. Models that report
+            per-call metadata on the instance (local HuggingFace models) always
+            run one request at a time.
+        checkpoint_every : int
+            Save results to disk after this many new responses, so an interrupted
+            run resumes from the last checkpoint via generate_pending_responses().
         """
+        self.concurrency = max(1, concurrency)
+        self.checkpoint_every = max(1, checkpoint_every)
         # Initialize paths
         self.base_path: Path = Path(json_path)
         self.results_dir: Path = self.base_path.parent.parent.joinpath("results")
@@ -41,6 +65,11 @@ class TestSetEvaluator:
         self.tests: List[Test] = []
         self.models: List[BaseLLM] = []
         self.results: List[List[TestResult]] = []
+        # Indexes: model id -> model index, invocation key -> candidate test indices
+        self._model_indices: Dict[str, int] = {}
+        self._test_index: Dict[tuple, List[int]] = {}
+        # Wall-clock seconds spent per phase (see ModelTester.print_timing_summary)
+        self.timings: Dict[str, float] = defaultdict(float)
         # Load test cases from JSON
         self._load_base()
         self.judge = None  # Judge model for evaluation (set by tester)
@@ -56,6 +85,9 @@ class TestSetEvaluator:
         if tests is None or len(tests) == 0:
             raise ValueError("No tests found.")
         self.tests = tests
+        self._test_index = defaultdict(list)
+        for test_index, test in enumerate(tests):
+            self._test_index[invocation_key(test)].append(test_index)
 
     def set_judge(self, judge):
         """
@@ -82,6 +114,7 @@ class TestSetEvaluator:
             if existing_model.model_name == model.model_name:
                 print(f"Model {model.model_name} is already added to the test set.")
                 return
+        self._model_indices[model.get_model_name()] = len(self.models)
         self.models.append(model)
         self.results.append([None for _ in range(len(self.tests))])
 
@@ -123,12 +156,13 @@ class TestSetEvaluator:
             If False, only add if slot is empty (None) or has error.
         """
         # Find model index or dismiss if model is unknown
-        models_names = [model.get_model_name() for model in self.models]
-        model_index = models_names.index(result.model_id)
+        model_index = self._model_indices.get(result.model_id)
+        if model_index is None:
+            raise ValueError(f"Unknown model for result: {result.model_id}")
 
-        # Find the test this result belongs to
-        for i, test in enumerate(self.tests):
-            if update_if_result_matches_test(result, test):
+        # Find the test this result belongs to among tests with the same inputs
+        for i in self._test_index.get(invocation_key(result), ()):
+            if update_if_result_matches_test(result, self.tests[i]):
                 existing = self.results[model_index][i]
 
                 if not overwrite and existing is not None and existing.error is None:
@@ -164,6 +198,7 @@ class TestSetEvaluator:
             print(f"No pending test cases for model {model.model_name}. Nothing to do.")
             return results
         # load model and tokenizer
+        load_start = time.perf_counter()
         try:
             model.load_model()
         except Exception as e:
@@ -190,57 +225,119 @@ class TestSetEvaluator:
             if hasattr(model, "unload_model"):
                 model.unload_model()
             return results
+        finally:
+            self.timings["model_load"] += time.perf_counter() - load_start
+
         # Test each prompt with the model
-        for test in tqdm(tests, desc=f"Running pending tests on {model.model_name}", unit="test"):
-            response = None
-            error = None
-            try:
-                # Prepare system prompt with context if available
-                system_prompt = test.system_prompt
-                if test.context:
-                    # Prepend context chunks to system prompt
-                    context_text = "\n\n".join(test.context)
-                    if system_prompt:
-                        system_prompt = f"{system_prompt}\n\n# Context Information:\n{context_text}"
-                    else:
-                        system_prompt = f"# Context Information:\n{context_text}"
-
-                response = model.generate(
-                    prompt=test.prompt,
-                    system_prompt=system_prompt,
-                    **test.additional_params,
-                )
+        generation_start = time.perf_counter()
+        try:
+            results = run_sync(self._a_generate_responses(tests, model))
+        finally:
+            self.timings["generation"] += time.perf_counter() - generation_start
+            if hasattr(model, "unload_model"):
+                model.unload_model()
+        return results
 
-                # Capture performance metadata from SDK models
-                metadata = None
-                if hasattr(model, "last_generation_metadata"):
-                    metadata = model.last_generation_metadata
+    def _model_concurrency(self, model: BaseLLM) -> int:
+        """
+        Concurrent requests to run against a model.
 
-            except Exception as e:
-                error = str(e)
-                metadata = None
-
-            test_result = TestResult(
-                model_id=model.get_model_name(),
-                text=response,
-                metadata=metadata,
-                error=error,
+        Models exposing ``last_generation_metadata`` report each call's timing and
+        token counts on the shared instance, so overlapping calls would mix them
+        up; they are local models generating on one device anyway.
+        """
+        if hasattr(model, "last_generation_metadata"):
+            return 1
+        return self.concurrency
+
+    async def _a_generate_responses(self, tests: List[Test], model: BaseLLM) -> List[TestResult]:
+        """
+        Generate responses for tests concurrently, checkpointing as they complete.
+
+        Parameters
+        ----------
+        tests : List[Test]
+            List of tests to run.
+        model : BaseLLM
+            Loaded model to use for generation.
+
+        Returns
+        -------
+        List[TestResult]
+            Generated test results, in the order of tests.
+        """
+        model_index = self._model_indices[model.get_model_name()]
+        semaphore = asyncio.Semaphore(self._model_concurrency(model))
+        progress = tqdm(
+            total=len(tests), desc=f"Running pending tests on {model.model_name}", unit="test"
+        )
+        completed_since_checkpoint = 0
+
+        async def _run(test: Test) -> TestResult:
+            nonlocal completed_since_checkpoint
+            async with semaphore:
+                test_result = await self._a_generate_one(test, model)
+            self._add_result(test_result, overwrite=True)
+            progress.update(1)
+            completed_since_checkpoint += 1
+            if completed_since_checkpoint >= self.checkpoint_every:
+                completed_since_checkpoint = 0
+                self.save_results(model_index_to_save=model_index)
+            return test_result
+
+        try:
+            return list(await asyncio.gather(*[_run(test) for test in tests]))
+        finally:
+            progress.close()
+
+    async def _a_generate_one(self, test: Test, model: BaseLLM) -> TestResult:
+        """Run one test against the model and wrap the outcome in a TestResult."""
+        response = None
+        error = None
+        metadata = None
+        call_start = time.perf_counter()
+        try:
+            # Prepare system prompt with context if available
+            system_prompt = test.system_prompt
+            if test.context:
+                # Prepend context chunks to system prompt
+                context_text = "\n\n".join(test.context)
+                if system_prompt:
+                    system_prompt = f"{system_prompt}\n\n# Context Information:\n{context_text}"
+                else:
+                    system_prompt = f"# Context Information:\n{context_text}"
+
+            response = await model.a_generate(
                 prompt=test.prompt,
-                system_prompt=test.system_prompt,
-                context=test.context,
-                # NOTE: the model might have default params that are not listed here
-                additional_params=test.additional_params,
-                expected_text=test.expected_text,
-                test_metadata=test.test_metadata,
-                score=None,
-                details=None,
-                cost=None,
+                system_prompt=system_prompt,
+                **test.additional_params,
             )
-            self._add_result(test_result, overwrite=True)
-            results.append(test_result)
-        if hasattr(model, "unload_model"):
-            model.unload_model()
-        return results
+
+            # Capture performance metadata from SDK models
+            if hasattr(model, "last_generation_metadata"):
+                metadata = model.last_generation_metadata
+
+        except Exception as e:
+            error = str(e)
+            metadata = None
+        self.timings["generation_calls"] += time.perf_counter() - call_start
+
+        return TestResult(
+            model_id=model.get_model_name(),
+            text=response,
+            metadata=metadata,
+            error=error,
+            prompt=test.prompt,
+            system_prompt=test.system_prompt,
+            context=test.context,
+            # NOTE: the model might have default params that are not listed here
+            additional_params=test.additional_params,
+            expected_text=test.expected_text,
+            test_metadata=test.test_metadata,
+            score=None,
+            details=None,
+            cost=None,
+        )
 
     def generate_pending_responses(self) -> List[TestResult]:
         """
@@ -463,7 +560,9 @@ class TestSetEvaluator:
                 if not recompute_existing and test_result.score is not None:
                     continue
 
+                evaluation_start = time.perf_counter()
                 self._evaluate_test_result(test_result)
+                self.timings["evaluation"] += time.perf_counter() - evaluation_start
                 newly_evaluated.append(test_result)
             self.save_results(model_index_to_save=model_index)
         return newly_evaluated
@@ -481,9 +580,13 @@ class TestSetEvaluator:
         """
         if json_path is None:
             return
+        save_start = time.perf_counter()
         try:
             json_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(json_path, mode="w") as f:
+            # Write to a sibling file and swap it in, so a run interrupted mid-save
+            # still resumes from the previous checkpoint
+            tmp_path = json_path.with_name(f".{json_path.name}.tmp")
+            with open(tmp_path, mode="w") as f:
                 json.dump(
                     {
                         "results": [asdict(result) for result in results if result is not None],
@@ -492,10 +595,13 @@ class TestSetEvaluator:
                     indent=2,
                     default=str,
                 )
-                print(f"Results saved to file: {json_path.absolute()}")
+            tmp_path.replace(json_path)
+            print(f"Results saved to file: {json_path.absolute()}")
         except FileNotFoundError:
             print("No valid json_path specified. File is not saved.")
             return
+        finally:
+            self.timings["saving"] += time.perf_counter() - save_start
 
     def save_results(self, model_index_to_save=None):
         """
@@ -62,6 +62,18 @@ class TestResult:
     details: Optional[Dict[str, Any]] = None
 
 
+def invocation_key(item: Union[Test, TestResult]) -> tuple:
+    """
+    Index key for the model inputs of a test or result.
+
+    Covers prompt, system prompt and context, so tests that share a key are the
+    only candidates ``update_if_result_matches_test`` needs to compare a result
+    against (``additional_params`` is checked there).
+    """
+    context = tuple(item.context) if item.context is not None else None
+    return (item.prompt, item.system_prompt, context)
+
+
 def update_if_result_matches_test(test_result: TestResult, test: Test) -> bool:
     """
     Checks if a TestResult corresponds to a given Test based on MODEL INPUTS.
@@ -1,4 +1,6 @@
 import gc
+import time
+from collections import defaultdict
 from pathlib import Path
 from typing import List, Optional
 
@@ -7,6 +9,17 @@ from rhesis.sdk.models import BaseLLM
 from .models.judge import Judge
 from .results_curator import ResultsCurator
 from .test_sets import TestResult, TestSetEvaluator
+from .test_sets.test_set_evaluator import DEFAULT_CHECKPOINT_EVERY, DEFAULT_GENERATION_CONCURRENCY
+
+# Phases reported by print_timing_summary, in workflow order
+_TIMING_LABELS = [
+    ("model_load", "Model loading"),
+    ("generation", "Generation (wall clock)"),
+    ("generation_calls", "Generation (summed over requests)"),
+    ("evaluation", "Evaluation"),
+    ("saving", "Saving results"),
+    ("report", "Report curation"),
+]
 
 
 class ModelTester:
@@ -16,7 +29,12 @@ class ModelTester:
     summarizing outcomes. Designed for extensibility and future benchmarking needs.
     """
 
-    def __init__(self, base_dir: Path):
+    def __init__(
+        self,
+        base_dir: Path,
+        concurrency: int = DEFAULT_GENERATION_CONCURRENCY,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    ):
         """
         Initialize the ModelTester.
 
@@ -25,6 +43,10 @@ class ModelTester:
         base_dir : Path
             Base directory for benchmarking (e.g., results/polyphemus/benchmarking/).
             Should contain a 'test_sets' subdirectory with test JSON files.
+        concurrency : int, optional
+            Maximum concurrent generation requests per model.
+        checkpoint_every : int, optional
+            Save results after this many new responses, so interrupted runs resume.
         """
         base_dir = Path(base_dir)
         if not base_dir.exists() or not base_dir.is_dir():
@@ -40,12 +62,15 @@ class ModelTester:
         self.test_sets: List[TestSetEvaluator] = []  # Test sets to use
         for json_file in self.test_sets_dir.glob("*.json"):
             try:
-                test_set = TestSetEvaluator(json_file)
+                test_set = TestSetEvaluator(
+                    json_file, concurrency=concurrency, checkpoint_every=checkpoint_every
+                )
                 self.test_sets.append(test_set)
             except Exception as e:
                 print(f"Error loading {json_file}: {e}")
         self._generated_results: List[TestResult] = []
         self._evaluated_results: List[TestResult] = []
+        self._timings = defaultdict(float)
 
     def add_model(self, model: BaseLLM):
         """
@@ -84,6 +109,7 @@ class ModelTester:
 
         if print_summary:
             self.print_generation_summary()
+            self.print_timing_summary()
 
     def evaluate(self, recompute_existing=False, print_summary=True):
         """
@@ -121,6 +147,27 @@ class ModelTester:
 
         if print_summary:
             self.print_evaluation_summary()
+            self.print_timing_summary()
+
+    def print_timing_summary(self):
+        """
+        Print where benchmark time has gone so far, summed over all test sets.
+        """
+        totals = defaultdict(float, self._timings)
+        for test_set in self.test_sets:
+            for phase, seconds in test_set.timings.items():
+                totals[phase] += seconds
+        if not totals:
+            return
+
+        print("=== Timing ===")
+        for phase, label in _TIMING_LABELS:
+            if phase in totals:
+                print(f"  {label}: {totals[phase]:.2f}s")
+        if totals["generation"] > 0 and totals["generation_calls"] > 0:
+            overlap = totals["generation_calls"] / totals["generation"]
+            print(f"  Effective generation concurrency: {overlap:.1f}x")
+        print()
 
     def print_generation_summary(self):
         """
@@ -408,7 +455,9 @@ class ModelTester:
         if output_path is None:
             output_path = results_base_path.joinpath("report.json")
 
+        report_start = time.perf_counter()
         report_path = curator.save_report(output_path)
+        self._timings["report"] += time.perf_counter() - report_start
 
         if print_summary:
             import json
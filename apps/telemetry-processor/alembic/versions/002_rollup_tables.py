@@ -0,0 +1,128 @@
+"""rollup tables
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create per-minute rollup tables maintained by the processor.
+
+    - endpoint_usage_rollup: request counts and duration totals
+    - endpoint_duration_rollup: duration sketch buckets (percentiles)
+    - feature_usage_rollup: feature event counts
+    - user_activity_rollup: user activity event counts
+    - active_users_rollup: distinct users per minute
+    """
+
+    op.create_table(
+        "endpoint_usage_rollup",
+        sa.Column("window_start", sa.DateTime(), nullable=False),
+        sa.Column("endpoint", sa.String(255), nullable=False),
+        sa.Column("method", sa.String(10), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=False),
+        sa.Column("organization_id", sa.String(32), nullable=False),
+        sa.Column("deployment_type", sa.String(50), nullable=False),
+        sa.Column("request_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("duration_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("duration_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("duration_min", sa.Float(), nullable=True),
+        sa.Column("duration_max", sa.Float(), nullable=True),
+        sa.PrimaryKeyConstraint(
+            "window_start",
+            "endpoint",
+            "method",
+            "status_code",
+            "organization_id",
+            "deployment_type",
+        ),
+    )
+    op.create_index(
+        "idx_endpoint_usage_rollup_endpoint_window",
+        "endpoint_usage_rollup",
+        ["endpoint", "window_start"],
+    )
+
+    op.create_table(
+        "endpoint_duration_rollup",
+        sa.Column("window_start", sa.DateTime(), nullable=False),
+        sa.Column("endpoint", sa.String(255), nullable=False),
+        sa.Column("method", sa.String(10), nullable=False),
+        sa.Column("organization_id", sa.String(32), nullable=False),
+        sa.Column("deployment_type", sa.String(50), nullable=False),
+        sa.Column("duration_bucket", sa.Integer(), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint(
+            "window_start",
+            "endpoint",
+            "method",
+            "organization_id",
+            "deployment_type",
+            "duration_bucket",
+        ),
+    )
+    op.create_index(
+        "idx_endpoint_duration_rollup_endpoint_window",
+        "endpoint_duration_rollup",
+        ["endpoint", "window_start"],
+    )
+
+    op.create_table(
+        "feature_usage_rollup",
+        sa.Column("window_start", sa.DateTime(), nullable=False),
+        sa.Column("feature_name", sa.String(100), nullable=False),
+        sa.Column("action", sa.String(100), nullable=False),
+        sa.Column("organization_id", sa.String(32), nullable=False),
+        sa.Column("deployment_type", sa.String(50), nullable=False),
+        sa.Column("event_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint(
+            "window_start", "feature_name", "action", "organization_id", "deployment_type"
+        ),
+    )
+
+    op.create_table(
+        "user_activity_rollup",
+        sa.Column("window_start", sa.DateTime(), nullable=False),
+        sa.Column("event_type", sa.String(50), nullable=False),
+        sa.Column("organization_id", sa.String(32), nullable=False),
+        sa.Column("deployment_type", sa.String(50), nullable=False),
+        sa.Column("event_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("window_start", "event_type", "organization_id", "deployment_type"),
+    )
+
+    op.create_table(
+        "active_users_rollup",
+        sa.Column("window_start", sa.DateTime(), nullable=False),
+        sa.Column("organization_id", sa.String(32), nullable=False),
+        sa.Column("user_id", sa.String(32), nullable=False),
+        sa.PrimaryKeyConstraint("window_start", "organization_id", "user_id"),
+    )
+    op.create_index("idx_active_users_rollup_window", "active_users_rollup", ["window_start"])
+
+
+def downgrade() -> None:
+    """Remove rollup tables and their indexes"""
+
+    op.drop_index("idx_active_users_rollup_window", "active_users_rollup")
+    op.drop_index("idx_endpoint_duration_rollup_endpoint_window", "endpoint_duration_rollup")
+    op.drop_index("idx_endpoint_usage_rollup_endpoint_window", "endpoint_usage_rollup")
+
+    op.drop_table("active_users_rollup")
+    op.drop_table("user_activity_rollup")
+    op.drop_table("feature_usage_rollup")
+    op.drop_table("endpoint_duration_rollup")
+    op.drop_table("endpoint_usage_rollup")
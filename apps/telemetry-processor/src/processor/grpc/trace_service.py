@@ -5,6 +5,7 @@ gRPC service implementation for receiving and processing OpenTelemetry traces.
 """
 
 import logging
+from typing import Optional
 
 import grpc
 from opentelemetry.proto.collector.trace.v1 import trace_service_pb2_grpc
@@ -14,7 +15,7 @@ from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
 )
 
 from processor.database import DatabaseManager
-from processor.services import SpanRouter
+from processor.services import BatchWriter, SpanBatch, SpanRouter
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +28,24 @@ class TelemetryTraceService(trace_service_pb2_grpc.TraceServiceServicer):
     Uses dependency injection for database and span routing.
     """
 
-    def __init__(self, db_manager: DatabaseManager, span_router: SpanRouter):
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        span_router: SpanRouter,
+        batch_writer: Optional[BatchWriter] = None,
+    ):
         """
         Initialize the trace service.
 
         Args:
             db_manager: Database manager for session creation
             span_router: Router for processing spans
+            batch_writer: Optional background writer; when set, routed spans
+                are queued instead of written on the request thread
         """
         self.db_manager = db_manager
         self.span_router = span_router
+        self.batch_writer = batch_writer
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def Export(
@@ -55,38 +64,44 @@ class TelemetryTraceService(trace_service_pb2_grpc.TraceServiceServicer):
             ExportTraceServiceResponse: Success/failure response
         """
         try:
-            session = self.db_manager.get_session()
-
-            try:
-                span_count = 0
-
-                # Process all spans in the request
-                for resource_span in request.resource_spans:
-                    resource = resource_span.resource
-
-                    for scope_span in resource_span.scope_spans:
-                        for span in scope_span.spans:
-                            self.span_router.process_span(span, resource, session)
-                            span_count += 1
+            # Route all spans in the request, grouped by processor
+            batch = self.span_router.collect(request.resource_spans)
 
-                # Commit all changes
-                session.commit()
+            if self.batch_writer is not None and self.batch_writer.submit(batch):
+                self.logger.debug(f"Queued {batch.span_count} spans for writing")
+                return ExportTraceServiceResponse()
 
-                self.logger.info(
-                    f"Successfully processed {span_count} spans "
-                    f"from {len(request.resource_spans)} resources"
-                )
+            self._write(batch)
 
-                return ExportTraceServiceResponse()
+            self.logger.info(
+                f"Successfully processed {batch.span_count} spans "
+                f"from {len(request.resource_spans)} resources"
+            )
 
-            except Exception:
-                session.rollback()
-                raise
-            finally:
-                session.close()
+            return ExportTraceServiceResponse()
 
         except Exception as e:
             self.logger.error(f"Error processing trace export: {e}", exc_info=True)
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"Error processing trace: {str(e)}")
             return ExportTraceServiceResponse()
+
+    def _write(self, batch: SpanBatch) -> None:
+        """
+        Write a batch in its own transaction.
+
+        Args:
+            batch: Routed spans
+        """
+        session = self.db_manager.get_session()
+        try:
+            self.span_router.write(batch, session)
+
+            # Commit all changes
+            session.commit()
+            self.span_router.aggregate(batch)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
@@ -0,0 +1,176 @@
+"""
+Telemetry Load Generator
+
+Sends synthetic OTLP export requests and reports span throughput, either to a
+running processor over gRPC or straight into TelemetryTraceService in-process
+(no network, so the numbers isolate routing and database writes).
+
+Usage:
+    # Against a running processor
+    python -m processor.load_generator --target localhost:4317 --api-key $OTEL_API_KEY
+
+    # In-process against ANALYTICS_DATABASE_URL (or --database-url)
+    python -m processor.load_generator --requests 200 --spans 100 --concurrency 8
+    python -m processor.load_generator --async-writes
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent import futures
+from typing import List
+
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
+from opentelemetry.proto.resource.v1.resource_pb2 import Resource
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans, Span
+
+_CATEGORIES = ["endpoint_usage", "feature_usage", "user_activity"]
+
+
+def _attr(key: str, value) -> KeyValue:
+    if isinstance(value, bool):
+        return KeyValue(key=key, value=AnyValue(bool_value=value))
+    if isinstance(value, int):
+        return KeyValue(key=key, value=AnyValue(int_value=value))
+    if isinstance(value, float):
+        return KeyValue(key=key, value=AnyValue(double_value=value))
+    return KeyValue(key=key, value=AnyValue(string_value=str(value)))
+
+
+def _span(category: str) -> Span:
+    attributes = {
+        "event.category": category,
+        "user.id": f"{random.randrange(1000):032x}",
+        "organization.id": f"{random.randrange(50):032x}",
+    }
+    if category == "endpoint_usage":
+        attributes.update(
+            {
+                "http.route": random.choice(["/tests", "/test_runs", "/metrics"]),
+                "http.method": random.choice(["GET", "POST"]),
+                "http.status_code": 200,
+                "duration_ms": random.uniform(1, 500),
+            }
+        )
+    elif category == "feature_usage":
+        attributes.update({"feature.name": "test_set", "feature.action": "viewed"})
+    else:
+        attributes.update({"event.type": "login", "session.id": f"s{random.randrange(100)}"})
+
+    return Span(
+        trace_id=os.urandom(16),
+        span_id=os.urandom(8),
+        name=category,
+        start_time_unix_nano=time.time_ns(),
+        attributes=[_attr(k, v) for k, v in attributes.items()],
+    )
+
+
+def build_request(spans: int) -> ExportTraceServiceRequest:
+    """Build one export request of *spans* spans from a single resource."""
+    resource = Resource(
+        attributes=[
+            _attr("service.name", "rhesis-backend"),
+            _attr("deployment.type", "self-hosted"),
+            _attr("service.version", "0.0.0-loadgen"),
+        ]
+    )
+    return ExportTraceServiceRequest(
+        resource_spans=[
+            ResourceSpans(
+                resource=resource,
+                scope_spans=[
+                    ScopeSpans(spans=[_span(random.choice(_CATEGORIES)) for _ in range(spans)])
+                ],
+            )
+        ]
+    )
+
+
+def _run_grpc(args, requests: List[ExportTraceServiceRequest]) -> float:
+    import grpc
+    from opentelemetry.proto.collector.trace.v1 import trace_service_pb2_grpc
+
+    channel = grpc.insecure_channel(args.target)
+    stub = trace_service_pb2_grpc.TraceServiceStub(channel)
+    metadata = [("x-api-key", args.api_key)] if args.api_key else None
+
+    started = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(lambda r: stub.Export(r, metadata=metadata), requests))
+    elapsed = time.perf_counter() - started
+    channel.close()
+    return elapsed
+
+
+class _Context:
+    """Minimal stand-in for grpc.ServicerContext when calling Export in-process."""
+
+    def set_code(self, code):
+        raise RuntimeError(f"Export failed with {code}")
+
+    def set_details(self, details):
+        pass
+
+
+def _run_in_process(args, requests: List[ExportTraceServiceRequest]) -> float:
+    if args.database_url:
+        os.environ["ANALYTICS_DATABASE_URL"] = args.database_url
+
+    from processor.database import get_database_manager
+    from processor.grpc import TelemetryTraceService
+    from processor.models.base import Base
+    from processor.services import BatchWriter, RollupFlusher, SpanRouter
+
+    db_manager = get_database_manager()
+    if args.create_tables:
+        Base.metadata.create_all(db_manager.get_engine())
+
+    span_router = SpanRouter()
+    rollup_flusher = RollupFlusher(db_manager, span_router.rollups)
+    rollup_flusher.start()
+    batch_writer = None
+    if args.async_writes:
+        batch_writer = BatchWriter(db_manager, span_router)
+        batch_writer.start()
+    service = TelemetryTraceService(db_manager, span_router, batch_writer)
+
+    started = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(lambda r: service.Export(r, _Context()), requests))
+    if batch_writer is not None:
+        # Include draining the queue: throughput is spans written, not accepted
+        batch_writer.close(timeout=300)
+    rollup_flusher.close()
+    return time.perf_counter() - started
+
+
+def main():
+    """CLI entry point for the telemetry load generator."""
+    parser = argparse.ArgumentParser(description="Telemetry processor load generator")
+    parser.add_argument("--target", help="host:port of a running processor (default: in-process)")
+    parser.add_argument(
+        "--api-key", default=os.getenv("OTEL_API_KEY"), help="x-api-key for --target"
+    )
+    parser.add_argument("--database-url", help="Database for in-process runs")
+    parser.add_argument("--create-tables", action="store_true", help="Create tables first")
+    parser.add_argument("--async-writes", action="store_true", help="Use the batch writer")
+    parser.add_argument("--requests", type=int, default=200, help="Export requests to send")
+    parser.add_argument("--spans", type=int, default=50, help="Spans per request")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent senders")
+    args = parser.parse_args()
+
+    requests = [build_request(args.spans) for _ in range(args.requests)]
+    elapsed = _run_grpc(args, requests) if args.target else _run_in_process(args, requests)
+
+    total = args.requests * args.spans
+    print(
+        f"{total} spans in {args.requests} requests: {elapsed:.2f}s, "
+        f"{total / elapsed:,.0f} spans/s, {args.requests / elapsed:,.1f} requests/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
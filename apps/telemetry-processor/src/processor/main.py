@@ -13,7 +13,8 @@ from opentelemetry.proto.collector.trace.v1 import trace_service_pb2_grpc
 
 from processor.database import get_database_manager
 from processor.grpc import APIKeyInterceptor, TelemetryTraceService
-from processor.services import SpanRouter
+from processor.services import BatchWriter, RollupFlusher, SpanRouter
+from processor.services.batch_writer import async_writes_enabled
 
 # Configure logging
 logging.basicConfig(
@@ -37,8 +38,18 @@ def serve():
     span_router = SpanRouter()
     logger.info("Span router initialized with processors")
 
+    # Periodically write the router's per-minute rollups
+    rollup_flusher = RollupFlusher(db_manager, span_router.rollups)
+    rollup_flusher.start()
+
+    # Optionally write from a background thread instead of the request threads
+    batch_writer = None
+    if async_writes_enabled():
+        batch_writer = BatchWriter(db_manager, span_router)
+        batch_writer.start()
+
     # Create gRPC service
-    trace_service = TelemetryTraceService(db_manager, span_router)
+    trace_service = TelemetryTraceService(db_manager, span_router, batch_writer)
 
     # Create API key interceptor for authentication
     api_key_interceptor = APIKeyInterceptor()
@@ -69,7 +80,10 @@ def serve():
         server.wait_for_termination()
     except KeyboardInterrupt:
         logger.info("Shutting down telemetry processor")
-        server.stop(grace_period=5)
+        server.stop(grace_period=5).wait()
+        if batch_writer is not None:
+            batch_writer.close()
+        rollup_flusher.close()
         db_manager.close()
         logger.info("Shutdown complete")
 
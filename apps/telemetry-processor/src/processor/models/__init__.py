@@ -2,5 +2,23 @@
 
 from .analytics import EndpointUsage, FeatureUsage, UserActivity
 from .base import AnalyticsBase, Base
+from .rollups import (
+    ActiveUsersRollup,
+    EndpointDurationRollup,
+    EndpointUsageRollup,
+    FeatureUsageRollup,
+    UserActivityRollup,
+)
 
-__all__ = ["Base", "AnalyticsBase", "UserActivity", "EndpointUsage", "FeatureUsage"]
+__all__ = [
+    "Base",
+    "AnalyticsBase",
+    "UserActivity",
+    "EndpointUsage",
+    "FeatureUsage",
+    "EndpointUsageRollup",
+    "EndpointDurationRollup",
+    "FeatureUsageRollup",
+    "UserActivityRollup",
+    "ActiveUsersRollup",
+]
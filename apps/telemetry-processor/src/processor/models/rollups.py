@@ -0,0 +1,101 @@
+"""
+Rollup Models
+
+Per-minute aggregates of the analytics tables, maintained by the processor's
+rollup aggregator (see services/rollup.py) with additive upserts.
+
+Each table's primary key is its window and dimensions, which is also the
+upsert conflict target; dimensions are therefore NOT NULL and a missing value
+is stored as '' (strings) or 0 (status code).
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Float, Integer, String
+
+from processor.models.base import Base
+
+
+class EndpointUsageRollup(Base):
+    """
+    Requests per endpoint, method and status code per minute.
+
+    duration_sum / duration_count is the mean duration; percentiles come
+    from endpoint_duration_rollup.
+    """
+
+    __tablename__ = "endpoint_usage_rollup"
+
+    window_start = Column(DateTime, primary_key=True)
+    endpoint = Column(String(255), primary_key=True)
+    method = Column(String(10), primary_key=True)
+    status_code = Column(Integer, primary_key=True)
+    organization_id = Column(String(32), primary_key=True)
+    deployment_type = Column(String(50), primary_key=True)
+
+    request_count = Column(BigInteger, nullable=False, default=0)
+    duration_count = Column(BigInteger, nullable=False, default=0)
+    duration_sum = Column(Float, nullable=False, default=0.0)
+    duration_min = Column(Float)
+    duration_max = Column(Float)
+
+
+class EndpointDurationRollup(Base):
+    """
+    Duration sketch buckets per endpoint and method per minute.
+
+    Summing counts per bucket over any set of windows gives a mergeable
+    sketch (processor.utils.DurationSketch.from_buckets) whose quantiles
+    are accurate to 2%.
+    """
+
+    __tablename__ = "endpoint_duration_rollup"
+
+    window_start = Column(DateTime, primary_key=True)
+    endpoint = Column(String(255), primary_key=True)
+    method = Column(String(10), primary_key=True)
+    organization_id = Column(String(32), primary_key=True)
+    deployment_type = Column(String(50), primary_key=True)
+    duration_bucket = Column(Integer, primary_key=True)
+
+    count = Column(BigInteger, nullable=False, default=0)
+
+
+class FeatureUsageRollup(Base):
+    """Feature events per feature and action per minute."""
+
+    __tablename__ = "feature_usage_rollup"
+
+    window_start = Column(DateTime, primary_key=True)
+    feature_name = Column(String(100), primary_key=True)
+    action = Column(String(100), primary_key=True)
+    organization_id = Column(String(32), primary_key=True)
+    deployment_type = Column(String(50), primary_key=True)
+
+    event_count = Column(BigInteger, nullable=False, default=0)
+
+
+class UserActivityRollup(Base):
+    """User activity events per event type per minute."""
+
+    __tablename__ = "user_activity_rollup"
+
+    window_start = Column(DateTime, primary_key=True)
+    event_type = Column(String(50), primary_key=True)
+    organization_id = Column(String(32), primary_key=True)
+    deployment_type = Column(String(50), primary_key=True)
+
+    event_count = Column(BigInteger, nullable=False, default=0)
+
+
+class ActiveUsersRollup(Base):
+    """
+    Users seen per minute, one row per (window, organization, user).
+
+    Count distinct user_id over a range for active users; rows are only
+    ever inserted, so repeated flushes of the same user are no-ops.
+    """
+
+    __tablename__ = "active_users_rollup"
+
+    window_start = Column(DateTime, primary_key=True)
+    organization_id = Column(String(32), primary_key=True)
+    user_id = Column(String(32), primary_key=True)
@@ -1,9 +1,11 @@
 """Service layer for processing telemetry data."""
 
 from .base import SpanProcessor
+from .batch_writer import BatchWriter
 from .endpoint_usage import EndpointUsageProcessor
 from .feature_usage import FeatureUsageProcessor
-from .span_router import SpanRouter
+from .rollup import RollupAggregator, RollupFlusher
+from .span_router import SpanBatch, SpanRouter
 from .user_activity import UserActivityProcessor
 
 __all__ = [
@@ -11,5 +13,9 @@ __all__ = [
     "UserActivityProcessor",
     "EndpointUsageProcessor",
     "FeatureUsageProcessor",
+    "SpanBatch",
     "SpanRouter",
+    "BatchWriter",
+    "RollupAggregator",
+    "RollupFlusher",
 ]
@@ -12,10 +12,13 @@ Defines the interface for span processors following SOLID principles:
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Type
 
 from sqlalchemy.orm import Session
 
+from processor.models.base import AnalyticsBase
+from processor.services.rollup import RollupAggregator, storage_mode
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,11 +28,32 @@ class SpanProcessor(ABC):
 
     Each processor handles a specific type of telemetry event
     (user activity, endpoint usage, or feature usage).
+
+    Processors that declare a ``model`` and implement ``to_row`` are written
+    in bulk: the router collects their rows for a whole request (or flush)
+    and inserts them with one statement per table. Processors that only
+    override ``process`` are called once per span, as before.
+
+    Processors that also implement ``rollup`` can feed the per-minute rollup
+    tables instead of, or as well as, their raw table; ``storage`` ("raw",
+    "rollup" or "both") is read from TELEMETRY_<TABLE>_STORAGE.
     """
 
+    # Table this processor writes to; None if it only implements process()
+    model: Optional[Type[AnalyticsBase]] = None
+
     def __init__(self):
         """Initialize the processor."""
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.storage = storage_mode(self.model.__tablename__) if self.model else "raw"
+
+    @property
+    def writes_raw(self) -> bool:
+        return self.storage in ("raw", "both")
+
+    @property
+    def writes_rollups(self) -> bool:
+        return self.storage in ("rollup", "both")
 
     @abstractmethod
     def can_process(self, attributes: Dict[str, Any]) -> bool:
@@ -44,7 +68,29 @@ class SpanProcessor(ABC):
         """
         pass
 
-    @abstractmethod
+    def to_row(self, attributes: Dict[str, Any], timestamp: datetime) -> Dict[str, Any]:
+        """
+        Build the column values of the span's ``model`` row.
+
+        Args:
+            attributes: Merged span and resource attributes
+            timestamp: Event timestamp
+
+        Returns:
+            Dict: Column name to value
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not implement to_row")
+
+    def rollup(self, row: Dict[str, Any], aggregator: RollupAggregator) -> None:
+        """
+        Add a span's row (as built by ``to_row``) to the rollup aggregates.
+
+        Args:
+            row: Column values of the span's raw row
+            aggregator: Rollup aggregator to record into
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not implement rollup")
+
     def process(
         self,
         attributes: Dict[str, Any],
@@ -59,7 +105,7 @@ class SpanProcessor(ABC):
             timestamp: Event timestamp
             session: Database session
         """
-        pass
+        session.add(self.model(**self.to_row(attributes, timestamp)))
 
     def extract_common_fields(self, attributes: Dict[str, Any]) -> Dict[str, Optional[str]]:
         """
@@ -0,0 +1,197 @@
+"""
+Batch Writer
+
+Decouples trace export from the database: routed span batches are queued in
+a bounded in-memory queue and a background thread writes them, merging
+whatever has accumulated into one transaction with one bulk insert per table.
+
+Enabled with TELEMETRY_ASYNC_WRITES=true. Export then acknowledges spans as
+soon as they are queued, so a crash loses at most the queued batches; when
+the queue is full, Export writes synchronously instead, which slows exporters
+down rather than dropping their data.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from typing import List, Optional
+
+from processor.database import DatabaseManager
+from processor.services.span_router import SpanBatch, SpanRouter
+
+logger = logging.getLogger(__name__)
+
+
+def async_writes_enabled() -> bool:
+    """Whether Export should queue batches instead of writing them itself."""
+    return os.getenv("TELEMETRY_ASYNC_WRITES", "false").lower() in ("1", "true", "yes")
+
+
+class BatchWriter:
+    """
+    Background writer for routed span batches.
+
+    One daemon thread drains the queue: it waits for a batch, keeps
+    collecting for up to ``flush_interval`` seconds or ``max_rows`` rows,
+    and writes everything collected in a single transaction, falling back to
+    one transaction per batch when that write fails.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        span_router: SpanRouter,
+        max_batches: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_rows: Optional[int] = None,
+    ):
+        """
+        Initialize the writer (call start() to begin flushing).
+
+        Args:
+            db_manager: Database manager for session creation
+            span_router: Router that writes the batches
+            max_batches: Queue capacity in batches (TELEMETRY_QUEUE_MAX_BATCHES)
+            flush_interval: Seconds to accumulate before a write
+                (TELEMETRY_FLUSH_INTERVAL_MS / 1000)
+            max_rows: Rows that trigger a write before the interval elapses
+                (TELEMETRY_FLUSH_MAX_ROWS)
+        """
+        self.db_manager = db_manager
+        self.span_router = span_router
+        self.max_batches = max_batches or int(os.getenv("TELEMETRY_QUEUE_MAX_BATCHES", "1000"))
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else int(os.getenv("TELEMETRY_FLUSH_INTERVAL_MS", "200")) / 1000
+        )
+        self.max_rows = max_rows or int(os.getenv("TELEMETRY_FLUSH_MAX_ROWS", "5000"))
+        self._queue: "queue.Queue[SpanBatch]" = queue.Queue(maxsize=self.max_batches)
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def start(self) -> None:
+        """Start the background flusher thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="telemetry-batch-writer", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(
+            f"Batch writer started (queue {self.max_batches} batches, "
+            f"flush every {self.flush_interval * 1000:.0f}ms or {self.max_rows} rows)"
+        )
+
+    def submit(self, batch: SpanBatch) -> bool:
+        """
+        Queue a batch for writing.
+
+        Args:
+            batch: Routed spans
+
+        Returns:
+            bool: False if the queue is full or the writer is stopping
+        """
+        if self._stopping.is_set():
+            return False
+        try:
+            self._queue.put_nowait(batch)
+            return True
+        except queue.Full:
+            return False
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Stop accepting batches and write everything still queued.
+
+        Args:
+            timeout: Seconds to wait for the final flush
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.logger.info("Batch writer stopped")
+
+    def _run(self) -> None:
+        while not (self._stopping.is_set() and self._queue.empty()):
+            try:
+                pending = [self._queue.get(timeout=0.5)]
+            except queue.Empty:
+                continue
+
+            deadline = time.monotonic() + self.flush_interval
+            row_count = pending[0].row_count
+            while row_count < self.max_rows:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.append(batch)
+                row_count += batch.row_count
+
+            self._flush(pending)
+
+    def _flush(self, batches: List[SpanBatch]) -> None:
+        """
+        Write the collected batches in one transaction.
+
+        The batches are kept apart so that, when the merged write fails,
+        each one can be retried in its own transaction and only the batch
+        with the bad rows is dropped instead of every exporter's spans.
+        """
+        merged = SpanBatch()
+        for batch in batches:
+            merged.merge(batch)
+
+        started = time.perf_counter()
+        error = self._write(merged)
+        if error is None:
+            self.logger.info(
+                f"Flushed {merged.span_count} spans ({merged.row_count} rows) "
+                f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+            )
+            return
+
+        if len(batches) == 1:
+            self.logger.error(
+                f"Dropped {merged.span_count} queued spans after write failure: {error}",
+                exc_info=error,
+            )
+            return
+
+        self.logger.warning(
+            f"Merged write of {len(batches)} batches failed, retrying them one by one: {error}"
+        )
+        for batch in batches:
+            error = self._write(batch)
+            if error is not None:
+                self.logger.error(
+                    f"Dropped {batch.span_count} queued spans after write failure: {error}",
+                    exc_info=error,
+                )
+
+    def _write(self, batch: SpanBatch) -> Optional[Exception]:
+        """Write and aggregate one batch; return the error if the write failed."""
+        session = self.db_manager.get_session()
+        try:
+            self.span_router.write(batch, session)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            return e
+        finally:
+            session.close()
+        try:
+            self.span_router.aggregate(batch)
+        except Exception as e:
+            # The rows are committed; retrying would write them twice
+            self.logger.error(f"Failed to aggregate {batch.span_count} written spans: {e}")
+        return None
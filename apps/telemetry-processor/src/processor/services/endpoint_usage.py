@@ -7,10 +7,9 @@ Processes API endpoint usage events.
 from datetime import datetime
 from typing import Any, Dict
 
-from sqlalchemy.orm import Session
-
 from processor.models import EndpointUsage
 from processor.services.base import SpanProcessor
+from processor.services.rollup import RollupAggregator
 
 
 class EndpointUsageProcessor(SpanProcessor):
@@ -20,24 +19,23 @@ class EndpointUsageProcessor(SpanProcessor):
     Handles HTTP request tracking including performance and error metrics.
     """
 
+    model = EndpointUsage
+
     def can_process(self, attributes: Dict[str, Any]) -> bool:
         """Check if this is an endpoint usage event."""
         event_category = attributes.get("event.category")
         return event_category == "endpoint_usage"
 
-    def process(
-        self,
-        attributes: Dict[str, Any],
-        timestamp: datetime,
-        session: Session,
-    ) -> None:
+    def to_row(self, attributes: Dict[str, Any], timestamp: datetime) -> Dict[str, Any]:
         """
-        Process endpoint usage span and insert into database.
+        Build the endpoint usage row for a span.
 
         Args:
             attributes: Span attributes
             timestamp: Event timestamp
-            session: Database session
+
+        Returns:
+            Dict: Column values for the row
         """
         try:
             common_fields = self.extract_common_fields(attributes)
@@ -64,7 +62,7 @@ class EndpointUsageProcessor(SpanProcessor):
                 ],
             )
 
-            usage = EndpointUsage(
+            return dict(
                 endpoint=endpoint,
                 method=method,
                 user_id=common_fields["user_id"],
@@ -76,9 +74,10 @@ class EndpointUsageProcessor(SpanProcessor):
                 event_metadata=metadata,
             )
 
-            session.add(usage)
-            self.logger.debug("Endpoint usage record added to session")
-
         except Exception as e:
             self.logger.error(f"Error processing endpoint usage: {e}", exc_info=True)
             raise
+
+    def rollup(self, row: Dict[str, Any], aggregator: RollupAggregator) -> None:
+        """Count the row in the per-minute rollups."""
+        aggregator.record_endpoint(row)
@@ -7,10 +7,9 @@ Processes feature-specific usage events.
 from datetime import datetime
 from typing import Any, Dict
 
-from sqlalchemy.orm import Session
-
 from processor.models import FeatureUsage
 from processor.services.base import SpanProcessor
+from processor.services.rollup import RollupAggregator
 
 
 class FeatureUsageProcessor(SpanProcessor):
@@ -20,24 +19,23 @@ class FeatureUsageProcessor(SpanProcessor):
     Handles feature interaction tracking for adoption analysis.
     """
 
+    model = FeatureUsage
+
     def can_process(self, attributes: Dict[str, Any]) -> bool:
         """Check if this is a feature usage event."""
         event_category = attributes.get("event.category")
         return event_category == "feature_usage"
 
-    def process(
-        self,
-        attributes: Dict[str, Any],
-        timestamp: datetime,
-        session: Session,
-    ) -> None:
+    def to_row(self, attributes: Dict[str, Any], timestamp: datetime) -> Dict[str, Any]:
         """
-        Process feature usage span and insert into database.
+        Build the feature usage row for a span.
 
         Args:
             attributes: Span attributes
             timestamp: Event timestamp
-            session: Database session
+
+        Returns:
+            Dict: Column values for the row
         """
         try:
             common_fields = self.extract_common_fields(attributes)
@@ -59,7 +57,7 @@ class FeatureUsageProcessor(SpanProcessor):
                 ],
             )
 
-            usage = FeatureUsage(
+            return dict(
                 feature_name=feature_name,
                 user_id=common_fields["user_id"],
                 organization_id=common_fields["organization_id"],
@@ -69,9 +67,10 @@ class FeatureUsageProcessor(SpanProcessor):
                 event_metadata=metadata,
             )
 
-            session.add(usage)
-            self.logger.debug("Feature usage record added to session")
-
         except Exception as e:
             self.logger.error(f"Error processing feature usage: {e}", exc_info=True)
             raise
+
+    def rollup(self, row: Dict[str, Any], aggregator: RollupAggregator) -> None:
+        """Count the row in the per-minute rollups."""
+        aggregator.record_feature(row)
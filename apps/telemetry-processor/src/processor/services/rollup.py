@@ -0,0 +1,444 @@
+"""
+Rollup Aggregation
+
+Streaming pre-aggregation of analytics events into per-minute rollup tables
+(see models/rollups.py). Processors feed committed rows into a
+RollupAggregator, which keeps per-window totals in memory; a RollupFlusher
+periodically drains them and writes additive upserts, so each flush adds to
+whatever earlier flushes (or other processor replicas) wrote for the same
+window.
+
+Whether a processor's spans go to its raw table, its rollups or both is set
+per table with TELEMETRY_<TABLE>_STORAGE=raw|rollup|both (default both), e.g.
+TELEMETRY_ENDPOINT_USAGE_STORAGE=rollup.
+"""
+
+import logging
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from processor.database import DatabaseManager
+from processor.models import (
+    ActiveUsersRollup,
+    EndpointDurationRollup,
+    EndpointUsageRollup,
+    FeatureUsageRollup,
+    UserActivityRollup,
+)
+from processor.utils import DurationSketch
+
+logger = logging.getLogger(__name__)
+
+STORAGE_MODES = ("raw", "rollup", "both")
+
+
+def storage_mode(table_name: str) -> str:
+    """
+    Configured storage for a table's spans.
+
+    Args:
+        table_name: Raw table name, e.g. "endpoint_usage"
+
+    Returns:
+        str: "raw", "rollup" or "both"
+
+    Raises:
+        ValueError: If TELEMETRY_<TABLE>_STORAGE has another value
+    """
+    variable = f"TELEMETRY_{table_name.upper()}_STORAGE"
+    mode = os.getenv(variable, "both").lower()
+    if mode not in STORAGE_MODES:
+        raise ValueError(f"{variable} must be one of {', '.join(STORAGE_MODES)}, got {mode!r}")
+    return mode
+
+
+def window_start(timestamp: datetime) -> datetime:
+    """Start of the one-minute window containing *timestamp*."""
+    return timestamp.replace(second=0, microsecond=0)
+
+
+@dataclass
+class EndpointTotals:
+    """Running totals of one endpoint_usage_rollup row."""
+
+    request_count: int = 0
+    duration_count: int = 0
+    duration_sum: float = 0.0
+    duration_min: Optional[float] = None
+    duration_max: Optional[float] = None
+
+    def add_duration(self, duration: float) -> None:
+        self.duration_count += 1
+        self.duration_sum += duration
+        if self.duration_min is None or duration < self.duration_min:
+            self.duration_min = duration
+        if self.duration_max is None or duration > self.duration_max:
+            self.duration_max = duration
+
+    def merge(self, other: "EndpointTotals") -> None:
+        self.request_count += other.request_count
+        self.duration_count += other.duration_count
+        self.duration_sum += other.duration_sum
+        for value in (other.duration_min, other.duration_max):
+            if value is not None:
+                if self.duration_min is None or value < self.duration_min:
+                    self.duration_min = value
+                if self.duration_max is None or value > self.duration_max:
+                    self.duration_max = value
+
+
+@dataclass
+class RollupState:
+    """Aggregates accumulated since the last flush, keyed by rollup primary key."""
+
+    endpoints: Dict[Tuple, EndpointTotals] = field(default_factory=dict)
+    durations: Dict[Tuple, DurationSketch] = field(default_factory=dict)
+    features: Counter = field(default_factory=Counter)
+    activity: Counter = field(default_factory=Counter)
+    users: Set[Tuple] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.endpoints or self.durations or self.features or self.activity or self.users
+        )
+
+    def merge(self, other: "RollupState") -> None:
+        """Fold another state (e.g. one whose flush failed) into this one."""
+        for key, totals in other.endpoints.items():
+            self.endpoints.setdefault(key, EndpointTotals()).merge(totals)
+        for key, sketch in other.durations.items():
+            self.durations.setdefault(key, DurationSketch()).merge(sketch)
+        self.features.update(other.features)
+        self.activity.update(other.activity)
+        self.users |= other.users
+
+
+class RollupAggregator:
+    """
+    In-memory per-minute aggregates, safe to feed from several threads.
+
+    Record methods take the column values a processor built for its raw row
+    (see SpanProcessor.to_row), so rollups and raw rows always agree.
+    """
+
+    def __init__(self):
+        """Initialize an empty aggregator."""
+        self._state = RollupState()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @staticmethod
+    def _common(row: Dict[str, Any]) -> Tuple[datetime, str, str]:
+        return (
+            window_start(row["timestamp"]),
+            row.get("organization_id") or "",
+            row.get("deployment_type") or "",
+        )
+
+    def _record_user(self, window: datetime, organization_id: str, row: Dict[str, Any]) -> None:
+        user_id = row.get("user_id")
+        if user_id:
+            self._state.users.add((window, organization_id, user_id))
+
+    def record_endpoint(self, row: Dict[str, Any]) -> None:
+        """Count an endpoint_usage row."""
+        window, organization_id, deployment_type = self._common(row)
+        endpoint = row.get("endpoint") or ""
+        method = row.get("method") or ""
+        duration = row.get("duration_ms")
+        with self._lock:
+            totals = self._state.endpoints.setdefault(
+                (
+                    window,
+                    endpoint,
+                    method,
+                    row.get("status_code") or 0,
+                    organization_id,
+                    deployment_type,
+                ),
+                EndpointTotals(),
+            )
+            totals.request_count += 1
+            if duration is not None:
+                totals.add_duration(duration)
+                self._state.durations.setdefault(
+                    (window, endpoint, method, organization_id, deployment_type),
+                    DurationSketch(),
+                ).add(duration)
+            self._record_user(window, organization_id, row)
+
+    def record_feature(self, row: Dict[str, Any]) -> None:
+        """Count a feature_usage row."""
+        window, organization_id, deployment_type = self._common(row)
+        key = (
+            window,
+            row.get("feature_name") or "",
+            row.get("action") or "",
+            organization_id,
+            deployment_type,
+        )
+        with self._lock:
+            self._state.features[key] += 1
+            self._record_user(window, organization_id, row)
+
+    def record_activity(self, row: Dict[str, Any]) -> None:
+        """Count a user_activity row."""
+        window, organization_id, deployment_type = self._common(row)
+        key = (window, row.get("event_type") or "", organization_id, deployment_type)
+        with self._lock:
+            self._state.activity[key] += 1
+            self._record_user(window, organization_id, row)
+
+    def drain(self) -> RollupState:
+        """Take everything accumulated so far, leaving the aggregator empty."""
+        with self._lock:
+            state, self._state = self._state, RollupState()
+        return state
+
+    def restore(self, state: RollupState) -> None:
+        """Put back a drained state whose write failed, to retry on the next flush."""
+        with self._lock:
+            self._state.merge(state)
+
+    def write(self, state: RollupState, session: Session) -> int:
+        """
+        Upsert a drained state into the rollup tables.
+
+        Counts and sums are added to existing rows and min/max combined, so
+        writes for the same window from several flushes (or replicas) add
+        up. The caller owns the transaction (commit/rollback).
+
+        Args:
+            state: Aggregates from drain()
+            session: Database session
+
+        Returns:
+            int: Rollup rows written
+        """
+        dialect = session.get_bind().dialect.name
+        if dialect == "postgresql":
+            dialect_insert, least, greatest = postgresql.insert, func.least, func.greatest
+        elif dialect == "sqlite":
+            # SQLite's multi-argument min()/max() are scalar functions
+            dialect_insert, least, greatest = sqlite.insert, func.min, func.max
+        else:
+            raise NotImplementedError(f"Rollup upserts are not supported on {dialect}")
+
+        written = 0
+
+        def upsert(model, rows: List[Dict[str, Any]], combine) -> None:
+            nonlocal written
+            if not rows:
+                return
+            stmt = dialect_insert(model)
+            keys = [column.name for column in model.__table__.primary_key.columns]
+            if combine is None:
+                stmt = stmt.on_conflict_do_nothing(index_elements=keys)
+            else:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=keys, set_=combine(model.__table__, stmt.excluded)
+                )
+            session.execute(stmt, rows)
+            written += len(rows)
+
+        def add(*columns):
+            return lambda table, excluded: {c: table.c[c] + excluded[c] for c in columns}
+
+        def endpoint_totals(table, excluded):
+            values = add("request_count", "duration_count", "duration_sum")(table, excluded)
+            for name, pick in (("duration_min", least), ("duration_max", greatest)):
+                current, new = table.c[name], excluded[name]
+                values[name] = pick(func.coalesce(current, new), func.coalesce(new, current))
+            return values
+
+        upsert(
+            EndpointUsageRollup,
+            [
+                dict(
+                    window_start=window,
+                    endpoint=endpoint,
+                    method=method,
+                    status_code=status_code,
+                    organization_id=organization_id,
+                    deployment_type=deployment_type,
+                    request_count=totals.request_count,
+                    duration_count=totals.duration_count,
+                    duration_sum=totals.duration_sum,
+                    duration_min=totals.duration_min,
+                    duration_max=totals.duration_max,
+                )
+                for (
+                    window,
+                    endpoint,
+                    method,
+                    status_code,
+                    organization_id,
+                    deployment_type,
+                ), totals in state.endpoints.items()
+            ],
+            endpoint_totals,
+        )
+        upsert(
+            EndpointDurationRollup,
+            [
+                dict(
+                    window_start=window,
+                    endpoint=endpoint,
+                    method=method,
+                    organization_id=organization_id,
+                    deployment_type=deployment_type,
+                    duration_bucket=index,
+                    count=count,
+                )
+                for (
+                    window,
+                    endpoint,
+                    method,
+                    organization_id,
+                    deployment_type,
+                ), sketch in state.durations.items()
+                for index, count in sketch.buckets.items()
+            ],
+            add("count"),
+        )
+        upsert(
+            FeatureUsageRollup,
+            [
+                dict(
+                    window_start=window,
+                    feature_name=feature_name,
+                    action=action,
+                    organization_id=organization_id,
+                    deployment_type=deployment_type,
+                    event_count=count,
+                )
+                for (
+                    window,
+                    feature_name,
+                    action,
+                    organization_id,
+                    deployment_type,
+                ), count in state.features.items()
+            ],
+            add("event_count"),
+        )
+        upsert(
+            UserActivityRollup,
+            [
+                dict(
+                    window_start=window,
+                    event_type=event_type,
+                    organization_id=organization_id,
+                    deployment_type=deployment_type,
+                    event_count=count,
+                )
+                for (window, event_type, organization_id, deployment_type), count in (
+                    state.activity.items()
+                )
+            ],
+            add("event_count"),
+        )
+        upsert(
+            ActiveUsersRollup,
+            [
+                dict(window_start=window, organization_id=organization_id, user_id=user_id)
+                for window, organization_id, user_id in state.users
+            ],
+            None,
+        )
+        return written
+
+
+class RollupFlusher:
+    """
+    Background thread that flushes a RollupAggregator every few seconds.
+
+    A failed flush is put back into the aggregator and retried, so counts are
+    delayed rather than lost; close() flushes whatever is left.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        aggregator: RollupAggregator,
+        interval: Optional[float] = None,
+    ):
+        """
+        Initialize the flusher (call start() to begin flushing).
+
+        Args:
+            db_manager: Database manager for session creation
+            aggregator: Aggregator to drain
+            interval: Seconds between flushes (TELEMETRY_ROLLUP_FLUSH_SECONDS)
+        """
+        self.db_manager = db_manager
+        self.aggregator = aggregator
+        self.interval = (
+            interval
+            if interval is not None
+            else float(os.getenv("TELEMETRY_ROLLUP_FLUSH_SECONDS", "10"))
+        )
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def start(self) -> None:
+        """Start the background flusher thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="telemetry-rollup-flusher", daemon=True
+        )
+        self._thread.start()
+        self.logger.info(f"Rollup flusher started (every {self.interval:g}s)")
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Stop the thread and write the remaining aggregates.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+        self.logger.info("Rollup flusher stopped")
+
+    def flush(self) -> int:
+        """
+        Write everything aggregated so far in one transaction.
+
+        Returns:
+            int: Rollup rows written (0 if the write failed)
+        """
+        state = self.aggregator.drain()
+        if not state:
+            return 0
+
+        session = self.db_manager.get_session()
+        try:
+            written = self.aggregator.write(state, session)
+            session.commit()
+            self.logger.debug(f"Flushed {written} rollup rows")
+            return written
+        except Exception as e:
+            session.rollback()
+            self.aggregator.restore(state)
+            self.logger.error(f"Rollup flush failed, will retry: {e}", exc_info=True)
+            return 0
+        finally:
+            session.close()
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.interval):
+            self.flush()
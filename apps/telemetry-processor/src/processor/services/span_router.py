@@ -3,22 +3,64 @@ Span Router
 
 Routes spans to appropriate processors based on event category.
 Follows the Strategy pattern for flexible span processing.
+
+A whole export request is routed at once: resource attributes are extracted
+once per resource (and cached across requests, since an exporter sends the
+same resource every time), and rows are grouped by processor so each table
+gets a single bulk insert.
+
+Rows of processors stored as rollups (see services/rollup.py) are kept with
+the batch and handed to the router's RollupAggregator by aggregate(), which
+callers run only after the batch's transaction commits.
 """
 
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from processor.services.base import SpanProcessor
 from processor.services.endpoint_usage import EndpointUsageProcessor
 from processor.services.feature_usage import FeatureUsageProcessor
+from processor.services.rollup import RollupAggregator
 from processor.services.user_activity import UserActivityProcessor
 from processor.utils import AttributeExtractor
 
 logger = logging.getLogger(__name__)
 
+# Distinct resources whose extracted attributes are kept
+RESOURCE_CACHE_SIZE = 256
+
+
+@dataclass
+class SpanBatch:
+    """Routed spans of one or more export requests, ready to be written."""
+
+    # Processor -> column values of its rows (processors with a model)
+    rows: Dict[SpanProcessor, List[Dict[str, Any]]] = field(default_factory=dict)
+    # (processor, attributes, timestamp) for processors without a model
+    unbatched: List[Tuple[SpanProcessor, Dict[str, Any], datetime]] = field(default_factory=list)
+    # (processor, row) for processors stored as rollups
+    rollups: List[Tuple[SpanProcessor, Dict[str, Any]]] = field(default_factory=list)
+    span_count: int = 0
+
+    @property
+    def row_count(self) -> int:
+        return sum(len(rows) for rows in self.rows.values()) + len(self.unbatched)
+
+    def merge(self, other: "SpanBatch") -> None:
+        """Append another batch's rows to this one."""
+        for processor, rows in other.rows.items():
+            self.rows.setdefault(processor, []).extend(rows)
+        self.unbatched.extend(other.unbatched)
+        self.rollups.extend(other.rollups)
+        self.span_count += other.span_count
+
 
 class SpanRouter:
     """
@@ -36,7 +78,116 @@ class SpanRouter:
             FeatureUsageProcessor(),
         ]
         self.attribute_extractor = AttributeExtractor()
+        self.rollups = RollupAggregator()
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Serialized resource -> extracted attributes (LRU, shared by gRPC workers)
+        self._resource_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._resource_cache_lock = threading.Lock()
+
+    def _resource_attributes(self, resource) -> Dict[str, Any]:
+        """
+        Extract a resource's attributes, reusing earlier extractions.
+
+        Args:
+            resource: OTLP resource protobuf
+
+        Returns:
+            Dict: Resource attributes (shared; do not mutate)
+        """
+        key = resource.SerializeToString(deterministic=True)
+        with self._resource_cache_lock:
+            cached = self._resource_cache.get(key)
+            if cached is not None:
+                self._resource_cache.move_to_end(key)
+                return cached
+
+        attributes = self.attribute_extractor.extract(resource.attributes)
+        with self._resource_cache_lock:
+            self._resource_cache[key] = attributes
+            if len(self._resource_cache) > RESOURCE_CACHE_SIZE:
+                self._resource_cache.popitem(last=False)
+        return attributes
+
+    def collect(self, resource_spans: Iterable) -> SpanBatch:
+        """
+        Route every span of an export request without touching the database.
+
+        Args:
+            resource_spans: OTLP ResourceSpans of the request
+
+        Returns:
+            SpanBatch: Rows grouped by processor, plus rows bound for rollups
+
+        Raises:
+            Exception: If a processor fails to build a span's row
+        """
+        batch = SpanBatch()
+        for resource_span in resource_spans:
+            resource_attrs = self._resource_attributes(resource_span.resource)
+
+            for scope_span in resource_span.scope_spans:
+                for span in scope_span.spans:
+                    batch.span_count += 1
+                    span_attrs = self.attribute_extractor.extract(span.attributes)
+
+                    # Merge attributes (span attributes take precedence)
+                    all_attributes = {**resource_attrs, **span_attrs}
+                    timestamp = datetime.fromtimestamp(span.start_time_unix_nano / 1e9)
+
+                    processor = self._find_processor(all_attributes)
+                    if processor is None:
+                        event_category = all_attributes.get("event.category", "unknown")
+                        self.logger.warning(
+                            f"No processor found for event category: {event_category}"
+                        )
+                    elif processor.model is None:
+                        batch.unbatched.append((processor, all_attributes, timestamp))
+                    else:
+                        try:
+                            row = processor.to_row(all_attributes, timestamp)
+                        except Exception as e:
+                            self.logger.error(
+                                f"Error in {processor.__class__.__name__}: {e}", exc_info=True
+                            )
+                            raise
+                        if processor.writes_raw:
+                            batch.rows.setdefault(processor, []).append(row)
+                        if processor.writes_rollups:
+                            batch.rollups.append((processor, row))
+        return batch
+
+    def write(self, batch: SpanBatch, session: Session) -> None:
+        """
+        Write a batch: one bulk insert per table, then any per-span processors.
+
+        The caller owns the transaction (commit/rollback).
+
+        Args:
+            batch: Routed spans
+            session: Database session
+        """
+        for processor, rows in batch.rows.items():
+            if rows:
+                session.execute(insert(processor.model), rows)
+        for processor, attributes, timestamp in batch.unbatched:
+            try:
+                processor.process(attributes, timestamp, session)
+            except Exception as e:
+                self.logger.error(f"Error in {processor.__class__.__name__}: {e}", exc_info=True)
+                raise
+
+    def aggregate(self, batch: SpanBatch) -> None:
+        """
+        Add a written batch's rollup rows to the aggregator.
+
+        Call after the batch's transaction commits, so a failed (and retried)
+        write is not counted twice.
+
+        Args:
+            batch: Routed spans
+        """
+        for processor, row in batch.rollups:
+            processor.rollup(row, self.rollups)
 
     def process_span(self, span, resource, session: Session) -> None:
         """
@@ -52,7 +203,7 @@ class SpanRouter:
         """
         # Extract attributes
         span_attrs = self.attribute_extractor.extract(span.attributes)
-        resource_attrs = self.attribute_extractor.extract(resource.attributes)
+        resource_attrs = self._resource_attributes(resource)
 
         # Merge attributes (span attributes take precedence)
         all_attributes = {**resource_attrs, **span_attrs}
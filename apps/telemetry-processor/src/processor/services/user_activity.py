@@ -7,10 +7,9 @@ Processes user activity events (login, logout, sessions).
 from datetime import datetime
 from typing import Any, Dict
 
-from sqlalchemy.orm import Session
-
 from processor.models import UserActivity
 from processor.services.base import SpanProcessor
+from processor.services.rollup import RollupAggregator
 
 
 class UserActivityProcessor(SpanProcessor):
@@ -20,24 +19,23 @@ class UserActivityProcessor(SpanProcessor):
     Handles login, logout, and session tracking events.
     """
 
+    model = UserActivity
+
     def can_process(self, attributes: Dict[str, Any]) -> bool:
         """Check if this is a user activity event."""
         event_category = attributes.get("event.category")
         return event_category == "user_activity"
 
-    def process(
-        self,
-        attributes: Dict[str, Any],
-        timestamp: datetime,
-        session: Session,
-    ) -> None:
+    def to_row(self, attributes: Dict[str, Any], timestamp: datetime) -> Dict[str, Any]:
         """
-        Process user activity span and insert into database.
+        Build the user activity row for a span.
 
         Args:
             attributes: Span attributes
             timestamp: Event timestamp
-            session: Database session
+
+        Returns:
+            Dict: Column values for the row
         """
         try:
             common_fields = self.extract_common_fields(attributes)
@@ -61,7 +59,7 @@ class UserActivityProcessor(SpanProcessor):
                 ],
             )
 
-            activity = UserActivity(
+            return dict(
                 user_id=common_fields["user_id"],
                 organization_id=common_fields["organization_id"],
                 event_type=event_type,
@@ -71,9 +69,10 @@ class UserActivityProcessor(SpanProcessor):
                 event_metadata=metadata,
             )
 
-            session.add(activity)
-            self.logger.debug("User activity record added to session")
-
         except Exception as e:
             self.logger.error(f"Error processing user activity: {e}", exc_info=True)
             raise
+
+    def rollup(self, row: Dict[str, Any], aggregator: RollupAggregator) -> None:
+        """Count the row in the per-minute rollups."""
+        aggregator.record_activity(row)
@@ -1,5 +1,6 @@
 """Utility functions for telemetry processing."""
 
 from .attribute_extractor import AttributeExtractor
+from .sketch import DurationSketch
 
-__all__ = ["AttributeExtractor"]
+__all__ = ["AttributeExtractor", "DurationSketch"]
@@ -0,0 +1,105 @@
+"""
+Duration Sketch
+
+Mergeable quantile sketch for latency percentiles (a DDSketch-style
+log-bucketed histogram).
+
+A value v lands in bucket ceil(log_gamma(v)); every value in a bucket is
+within RELATIVE_ACCURACY of the bucket's representative value, so any
+quantile is estimated to that relative error. Sketches merge by adding
+bucket counts, which is what makes them storable as per-minute rows and
+combinable over any time range at query time.
+"""
+
+import math
+from typing import Dict, Iterable, Optional, Tuple
+
+# Relative error of quantile estimates (2%)
+RELATIVE_ACCURACY = 0.02
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(GAMMA)
+
+# Values at or below this (in ms) share the lowest bucket
+MIN_VALUE = 0.001
+
+
+def bucket_index(value: float) -> int:
+    """Bucket a value falls into."""
+    return math.ceil(math.log(max(value, MIN_VALUE)) / _LOG_GAMMA)
+
+
+def bucket_value(index: int) -> float:
+    """Representative value of a bucket (within RELATIVE_ACCURACY of its members)."""
+    return 2 * GAMMA**index / (GAMMA + 1)
+
+
+class DurationSketch:
+    """
+    Log-bucketed histogram of durations.
+
+    Only non-empty buckets are kept, so a sketch of one endpoint-minute is a
+    handful of entries.
+    """
+
+    def __init__(self, buckets: Optional[Dict[int, int]] = None):
+        """
+        Initialize the sketch.
+
+        Args:
+            buckets: Bucket index to count, e.g. as read back from storage
+        """
+        self.buckets: Dict[int, int] = dict(buckets or {})
+
+    @classmethod
+    def from_buckets(cls, rows: Iterable[Tuple[int, int]]) -> "DurationSketch":
+        """
+        Build a sketch from (bucket index, count) pairs, summing duplicates.
+
+        Args:
+            rows: Pairs such as rollup rows of several windows
+
+        Returns:
+            DurationSketch: Combined sketch
+        """
+        sketch = cls()
+        for index, count in rows:
+            sketch.buckets[index] = sketch.buckets.get(index, 0) + count
+        return sketch
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record a value."""
+        index = bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge(self, other: "DurationSketch") -> None:
+        """Add another sketch's counts to this one."""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1], e.g. 0.95
+
+        Returns:
+            Optional[float]: Estimated value, or None for an empty sketch
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        total = self.count
+        if total == 0:
+            return None
+
+        rank = q * (total - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return bucket_value(index)
+        return bucket_value(max(self.buckets))
@@ -20,6 +20,11 @@ From backlog + throughput we estimate the **average queue wait** via Little's
 Law:  W = L / λ  (mean time waiting in queue = backlog / completion rate).
 This is the "average waiting time in the queue" number Flower won't give you.
 
+The workers also record each task's measured queue wait and run time
+themselves (``rhesis.backend.celery.metrics``, served on
+``:$CELERY_METRICS_PORT/metrics``); this tool remains useful for the live
+backlog view during stress tests.
+
 It renders two live tables — PER QUEUE and PER TASK — each with an `ALL` row
 (the general/overall aggregate). Per-task throughput, runtime, and in-worker
 wait come from events; per-task backlog and est.wait need `--peek` (which
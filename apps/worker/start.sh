@@ -16,6 +16,7 @@ set -e
 : "${CELERY_WORKER_LOGLEVEL:=$LOG_LEVEL}"      # celery's own task-lifecycle logger; defaults to LOG_LEVEL
 : "${CELERY_WORKER_OPTS:=}"                   # extra flags passed to both workers
 : "${ENABLE_FLOWER:=no}"
+: "${CELERY_METRICS_PORT:=9540}"              # Prometheus /metrics: main worker, architect on +1
 export CELERY_WORKER_CONCURRENCY CELERY_ARCHITECT_CONCURRENCY \
     CELERY_WORKER_PREFETCH_MULTIPLIER CELERY_ARCHITECT_PREFETCH_MULTIPLIER \
     LOG_LEVEL CELERY_WORKER_LOGLEVEL CELERY_WORKER_OPTS ENABLE_FLOWER
@@ -259,13 +260,16 @@ echo "Pool:        threads"
 echo "Log level:   $CELERY_WORKER_LOGLEVEL"
 echo "Extra opts:  ${CELERY_WORKER_OPTS:-none}"
 
-# Start main worker in background
-$MAIN_CMD &
+echo "Metrics:     main :$CELERY_METRICS_PORT/metrics, architect :$((CELERY_METRICS_PORT + 1))/metrics"
+
+# Start main worker in background; each worker serves its own queue-wait and
+# run-time histograms (rhesis.backend.celery.metrics)
+CELERY_METRICS_PORT=$CELERY_METRICS_PORT $MAIN_CMD &
 MAIN_PID=$!
 echo "Main Celery worker started with PID: $MAIN_PID"
 
 # Start architect worker in background
-$ARCHITECT_CMD &
+CELERY_METRICS_PORT=$((CELERY_METRICS_PORT + 1)) $ARCHITECT_CMD &
 ARCHITECT_PID=$!
 echo "Architect Celery worker started with PID: $ARCHITECT_PID"
 
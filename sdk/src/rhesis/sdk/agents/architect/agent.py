@@ -521,24 +521,12 @@ class ArchitectAgent(BaseAgent):
             )
         return tools
 
+    def _readonly_http_methods(self) -> frozenset:
+        return self._cfg.readonly_http_methods
+
     def _classify_mutating(self, tools: List[Dict[str, Any]]) -> FrozenSet[str]:
         """Build the set of tools that require user confirmation."""
-        cfg = self._cfg
-        mutating: Set[str] = set()
-        for t in tools:
-            rc = t.get(ToolMeta.REQUIRES_CONFIRMATION)
-            if rc is not None:
-                if rc:
-                    mutating.add(t["name"])
-            elif t.get(ToolMeta.READONLY_HINT) is True:
-                pass
-            elif t.get(ToolMeta.DESTRUCTIVE_HINT) is True:
-                mutating.add(t["name"])
-            else:
-                method = t.get(ToolMeta.HTTP_METHOD, "POST").upper()
-                if method not in cfg.readonly_http_methods:
-                    mutating.add(t["name"])
-        return frozenset(mutating)
+        return frozenset(t["name"] for t in tools if not self._is_readonly_tool(t))
 
     def _is_mutating(self, tool_name: str) -> bool:
         """Check if a tool requires user confirmation."""
@@ -1880,34 +1868,34 @@ class ArchitectAgent(BaseAgent):
         if carried:
             parts.append(carried)
 
-        exec_window = self._execution_history[-self._history_window :]
-        if len(self._execution_history) > self._history_window:
-            omitted = len(self._execution_history) - self._history_window
-            parts.append(f"[... {omitted} earlier tool steps omitted ...]")
-        for step in exec_window:
-            reasoning_preview = step.reasoning[: cfg.reasoning_preview_chars]
-            parts.append(f"[Tool iteration {step.iteration}] Reasoning: {reasoning_preview}")
-            for i, tc in enumerate(step.tool_calls):
-                line = f"  Called: {tc.tool_name}"
-                # Echo the payload back only when the call failed. Without it
-                # the model sees the rejection but not what it sent, so it
-                # cannot tell which argument to change and retries blind.
-                if self._call_failed(step, i) and tc.arguments:
-                    preview = self._preview_args(tc.arguments, limit=cfg.failed_args_preview_chars)
-                    line += f" with arguments: {preview}"
-                parts.append(line)
-            if step.tool_results:
-                for tr in step.tool_results:
-                    rendered = self._render_tool_result(
-                        tr,
-                        prefix=f"  Result ({tr.tool_name})",
-                        preview=cfg.tool_result_preview_chars,
-                    )
-                    if rendered:
-                        parts.append(rendered)
+        parts.extend(self._format_execution_steps())
 
         return "\n".join(parts) if parts else ""
 
+    def _format_step(self, step: ExecutionStep) -> str:
+        cfg = self._cfg
+        reasoning_preview = step.reasoning[: cfg.reasoning_preview_chars]
+        lines = [f"[Tool iteration {step.iteration}] Reasoning: {reasoning_preview}"]
+        for i, tc in enumerate(step.tool_calls):
+            line = f"  Called: {tc.tool_name}"
+            # Echo the payload back only when the call failed. Without it
+            # the model sees the rejection but not what it sent, so it
+            # cannot tell which argument to change and retries blind.
+            if self._call_failed(step, i) and tc.arguments:
+                preview = self._preview_args(tc.arguments, limit=cfg.failed_args_preview_chars)
+                line += f" with arguments: {preview}"
+            lines.append(line)
+        if step.tool_results:
+            for tr in step.tool_results:
+                rendered = self._render_tool_result(
+                    tr,
+                    prefix=f"  Result ({tr.tool_name})",
+                    preview=cfg.tool_result_preview_chars,
+                )
+                if rendered:
+                    lines.append(rendered)
+        return "\n".join(lines)
+
     @staticmethod
     def _call_failed(step: ExecutionStep, index: int) -> bool:
         """Whether the tool call at ``index`` produced a failed result.
@@ -8,6 +8,7 @@ import asyncio
 import json
 import logging
 import time
+import weakref
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -16,7 +17,7 @@ import jinja2
 from opentelemetry import trace
 from pydantic import ValidationError
 
-from rhesis.sdk.agents.constants import Action, InternalTool
+from rhesis.sdk.agents.constants import Action, InternalTool, ToolMeta
 from rhesis.sdk.agents.errors import format_user_facing_error
 from rhesis.sdk.agents.events import AgentEventHandler, _emit
 from rhesis.sdk.agents.schemas import (
@@ -40,6 +41,42 @@ _MAX_LLM_CONTENT = 8000
 
 _LLM_TRACER = trace.get_tracer("rhesis.sdk.agents.llm")
 
+# Seconds an MCP server's tool list is reused before it is fetched again.
+# Reconnecting always refetches, since the server may have changed.
+_DEFAULT_CATALOG_TTL = 300.0
+
+# Read-only tool calls from one LLM step run concurrently, at most this many
+# at a time. Calls that may write keep their order (see ``_execute_tools``).
+_DEFAULT_MAX_CONCURRENT_TOOLS = 4
+
+_READONLY_HTTP_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def is_readonly_tool(
+    tool: Dict[str, Any], readonly_http_methods: frozenset = _READONLY_HTTP_METHODS
+) -> bool:
+    """Whether a tool description declares the tool free of side effects.
+
+    Classification priority:
+    1. Explicit ``requires_confirmation`` flag
+    2. MCP ``readOnlyHint`` annotation
+    3. MCP ``destructiveHint`` annotation
+    4. ``http_method`` fallback (*readonly_http_methods* are read-only)
+
+    Anything unannotated is assumed to write. The same answer decides which
+    calls run concurrently (``BaseAgent``) and which need the user's
+    confirmation (``ArchitectAgent``).
+    """
+    rc = tool.get(ToolMeta.REQUIRES_CONFIRMATION)
+    if rc is not None:
+        return not rc
+    if tool.get(ToolMeta.READONLY_HINT) is True:
+        return True
+    if tool.get(ToolMeta.DESTRUCTIVE_HINT) is True:
+        return False
+    return tool.get(ToolMeta.HTTP_METHOD, "POST").upper() in readonly_http_methods
+
+
 # How many levels of nested object/array-item properties to expand in the
 # tool descriptions.  Two covers ``tests[].prompt.content`` — the deepest
 # shape in the Rhesis catalog — without bloating the prompt further.
@@ -175,9 +212,21 @@ class MCPTool:
     into individual tool descriptions at runtime.
     """
 
-    def __init__(self, client):
+    def __init__(self, client, catalog_ttl: Optional[float] = _DEFAULT_CATALOG_TTL):
         self._client = client
         self._connected = False
+        # Tool list cache: valid for ``catalog_ttl`` seconds (None = until
+        # reconnect, 0 = never cached) and only for the connection it was
+        # fetched on, tracked by ``_connection_version``.
+        self._catalog_ttl = catalog_ttl
+        self._catalog: Optional[List[Dict[str, Any]]] = None
+        self._catalog_fetched_at = 0.0
+        self._catalog_version = -1
+        self._connection_version = 0
+        # Read-only tool calls run concurrently, so (re)connecting is
+        # serialized. asyncio locks are bound to a loop, and the tool can
+        # outlive one (asyncio.run() per turn), hence one lock per loop.
+        self._connect_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     @classmethod
     def from_url(
@@ -185,6 +234,7 @@ class MCPTool:
         url: str,
         api_key: Optional[str] = None,
         headers: Optional[Dict[str, str]] = None,
+        catalog_ttl: Optional[float] = _DEFAULT_CATALOG_TTL,
     ) -> "MCPTool":
         """Connect to an MCP server via HTTP/StreamableHTTP."""
         from rhesis.sdk.agents.mcp.client import MCPClient
@@ -198,13 +248,14 @@ class MCPTool:
             transport_type="http",
             transport_params={"url": url, "headers": final_headers},
         )
-        return cls(client=client)
+        return cls(client=client, catalog_ttl=catalog_ttl)
 
     @classmethod
     def from_provider(
         cls,
         provider: str,
         credentials: Dict[str, str],
+        catalog_ttl: Optional[float] = _DEFAULT_CATALOG_TTL,
     ) -> "MCPTool":
         """Connect to a known MCP provider (confluence, jira, etc.).
 
@@ -218,41 +269,85 @@ class MCPTool:
         servers = config.get("mcpServers", {})
         server_name = next(iter(servers))
         client = factory.create_client(server_name)
-        return cls(client=client)
+        return cls(client=client, catalog_ttl=catalog_ttl)
+
+    def _connect_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock = self._connect_locks.get(loop)
+        if lock is None:
+            lock = self._connect_locks[loop] = asyncio.Lock()
+        return lock
 
     async def _ensure_connected(self) -> None:
         """Connect or reconnect if the session was lost."""
-        if not self._connected:
-            # Reset stale state left over from a destroyed event loop
-            self._client._reset()
-            await self.connect()
-            return
-        # Session may have been destroyed (e.g. event loop closed
-        # between asyncio.run() calls). Detect and reconnect.
-        session = getattr(self._client, "session", None)
-        if session is None:
-            self._connected = False
-            self._client._reset()
-            await self.connect()
-
-    async def list_tools(self) -> List[Dict[str, Any]]:
-        """Discover tools from the MCP server."""
+        async with self._connect_lock():
+            if not self._connected:
+                # Reset stale state left over from a destroyed event loop
+                self._client._reset()
+                await self.connect()
+                return
+            # Session may have been destroyed (e.g. event loop closed
+            # between asyncio.run() calls). Detect and reconnect.
+            session = getattr(self._client, "session", None)
+            if session is None:
+                self._connected = False
+                self._client._reset()
+                await self.connect()
+
+    async def _reconnect(self, failed_version: int) -> None:
+        """Reconnect after a transport error on connection *failed_version*.
+
+        Concurrent calls that failed on the same connection reconnect once.
+        """
+        async with self._connect_lock():
+            if self._connection_version == failed_version:
+                self._connected = False
+                await self.connect()
+
+    def _catalog_is_fresh(self) -> bool:
+        if self._catalog is None or self._catalog_version != self._connection_version:
+            return False
+        if self._catalog_ttl is None:
+            return True
+        return time.monotonic() - self._catalog_fetched_at < self._catalog_ttl
+
+    def invalidate_catalog(self) -> None:
+        """Drop the cached tool list so the next ``list_tools()`` refetches it."""
+        self._catalog = None
+
+    async def list_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Discover tools from the MCP server.
+
+        The result is cached (see ``catalog_ttl``), so agents can ask on
+        every turn without an MCP round trip each time. Pass
+        ``refresh=True`` to bypass the cache.
+        """
+        if not refresh and self._catalog_is_fresh():
+            await self._ensure_connected()
+            if self._catalog_is_fresh():
+                return list(self._catalog)
+        version = self._connection_version
         try:
             await self._ensure_connected()
-            return await self._client.list_tools()
+            version = self._connection_version
+            tools = await self._client.list_tools()
         except Exception:
             # Reconnect on any transport error
-            self._connected = False
-            await self.connect()
-            return await self._client.list_tools()
+            await self._reconnect(version)
+            tools = await self._client.list_tools()
+        if self._catalog_ttl != 0:
+            self._catalog = list(tools)
+            self._catalog_fetched_at = time.monotonic()
+            self._catalog_version = self._connection_version
+        return tools
 
     async def execute(self, tool_name: str, **kwargs) -> ToolResult:
         """Route execution to the MCP server."""
+        version = self._connection_version
         try:
             await self._ensure_connected()
         except Exception:
-            self._connected = False
-            await self.connect()
+            await self._reconnect(version)
 
         result = await self._client.call_tool(tool_name, kwargs)
         content = extract_mcp_content(result)
@@ -272,6 +367,7 @@ class MCPTool:
         """Connect to the MCP server."""
         await self._client.connect()
         self._connected = True
+        self._connection_version += 1
 
     async def disconnect(self) -> None:
         """Disconnect from the MCP server."""
@@ -311,6 +407,7 @@ class BaseAgent:
         prompt_templates_dir: Optional[Path] = None,
         jinja_env: Optional[jinja2.Environment] = None,
         event_handlers: Optional[List[AgentEventHandler]] = None,
+        max_concurrent_tools: int = _DEFAULT_MAX_CONCURRENT_TOOLS,
     ):
         # Template environment
         templates_dir = prompt_templates_dir or (Path(__file__).parent / "mcp" / "prompt_templates")
@@ -340,6 +437,13 @@ class BaseAgent:
         self._execution_history: List[ExecutionStep] = []
         self._needs_confirmation = False
         self._turn_lock = asyncio.Lock()
+        self._max_concurrent_tools = max(1, max_concurrent_tools)
+        # Names of tools declared read-only, from the last get_available_tools()
+        self._readonly_tools: frozenset[str] = frozenset()
+        # Prompt text caches: the tool list is the same object for every
+        # iteration of a turn, and history steps never change once recorded.
+        self._tools_text_cache: Optional[Tuple[List[Dict[str, Any]], int, str]] = None
+        self._step_text_cache: Dict[int, Tuple[ExecutionStep, str]] = {}
 
     @property
     def needs_confirmation(self) -> bool:
@@ -364,8 +468,16 @@ class BaseAgent:
                 all_tools.extend(await tool.list_tools())
             elif isinstance(tool, BaseTool):
                 all_tools.append(tool.to_dict())
+        self._readonly_tools = frozenset(t["name"] for t in all_tools if self._is_readonly_tool(t))
         return all_tools
 
+    def _readonly_http_methods(self) -> frozenset:
+        """HTTP methods whose tools count as read-only (see ``is_readonly_tool``)."""
+        return _READONLY_HTTP_METHODS
+
+    def _is_readonly_tool(self, tool: Dict[str, Any]) -> bool:
+        return is_readonly_tool(tool, self._readonly_http_methods())
+
     async def execute_tool(self, tool_call: ToolCall) -> ToolResult:
         """Route a tool call to the matching tool source."""
         tool_name = tool_call.tool_name
@@ -534,7 +646,18 @@ class BaseAgent:
         description.  Nested object and array-item shapes are expanded up
         to ``_MAX_SCHEMA_DEPTH`` levels.  Server-managed fields are
         excluded so the LLM never tries to send them.
+
+        The text is reused while the same tool list is passed in, which is
+        the case for every iteration of a turn.
         """
+        cached = self._tools_text_cache
+        if cached is not None and cached[0] is tools and cached[1] == len(tools):
+            return cached[2]
+        text = self._render_tools(tools)
+        self._tools_text_cache = (tools, len(tools), text)
+        return text
+
+    def _render_tools(self, tools: List[Dict[str, Any]]) -> str:
         if not tools:
             return "(no tools available)"
 
@@ -551,26 +674,45 @@ class BaseAgent:
         return "\n".join(descriptions)
 
     def _format_history(self) -> str:
-        if not self._execution_history:
-            return ""
-        window = self._execution_history[-self._history_window :]
+        return "\n".join(self._format_execution_steps())
+
+    def _format_execution_steps(self) -> List[str]:
+        """Render the windowed execution history, one entry per step.
+
+        Each step is rendered once and reused on later iterations, so the
+        per-iteration cost is the new steps only. Subclasses change how a
+        step looks by overriding ``_format_step``.
+        """
+        history = self._execution_history
+        window = history[-self._history_window :]
         parts: List[str] = []
-        if len(self._execution_history) > self._history_window:
-            omitted = len(self._execution_history) - self._history_window
+        if len(history) > self._history_window:
+            omitted = len(history) - self._history_window
             parts.append(f"[... {omitted} earlier tool steps omitted ...]")
+
+        # Keyed by id(); holding the step keeps the id from being reused.
+        cache: Dict[int, Tuple[ExecutionStep, str]] = {}
         for step in window:
-            parts.append(f"[Tool iteration {step.iteration}] Reasoning: {step.reasoning[:200]}")
-            if step.tool_calls:
-                for tc in step.tool_calls:
-                    parts.append(f"  Called: {tc.tool_name}")
-            if step.tool_results:
-                for tr in step.tool_results:
-                    if tr.success:
-                        content_preview = tr.content[:4000]
-                        parts.append(f"  Result ({tr.tool_name}): {content_preview}")
-                    else:
-                        parts.append(f"  Error ({tr.tool_name}): {tr.error}")
-        return "\n".join(parts)
+            hit = self._step_text_cache.get(id(step))
+            text = hit[1] if hit is not None and hit[0] is step else self._format_step(step)
+            cache[id(step)] = (step, text)
+            parts.append(text)
+        self._step_text_cache = cache
+        return parts
+
+    def _format_step(self, step: ExecutionStep) -> str:
+        lines = [f"[Tool iteration {step.iteration}] Reasoning: {step.reasoning[:200]}"]
+        if step.tool_calls:
+            for tc in step.tool_calls:
+                lines.append(f"  Called: {tc.tool_name}")
+        if step.tool_results:
+            for tr in step.tool_results:
+                if tr.success:
+                    content_preview = tr.content[:4000]
+                    lines.append(f"  Result ({tr.tool_name}): {content_preview}")
+                else:
+                    lines.append(f"  Error ({tr.tool_name}): {tr.error}")
+        return "\n".join(lines)
 
     # ── ReAct loop ──────────────────────────────────────────────────
 
@@ -967,42 +1109,67 @@ class BaseAgent:
     async def _execute_tools(
         self, tool_calls: List[ToolCall], reasoning: str = ""
     ) -> List[ToolResult]:
+        """Execute one step's tool calls; results are returned in call order.
+
+        Consecutive calls to read-only tools run concurrently (up to
+        ``max_concurrent_tools`` at a time), since most steps are lookups
+        dominated by MCP round trips. Any other call runs on its own, after
+        the calls before it, so a step like "create X, then link X"
+        keeps its order.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrent_tools)
+
+        async def run(tc: ToolCall) -> ToolResult:
+            async with semaphore:
+                return await self._execute_one_tool(tc, reasoning)
+
         results: List[ToolResult] = []
+        group: List[ToolCall] = []
         for tc in tool_calls:
-            arguments = tc.arguments
-            await _emit(
-                self._event_handlers,
-                "on_tool_start",
-                tool_name=tc.tool_name,
-                arguments=arguments,
-                reasoning=reasoning,
-            )
+            if self._max_concurrent_tools > 1 and tc.tool_name in self._readonly_tools:
+                group.append(tc)
+                continue
+            if group:
+                results.extend(await asyncio.gather(*(run(g) for g in group)))
+                group = []
+            results.append(await self._execute_one_tool(tc, reasoning))
+        if group:
+            results.extend(await asyncio.gather(*(run(g) for g in group)))
+        return results
 
-            t0 = time.monotonic()
-            result = await self.execute_tool(tc)
-            result.duration_ms = round((time.monotonic() - t0) * 1000)
-            results.append(result)
+    async def _execute_one_tool(self, tc: ToolCall, reasoning: str) -> ToolResult:
+        await _emit(
+            self._event_handlers,
+            "on_tool_start",
+            tool_name=tc.tool_name,
+            arguments=tc.arguments,
+            reasoning=reasoning,
+        )
 
-            if not result.success:
-                logger.warning(
-                    "[Agent] Tool %s failed: %s",
-                    tc.tool_name,
-                    result.error,
-                )
+        t0 = time.monotonic()
+        result = await self.execute_tool(tc)
+        result.duration_ms = round((time.monotonic() - t0) * 1000)
 
-            await _emit(
-                self._event_handlers,
-                "on_tool_end",
-                tool_name=tc.tool_name,
-                result=result,
+        if not result.success:
+            logger.warning(
+                "[Agent] Tool %s failed: %s",
+                tc.tool_name,
+                result.error,
             )
 
-            if self.verbose:
-                if result.success:
-                    print(f"      + {result.tool_name}: {len(result.content)} chars")
-                else:
-                    print(f"      x {result.tool_name}: {result.error}")
-        return results
+        await _emit(
+            self._event_handlers,
+            "on_tool_end",
+            tool_name=tc.tool_name,
+            result=result,
+        )
+
+        if self.verbose:
+            if result.success:
+                print(f"      + {result.tool_name}: {len(result.content)} chars")
+            else:
+                print(f"      x {result.tool_name}: {result.error}")
+        return result
 
     def _handle_unknown_action(
         self, action: AgentAction, iteration: int
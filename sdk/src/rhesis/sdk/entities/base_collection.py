@@ -4,6 +4,7 @@ from requests.exceptions import HTTPError
 
 from rhesis.sdk.clients import APIClient, Endpoints, HTTPStatus, Methods
 from rhesis.sdk.entities.base_entity import BaseEntity, handle_http_errors
+from rhesis.sdk.entities.pagination import DEFAULT_PAGE_SIZE, DEFAULT_PREFETCH, PageIterator
 
 T = TypeVar("T", bound=BaseEntity)
 
@@ -42,6 +43,65 @@ class BaseCollection(Generic[T]):
         validated_instances = [cls.entity_class.model_validate(item) for item in response]
         return validated_instances
 
+    @classmethod
+    @handle_http_errors
+    def _fetch_page(cls, skip: int, limit: int, filter: Optional[str] = None) -> list[dict]:
+        """Fetch one raw ``skip``/``limit`` page of records (for :meth:`iter_all`)."""
+        params: dict[str, Any] = {"skip": skip, "limit": limit}
+        if filter:
+            params["$filter"] = filter
+        return APIClient().send_request(
+            endpoint=cls.endpoint,
+            method=Methods.GET,
+            params=params,
+        )
+
+    @classmethod
+    @handle_http_errors
+    def iter_all(
+        cls,
+        filter: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_items: Optional[int] = None,
+    ) -> PageIterator[T]:
+        """Lazily iterate over every record, one page at a time.
+
+        Unlike :meth:`all`, which returns a single server page, this walks the
+        whole collection with ``skip``/``limit`` requests. The next page is
+        fetched in the background while the current one is consumed, and items
+        are validated into models only as they are yielded, so memory stays
+        bounded by ``(prefetch + 1) * page_size`` raw items.
+
+        Args:
+            filter: Optional OData filter string to filter results
+            page_size: Number of records requested per page, at most 100
+            prefetch: Number of pages fetched ahead of the consumer
+            max_items: Optional maximum number of records to yield
+
+        Returns:
+            An iterator of validated entity instances
+
+        Raises:
+            ValueError: If page_size is outside 1..100, the backend's limit.
+            RhesisAPIError: From the iterator, if fetching a page fails.
+
+        Example:
+            >>> for test in Tests.iter_all(page_size=50):
+            ...     print(test.id)
+        """
+
+        def fetch_page(skip: int, limit: int) -> list[dict]:
+            return cls._fetch_page(skip, limit, filter)
+
+        return PageIterator(
+            fetch_page,
+            cls.entity_class.model_validate,
+            page_size=page_size,
+            prefetch=prefetch,
+            max_items=max_items,
+        )
+
     @classmethod
     @handle_http_errors
     def first(cls) -> Optional[T]:
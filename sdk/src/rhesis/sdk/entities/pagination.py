@@ -0,0 +1,137 @@
+"""Lazy, prefetching page iteration over paginated list endpoints.
+
+The backend list endpoints accept ``skip``/``limit`` and cap the page size, so
+pulling a large collection means issuing many requests. :class:`PageIterator`
+hides that loop: it fetches pages on a single background thread while the
+caller consumes items, keeps at most ``prefetch + 1`` raw pages in memory, and
+only validates items into models when they are yielded.
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Generic, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+# The backend rejects list requests with ``limit`` above this.
+MAX_PAGE_SIZE = 100
+DEFAULT_PREFETCH = 1
+
+FetchPage = Callable[[int, int], Optional[List[Dict[str, Any]]]]
+
+
+class PageIterator(Generic[T]):
+    """Iterate over every item of a ``skip``/``limit`` paginated endpoint.
+
+    Pages are requested in order on one worker thread, ``prefetch`` pages ahead
+    of the page currently being consumed. Iteration stops at the first page
+    shorter than ``page_size``. Errors raised while fetching a page surface in
+    the consuming thread when that page is reached.
+
+    Example:
+        >>> pages = PageIterator(fetch_page, Test.model_validate, page_size=50)
+        >>> for test in pages:
+        ...     process(test)
+
+    Args:
+        fetch_page: Callable taking ``(skip, limit)`` and returning the raw
+            list of items for that page.
+        parse: Callable turning one raw item into the yielded value.
+        page_size: Number of items requested per page, at most
+            ``MAX_PAGE_SIZE``.
+        prefetch: Number of pages fetched ahead of the consumer. ``0`` fetches
+            strictly on demand.
+        max_items: Optional upper bound on the number of yielded items.
+    """
+
+    def __init__(
+        self,
+        fetch_page: FetchPage,
+        parse: Callable[[Dict[str, Any]], T],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_items: Optional[int] = None,
+    ):
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        if max_items is not None and max_items < 0:
+            raise ValueError("max_items must not be negative")
+
+        self._fetch_page = fetch_page
+        self._parse = parse
+        self._page_size = page_size
+        self._prefetch = prefetch
+        self._max_items = max_items
+        self._items: Optional[Iterator[T]] = None
+        self.pages_fetched = 0
+
+    def __iter__(self) -> "PageIterator[T]":
+        return self
+
+    def __next__(self) -> T:
+        if self._items is None:
+            self._items = self._iter_items()
+        return next(self._items)
+
+    def __enter__(self) -> "PageIterator[T]":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop iterating and cancel any pages that have not been fetched yet."""
+        if self._items is not None:
+            self._items.close()  # type: ignore[attr-defined]
+
+    def _iter_items(self) -> Iterator[T]:
+        yielded = 0
+        if self._max_items == 0:
+            return
+        pages = self._iter_pages()
+        try:
+            for page in pages:
+                for item in page:
+                    yield self._parse(item)
+                    yielded += 1
+                    if self._max_items is not None and yielded >= self._max_items:
+                        return
+        finally:
+            pages.close()
+
+    def _iter_pages(self) -> Iterator[List[Dict[str, Any]]]:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rhesis-page")
+        pending: Deque[Future] = deque()
+        next_skip = 0
+
+        def submit() -> None:
+            nonlocal next_skip
+            pending.append(executor.submit(self._fetch_page, next_skip, self._page_size))
+            next_skip += self._page_size
+
+        try:
+            for _ in range(self._prefetch + 1):
+                submit()
+
+            while pending:
+                page = pending.popleft().result() or []
+                self.pages_fetched += 1
+
+                if len(page) < self._page_size:
+                    # Last page: pages queued behind it can only be empty.
+                    for future in pending:
+                        future.cancel()
+                    pending.clear()
+                else:
+                    submit()
+
+                if page:
+                    yield page
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
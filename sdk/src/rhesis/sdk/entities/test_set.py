@@ -12,6 +12,7 @@ from rhesis.sdk.clients import APIClient, Endpoints, Methods
 from rhesis.sdk.entities import BaseEntity, Endpoint
 from rhesis.sdk.entities.base_collection import BaseCollection
 from rhesis.sdk.entities.base_entity import handle_http_errors
+from rhesis.sdk.entities.pagination import DEFAULT_PAGE_SIZE, DEFAULT_PREFETCH, PageIterator
 from rhesis.sdk.entities.prompt import Prompt
 from rhesis.sdk.entities.test import Test
 from rhesis.sdk.enums import ExecutionMode, TestType
@@ -165,11 +166,67 @@ class TestSet(BaseEntity):
             return self.tests
         return []
 
+    @handle_http_errors
+    def _fetch_tests_page(self, skip: int, limit: int) -> List[Dict[str, Any]]:
+        """Fetch one raw page of this test set's tests (for :meth:`iter_tests`)."""
+        return APIClient().send_request(
+            endpoint=self.endpoint,
+            method=Methods.GET,
+            url_params=f"{self.id}/tests",
+            params={"skip": skip, "limit": limit},
+        )
+
+    @handle_http_errors
+    def iter_tests(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_items: Optional[int] = None,
+    ) -> PageIterator[Test]:
+        """Lazily iterate over all tests in this test set.
+
+        Pages are fetched in the background while the previous page is being
+        consumed, and each test is validated only when it is yielded. Memory
+        use is bounded by ``(prefetch + 1) * page_size`` raw tests regardless
+        of the size of the test set. Unlike :meth:`fetch_tests`, this does
+        not populate ``self.tests``.
+
+        Args:
+            page_size: Number of tests requested per page, at most 100.
+                Defaults to 100.
+            prefetch: Number of pages fetched ahead of the consumer. Defaults to 1.
+            max_items: Optional maximum number of tests to yield.
+
+        Returns:
+            An iterator of Test objects.
+
+        Raises:
+            ValueError: If test set ID is not set, or page_size is outside
+                1..100, the backend's limit.
+            RhesisAPIError: From the iterator, if fetching a page fails.
+
+        Example:
+            >>> test_set = TestSet(id='test-set-123')
+            >>> for test in test_set.iter_tests(page_size=50):
+            ...     print(test.prompt.content)
+        """
+        if not self.id:
+            raise ValueError("Test set ID must be set before fetching tests")
+
+        return PageIterator(
+            self._fetch_tests_page,
+            Test.model_validate,
+            page_size=page_size,
+            prefetch=prefetch,
+            max_items=max_items,
+        )
+
     def pull(self, include_tests: bool = True) -> "TestSet":
         """Pull the test set from the database and update this instance.
 
         Args:
-            include_tests: If True (default), also fetches associated tests.
+            include_tests: If True (default), also fetches all associated
+                tests, following pagination until the last page.
 
         Returns:
             TestSet: Returns self for method chaining.
@@ -184,7 +241,8 @@ class TestSet(BaseEntity):
 
         # Fetch tests if requested
         if include_tests:
-            self.fetch_tests()
+            self.tests = list(self.iter_tests())
+            self.test_count = len(self.tests)
 
         return self
 
@@ -4,12 +4,22 @@ Garak detector metric implementation.
 This module wraps Garak detectors as Rhesis metrics, enabling
 the use of Garak's vulnerability detection capabilities within
 the Rhesis evaluation framework.
+
+Detector instances are cached per process: several detectors load a local
+classifier model, which must not happen again for every metric instance.
+Those classifier detectors are also far faster when they score many outputs
+at once, so concurrent ``a_evaluate`` calls for the same detector (the tests
+of a batch run) are coalesced into one multi-output ``Attempt``, and
+``evaluate_batch`` does the same for callers that hold all outputs already.
 """
 
 import asyncio
 import importlib
+import json
 import logging
-from typing import List, Optional, Union
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from rhesis.sdk.metrics.base import (
     Backend,
@@ -39,6 +49,153 @@ _DETECTOR_OVERRIDES = {
 # requirement in detectors.yaml (catalog-only) and report "not implemented" if run.
 _UNSUPPORTED_DETECTOR_MODULES = ("packagehallucination",)
 
+# Upper bound on outputs scored in one detector call, and how long a
+# coalesced call waits for more outputs to arrive before it runs.
+DETECTOR_BATCH_SIZE = 32
+DETECTOR_BATCH_WAIT_SECONDS = 0.02
+
+# (detector class, constructor kwargs) -> detector instance, for the process.
+_detector_cache: Dict[Tuple[Any, str], Any] = {}
+# Guards the two dicts only; construction holds the key's own build lock, so
+# a classifier loading its model does not block lookups of other detectors.
+_detector_cache_lock = threading.Lock()
+_detector_build_locks: Dict[Tuple[Any, str], threading.Lock] = {}
+# id(detector) -> lock serializing its detect() calls. A cached detector is
+# shared by every thread of the process, and the HuggingFace pipeline behind
+# a classifier detector is not safe to call concurrently. Cached detectors
+# live for the process, so their ids are never reused.
+_detect_locks: Dict[int, threading.Lock] = {}
+
+
+def _cached_detector(detector_class: Any, kwargs: Dict[str, Any]) -> Any:
+    """Return the process's instance of *detector_class*, constructing it once."""
+    key = (detector_class, json.dumps(kwargs, sort_keys=True, default=str))
+    with _detector_cache_lock:
+        detector = _detector_cache.get(key)
+        if detector is not None:
+            return detector
+        build_lock = _detector_build_locks.setdefault(key, threading.Lock())
+
+    with build_lock:
+        with _detector_cache_lock:
+            detector = _detector_cache.get(key)
+        if detector is None:
+            detector = detector_class(**kwargs)
+            with _detector_cache_lock:
+                _detector_cache[key] = detector
+                _detector_build_locks.pop(key, None)
+        return detector
+
+
+def _detect(detector: Any, attempt: Any) -> List[Any]:
+    """Run *detector* on *attempt* under its lock and return the scores as a list."""
+    with _detector_cache_lock:
+        lock = _detect_locks.setdefault(id(detector), threading.Lock())
+    with lock:
+        results = detector.detect(attempt)
+        # Garak detectors return generators/iterables as of v0.14+, but tolerate a
+        # bare scalar too in case a detector implementation returns one directly.
+        try:
+            return list(results)
+        except TypeError:
+            return [float(results)]
+
+
+def _is_batchable(detector: Any) -> bool:
+    """Whether *detector* scores each output on its own text alone.
+
+    Garak's HuggingFace classifier detectors ignore the prompt and the notes,
+    so outputs from different tests can share one ``Attempt``. Other
+    detectors read the prompt or the probe notes and are called per test.
+    """
+    try:
+        from garak.detectors.base import HFDetector
+    except ImportError:
+        return False
+    return isinstance(detector, HFDetector)
+
+
+def _score_outputs(detector: Any, outputs: Sequence[str]) -> List[List[float]]:
+    """Score *outputs* with one detector call per chunk; one score list per output."""
+    from garak.attempt import Attempt, Message
+
+    def make_attempt(chunk: List[str]) -> Any:
+        # Garak requires a prompt before outputs are set. The outputs may come
+        # from different tests; batchable detectors ignore the prompt anyway.
+        attempt = Attempt()
+        attempt.prompt = Message(text="", lang="*")
+        attempt.outputs = chunk
+        return attempt
+
+    scores: List[List[float]] = []
+    for start in range(0, len(outputs), DETECTOR_BATCH_SIZE):
+        chunk = list(outputs[start : start + DETECTOR_BATCH_SIZE])
+        chunk_scores = _detect(detector, make_attempt(chunk))
+        if len(chunk_scores) != len(chunk):
+            # Scores can't be mapped back to outputs; score them one by one.
+            chunk_scores = []
+            for output in chunk:
+                chunk_scores.extend(_detect(detector, make_attempt([output]))[:1] or [None])
+        scores.extend([] if score is None else [score] for score in chunk_scores)
+    return scores
+
+
+class _DetectorBatcher:
+    """Coalesces concurrent score requests for one detector on one event loop."""
+
+    def __init__(self, detector: Any) -> None:
+        self._detector = detector
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def score(self, output: str) -> List[float]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((output, future))
+        if len(self._pending) >= DETECTOR_BATCH_SIZE:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(DETECTOR_BATCH_WAIT_SECONDS, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.get_running_loop().create_task(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            scores = await asyncio.to_thread(
+                _score_outputs, self._detector, [output for output, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        logger.debug(f"[GARAK] Scored {len(batch)} outputs in one batched detector call")
+        for (_, future), output_scores in zip(batch, scores):
+            if not future.done():
+                future.set_result(output_scores)
+
+
+# event loop -> {id(detector): batcher}. Batchers hold loop-bound futures and
+# timers, so each loop gets its own; they go away with their loop.
+_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[int, _DetectorBatcher]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _batcher_for(detector: Any) -> _DetectorBatcher:
+    per_loop = _batchers.setdefault(asyncio.get_running_loop(), {})
+    batcher = per_loop.get(id(detector))
+    if batcher is None:
+        batcher = per_loop[id(detector)] = _DetectorBatcher(detector)
+    return batcher
+
 
 class GarakDetectorMetric(BaseMetric):
     """
@@ -150,8 +307,8 @@ class GarakDetectorMetric(BaseMetric):
             # Get the detector class
             detector_class = getattr(module, class_name)
 
-            # Instantiate the detector
-            return detector_class(**self._detector_kwargs)
+            # Instantiate the detector, or reuse this process's instance
+            return _cached_detector(detector_class, self._detector_kwargs)
 
         except ImportError as e:
             logger.error(f"Failed to import Garak detector module: {e}")
@@ -212,6 +369,7 @@ class GarakDetectorMetric(BaseMetric):
                 },
             )
 
+        effective_notes = notes if notes is not None else self._probe_notes
         try:
             from garak.attempt import Attempt, Message
 
@@ -223,7 +381,6 @@ class GarakDetectorMetric(BaseMetric):
             attempt.prompt = Message(text=input, lang="*")
             attempt.outputs = [output]
 
-            effective_notes = notes if notes is not None else self._probe_notes
             if effective_notes:
                 attempt.notes.update(effective_notes)
 
@@ -231,112 +388,148 @@ class GarakDetectorMetric(BaseMetric):
 
             # Run the detector
             logger.debug("[GARAK] Calling detector.detect()...")
-            results = self.detector.detect(attempt)
-            logger.debug(
-                f"[GARAK] Raw detector results: {results} (type: {type(results).__name__})"
-            )
-
-            # Garak detectors return generators/iterables as of v0.14+, but tolerate a
-            # bare scalar too in case a detector implementation returns one directly.
-            try:
-                raw_scores = list(results)
-            except TypeError:
-                raw_scores = [float(results)]
-
-            # --- Handle empty results (probe-context missing) ---------------
-            if not raw_scores:
-                required_note = CONTEXT_REQUIRED_NOTES.get(
-                    normalize_detector_path(self.detector_class_path)
-                )
-                notes_missing_key = required_note and (
-                    not effective_notes
-                    or required_note not in effective_notes
-                    or not effective_notes.get(required_note)
-                )
-                if notes_missing_key:
-                    reason = (
-                        f"Detector '{self.detector_class_path.split('.')[-1]}' "
-                        f"returned no scores because "
-                        f"notes['{required_note}'] was not provided or empty. "
-                        f"Pass probe metadata via the 'notes' parameter."
-                    )
-                else:
-                    reason = (
-                        f"Detector '{self.detector_class_path.split('.')[-1]}' returned no scores."
-                    )
-                logger.warning(f"[GARAK] Inconclusive: {reason}")
-                return MetricResult(
-                    score=None,
-                    details={
-                        "detector": self.detector_class_path,
-                        "detector_class": self.detector_class_path.split(".")[-1],
-                        "raw_scores": [],
-                        "is_successful": None,
-                        "inconclusive": True,
-                        "threshold": self.threshold,
-                        "reason": reason,
-                    },
-                )
+            raw_scores = _detect(self.detector, attempt)
+            logger.debug(f"[GARAK] Raw detector scores: {raw_scores}")
 
-            max_score = max(raw_scores)
-            logger.debug(f"[GARAK] Scores: {raw_scores}, max={max_score:.4f}")
+            return self._result_from_scores(raw_scores, effective_notes)
 
-            is_successful = max_score < self.threshold
+        except ImportError as e:
+            logger.error(f"[GARAK] Import error - Garak not available: {e}")
+            return self._error_result(e, "Garak package not available")
+        except Exception as e:
+            logger.error(f"[GARAK] Error running detector: {e}", exc_info=True)
+            return self._error_result(e, f"Detector evaluation failed: {str(e)}")
+
+    def _error_result(self, error: Exception, reason: str) -> MetricResult:
+        return MetricResult(
+            score=1.0,  # Max score indicates failure
+            details={
+                "error": str(error),
+                "detector": self.detector_class_path,
+                "is_successful": False,
+                "threshold": self.threshold,
+                "reason": reason,
+            },
+        )
 
-            if is_successful:
+    def _result_from_scores(
+        self, raw_scores: List[float], effective_notes: Optional[dict]
+    ) -> MetricResult:
+        """Turn a detector's scores for one output into a metric result."""
+        # --- Handle empty results (probe-context missing) ---------------
+        if not raw_scores:
+            required_note = CONTEXT_REQUIRED_NOTES.get(
+                normalize_detector_path(self.detector_class_path)
+            )
+            notes_missing_key = required_note and (
+                not effective_notes
+                or required_note not in effective_notes
+                or not effective_notes.get(required_note)
+            )
+            if notes_missing_key:
                 reason = (
-                    f"Garak detector score ({max_score:.4f}) < threshold ({self.threshold}). "
-                    "Model defended against probe."
+                    f"Detector '{self.detector_class_path.split('.')[-1]}' "
+                    f"returned no scores because "
+                    f"notes['{required_note}'] was not provided or empty. "
+                    f"Pass probe metadata via the 'notes' parameter."
                 )
             else:
-                reason = (
-                    f"Garak detector score ({max_score:.4f}) >= threshold ({self.threshold}). "
-                    "Potential vulnerability detected."
-                )
-
-            logger.info(
-                f"[GARAK] Final: score={max_score:.4f}, is_successful={is_successful}, "
-                f"threshold={self.threshold}, detector={self.detector_class_path.split('.')[-1]}"
-            )
-
+                reason = f"Detector '{self.detector_class_path.split('.')[-1]}' returned no scores."
+            logger.warning(f"[GARAK] Inconclusive: {reason}")
             return MetricResult(
-                score=max_score,
+                score=None,
                 details={
                     "detector": self.detector_class_path,
                     "detector_class": self.detector_class_path.split(".")[-1],
-                    "raw_scores": raw_scores,
-                    "is_successful": is_successful,
-                    "inconclusive": False,
+                    "raw_scores": [],
+                    "is_successful": None,
+                    "inconclusive": True,
                     "threshold": self.threshold,
                     "reason": reason,
                 },
             )
 
-        except ImportError as e:
-            logger.error(f"[GARAK] Import error - Garak not available: {e}")
-            return MetricResult(
-                score=1.0,  # Max score indicates failure
-                details={
-                    "error": str(e),
-                    "detector": self.detector_class_path,
-                    "is_successful": False,
-                    "threshold": self.threshold,
-                    "reason": "Garak package not available",
-                },
+        max_score = max(raw_scores)
+        logger.debug(f"[GARAK] Scores: {raw_scores}, max={max_score:.4f}")
+
+        is_successful = max_score < self.threshold
+
+        if is_successful:
+            reason = (
+                f"Garak detector score ({max_score:.4f}) < threshold ({self.threshold}). "
+                "Model defended against probe."
             )
-        except Exception as e:
-            logger.error(f"[GARAK] Error running detector: {e}", exc_info=True)
-            return MetricResult(
-                score=1.0,  # Max score indicates failure
-                details={
-                    "error": str(e),
-                    "detector": self.detector_class_path,
-                    "is_successful": False,
-                    "threshold": self.threshold,
-                    "reason": f"Detector evaluation failed: {str(e)}",
-                },
+        else:
+            reason = (
+                f"Garak detector score ({max_score:.4f}) >= threshold ({self.threshold}). "
+                "Potential vulnerability detected."
             )
 
+        logger.info(
+            f"[GARAK] Final: score={max_score:.4f}, is_successful={is_successful}, "
+            f"threshold={self.threshold}, detector={self.detector_class_path.split('.')[-1]}"
+        )
+
+        return MetricResult(
+            score=max_score,
+            details={
+                "detector": self.detector_class_path,
+                "detector_class": self.detector_class_path.split(".")[-1],
+                "raw_scores": raw_scores,
+                "is_successful": is_successful,
+                "inconclusive": False,
+                "threshold": self.threshold,
+                "reason": reason,
+            },
+        )
+
+    def evaluate_batch(
+        self,
+        inputs: Sequence[str],
+        outputs: Sequence[str],
+        notes: Optional[Sequence[Optional[dict]]] = None,
+    ) -> List[MetricResult]:
+        """
+        Evaluate many (input, output) pairs, scoring outputs in chunked detector calls.
+
+        Classifier detectors score all outputs through multi-output attempts;
+        any other detector, and any empty output, is evaluated one by one.
+
+        Args:
+            inputs: The input prompts, one per output
+            outputs: The model responses to evaluate
+            notes: Optional probe notes per output (see :meth:`evaluate`)
+
+        Returns:
+            One MetricResult per output, in order
+        """
+        notes = list(notes) if notes is not None else [None] * len(outputs)
+        results: List[Optional[MetricResult]] = [None] * len(outputs)
+
+        batched: List[int] = []
+        if not self._is_unsupported():
+            try:
+                if _is_batchable(self.detector):
+                    batched = [i for i, output in enumerate(outputs) if output]
+            except ImportError:
+                pass
+
+        if batched:
+            try:
+                scores = _score_outputs(self.detector, [outputs[i] for i in batched])
+                for i, raw_scores in zip(batched, scores):
+                    effective_notes = notes[i] if notes[i] is not None else self._probe_notes
+                    results[i] = self._result_from_scores(raw_scores, effective_notes)
+            except Exception as e:
+                logger.error(f"[GARAK] Error running batched detector: {e}", exc_info=True)
+                for i in batched:
+                    results[i] = self._error_result(e, f"Detector evaluation failed: {str(e)}")
+
+        return [
+            result if result is not None else self.evaluate(input, output, notes=note)
+            for result, input, output, note in zip(results, inputs, outputs, notes)
+        ]
+
     async def a_evaluate(
         self,
         input: str = "",
@@ -346,7 +539,27 @@ class GarakDetectorMetric(BaseMetric):
         notes: Optional[dict] = None,
         **kwargs,
     ) -> MetricResult:
-        """Async evaluate wrapping the sync detector in to_thread."""
+        """Async evaluate.
+
+        Classifier detectors score this output together with whatever other
+        outputs are waiting for the same detector; any other detector runs
+        the sync path in to_thread.
+        """
+        if output and not self._is_unsupported():
+            try:
+                # Loading may build a classifier model; keep it off the loop.
+                detector = await asyncio.to_thread(lambda: self.detector)
+            except ImportError:
+                detector = None
+            if detector is not None and _is_batchable(detector):
+                effective_notes = notes if notes is not None else self._probe_notes
+                try:
+                    raw_scores = await _batcher_for(detector).score(output)
+                except Exception as e:
+                    logger.error(f"[GARAK] Error running batched detector: {e}", exc_info=True)
+                    return self._error_result(e, f"Detector evaluation failed: {str(e)}")
+                return self._result_from_scores(raw_scores, effective_notes)
+
         return await asyncio.to_thread(
             self.evaluate, input, output, expected_output, context, notes, **kwargs
         )
@@ -6,6 +6,7 @@ from rhesis.sdk.services.owasp_extractor import (
 )
 from rhesis.sdk.synthesizers.config_synthesizer import ConfigSynthesizer, GenerationConfig
 from rhesis.sdk.synthesizers.context_synthesizer import ContextSynthesizer
+from rhesis.sdk.synthesizers.dedup import DedupResult, TestDeduplicator
 from rhesis.sdk.synthesizers.multi_turn.base import MultiTurnSynthesizer
 from rhesis.sdk.synthesizers.owasp_synthesizer import OWASPSynthesizer
 from rhesis.sdk.synthesizers.prompt_synthesizer import PromptSynthesizer
@@ -19,6 +20,8 @@ __all__ = [
     "ContextSynthesizer",
     "Synthesizer",
     "OWASPSynthesizer",
+    "TestDeduplicator",
+    "DedupResult",
     "ReportSection",
     "DEFAULT_OWASP_LLM_PDF_URL",
     "DEFAULT_OWASP_AGENTIC_PDF_URL",
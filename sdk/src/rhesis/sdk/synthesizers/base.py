@@ -19,6 +19,7 @@ from rhesis.sdk.synthesizers.utils import (
 if TYPE_CHECKING:
     from rhesis.sdk.services.chunker import ChunkingStrategy
     from rhesis.sdk.services.extractor import SourceSpecification
+    from rhesis.sdk.synthesizers.dedup import TestDeduplicator
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +55,7 @@ class TestSetSynthesizer(ABC):
         sources: Optional[List[SourceSpecification]] = None,
         chunking_strategy: Optional[ChunkingStrategy] = None,
         harmful: bool = False,
+        deduplicator: Optional[TestDeduplicator] = None,
     ):
         """
         Initialize the base synthesizer.
@@ -65,6 +67,8 @@ class TestSetSynthesizer(ABC):
             chunking_strategy: Strategy for chunking source content when using
                 ``sources`` (defaults to RecursiveChunker with 1500 chunk_size
                 on first document-backed generation; not loaded until then)
+            deduplicator: Optional near-duplicate filter applied to the
+                generated tests before the test set is built
         """
         if batch_size < _MIN_BATCH_SIZE:
             raise ValueError(f"batch_size must be >= {_MIN_BATCH_SIZE}, got {batch_size}")
@@ -78,6 +82,7 @@ class TestSetSynthesizer(ABC):
         self.last_error: Optional[str] = None
         # Default RecursiveChunker is applied in _generate_with_sources (lazy import).
         self.chunker = chunking_strategy
+        self.deduplicator = deduplicator
 
         if isinstance(model, str) or model is None:
             self.model = get_model(model)
@@ -505,6 +510,16 @@ class TestSetSynthesizer(ABC):
         else:
             tests = self._generate_without_sources(num_tests, **kwargs)
 
+        if self.deduplicator is not None and tests:
+            tests, dedup_result = self.deduplicator.deduplicate(tests)
+            test_set_metadata["duplicates_removed"] = dedup_result.num_duplicates
+            logger.info(
+                "[Synthesizer] Dropped %d near-duplicate tests (%d lexical, %d semantic)",
+                dedup_result.num_duplicates,
+                dedup_result.lexical_duplicates,
+                dedup_result.semantic_duplicates,
+            )
+
         logger.info(
             "[Synthesizer] Test generation phase complete: %d tests in %.1fs, creating TestSet...",
             len(tests),
@@ -12,6 +12,7 @@ from rhesis.sdk.synthesizers.base import TestSetSynthesizer
 if TYPE_CHECKING:
     from rhesis.sdk.services.chunker import ChunkingStrategy
     from rhesis.sdk.services.extractor import SourceSpecification
+    from rhesis.sdk.synthesizers.dedup import TestDeduplicator
 
 
 class GenerationConfig(BaseModel):
@@ -39,6 +40,7 @@ class ConfigSynthesizer(TestSetSynthesizer):
         sources: Optional[List[SourceSpecification]] = None,
         chunking_strategy: Optional[ChunkingStrategy] = None,
         harmful: bool = False,
+        deduplicator: Optional[TestDeduplicator] = None,
     ):
         """
         Initialize the ConfigSynthesizer.
@@ -49,6 +51,7 @@ class ConfigSynthesizer(TestSetSynthesizer):
             sources: Optional list of source specifications to use
             chunking_strategy: Strategy for chunking source content
             harmful: If True, generate adversarial/harmful test cases
+            deduplicator: Optional near-duplicate filter for generated tests
         """
 
         super().__init__(
@@ -57,6 +60,7 @@ class ConfigSynthesizer(TestSetSynthesizer):
             sources=sources,
             chunking_strategy=chunking_strategy,
             harmful=harmful,
+            deduplicator=deduplicator,
         )
         self.config = config
 
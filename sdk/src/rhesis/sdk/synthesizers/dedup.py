@@ -0,0 +1,256 @@
+"""Near-duplicate detection for generated tests.
+
+Two passes, both linear in the number of tests: each test is compared only
+against at most ``max_candidates`` earlier tests that share a hash bucket
+with it, never against every other test.
+
+1. Lexical: MinHash signatures over character shingles, bucketed with
+   locality-sensitive hashing (LSH bands). Only tests that share a bucket are
+   compared, by estimated Jaccard similarity.
+2. Semantic (optional): embeddings from a ``BaseEmbedder`` (or precomputed
+   vectors), bucketed by random-hyperplane signatures and compared by cosine
+   similarity. Catches paraphrases the lexical pass misses.
+
+Tests are processed in order and only kept tests are indexed, so the first
+occurrence of a duplicate group is always the one kept.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from rhesis.sdk.models.base import BaseEmbedder
+
+# Mersenne prime modulus for the MinHash permutations. Shingle hashes and
+# permutation coefficients stay below 2**32 and 2**31, so a * h + b fits uint64.
+_MERSENNE_PRIME = (1 << 31) - 1
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class DedupResult:
+    """Outcome of a deduplication pass over a sequence of texts."""
+
+    kept: List[int] = field(default_factory=list)
+    # Index of each dropped item -> index of the kept item it duplicates
+    duplicates: Dict[int, int] = field(default_factory=dict)
+    lexical_duplicates: int = 0
+    semantic_duplicates: int = 0
+
+    @property
+    def num_duplicates(self) -> int:
+        return len(self.duplicates)
+
+
+def comparison_text(test: Any) -> str:
+    """Text a test is compared on: its prompt, or its goal for multi-turn tests."""
+    if isinstance(test, dict):
+        prompt = test.get("prompt") or {}
+        content = prompt.get("content") if isinstance(prompt, dict) else None
+        if content:
+            return content
+        config = test.get("test_configuration") or {}
+        return (config.get("goal") if isinstance(config, dict) else None) or ""
+
+    prompt = getattr(test, "prompt", None)
+    if prompt is not None and getattr(prompt, "content", None):
+        return prompt.content
+    config = getattr(test, "test_configuration", None)
+    return (getattr(config, "goal", None) if config is not None else None) or ""
+
+
+class TestDeduplicator:
+    """Drop near-duplicate tests with MinHash/LSH and an optional embedding pass."""
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(
+        self,
+        jaccard_threshold: float = 0.7,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 5,
+        embedder: Optional[BaseEmbedder] = None,
+        cosine_threshold: float = 0.92,
+        hyperplane_bits: int = 10,
+        hyperplane_tables: int = 20,
+        max_candidates: int = 100,
+        seed: int = 1,
+    ):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            jaccard_threshold: Estimated shingle Jaccard similarity at or above
+                which two texts are lexical duplicates
+            num_perm: MinHash signature length (must be divisible by ``bands``)
+            bands: LSH bands; more bands catch lower similarities as candidates
+            shingle_size: Characters per shingle
+            embedder: Optional embedder for the semantic pass
+            cosine_threshold: Cosine similarity at or above which two embeddings
+                are semantic duplicates
+            hyperplane_bits: Random hyperplanes per embedding hash table
+            hyperplane_tables: Embedding hash tables
+            max_candidates: Most indexed items compared against each new item,
+                which bounds the work per item regardless of bucket skew
+            seed: Seed for the MinHash permutations and hyperplanes
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.jaccard_threshold = jaccard_threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.embedder = embedder
+        self.cosine_threshold = cosine_threshold
+        self.hyperplane_bits = hyperplane_bits
+        self.hyperplane_tables = hyperplane_tables
+        self.max_candidates = max_candidates
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        self._perm_a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._perm_b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    # -- lexical pass -----------------------------------------------------------
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        normalized = _WHITESPACE.sub(" ", text.lower()).strip()
+        k = self.shingle_size
+        if len(normalized) <= k:
+            shingles = {normalized}
+        else:
+            shingles = {normalized[i : i + k] for i in range(len(normalized) - k + 1)}
+        return np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+        )
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature of *text* (``num_perm`` values)."""
+        hashes = self._shingle_hashes(text)[:, None]
+        permuted = (self._perm_a * hashes + self._perm_b) % np.uint64(_MERSENNE_PRIME)
+        return permuted.min(axis=0)
+
+    def _candidates(self, buckets: List[Dict[Any, List[int]]], keys: Sequence[Any]) -> List[int]:
+        """Indexed items sharing a bucket with *keys*, most shared buckets first."""
+        counts: Counter = Counter()
+        for table, key in enumerate(keys):
+            counts.update(buckets[table].get(key, ()))
+        return [other for other, _ in counts.most_common(self.max_candidates)]
+
+    def _lexical_pass(self, texts: Sequence[str], result: DedupResult) -> List[int]:
+        rows = self.num_perm // self.bands
+        buckets: List[Dict[bytes, List[int]]] = [defaultdict(list) for _ in range(self.bands)]
+        signatures: Dict[int, np.ndarray] = {}
+        kept: List[int] = []
+
+        for index, text in enumerate(texts):
+            sig = self.signature(text)
+            keys = [sig[b * rows : (b + 1) * rows].tobytes() for b in range(self.bands)]
+
+            candidates = self._candidates(buckets, keys)
+            if candidates:
+                similarities = (np.stack([signatures[c] for c in candidates]) == sig).mean(axis=1)
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.jaccard_threshold:
+                    result.duplicates[index] = candidates[best]
+                    result.lexical_duplicates += 1
+                    continue
+
+            signatures[index] = sig
+            for band, key in enumerate(keys):
+                buckets[band][key].append(index)
+            kept.append(index)
+        return kept
+
+    # -- semantic pass ----------------------------------------------------------
+
+    def _semantic_pass(
+        self, indices: List[int], embeddings: np.ndarray, result: DedupResult
+    ) -> List[int]:
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        unit = embeddings / np.where(norms == 0, 1.0, norms)
+
+        rng = np.random.default_rng(self.seed)
+        planes = rng.standard_normal(
+            (self.hyperplane_tables, self.hyperplane_bits, embeddings.shape[1])
+        )
+        # One bucket key per table, built from the signs against its hyperplanes
+        bits = np.einsum("tbd,nd->ntb", planes, unit) > 0
+        keys = bits.dot(1 << np.arange(self.hyperplane_bits)).tolist()
+
+        tables: List[Dict[int, List[int]]] = [
+            defaultdict(list) for _ in range(self.hyperplane_tables)
+        ]
+        kept: List[int] = []
+        for position, index in enumerate(indices):
+            candidates = self._candidates(tables, keys[position])
+            if candidates:
+                similarities = unit[candidates] @ unit[position]
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.cosine_threshold:
+                    result.duplicates[index] = indices[candidates[best]]
+                    result.semantic_duplicates += 1
+                    continue
+
+            for table, key in enumerate(keys[position]):
+                tables[table][key].append(position)
+            kept.append(index)
+        return kept
+
+    # -- public API -------------------------------------------------------------
+
+    def find_duplicates(
+        self,
+        texts: Sequence[str],
+        embeddings: Optional[Sequence[Optional[Sequence[float]]]] = None,
+    ) -> DedupResult:
+        """
+        Find near-duplicates in *texts*, keeping the first of each group.
+
+        Args:
+            texts: Texts to compare
+            embeddings: Optional precomputed embeddings aligned with *texts*
+                (``None`` entries skip the semantic pass for that text). When
+                omitted and an embedder is configured, texts that survive the
+                lexical pass are embedded with it.
+
+        Returns:
+            DedupResult with kept indices and a duplicate -> kept mapping
+        """
+        result = DedupResult()
+        kept = self._lexical_pass(texts, result)
+
+        if embeddings is None and self.embedder is not None and kept:
+            vectors = self.embedder.generate_batch([texts[i] for i in kept])
+            embeddings_by_index = dict(zip(kept, vectors))
+        elif embeddings is not None:
+            embeddings_by_index = {i: embeddings[i] for i in kept}
+        else:
+            embeddings_by_index = {}
+
+        embedded = [i for i in kept if embeddings_by_index.get(i) is not None]
+        if len(embedded) > 1:
+            matrix = np.asarray([embeddings_by_index[i] for i in embedded], dtype=np.float64)
+            survivors = set(self._semantic_pass(embedded, matrix, result))
+            kept = [i for i in kept if i in survivors or i not in result.duplicates]
+
+        result.kept = kept
+        return result
+
+    def deduplicate(self, tests: Sequence[Any]) -> Tuple[List[Any], DedupResult]:
+        """
+        Drop near-duplicate tests (SDK ``Test`` objects or test dicts).
+
+        Returns:
+            Tuple of (kept tests in their original order, DedupResult)
+        """
+        result = self.find_duplicates([comparison_text(test) for test in tests])
+        return [tests[i] for i in result.kept], result
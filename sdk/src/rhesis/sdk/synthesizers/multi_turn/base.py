@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Union
 
 from jinja2 import Environment, FileSystemLoader, Template
 from pydantic import BaseModel, Field
@@ -12,6 +12,9 @@ from rhesis.sdk.models import get_model
 from rhesis.sdk.models.base import BaseLLM
 from rhesis.sdk.synthesizers.utils import create_test_set, stamp_multi_turn
 
+if TYPE_CHECKING:
+    from rhesis.sdk.synthesizers.dedup import TestDeduplicator
+
 logger = logging.getLogger(__name__)
 
 # A batch failing this many times in a row (bad/error LLM response) gives up
@@ -67,10 +70,13 @@ class MultiTurnSynthesizer:
         model: Optional[Union[str, BaseLLM]] = None,
         batch_size: int = 10,
         harmful: bool = False,
+        deduplicator: Optional["TestDeduplicator"] = None,
     ):
         self.config = config
         self.batch_size = batch_size
         self.harmful = harmful
+        # Optional near-duplicate filter; multi-turn tests are compared on their goal
+        self.deduplicator = deduplicator
         self.last_error: Optional[str] = None
 
         if isinstance(model, str) or model is None:
@@ -201,6 +207,17 @@ class MultiTurnSynthesizer:
             reason = f": {self.last_error}" if self.last_error else ""
             raise ValueError(f"Failed to generate any valid test cases{reason}")
 
+        test_set_metadata = {}
+        if self.deduplicator is not None:
+            all_tests, dedup_result = self.deduplicator.deduplicate(all_tests)
+            test_set_metadata["duplicates_removed"] = dedup_result.num_duplicates
+            logger.info(
+                "[MultiTurnSynthesizer] Dropped %d near-duplicate tests (%d lexical, %d semantic)",
+                dedup_result.num_duplicates,
+                dedup_result.lexical_duplicates,
+                dedup_result.semantic_duplicates,
+            )
+
         test_set = create_test_set(
             tests=all_tests,
             model=self.model,
@@ -209,6 +226,7 @@ class MultiTurnSynthesizer:
             num_tests=len(all_tests),
             requested_tests=num_tests,
             generation_prompt=self.config.generation_prompt,
+            **test_set_metadata,
         )
 
         return stamp_multi_turn(test_set)
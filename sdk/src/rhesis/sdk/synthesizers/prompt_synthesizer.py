@@ -10,6 +10,7 @@ from rhesis.sdk.synthesizers.base import TestSetSynthesizer
 if TYPE_CHECKING:
     from rhesis.sdk.services.chunker import ChunkingStrategy
     from rhesis.sdk.services.extractor import SourceSpecification
+    from rhesis.sdk.synthesizers.dedup import TestDeduplicator
 
 
 class PromptSynthesizer(TestSetSynthesizer):
@@ -25,6 +26,7 @@ class PromptSynthesizer(TestSetSynthesizer):
         model: Optional[Union[str, BaseLLM]] = None,
         chunking_strategy: Optional[ChunkingStrategy] = None,
         harmful: bool = False,
+        deduplicator: Optional[TestDeduplicator] = None,
     ):
         """
         Initialize the prompt synthesizer.
@@ -34,6 +36,7 @@ class PromptSynthesizer(TestSetSynthesizer):
             sources: Optional list of source specifications to use
             model: The model to use for generation
             chunking_strategy: Strategy for chunking source content
+            deduplicator: Optional near-duplicate filter for generated tests
         """
 
         super().__init__(
@@ -42,6 +45,7 @@ class PromptSynthesizer(TestSetSynthesizer):
             sources=sources,
             chunking_strategy=chunking_strategy,
             harmful=harmful,
+            deduplicator=deduplicator,
         )
         self.prompt = prompt
 
@@ -10,6 +10,7 @@ from rhesis.sdk.synthesizers.base import TestSetSynthesizer
 if TYPE_CHECKING:
     from rhesis.sdk.services.chunker import ChunkingStrategy
     from rhesis.sdk.services.extractor import SourceSpecification
+    from rhesis.sdk.synthesizers.dedup import TestDeduplicator
 
 
 class Synthesizer(TestSetSynthesizer):
@@ -28,6 +29,7 @@ class Synthesizer(TestSetSynthesizer):
         model: Optional[Union[str, BaseLLM]] = None,
         chunking_strategy: Optional[ChunkingStrategy] = None,
         harmful: bool = False,
+        deduplicator: Optional[TestDeduplicator] = None,
     ):
         """
         Initialize the synthesizer.
@@ -41,6 +43,7 @@ class Synthesizer(TestSetSynthesizer):
             model: The model to use for generation
             chunking_strategy: Strategy for chunking source content
             harmful: If True, generate adversarial/harmful test cases
+            deduplicator: Optional near-duplicate filter for generated tests
         """
 
         super().__init__(
@@ -49,6 +52,7 @@ class Synthesizer(TestSetSynthesizer):
             sources=sources,
             chunking_strategy=chunking_strategy,
             harmful=harmful,
+            deduplicator=deduplicator,
         )
         self.prompt = prompt
         self.requirements = requirements
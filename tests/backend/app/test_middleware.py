@@ -0,0 +1,135 @@
+"""Tests for the pure ASGI middleware stack and the orjson default response."""
+
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.datastructures import Default
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from rhesis.backend.app.middleware import (
+    CompressionMiddleware,
+    HTTPSRedirectMiddleware,
+    SecurityHeadersMiddleware,
+    compression,
+)
+from rhesis.backend.app.middleware.compression import compress, negotiate_encoding
+from rhesis.backend.app.utils.responses import ORJSONResponse
+
+LARGE = [{"id": i, "name": f"item-{i}"} for i in range(200)]
+
+
+def _app(**compression) -> FastAPI:
+    app = FastAPI(default_response_class=Default(ORJSONResponse))
+
+    @app.get("/large")
+    def large():
+        return LARGE
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((b"x" * 2048 for _ in range(3)), media_type="text/plain")
+
+    app.add_middleware(HTTPSRedirectMiddleware)
+    app.add_middleware(CompressionMiddleware, **compression)
+    app.add_middleware(SecurityHeadersMiddleware)
+    return app
+
+
+@pytest.fixture
+def client():
+    return TestClient(_app())
+
+
+class TestCompressionMiddleware:
+    def test_compresses_large_json_with_gzip(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in response.headers["vary"].lower()
+        # httpx decodes the body; the length header is the compressed size
+        assert response.json() == LARGE
+        assert int(response.headers["content-length"]) < len(json.dumps(LARGE))
+
+    def test_small_response_is_not_compressed(self, client):
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"ok": True}
+
+    def test_no_accept_encoding_is_not_compressed(self, client):
+        response = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == LARGE
+
+    def test_streaming_response_passes_through(self, client):
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.content == b"x" * 2048 * 3
+
+    def test_minimum_size_is_configurable(self):
+        client = TestClient(_app(minimum_size=1))
+
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+
+    @pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+    def test_compress_round_trips(self, encoding):
+        body = json.dumps(LARGE).encode()
+        if encoding == "zstd":
+            zstandard = pytest.importorskip("zstandard")
+            decompress = zstandard.ZstdDecompressor().decompress
+        else:
+            decompress = gzip.decompress
+
+        assert decompress(compress(body, encoding)) == body
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("gzip, deflate, br", "gzip"),
+            ("gzip;q=0", None),
+            ("br", None),
+            ("", None),
+        ],
+    )
+    def test_negotiate_encoding_without_zstd(self, monkeypatch, header, expected):
+        monkeypatch.setattr(compression, "zstandard", None)
+
+        assert negotiate_encoding(header) == expected
+
+    def test_zstd_preferred_when_available(self):
+        pytest.importorskip("zstandard")
+
+        assert negotiate_encoding("gzip, zstd") == "zstd"
+
+
+class TestSecurityHeadersMiddleware:
+    def test_sets_security_headers(self, client):
+        response = client.get("/small")
+
+        assert response.headers["x-frame-options"] == "DENY"
+        assert response.headers["x-content-type-options"] == "nosniff"
+        assert "strict-transport-security" not in response.headers
+
+    def test_hsts_uses_forwarded_proto(self, client):
+        response = client.get("/small", headers={"X-Forwarded-Proto": "https"})
+
+        assert response.headers["strict-transport-security"].startswith("max-age=")
+
+
+class TestORJSONResponse:
+    def test_renders_compact_json_with_non_string_keys(self):
+        response = ORJSONResponse({1: "a", "b": [1.5, None]})
+
+        assert response.body == b'{"1":"a","b":[1.5,null]}'
+        assert response.media_type == "application/json"
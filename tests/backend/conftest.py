@@ -92,6 +92,20 @@ _TEST_ENV_VARS = {
     # thread and the concurrent pile-up would hang the suite. See the guard in
     # app/main.py's lifespan for the full rationale.
     "RHESIS_SKIP_GARAK_WARM_CACHE": "true",
+    # Enumerate Garak probes in-process: tests patch the enumeration methods
+    # on the service, which spawned pool workers would never see.
+    "GARAK_ENUMERATION_WORKERS": "0",
+    # Every test's writes are rolled back at teardown without a commit, so the
+    # insights result cache generation is never bumped for them and a cached
+    # result would leak into the next test of the same org. Result-cache tests
+    # re-enable it themselves. Likewise, insights batches run on the test
+    # session: concurrent ones would open sessions that can't see its
+    # uncommitted fixtures.
+    "RHESIS_DISABLE_INSIGHTS_RESULT_CACHE": "true",
+    "INSIGHTS_QUERY_CONCURRENCY": "1",
+    # Queue usage accruals immediately rather than buffering them on a
+    # background thread, so tests can assert on what was dispatched.
+    "USAGE_ACCRUAL_FLUSH_INTERVAL": "0",
     "RHESIS_LICENSE_PUBLIC_KEY": _LICENSE_TEST_PUBLIC_KEY_PEM,
     "RHESIS_LICENSE": _LICENSE_TEST_TOKEN,
     "LITELLM_LOCAL_MODEL_COST_MAP": "true",
@@ -0,0 +1,193 @@
+"""Tests for the batch-scoped metric instance pool.
+
+Instances are checked out, never shared: a test holds its instances until
+its evaluation finishes, and only then can another test reuse them.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from rhesis.backend.metrics.metric_pool import MetricPool, metric_pool_key
+from rhesis.backend.metrics.strategies.local import LocalStrategy, prepare_metrics
+from rhesis.sdk.metrics import MetricConfig, MetricResult
+
+
+def _config(name="relevancy", **parameters):
+    return MetricConfig(
+        class_name="RhesisPromptMetric",
+        backend="rhesis",
+        name=name,
+        threshold=0.5,
+        parameters=parameters,
+    )
+
+
+def _fake_metric(*args, **kwargs):
+    metric = MagicMock(name="metric")
+    metric.name = "relevancy"
+    metric.requires_ground_truth = False
+    metric.evaluate.return_value = MetricResult(score=1.0, details={"reason": "ok"})
+
+    async def a_evaluate(**_):
+        return MetricResult(score=1.0, details={"reason": "ok"})
+
+    metric.a_evaluate = a_evaluate
+    return metric
+
+
+class TestMetricPool:
+    def test_reuses_a_released_instance(self):
+        pool = MetricPool()
+        factory = MagicMock(side_effect=lambda: object())
+
+        first = pool.acquire(("k",), factory)
+        pool.release(first)
+        second = pool.acquire(("k",), factory)
+
+        assert second is first
+        assert factory.call_count == 1
+        stats = pool.stats()
+        assert (stats.constructed, stats.reused) == (1, 1)
+
+    def test_never_hands_out_a_checked_out_instance(self):
+        pool = MetricPool()
+
+        first = pool.acquire(("k",), object)
+        second = pool.acquire(("k",), object)
+
+        assert second is not first
+        assert pool.stats().constructed == 2
+
+    def test_saved_time_is_reuses_times_average_construction(self):
+        pool = MetricPool()
+        metric = pool.acquire(("k",), object)
+        pool._stats.construction_seconds = 0.2
+        for _ in range(3):
+            pool.release(metric)
+            metric = pool.acquire(("k",), object)
+
+        assert round(pool.stats().saved_seconds, 6) == 0.6
+
+    def test_key_distinguishes_parameters_and_model_identity(self):
+        class Judge:
+            PROVIDER = "openai"
+
+            def __init__(self, model_name, api_key="key-1"):
+                self.model_name = model_name
+                self.api_key = api_key
+
+        base = {"threshold": 0.5, "model": Judge("gpt-4o")}
+
+        assert metric_pool_key("rhesis", "M", base) == metric_pool_key("rhesis", "M", dict(base))
+        assert metric_pool_key("rhesis", "M", base) != metric_pool_key(
+            "rhesis", "M", {**base, "probe_notes": "x"}
+        )
+        assert metric_pool_key("rhesis", "M", base) != metric_pool_key(
+            "rhesis", "M", {**base, "model": Judge("gpt-4o-mini")}
+        )
+        assert metric_pool_key("rhesis", "M", base) != metric_pool_key(
+            "rhesis", "M", {**base, "model": Judge("gpt-4o", api_key="key-2")}
+        )
+
+    def test_equal_models_resolved_separately_share_a_key(self):
+        class Judge:
+            PROVIDER = "openai"
+            model_name = "gpt-4o"
+
+        assert metric_pool_key("rhesis", "M", {"model": Judge()}) == metric_pool_key(
+            "rhesis", "M", {"model": Judge()}
+        )
+
+
+class TestPooledEvaluation:
+    def test_prepare_metrics_constructs_once_across_tests(self):
+        pool = MetricPool()
+        with patch("rhesis.sdk.metrics.MetricFactory.create", side_effect=_fake_metric) as create:
+            for _ in range(3):
+                ((_, metric, _, _),) = prepare_metrics([_config()], "expected", metric_pool=pool)
+                pool.release(metric)
+
+        assert create.call_count == 1
+        assert pool.stats().reused == 2
+
+    def test_skipped_metric_goes_back_to_the_pool(self):
+        pool = MetricPool()
+
+        def needs_ground_truth(*args, **kwargs):
+            metric = _fake_metric()
+            metric.requires_ground_truth = True
+            return metric
+
+        with patch(
+            "rhesis.sdk.metrics.MetricFactory.create", side_effect=needs_ground_truth
+        ) as create:
+            assert prepare_metrics([_config()], None, metric_pool=pool) == []
+            assert prepare_metrics([_config()], None, metric_pool=pool) == []
+
+        assert create.call_count == 1
+
+    def test_sync_and_async_evaluation_release_their_instances(self):
+        pool = MetricPool()
+        strategy = LocalStrategy(metric_pool=pool)
+
+        with patch("rhesis.sdk.metrics.MetricFactory.create", side_effect=_fake_metric) as create:
+            sync = strategy.evaluate([_config()], "in", "out", "expected", [])
+            async_ = asyncio.run(strategy.a_evaluate([_config()], "in", "out", "expected", []))
+
+        assert sync["relevancy"]["score"] == 1.0
+        assert async_["relevancy"]["score"] == 1.0
+        assert create.call_count == 1
+
+    def test_sync_evaluation_cancelled_before_start_releases_its_instance(self):
+        pool = MetricPool()
+        strategy = LocalStrategy(metric_pool=pool)
+        metric = pool.acquire(("k",), _fake_metric)
+        config = _config()
+        release_worker = threading.Event()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(release_worker.wait, 5)  # keeps the only worker busy
+            futures = strategy._submit_metric_evaluations(
+                executor,
+                [("RhesisPromptMetric", metric, config, "rhesis")],
+                ["relevancy"],
+                "in",
+                "out",
+                "expected",
+                [],
+            )
+            for future in futures:
+                assert future.cancel()
+            release_worker.set()
+
+        assert pool.acquire(("k",), _fake_metric) is metric
+
+    def test_failed_async_evaluation_releases_its_instance(self):
+        pool = MetricPool()
+        strategy = LocalStrategy(metric_pool=pool)
+
+        with (
+            patch("rhesis.sdk.metrics.MetricFactory.create", side_effect=_fake_metric) as create,
+            patch.object(LocalStrategy, "_a_eval_one_with_retry", side_effect=RuntimeError("boom")),
+        ):
+            asyncio.run(strategy.a_evaluate([_config()], "in", "out", "expected", []))
+            asyncio.run(strategy.a_evaluate([_config()], "in", "out", "expected", []))
+
+        assert create.call_count == 1
+        assert pool.stats().reused == 1
+
+    def test_metric_failing_after_checkout_goes_back_to_the_pool(self):
+        pool = MetricPool()
+
+        def broken(*args, **kwargs):
+            metric = _fake_metric()
+            type(metric).requires_ground_truth = PropertyMock(side_effect=RuntimeError("boom"))
+            return metric
+
+        with patch("rhesis.sdk.metrics.MetricFactory.create", side_effect=broken) as create:
+            assert prepare_metrics([_config()], "expected", metric_pool=pool) == []
+            assert prepare_metrics([_config()], "expected", metric_pool=pool) == []
+
+        assert create.call_count == 1
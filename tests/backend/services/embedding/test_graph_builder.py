@@ -9,9 +9,13 @@ import pytest
 from rhesis.backend.app.models.test import Test
 from rhesis.backend.app.services.embedding import graph_builder
 from rhesis.backend.app.services.embedding.graph_builder import (
+    GraphModel,
+    _fit_reducer,
     _generate_cluster_labels,
-    _reduce_dimensions,
     build_2d_graph,
+    load_graph_model,
+    refresh_2d_graph,
+    save_graph_model,
 )
 from rhesis.backend.app.utils.model_errors import ModelConfigurationError
 
@@ -73,11 +77,11 @@ class TestGenerateClusterLabels:
 
 
 @pytest.mark.unit
-class TestReduceDimensions:
+class TestFitReducer:
     def test_invalid_purpose_raises(self):
         X = np.array([[0.0, 1.0], [1.0, 0.0], [0.5, 0.5]])
         with pytest.raises(ValueError, match="Invalid purpose"):
-            _reduce_dimensions(X, purpose="other")
+            _fit_reducer(X, purpose="other")
 
 
 @pytest.mark.unit
@@ -146,8 +150,8 @@ class TestBuild2DGraph:
         assert all(p.cluster_index == -1 for p in graph.points)
 
     @patch.object(graph_builder, "_generate_cluster_labels")
-    @patch.object(graph_builder, "_cluster_with_hdbscan")
-    @patch.object(graph_builder, "_reduce_dimensions")
+    @patch.object(graph_builder, "_fit_clusterer")
+    @patch.object(graph_builder, "_fit_reducer")
     def test_three_plus_points_pipeline(
         self,
         mock_reduce,
@@ -170,11 +174,8 @@ class TestBuild2DGraph:
             dtype=np.float64,
         )
         umap_2 = np.array([[0.0, 0.0], [2.0, 0.0], [1.0, 3.0]], dtype=np.float64)
-        mock_reduce.side_effect = [umap_50, umap_2]
-        mock_cluster.return_value = (
-            np.array([0, 0, -1]),
-            {0: np.array([0.33, 0.33, 0.15])},
-        )
+        mock_reduce.side_effect = [MagicMock(embedding_=umap_50), MagicMock(embedding_=umap_2)]
+        mock_cluster.return_value = MagicMock(labels_=np.array([0, 0, -1]))
         mock_labels.return_value = {0: "Alpha"}
 
         with patch.object(graph_builder, "fetch_embeddings", return_value=embs):
@@ -197,8 +198,8 @@ class TestBuild2DGraph:
         assert graph.clusters[0].size == 2
 
     @patch.object(graph_builder, "get_user_generation_model")
-    @patch.object(graph_builder, "_cluster_with_hdbscan")
-    @patch.object(graph_builder, "_reduce_dimensions")
+    @patch.object(graph_builder, "_fit_clusterer")
+    @patch.object(graph_builder, "_fit_reducer")
     def test_graph_uses_unlabeled_when_label_model_unavailable(
         self,
         mock_reduce,
@@ -221,11 +222,8 @@ class TestBuild2DGraph:
             dtype=np.float64,
         )
         umap_2 = np.array([[0.0, 0.0], [2.0, 0.0], [1.0, 3.0]], dtype=np.float64)
-        mock_reduce.side_effect = [umap_50, umap_2]
-        mock_cluster.return_value = (
-            np.array([0, 0, -1]),
-            {0: np.array([0.33, 0.33, 0.15])},
-        )
+        mock_reduce.side_effect = [MagicMock(embedding_=umap_50), MagicMock(embedding_=umap_2)]
+        mock_cluster.return_value = MagicMock(labels_=np.array([0, 0, -1]))
 
         with patch.object(graph_builder, "fetch_embeddings", return_value=embs):
             graph = build_2d_graph(test_db, uids, user)
@@ -235,3 +233,186 @@ class TestBuild2DGraph:
         assert len(graph.clusters) == 1
         assert graph.clusters[0].label == "Unlabeled"
         assert graph.clusters[0].size == 2
+
+
+def _fitted_model(embeddings: list[MagicMock], **overrides) -> GraphModel:
+    """A model as if fitted on *embeddings*: all in cluster 0, laid out along x."""
+    defaults = dict(
+        config_hash="cfg-a",
+        reducer=MagicMock(),
+        reducer_2d=MagicMock(),
+        clusterer=MagicMock(),
+        labels={0: "Alpha"},
+        fitted_ids=frozenset(e.id for e in embeddings),
+        noise_rate=0.0,
+        points={e.id: (0, float(i), 0.0) for i, e in enumerate(embeddings)},
+    )
+    defaults.update(overrides)
+    return GraphModel(**defaults)
+
+
+@pytest.mark.unit
+class TestRefresh2DGraph:
+    def _refresh(self, embeddings, model):
+        user = _mock_user("org", "user")
+        with patch.object(graph_builder, "fetch_embeddings", return_value=embeddings):
+            return refresh_2d_graph(
+                MagicMock(), [e.entity_id for e in embeddings], user, model=model
+            )
+
+    @patch.object(graph_builder, "_generate_cluster_labels")
+    @patch.object(graph_builder, "_fit_reducer")
+    @patch.object(graph_builder, "_predict_clusters")
+    def test_projects_new_points_into_stored_model(self, mock_predict, mock_fit, mock_labels):
+        fitted = [_mock_embedding() for _ in range(10)]
+        new = _mock_embedding(searchable_text="new")
+        model = _fitted_model(fitted)
+        fitted_at = model.updated_at
+        model.reducer.transform.return_value = np.array([[0.1, 0.2, 0.3]], dtype=np.float32)
+        model.reducer_2d.transform.return_value = np.array([[5.0, 6.0]], dtype=np.float32)
+        mock_predict.return_value = np.array([0])
+
+        graph, returned = self._refresh(fitted + [new], model)
+
+        mock_fit.assert_not_called()
+        mock_labels.assert_not_called()
+        assert returned is model
+        assert returned.updated_at != fitted_at
+        assert model.reducer.transform.call_args[0][0].shape == (1, 3)
+        by_id = {p.embedding_id: p for p in graph.points}
+        assert (by_id[new.id].x, by_id[new.id].y, by_id[new.id].cluster_index) == (5.0, 6.0, 0)
+        assert by_id[fitted[3].id].x == 3.0
+        assert [(c.label, c.size) for c in graph.clusters] == [("Alpha", 11)]
+
+    @patch.object(graph_builder, "_predict_clusters")
+    def test_unchanged_points_reuse_layout(self, mock_predict):
+        fitted = [_mock_embedding() for _ in range(5)]
+        model = _fitted_model(fitted)
+        fitted_at = model.updated_at
+
+        graph, returned = self._refresh(fitted, model)
+
+        mock_predict.assert_not_called()
+        model.reducer.transform.assert_not_called()
+        assert returned.updated_at == fitted_at
+        assert sorted(p.x for p in graph.points) == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    @patch.object(graph_builder, "_fit_graph")
+    def test_refits_past_size_threshold(self, mock_fit_graph):
+        fitted = [_mock_embedding() for _ in range(10)]
+        # 3 added + 1 removed > 20% of 10
+        embeddings = fitted[1:] + [_mock_embedding() for _ in range(3)]
+        model = _fitted_model(fitted)
+        mock_fit_graph.return_value = ("graph", "new-model")
+
+        with patch.object(graph_builder, "GRAPH_REFIT_FRACTION", 0.2):
+            result = self._refresh(embeddings, model)
+
+        assert result == ("graph", "new-model")
+        model.reducer.transform.assert_not_called()
+
+    @patch.object(graph_builder, "_fit_graph")
+    @patch.object(graph_builder, "_predict_clusters")
+    def test_refits_when_new_points_fall_outside_clusters(self, mock_predict, mock_fit_graph):
+        fitted = [_mock_embedding() for _ in range(10)]
+        new = _mock_embedding()
+        model = _fitted_model(fitted, noise_rate=0.1)
+        model.reducer.transform.return_value = np.zeros((1, 3), dtype=np.float32)
+        model.reducer_2d.transform.return_value = np.zeros((1, 2), dtype=np.float32)
+        mock_predict.return_value = np.array([-1])
+        mock_fit_graph.return_value = ("graph", "new-model")
+
+        with patch.object(graph_builder, "GRAPH_DRIFT_MIN_POINTS", 1):
+            result = self._refresh(fitted + [new], model)
+
+        assert result == ("graph", "new-model")
+
+    @patch.object(graph_builder, "_fit_graph")
+    def test_refits_when_embedding_config_changes(self, mock_fit_graph):
+        fitted = [_mock_embedding() for _ in range(5)]
+        mock_fit_graph.return_value = ("graph", "new-model")
+
+        result = self._refresh(fitted, _fitted_model(fitted, config_hash="cfg-old"))
+
+        assert result == ("graph", "new-model")
+
+    @patch.object(graph_builder, "_generate_cluster_labels", return_value={0: "Alpha"})
+    @patch.object(graph_builder, "_fit_clusterer")
+    @patch.object(graph_builder, "_fit_reducer")
+    def test_full_fit_returns_model_for_next_refresh(self, mock_reduce, mock_cluster, _labels):
+        embeddings = [_mock_embedding(vector=[float(i)] * 8) for i in range(4)]
+        umap_2 = np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 0.0], [3.0, 0.0]])
+        mock_reduce.return_value = MagicMock(embedding_=umap_2)
+        mock_cluster.return_value = MagicMock(labels_=np.array([0, 0, 0, -1]))
+
+        with patch.object(graph_builder, "GRAPH_MODEL_MIN_POINTS", 4):
+            graph, model = self._refresh(embeddings, None)
+
+        # The clustering space is already 2D, so there is no second reducer
+        assert mock_reduce.call_count == 1
+        assert model.reducer_2d is None
+        assert model.fitted_ids == {e.id for e in embeddings}
+        assert model.noise_rate == 0.25
+        assert model.points[embeddings[3].id] == (-1, 3.0, 0.0)
+        assert len(graph.points) == 4
+
+    @patch.object(graph_builder, "_generate_cluster_labels", return_value={})
+    @patch.object(graph_builder, "_fit_clusterer")
+    @patch.object(graph_builder, "_fit_reducer")
+    def test_small_graph_keeps_no_model(self, mock_reduce, mock_cluster, _labels):
+        embeddings = [_mock_embedding(vector=[float(i)] * 8) for i in range(3)]
+        mock_reduce.return_value = MagicMock(embedding_=np.zeros((3, 2)))
+        mock_cluster.return_value = MagicMock(labels_=np.array([-1, -1, -1]))
+
+        _graph, model = self._refresh(embeddings, None)
+
+        assert model is None
+
+
+@pytest.mark.unit
+class TestGraphModelStorage:
+    def _storage(self):
+        objects = {}
+        storage = MagicMock()
+        storage.get_object_bytes.side_effect = objects.get
+        storage.put_object_bytes.side_effect = lambda content, path, _type: objects.update(
+            {path: content}
+        )
+        return storage, objects
+
+    def test_round_trip(self):
+        storage, _objects = self._storage()
+        point_id = uuid.uuid4()
+        model = GraphModel(
+            config_hash="cfg-a",
+            reducer=None,
+            reducer_2d=None,
+            clusterer=None,
+            labels={0: "Alpha"},
+            fitted_ids=frozenset({point_id}),
+            noise_rate=0.0,
+            points={point_id: (0, 1.0, 2.0)},
+        )
+
+        with patch.object(graph_builder, "_get_storage", return_value=storage):
+            save_graph_model("graphs/a.pkl", model)
+            loaded = load_graph_model("graphs/a.pkl")
+
+        assert loaded == model
+
+    def test_missing_or_corrupt_model_loads_as_none(self):
+        storage, objects = self._storage()
+        objects["graphs/bad.pkl"] = b"not a pickle"
+
+        with patch.object(graph_builder, "_get_storage", return_value=storage):
+            assert load_graph_model("graphs/none.pkl") is None
+            assert load_graph_model("graphs/bad.pkl") is None
+
+    def test_save_failure_is_swallowed(self):
+        storage = MagicMock()
+        storage.put_object_bytes.side_effect = OSError("bucket unavailable")
+
+        with patch.object(graph_builder, "_get_storage", return_value=storage):
+            save_graph_model(
+                "graphs/a.pkl", GraphModel("cfg", None, None, None, {}, frozenset(), 0)
+            )
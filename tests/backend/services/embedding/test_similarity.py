@@ -0,0 +1,142 @@
+"""Tests for embedding nearest-neighbour search (IVF fallback and similarity service)."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from rhesis.backend.app.services.embedding import similarity
+from rhesis.backend.app.services.embedding.ivf import IVFIndex
+from rhesis.backend.app.services.embedding.similarity import find_similar_embeddings
+
+
+def _clustered(n: int, dim: int, clusters: int = 40, seed: int = 0) -> np.ndarray:
+    """Embedding-like data: points scattered around a number of topics."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    return centers[rng.integers(0, clusters, n)] + rng.normal(scale=0.6, size=(n, dim))
+
+
+def _exact(vectors: np.ndarray, query: np.ndarray, k: int) -> list[int]:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = unit @ (query / np.linalg.norm(query))
+    return np.argsort(-scores)[:k].tolist()
+
+
+@pytest.mark.unit
+class TestIVFIndex:
+    def test_recall_against_exact_search(self):
+        vectors = _clustered(3000, 64)
+        index = IVFIndex(vectors)
+        rng = np.random.default_rng(1)
+        queries = vectors[rng.choice(len(vectors), 50)] + rng.normal(scale=0.3, size=(50, 64))
+
+        recall = np.mean(
+            [
+                len({i for i, _ in index.search(q, 10)} & set(_exact(vectors, q, 10))) / 10
+                for q in queries
+            ]
+        )
+
+        assert index.n_lists > 1
+        assert index.n_probe < index.n_lists
+        assert recall >= 0.95
+
+    def test_probing_every_list_is_exact(self):
+        vectors = _clustered(1000, 16)
+        index = IVFIndex(vectors, n_lists=20)
+        query = vectors[0] + 0.1
+
+        got = [i for i, _ in index.search(query, 10, n_probe=20)]
+
+        assert got == _exact(vectors, query, 10)
+
+    def test_small_inputs_use_a_single_list(self):
+        vectors = _clustered(50, 8)
+        index = IVFIndex(vectors)
+
+        assert index.n_lists == 1
+        assert [i for i, _ in index.search(vectors[3], 5)] == _exact(vectors, vectors[3], 5)
+
+    def test_returns_ids_and_cosine_similarity(self):
+        index = IVFIndex([[1.0, 0.0], [0.0, 2.0], [1.0, 1.0]], ids=["a", "b", "c"])
+
+        results = index.search([2.0, 0.0], k=5)
+
+        assert [i for i, _ in results] == ["a", "c", "b"]
+        assert results[0][1] == pytest.approx(1.0)
+        assert results[1][1] == pytest.approx(np.sqrt(0.5))
+        assert results[2][1] == pytest.approx(0.0)
+
+    def test_empty_index(self):
+        assert IVFIndex(np.zeros((0, 4))).search([1, 0, 0, 0], 3) == []
+
+    def test_mismatched_ids_raise(self):
+        with pytest.raises(ValueError):
+            IVFIndex([[1.0, 0.0]], ids=["a", "b"])
+
+
+class _Candidates:
+    """Stands in for the candidate-rows query the fallback reads."""
+
+    def __init__(self, entity_ids, vectors, version=(0, None)):
+        self.rows = list(zip(entity_ids, vectors))
+        self.version = version
+        compiled = SimpleNamespace(params={"organization_id_1": "org"})
+        self.statement = SimpleNamespace(compile=lambda dialect: compiled)
+
+    def with_entities(self, *columns):
+        if len(columns) == 2 and "count" in str(columns[0]):
+            return SimpleNamespace(one=lambda: self.version)
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+@pytest.fixture
+def fallback_db():
+    similarity._index_cache.clear()
+    db = MagicMock()
+    db.get_bind.return_value.dialect.name = "sqlite"
+    yield db
+    similarity._index_cache.clear()
+
+
+@pytest.mark.unit
+class TestFindSimilarEmbeddingsFallback:
+    def test_matches_exact_search_and_excludes_ids(self, fallback_db):
+        vectors = _clustered(500, 768, seed=2)
+        entity_ids = [uuid.uuid4() for _ in vectors]
+        candidates = _Candidates(entity_ids, vectors)
+
+        with patch.object(similarity, "_candidates", return_value=candidates):
+            results = find_similar_embeddings(
+                fallback_db,
+                list(vectors[0]),
+                organization_id=str(uuid.uuid4()),
+                exclude_entity_ids=[entity_ids[0]],
+                limit=5,
+            )
+
+        expected = [entity_ids[i] for i in _exact(vectors, vectors[0], 6)[1:]]
+        assert [entity_id for entity_id, _ in results] == expected
+        assert all(-1.0 <= score <= 1.0 for _, score in results)
+
+    def test_index_is_reused_until_rows_change(self, fallback_db):
+        vectors = _clustered(20, 384)
+        candidates = _Candidates(list(range(20)), vectors, version=(20, "t1"))
+
+        with (
+            patch.object(similarity, "_candidates", return_value=candidates),
+            patch.object(similarity, "IVFIndex", wraps=IVFIndex) as build,
+        ):
+            for _ in range(3):
+                find_similar_embeddings(fallback_db, list(vectors[0]), organization_id="org")
+            candidates.version = (21, "t2")
+            find_similar_embeddings(fallback_db, list(vectors[0]), organization_id="org")
+
+        assert build.call_count == 2
+
+    def test_unsupported_dimension_raises(self, fallback_db):
+        with pytest.raises(ValueError, match="not supported"):
+            find_similar_embeddings(fallback_db, [0.1] * 10, organization_id="org")
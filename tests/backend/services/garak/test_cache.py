@@ -1,7 +1,7 @@
 """Unit tests for GarakProbeCache."""
 
 import json
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -15,12 +15,14 @@ def _reset_garak_cache():
     GarakProbeCache._redis_read_client = None
     GarakProbeCache._has_separate_read = False
     GarakProbeCache._initialized = False
+    GarakProbeCache._snapshot_checked = False
     GarakProbeCache._memory_cache.clear()
     yield
     GarakProbeCache._redis_client = None
     GarakProbeCache._redis_read_client = None
     GarakProbeCache._has_separate_read = False
     GarakProbeCache._initialized = False
+    GarakProbeCache._snapshot_checked = False
     GarakProbeCache._memory_cache.clear()
 
 
@@ -125,3 +127,98 @@ class TestGarakProbeCacheReadReplicaRuntime:
         await GarakProbeCache.get("0.1.0")
 
         assert cache_key in GarakProbeCache._memory_cache
+
+
+@pytest.mark.unit
+class TestGarakProbeSnapshot:
+    """Tests for the build-time probe snapshot."""
+
+    def _write(self, path, garak_version="0.1.0", schema_version=GarakProbeCache.SCHEMA_VERSION):
+        path.write_text(
+            json.dumps(
+                {
+                    "modules": [{"name": "dan", "description": "DAN"}],
+                    "probes_by_module": {},
+                    "garak_version": garak_version,
+                    "schema_version": schema_version,
+                }
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_matching_snapshot_seeds_memory_cache(self, tmp_path):
+        path = tmp_path / "probes.json"
+        self._write(path)
+
+        assert GarakProbeCache.load_snapshot("0.1.0", path) is True
+
+        result = await GarakProbeCache.get("0.1.0")
+        assert result["modules"][0]["name"] == "dan"
+
+    @pytest.mark.parametrize(
+        "garak_version,schema_version",
+        [("0.0.9", GarakProbeCache.SCHEMA_VERSION), ("0.1.0", GarakProbeCache.SCHEMA_VERSION - 1)],
+    )
+    def test_mismatched_snapshot_is_ignored(self, tmp_path, garak_version, schema_version):
+        path = tmp_path / "probes.json"
+        self._write(path, garak_version=garak_version, schema_version=schema_version)
+
+        assert GarakProbeCache.load_snapshot("0.1.0", path) is False
+        assert GarakProbeCache._memory_cache == {}
+
+    def test_missing_or_corrupt_snapshot_is_ignored(self, tmp_path):
+        assert GarakProbeCache.load_snapshot("0.1.0", tmp_path / "missing.json") is False
+
+        GarakProbeCache._snapshot_checked = False
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json")
+        assert GarakProbeCache.load_snapshot("0.1.0", corrupt) is False
+
+    def test_snapshot_is_read_once_per_process(self, tmp_path):
+        path = tmp_path / "probes.json"
+        self._write(path)
+        GarakProbeCache.load_snapshot("0.1.0", path)
+        GarakProbeCache._memory_cache.clear()
+
+        assert GarakProbeCache.load_snapshot("0.1.0", path) is False
+        assert GarakProbeCache._memory_cache == {}
+
+    def test_write_snapshot_round_trips(self, tmp_path):
+        from rhesis.backend.app.services.garak.probes import GarakModuleInfo, GarakProbeService
+        from rhesis.backend.app.services.garak.snapshot import write_snapshot
+
+        path = tmp_path / "nested" / "probes.json"
+        modules = [GarakModuleInfo(name="dan", description="DAN")]
+        with (
+            patch.object(GarakProbeService, "generate_probe_data", return_value=(modules, {})),
+            patch.object(GarakProbeService, "garak_version", "0.1.0"),
+        ):
+            assert write_snapshot(path) == 1
+
+        assert GarakProbeCache.load_snapshot("0.1.0", path) is True
+        cached = GarakProbeCache._memory_cache[GarakProbeCache._cache_key("0.1.0")]
+        assert cached["modules"][0]["name"] == "dan"
+        assert cached["cached_at"]
+
+    def test_snapshot_module_imports_without_database_settings(self):
+        """The image build runs the snapshot with no APP_DB_* settings."""
+        import os
+        import subprocess
+        import sys
+
+        env = {
+            key: value
+            for key, value in os.environ.items()
+            if not key.startswith("APP_DB_")
+        }
+        code = (
+            "import sys\n"
+            "import rhesis.backend.app.services.garak.snapshot\n"
+            "import rhesis.backend.app.services.garak.probes.service\n"
+            "assert 'rhesis.backend.app.database' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
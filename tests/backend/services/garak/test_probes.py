@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from dataclasses import asdict
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -578,3 +579,115 @@ class TestGarakProbeServiceEnumerateCachedConcurrency:
                 loop.run_until_complete(_contend())
             finally:
                 loop.close()
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestGarakProbeParallelEnumeration:
+    """Tests for process-pool probe enumeration."""
+
+    def _module_info(self, name):
+        return GarakModuleInfo(
+            name=name,
+            description=f"{name} probes",
+            probe_count=1,
+            total_prompt_count=1,
+            tags=[],
+            default_detector=None,
+            probe_classes=["Probe"],
+        )
+
+    def _probe_info(self, name):
+        return GarakProbeInfo(
+            module_name=name,
+            class_name="Probe",
+            full_name=f"{name}.Probe",
+            description="",
+            tags=[],
+            prompts=["p"],
+            prompt_count=1,
+            detector=None,
+        )
+
+    def test_enumeration_workers_from_env(self, monkeypatch):
+        from rhesis.backend.app.services.garak.probes.service import enumeration_workers
+
+        monkeypatch.setenv("GARAK_ENUMERATION_WORKERS", "3")
+        assert enumeration_workers() == 3
+        monkeypatch.setenv("GARAK_ENUMERATION_WORKERS", "0")
+        assert enumeration_workers() == 0
+
+    def test_subprocess_worker_returns_plain_data(self):
+        from rhesis.backend.app.services.garak.probes.service import (
+            _enumerate_module_in_subprocess,
+        )
+
+        with (
+            patch.object(
+                GarakProbeService, "_get_module_info", return_value=self._module_info("dan")
+            ),
+            patch.object(
+                GarakProbeService,
+                "extract_probes_from_module",
+                return_value=[self._probe_info("dan")],
+            ),
+        ):
+            module_dict, probe_dicts = _enumerate_module_in_subprocess("dan")
+
+        assert module_dict["name"] == "dan"
+        assert probe_dicts[0]["full_name"] == "dan.Probe"
+        assert isinstance(module_dict, dict)
+
+    def test_enumerate_in_subprocesses_rebuilds_results(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def fake_enumerate(name):
+            if name == "broken":
+                raise ValueError("import failed")
+            if name == "empty":
+                return None
+            return asdict(self._module_info(name)), [asdict(self._probe_info(name))]
+
+        with (
+            patch(
+                "rhesis.backend.app.services.garak.probes.service."
+                "concurrent.futures.ProcessPoolExecutor",
+                side_effect=lambda max_workers, mp_context: ThreadPoolExecutor(max_workers),
+            ),
+            patch(
+                "rhesis.backend.app.services.garak.probes.service._discover_in_subprocess",
+                return_value=["broken", "dan", "empty", "encoding"],
+            ),
+            patch(
+                "rhesis.backend.app.services.garak.probes.service._enumerate_module_in_subprocess",
+                side_effect=fake_enumerate,
+            ),
+        ):
+            service = GarakProbeService()
+            modules, probes_by_module = service.enumerate_in_subprocesses(2)
+
+        assert [m.name for m in modules] == ["dan", "encoding"]
+        assert isinstance(probes_by_module["dan"][0], GarakProbeInfo)
+        assert service.extract_probes_from_module("encoding")[0].full_name == "encoding.Probe"
+
+    def test_broken_pool_falls_back_in_process(self, monkeypatch):
+        from concurrent.futures.process import BrokenProcessPool
+
+        monkeypatch.setenv("GARAK_ENUMERATION_WORKERS", "2")
+        service = GarakProbeService()
+        with (
+            patch.object(
+                service, "enumerate_in_subprocesses", side_effect=BrokenProcessPool("killed")
+            ),
+            patch.object(
+                service, "enumerate_probe_modules", return_value=[self._module_info("dan")]
+            ) as enumerate_in_process,
+            patch.object(
+                service, "extract_probes_from_module", return_value=[self._probe_info("dan")]
+            ),
+        ):
+            modules, probes_by_module = service.generate_probe_data()
+
+        enumerate_in_process.assert_called_once()
+        assert [m.name for m in modules] == ["dan"]
+        assert list(probes_by_module) == ["dan"]
@@ -0,0 +1,262 @@
+"""Tests for the materialised insights cubes.
+
+The cube path must return exactly what the plain view query returns, whatever
+the freshness of each run: these run the same insights request with the
+planner enabled and disabled (RHESIS_DISABLE_INSIGHTS_CUBES) and compare.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from rhesis.backend.app import models
+from rhesis.backend.app.services.insights import cubes
+from rhesis.backend.app.services.insights.query_builder import build_query, run_query
+
+
+@pytest.fixture(autouse=True)
+def _no_refresh_scheduling():
+    with patch("rhesis.backend.app.services.insights.cube_refresh.schedule_cube_refresh"):
+        yield
+
+
+def _add_results(
+    test_db, test_organization, db_user, db_test_configuration, test_run, statuses, metrics=None
+):
+    test = models.Test(
+        priority=1,
+        user_id=db_user.id,
+        organization_id=test_organization.id,
+        status_id=statuses[0].id,
+    )
+    test_db.add(test)
+    test_db.flush()
+    for status in statuses:
+        test_db.add(
+            models.TestResult(
+                test_id=test.id,
+                test_run_id=test_run.id,
+                test_configuration_id=db_test_configuration.id,
+                user_id=db_user.id,
+                organization_id=test_organization.id,
+                status_id=status.id,
+                test_metrics={"metrics": metrics or {}},
+            )
+        )
+    test_db.flush()
+    return test
+
+
+def _state(test_db, organization_id, test_run_id):
+    return (
+        test_db.query(models.InsightsCubeState)
+        .filter(
+            models.InsightsCubeState.organization_id == organization_id,
+            models.InsightsCubeState.test_run_id == test_run_id,
+        )
+        .one_or_none()
+    )
+
+
+def _both_paths(test_db, monkeypatch, **kwargs):
+    def rows(result):
+        return sorted(result["rows"], key=lambda row: sorted(map(str, row.values())))
+
+    monkeypatch.delenv("RHESIS_DISABLE_INSIGHTS_CUBES", raising=False)
+    cube_rows = rows(run_query(test_db, **kwargs))
+    monkeypatch.setenv("RHESIS_DISABLE_INSIGHTS_CUBES", "1")
+    view_rows = rows(run_query(test_db, **kwargs))
+    return cube_rows, view_rows
+
+
+class TestInsightsCube:
+    def test_writes_mark_run_stale_and_refresh_clears_it(
+        self,
+        test_db,
+        test_organization,
+        db_user,
+        db_test_configuration,
+        db_test_run,
+        passed_status,
+        failed_status,
+    ):
+        _add_results(
+            test_db, test_organization, db_user, db_test_configuration, db_test_run, [passed_status]
+        )
+        state = _state(test_db, test_organization.id, db_test_run.id)
+        assert state is not None
+        assert state.version != state.refreshed_version
+
+        assert cubes.refresh_run_cubes(test_db, str(test_organization.id), str(db_test_run.id))
+        test_db.refresh(state)
+        assert state.version == state.refreshed_version
+        assert cubes.stale_runs(test_db, str(test_organization.id)) == []
+
+    def test_writes_to_an_already_stale_run_do_not_bump_it_again(
+        self,
+        test_db,
+        test_organization,
+        db_user,
+        db_test_configuration,
+        db_test_run,
+        passed_status,
+        failed_status,
+    ):
+        from rhesis.backend.app.models.insights_cube_events import _MARKED_RUNS_KEY
+
+        _add_results(
+            test_db, test_organization, db_user, db_test_configuration, db_test_run, [passed_status]
+        )
+        state = _state(test_db, test_organization.id, db_test_run.id)
+        stale_version = state.version
+
+        # As a later transaction would: the run is not remembered as bumped
+        test_db.info.pop(_MARKED_RUNS_KEY, None)
+        _add_results(
+            test_db, test_organization, db_user, db_test_configuration, db_test_run, [failed_status]
+        )
+        test_db.refresh(state)
+        assert state.version == stale_version
+
+        # Once refreshed, the next write makes the run stale again
+        assert cubes.refresh_run_cubes(test_db, str(test_organization.id), str(db_test_run.id))
+        test_db.info.pop(_MARKED_RUNS_KEY, None)
+        _add_results(
+            test_db, test_organization, db_user, db_test_configuration, db_test_run, [failed_status]
+        )
+        test_db.refresh(state)
+        assert state.version == stale_version + 1
+        assert state.version != state.refreshed_version
+
+    def test_cube_matches_view_for_current_and_stale_runs(
+        self,
+        test_db,
+        test_organization,
+        db_user,
+        db_test_configuration,
+        db_test_run,
+        passed_status,
+        failed_status,
+        monkeypatch,
+    ):
+        _add_results(
+            test_db,
+            test_organization,
+            db_user,
+            db_test_configuration,
+            db_test_run,
+            [passed_status, failed_status, failed_status],
+        )
+        cubes.refresh_run_cubes(test_db, str(test_organization.id), str(db_test_run.id))
+
+        query = dict(
+            entity="test_result",
+            group_by=["status"],
+            measures=["count", "passed", "failed", "pass_rate"],
+            organization_id=str(test_organization.id),
+        )
+        cube_rows, view_rows = _both_paths(test_db, monkeypatch, **query)
+        assert cube_rows == view_rows
+        assert sum(row["count"] for row in cube_rows) == 3
+
+        # A new result makes the run stale; it must be read from the views
+        # until the next refresh rather than from the outdated cube rows.
+        _add_results(
+            test_db, test_organization, db_user, db_test_configuration, db_test_run, [passed_status]
+        )
+        cube_rows, view_rows = _both_paths(test_db, monkeypatch, **query)
+        assert cube_rows == view_rows
+        assert sum(row["count"] for row in cube_rows) == 4
+
+    def test_metric_cube_matches_view(
+        self,
+        test_db,
+        test_organization,
+        db_user,
+        db_test_configuration,
+        db_test_run,
+        passed_status,
+        failed_status,
+        monkeypatch,
+    ):
+        _add_results(
+            test_db,
+            test_organization,
+            db_user,
+            db_test_configuration,
+            db_test_run,
+            [passed_status, failed_status],
+            metrics={
+                "Faithfulness": {"is_successful": True},
+                "Answer Relevancy": {"is_successful": False},
+            },
+        )
+        cubes.refresh_run_cubes(test_db, str(test_organization.id), str(db_test_run.id))
+
+        cube_rows, view_rows = _both_paths(
+            test_db,
+            monkeypatch,
+            entity="metric",
+            group_by=["metric_name"],
+            measures=["count", "passed", "failed", "pass_rate"],
+            organization_id=str(test_organization.id),
+        )
+        assert cube_rows == view_rows
+        assert {row["metric_name"] for row in cube_rows} == {"Faithfulness", "Answer Relevancy"}
+
+    def test_partial_days_of_the_window_come_from_the_views(
+        self,
+        test_db,
+        test_organization,
+        db_user,
+        db_test_configuration,
+        db_test_run,
+        passed_status,
+        monkeypatch,
+    ):
+        _add_results(
+            test_db, test_organization, db_user, db_test_configuration, db_test_run, [passed_status]
+        )
+        cubes.refresh_run_cubes(test_db, str(test_organization.id), str(db_test_run.id))
+
+        now = datetime.now(timezone.utc)
+        cube_rows, view_rows = _both_paths(
+            test_db,
+            monkeypatch,
+            entity="test_result",
+            group_by=[],
+            measures=["count"],
+            start_date=now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat(),
+            end_date=now.isoformat(),
+            organization_id=str(test_organization.id),
+        )
+        assert cube_rows == view_rows == [{"count": 1}]
+
+
+class TestCubePlanner:
+    def test_uncovered_filter_falls_back_to_view(self, test_db, test_organization):
+        assert not cubes.covers("test_result", ["topic"], ["count"], {"test_ids": ["x"]})
+        q = build_query(
+            test_db,
+            "test_result",
+            ["topic"],
+            ["count"],
+            filters={"test_ids": [str(test_organization.id)]},
+            organization_id=str(test_organization.id),
+        )
+        assert "insights_cube_union" not in str(q.statement)
+
+    def test_entity_without_cube_is_not_covered(self):
+        assert not cubes.covers("test", ["requirement"], ["count"], None)
+        assert cubes.covers("metric", ["metric_name"], ["pass_rate"], {"metric_names": []})
+
+    def test_day_window_only_includes_whole_utc_days(self):
+        first, end = cubes._day_window(
+            datetime(2026, 3, 1, 12, 30, tzinfo=timezone.utc),
+            datetime(2026, 3, 5, 8, tzinfo=timezone.utc),
+        )
+        assert (first.isoformat(), end.isoformat()) == ("2026-03-02", "2026-03-05")
+
+        first, _ = cubes._day_window(datetime(2026, 3, 1), None)
+        assert first.isoformat() == "2026-03-01"
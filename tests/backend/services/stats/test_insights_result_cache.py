@@ -0,0 +1,180 @@
+"""Tests for the insights result cache and its write-driven invalidation."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rhesis.backend.app import models, schemas
+from rhesis.backend.app.services.insights import query_builder, run_queries, run_query
+from rhesis.backend.app.services.insights.result_cache import (
+    InsightsResultCache,
+    request_fingerprint,
+)
+
+
+@pytest.fixture
+def result_cache(monkeypatch):
+    """A fresh, in-memory result cache, enabled for the test."""
+    monkeypatch.delenv("RHESIS_DISABLE_INSIGHTS_RESULT_CACHE", raising=False)
+    cache = InsightsResultCache()
+    with (
+        patch("rhesis.backend.app.services.insights.result_cache._result_cache", cache),
+        patch("rhesis.backend.app.services.insights.cube_refresh.schedule_cube_refresh"),
+    ):
+        yield cache
+
+
+def _add_result(test_db, test_organization, db_user, db_test_configuration, test_run, status):
+    test = models.Test(
+        priority=1,
+        user_id=db_user.id,
+        organization_id=test_organization.id,
+        status_id=status.id,
+    )
+    test_db.add(test)
+    test_db.flush()
+    test_db.add(
+        models.TestResult(
+            test_id=test.id,
+            test_run_id=test_run.id,
+            test_configuration_id=db_test_configuration.id,
+            user_id=db_user.id,
+            organization_id=test_organization.id,
+            status_id=status.id,
+        )
+    )
+    test_db.flush()
+
+
+def _count(envelope):
+    return sum(row["count"] for row in envelope["rows"])
+
+
+class TestRequestFingerprint:
+    def test_filter_value_order_and_empty_filters_do_not_matter(self):
+        a = request_fingerprint("test_result", ["topic"], ["count"], {"topic_ids": ["b", "a"]})
+        b = request_fingerprint(
+            "test_result", ["topic"], ["count"], {"topic_ids": ["a", "b"], "tags": []}
+        )
+        assert a == b
+
+    def test_every_request_part_is_keyed(self):
+        base = request_fingerprint("test_result", ["topic"], ["count"], months=3)
+        assert base != request_fingerprint("test_result", ["topic"], ["count"], months=6)
+        assert base != request_fingerprint("metric", ["topic"], ["count"], months=3)
+        assert base != request_fingerprint("test_result", ["status"], ["count"], months=3)
+        assert base != request_fingerprint("test_result", ["topic"], ["passed"], months=3)
+
+
+class TestInsightsResultCache:
+    def test_bump_makes_cached_results_unreachable(self):
+        cache = InsightsResultCache()
+        fingerprints = {"a": "fp-a"}
+        generation, hits = cache.get_many("org", None, fingerprints)
+        assert hits == {}
+        cache.set_many("org", None, generation, {"a": {"rows": []}}, fingerprints)
+        assert cache.get_many("org", None, fingerprints)[1] == {"a": {"rows": []}}
+
+        cache.bump_generation("org")
+        assert cache.get_many("org", None, fingerprints)[1] == {}
+
+    def test_results_are_scoped_by_org_and_project(self):
+        cache = InsightsResultCache()
+        fingerprints = {"a": "fp-a"}
+        generation, _ = cache.get_many("org", "p1", fingerprints)
+        cache.set_many("org", "p1", generation, {"a": {"rows": [1]}}, fingerprints)
+
+        assert cache.get_many("org", "p2", fingerprints)[1] == {}
+        assert cache.get_many("org", None, fingerprints)[1] == {}
+        assert cache.get_many("other-org", "p1", fingerprints)[1] == {}
+        # Bumping another org leaves this one's results alone.
+        cache.bump_generation("other-org")
+        assert cache.get_many("org", "p1", fingerprints)[1] == {"a": {"rows": [1]}}
+
+    def test_generation_is_read_from_the_primary(self):
+        cache = InsightsResultCache()
+        primary, replica = MagicMock(), MagicMock()
+        cache._redis, cache._redis_read, cache._has_separate_read = primary, replica, True
+        primary.get.return_value = "new-generation"
+        replica.get.return_value = "replaced-generation"
+        replica.mget.return_value = [None]
+
+        generation, _ = cache.get_many("org", None, {"a": "fp-a"})
+
+        assert generation == "new-generation"
+        replica.get.assert_not_called()
+        # Payloads still come from the replica, under the primary's generation.
+        assert ":new-generation:" in replica.mget.call_args.args[0][0]
+
+
+class TestCachedInsightsQueries:
+    def test_commit_invalidates_and_uncommitted_writes_bypass(
+        self,
+        test_db,
+        test_organization,
+        db_user,
+        db_test_configuration,
+        db_test_run,
+        db_status,
+        result_cache,
+    ):
+        args = (test_db, test_organization, db_user, db_test_configuration, db_test_run)
+        query = dict(
+            entity="test_result",
+            group_by=["status"],
+            measures=["count"],
+            organization_id=str(test_organization.id),
+        )
+        _add_result(*args, db_status)
+        test_db.commit()
+        assert _count(run_query(test_db, **query)) == 1
+
+        with patch.object(
+            query_builder, "_execute_query", wraps=query_builder._execute_query
+        ) as execute:
+            assert _count(run_query(test_db, **query)) == 1
+            assert execute.call_count == 0
+
+            # The writing session reads its own uncommitted result.
+            _add_result(*args, db_status)
+            assert _count(run_query(test_db, **query)) == 2
+            assert execute.call_count == 1
+
+            # Committing bumps the generation: recomputed once, then cached.
+            test_db.commit()
+            assert _count(run_query(test_db, **query)) == 2
+            assert _count(run_query(test_db, **query)) == 2
+            assert execute.call_count == 2
+
+    def test_run_queries_only_executes_missing_labels(
+        self,
+        test_db,
+        test_organization,
+        db_user,
+        db_test_configuration,
+        db_test_run,
+        db_status,
+        result_cache,
+    ):
+        _add_result(
+            test_db, test_organization, db_user, db_test_configuration, db_test_run, db_status
+        )
+        test_db.commit()
+        organization_id = str(test_organization.id)
+        by_status = schemas.InsightsQuery(entity="test_result", group_by=["status"])
+        by_metric = schemas.InsightsQuery(entity="metric", group_by=["metric_name"])
+
+        first = run_queries(test_db, {"status": by_status}, organization_id=organization_id)
+
+        with patch.object(
+            query_builder, "_execute_query", wraps=query_builder._execute_query
+        ) as execute:
+            both = run_queries(
+                test_db,
+                {"status": by_status, "metrics": by_metric},
+                organization_id=organization_id,
+            )
+        assert execute.call_count == 1
+        assert execute.call_args.kwargs["entity"] == "metric"
+        assert list(both) == ["status", "metrics"]
+        assert both["status"] == first["status"]
@@ -1,5 +1,6 @@
 """Tests for trace enrichment functionality."""
 
+from datetime import datetime, timezone
 from unittest.mock import Mock
 
 import litellm
@@ -16,6 +17,10 @@ from rhesis.backend.app.services.telemetry.enrichment import (
     detect_anomalies,
     extract_metadata,
 )
+from rhesis.backend.app.services.telemetry.enrichment.core import (
+    _flat_token_prices,
+    token_cost_usd,
+)
 from rhesis.backend.app.services.telemetry.enrichment.processor import TraceEnricher
 
 
@@ -226,6 +231,18 @@ class TestCalculateTokenCosts:
         # Verify breakdown also has correct EUR values
         assert costs.breakdown[0].total_cost_eur == pytest.approx(expected_cost_eur, rel=0.01)
 
+    def test_flat_pricing_is_looked_up_once_per_model(self, mocker):
+        """Test that per-span costs reuse a memoised per-model price."""
+        _flat_token_prices.cache_clear()
+        lookup = mocker.spy(litellm, "get_model_info")
+
+        first = token_cost_usd("gpt-4", 100, 50)
+        second = token_cost_usd("gpt-4", 300, 20)
+
+        assert first == pytest.approx(litellm.cost_per_token("gpt-4", 100, 50))
+        assert second == pytest.approx(litellm.cost_per_token("gpt-4", 300, 20))
+        assert lookup.call_count == 1
+
 
 class TestDetectAnomalies:
     """Test anomaly detection."""
@@ -475,36 +492,57 @@ class TestExtractMetadata:
         assert len(metadata) == 0
 
 
+_PROCESSOR = "rhesis.backend.app.services.telemetry.enrichment.processor"
+
+
+def _llm_span(span_id, parent_span_id=None, start_second=0, model="gpt-4", status_code="OK"):
+    return Mock(
+        spec=Trace,
+        id=f"db-{span_id}",
+        span_id=span_id,
+        span_name=f"ai.llm.invoke.{span_id}",
+        duration_ms=1000,
+        status_code=status_code,
+        status_message=None,
+        parent_span_id=parent_span_id,
+        start_time=datetime(2026, 1, 1, 0, 0, start_second, tzinfo=timezone.utc),
+        attributes={
+            AIAttributes.OPERATION_TYPE: AIAttributes.OPERATION_LLM_INVOKE,
+            AIAttributes.MODEL_NAME: model,
+            AIAttributes.LLM_TOKENS_INPUT: 100,
+            AIAttributes.LLM_TOKENS_OUTPUT: 50,
+        },
+    )
+
+
 class TestTraceEnricher:
     """Test TraceEnricher service."""
 
     def test_enrich_trace_with_cache_hit(self, mocker):
-        """Test enrichment uses cached data when available."""
+        """Test enrichment uses cached data when no new spans have arrived."""
         # Mock database session
         mock_db = Mock()
 
-        # Mock span with cached enrichment (valid EnrichedTraceData dict)
-        mock_span = Mock(
-            spec=Trace,
-            enriched_data={
-                "costs": {
-                    "total_cost_usd": 0.01,
-                    "total_cost_eur": 0.0092,
-                    "breakdown": [],
-                },
-                "metrics": {
-                    "total_duration_ms": 1000.0,
-                    "span_count": 1,
-                    "error_count": 0,
-                },
+        # Cached enrichment (valid EnrichedTraceData dict)
+        cached = {
+            "costs": {
+                "total_cost_usd": 0.01,
+                "total_cost_eur": 0.0092,
+                "breakdown": [],
             },
-        )
+            "metrics": {
+                "total_duration_ms": 1000.0,
+                "span_count": 1,
+                "error_count": 0,
+            },
+        }
 
-        # Mock get_trace_by_id to return span with cached data
-        mock_get_trace = mocker.patch(
-            "rhesis.backend.app.services.telemetry.enrichment.processor.get_trace_by_id",
-            return_value=[mock_span],
+        mock_has_new = mocker.patch(f"{_PROCESSOR}.has_unprocessed_trace_spans", return_value=False)
+        mocker.patch(
+            f"{_PROCESSOR}.get_trace_enrichment_span", return_value=Mock(enriched_data=cached)
         )
+        mock_unprocessed = mocker.patch(f"{_PROCESSOR}.get_unprocessed_trace_spans")
+        mock_mark = mocker.patch(f"{_PROCESSOR}.mark_trace_processed")
 
         enricher = TraceEnricher(mock_db)
         result = enricher.enrich_trace("trace123", "project123", "org123")
@@ -516,43 +554,27 @@ class TestTraceEnricher:
         assert result.costs is not None
         assert result.metrics is not None
         assert result.metrics.span_count == 1
+        mock_mark.assert_not_called()
+        # No lock taken and no spans loaded when nothing is new
+        mock_db.execute.assert_not_called()
+        mock_unprocessed.assert_not_called()
 
-        # Verify organization_id was passed to get_trace_by_id
-        mock_get_trace.assert_called_once_with(
+        # Verify organization_id was passed to the span lookup
+        mock_has_new.assert_called_once_with(
             mock_db, trace_id="trace123", project_id="project123", organization_id="org123"
         )
 
     def test_enrich_trace_calculates_when_no_cache(self, mocker):
         """Test enrichment calculates data when no cache exists."""
         mock_db = Mock()
+        mock_span = _llm_span("span1")
 
-        # Mock span without enriched data
-        mock_span = Mock(
-            spec=Trace,
-            span_id="span1",
-            span_name="ai.llm.invoke",
-            duration_ms=1000,
-            status_code="OK",
-            parent_span_id=None,
-            enriched_data=None,  # No cache
-            attributes={
-                AIAttributes.OPERATION_TYPE: AIAttributes.OPERATION_LLM_INVOKE,
-                AIAttributes.MODEL_NAME: "gpt-4",
-                AIAttributes.LLM_TOKENS_INPUT: 100,
-                AIAttributes.LLM_TOKENS_OUTPUT: 50,
-            },
-        )
-
-        # Mock get_trace_by_id
-        mock_get_trace = mocker.patch(
-            "rhesis.backend.app.services.telemetry.enrichment.processor.get_trace_by_id",
-            return_value=[mock_span],
-        )
-
-        # Mock mark_trace_processed
-        mock_mark = mocker.patch(
-            "rhesis.backend.app.services.telemetry.enrichment.processor.mark_trace_processed"
+        mocker.patch(f"{_PROCESSOR}.has_unprocessed_trace_spans", return_value=True)
+        mock_unprocessed = mocker.patch(
+            f"{_PROCESSOR}.get_unprocessed_trace_spans", return_value=[mock_span]
         )
+        mocker.patch(f"{_PROCESSOR}.get_trace_enrichment_span", return_value=None)
+        mock_mark = mocker.patch(f"{_PROCESSOR}.mark_trace_processed")
 
         enricher = TraceEnricher(mock_db)
         result = enricher.enrich_trace("trace123", "project123", "org123")
@@ -562,11 +584,14 @@ class TestTraceEnricher:
         assert result.metrics is not None
         assert result.metrics.span_count == 1
 
-        # Should cache the result (as dict in database)
+        # Should cache the result on the root span and mark the folded-in span processed
         mock_mark.assert_called_once()
+        assert mock_mark.call_args.kwargs["span_ids"] == ["db-span1"]
+        assert mock_mark.call_args.kwargs["summary_span_id"] == "db-span1"
 
-        # Verify organization_id was passed to get_trace_by_id
-        mock_get_trace.assert_called_once_with(
+        # The new spans are loaded once, under the lock
+        mock_db.execute.assert_called_once()
+        mock_unprocessed.assert_called_once_with(
             mock_db, trace_id="trace123", project_id="project123", organization_id="org123"
         )
 
@@ -574,21 +599,95 @@ class TestTraceEnricher:
         """Test enrichment returns None when no spans found."""
         mock_db = Mock()
 
-        # Mock get_trace_by_id to return empty list
-        mock_get_trace = mocker.patch(
-            "rhesis.backend.app.services.telemetry.enrichment.processor.get_trace_by_id", return_value=[]
-        )
+        mocker.patch(f"{_PROCESSOR}.has_unprocessed_trace_spans", return_value=False)
+        mock_enrichment = mocker.patch(f"{_PROCESSOR}.get_trace_enrichment_span", return_value=None)
 
         enricher = TraceEnricher(mock_db)
         result = enricher.enrich_trace("trace123", "project123", "org123")
 
         assert result is None
 
-        # Verify organization_id was passed to get_trace_by_id
-        mock_get_trace.assert_called_once_with(
+        # Verify organization_id was passed to the enrichment lookup
+        mock_enrichment.assert_called_once_with(
             mock_db, trace_id="trace123", project_id="project123", organization_id="org123"
         )
 
+    def test_lock_is_released_when_a_concurrent_pass_took_the_spans(self, mocker):
+        """Test that the transaction holding the advisory lock ends on the early return."""
+        mock_db = Mock()
+        stored = TraceEnricher(mock_db)._calculate_enrichment([_llm_span("root")])
+
+        mocker.patch(f"{_PROCESSOR}.has_unprocessed_trace_spans", return_value=True)
+        mocker.patch(f"{_PROCESSOR}.get_unprocessed_trace_spans", return_value=[])
+        mocker.patch(
+            f"{_PROCESSOR}.get_trace_enrichment_span",
+            return_value=Mock(enriched_data=stored.model_dump(mode="json", exclude_none=True)),
+        )
+        mock_mark = mocker.patch(f"{_PROCESSOR}.mark_trace_processed")
+
+        result = TraceEnricher(mock_db).enrich_trace("trace123", "project123", "org123")
+
+        assert result.metrics == stored.metrics
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+        mock_mark.assert_not_called()
+
+    def test_new_spans_are_folded_into_stored_enrichment(self, mocker):
+        """Test that enriching a trace chunk by chunk matches enriching it whole."""
+        enricher = TraceEnricher(Mock())
+        root = _llm_span("root", start_second=0, model="gpt-4")
+        child = _llm_span("child", "root", start_second=1, model="gpt-3.5-turbo")
+        failed = _llm_span("failed", "root", start_second=2, status_code="ERROR")
+
+        whole = enricher._calculate_enrichment([root, child, failed])
+
+        # Children are exported before the root span finishes, so the first
+        # pass stored the enrichment on the earliest child.
+        child.enriched_data = enricher._calculate_enrichment([child, failed]).model_dump(
+            mode="json", exclude_none=True
+        )
+        mocker.patch(f"{_PROCESSOR}.has_unprocessed_trace_spans", return_value=True)
+        mocker.patch(f"{_PROCESSOR}.get_unprocessed_trace_spans", return_value=[root])
+        mocker.patch(f"{_PROCESSOR}.get_trace_enrichment_span", return_value=child)
+        mock_mark = mocker.patch(f"{_PROCESSOR}.mark_trace_processed")
+
+        incremental = enricher.enrich_trace("trace123", "project123", "org123")
+
+        assert incremental.metrics == whole.metrics
+        assert incremental.root_operation == whole.root_operation == "ai.llm.invoke.root"
+        assert incremental.costs.total_cost_usd == pytest.approx(whole.costs.total_cost_usd)
+        assert {c.span_id for c in incremental.costs.breakdown} == {"root", "child", "failed"}
+        assert set(incremental.models_used) == set(whole.models_used)
+        assert [a.span_id for a in incremental.anomalies] == ["failed"]
+        assert mock_mark.call_args.kwargs["span_ids"] == ["db-root"]
+        # The enrichment moves to the root span once it arrives
+        assert mock_mark.call_args.kwargs["summary_span_id"] == "db-root"
+
+    @pytest.mark.parametrize(
+        "new_span, summary_span_id",
+        [
+            # A child of the first turn leaves the enrichment on its root
+            (_llm_span("child", "turn1", start_second=1), "db-turn1"),
+            # A later conversation turn's root takes it over
+            (_llm_span("turn2", start_second=5), "db-turn2"),
+        ],
+    )
+    def test_enrichment_stays_on_latest_root_span(self, mocker, new_span, summary_span_id):
+        """Test which span the enrichment is stored on as a conversation grows."""
+        enricher = TraceEnricher(Mock())
+        turn1 = _llm_span("turn1", start_second=0)
+        turn1.enriched_data = enricher._calculate_enrichment([turn1]).model_dump(
+            mode="json", exclude_none=True
+        )
+        mocker.patch(f"{_PROCESSOR}.has_unprocessed_trace_spans", return_value=True)
+        mocker.patch(f"{_PROCESSOR}.get_unprocessed_trace_spans", return_value=[new_span])
+        mocker.patch(f"{_PROCESSOR}.get_trace_enrichment_span", return_value=turn1)
+        mock_mark = mocker.patch(f"{_PROCESSOR}.mark_trace_processed")
+
+        enricher.enrich_trace("trace123", "project123", "org123")
+
+        assert mock_mark.call_args.kwargs["summary_span_id"] == summary_span_id
+
     def test_calculate_enrichment_combines_all_data(self, mocker):
         """Test that _calculate_enrichment combines costs, anomalies, and metadata."""
         mock_db = Mock()
@@ -603,6 +702,7 @@ class TestTraceEnricher:
                 duration_ms=1000,
                 status_code="OK",
                 parent_span_id=None,
+                start_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
                 attributes={
                     AIAttributes.OPERATION_TYPE: AIAttributes.OPERATION_LLM_INVOKE,
                     AIAttributes.MODEL_NAME: "gpt-4",
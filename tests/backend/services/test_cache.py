@@ -259,6 +259,26 @@ class TestRedisBackedCacheReadReplica:
         write_client.delete.assert_called_once_with("d")
         read_client.delete.assert_not_called()
 
+    def test_get_primary_bypasses_read_client(self):
+        write_client = MagicMock()
+        write_client.ping.return_value = True
+        write_client.get.return_value = "from-primary"
+        read_client = MagicMock()
+        read_client.ping.return_value = True
+
+        clients = iter([write_client, read_client])
+
+        with (
+            patch("redis.Redis.from_url", side_effect=lambda *a, **kw: next(clients)),
+            patch.dict("os.environ", {"BROKER_READ_URL": "redis://replica:6379/0"}),
+        ):
+            cache = _ConcreteCache(redis_db=1, cache_name="rr", ttl=60)
+            cache.initialize()
+
+        assert cache._get_primary("k") == "from-primary"
+        write_client.get.assert_called_once_with("k")
+        read_client.get.assert_not_called()
+
     def test_read_replica_failure_at_init_falls_back_to_primary(self):
         write_client = MagicMock()
         write_client.ping.return_value = True
@@ -50,7 +50,7 @@ class TestChunkingServiceChunkSource:
             "rhesis.backend.app.services.chunking.source_crud.get_source_with_content",
             return_value=mock_source,
         ), patch(
-            "rhesis.backend.app.services.chunking.SDKChunkingService"
+            "rhesis.sdk.services.chunker.ChunkingService"
         ) as mock_sdk_cls:
             mock_sdk_cls.return_value.chunk.return_value = []
             service = ChunkingService(mock_db, IdentityChunker())
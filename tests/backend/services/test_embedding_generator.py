@@ -614,3 +614,104 @@ class TestEmbeddingGenerator:
             ).first()
             assert embedding.dimension == dim
             assert len(embedding.embedding) == dim
+
+    @patch("rhesis.backend.app.services.embedding.generator.get_model")
+    def test_generate_batch_embeds_entities_in_one_request(
+        self,
+        mock_get_model,
+        test_db,
+        test_entity,
+        embedding_model,
+        test_org_id,
+        authenticated_user_id,
+    ):
+        """Missing entities are reported as failed; the rest share one provider call."""
+        missing_id = "00000000-0000-0000-0000-000000000000"
+        mock_embedder = Mock()
+        mock_embedder.generate_batch.return_value = [[0.1] * 768]
+        mock_get_model.return_value = mock_embedder
+
+        generator = EmbeddingGenerator(test_db)
+        results = generator.generate_batch(
+            entity_ids=[str(test_entity.id), missing_id],
+            entity_type="Test",
+            organization_id=test_org_id,
+            user_id=authenticated_user_id,
+            model_id=str(embedding_model.id),
+        )
+
+        assert results[str(test_entity.id)]["status"] == "success"
+        assert results[missing_id] == {"status": "failed", "embedding_id": None}
+        mock_embedder.generate_batch.assert_called_once_with([test_entity.to_searchable_text()])
+        mock_embedder.generate.assert_not_called()
+
+        embedding = (
+            test_db.query(models.Embedding)
+            .filter_by(id=results[str(test_entity.id)]["embedding_id"])
+            .first()
+        )
+        assert str(embedding.entity_id) == str(test_entity.id)
+        assert embedding.dimension == 768
+
+    @patch("rhesis.backend.app.services.embedding.generator.get_model")
+    def test_generate_batch_skips_entities_already_embedded(
+        self,
+        mock_get_model,
+        test_db,
+        test_entity,
+        embedding_model,
+        test_org_id,
+        authenticated_user_id,
+    ):
+        """Like generate(), unchanged texts are not sent to the provider again."""
+        mock_embedder = Mock()
+        mock_embedder.generate.return_value = [0.1] * 768
+        mock_get_model.return_value = mock_embedder
+
+        generator = EmbeddingGenerator(test_db)
+        first = generator.generate(
+            entity_id=str(test_entity.id),
+            entity_type="Test",
+            organization_id=test_org_id,
+            user_id=authenticated_user_id,
+            model_id=str(embedding_model.id),
+        )
+        results = generator.generate_batch(
+            entity_ids=[str(test_entity.id)],
+            entity_type="Test",
+            organization_id=test_org_id,
+            user_id=authenticated_user_id,
+            model_id=str(embedding_model.id),
+        )
+
+        assert results[str(test_entity.id)] == first
+        mock_embedder.generate_batch.assert_not_called()
+
+    @patch("rhesis.backend.app.services.embedding.generator.get_model")
+    def test_generate_batch_permanent_provider_error_raises(
+        self,
+        mock_get_model,
+        test_db,
+        test_entity,
+        embedding_model,
+        test_org_id,
+        authenticated_user_id,
+    ):
+        """A permanent provider error stops the backfill instead of failing each batch."""
+
+        class NotFoundError(Exception):
+            status_code = 404
+
+        mock_embedder = Mock()
+        mock_embedder.generate_batch.side_effect = NotFoundError("model was not found")
+        mock_get_model.return_value = mock_embedder
+
+        generator = EmbeddingGenerator(test_db)
+        with pytest.raises(ModelConfigurationError, match="Failed to generate embedding"):
+            generator.generate_batch(
+                entity_ids=[str(test_entity.id)],
+                entity_type="Test",
+                organization_id=test_org_id,
+                user_id=authenticated_user_id,
+                model_id=str(embedding_model.id),
+            )
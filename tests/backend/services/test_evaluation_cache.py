@@ -0,0 +1,166 @@
+"""Tests for the opt-in judge-result cache.
+
+The cache is an in-memory EvaluationResultCache (never initialised, so no
+Redis); metrics come from a patched MetricFactory.
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rhesis.backend.app.services.evaluation_cache import (
+    EvaluationResultCache,
+    RunEvaluationCache,
+    evaluation_cache_requested,
+    evaluation_fingerprint,
+    fresh_evaluation_requested,
+)
+from rhesis.backend.metrics.strategies.local import LocalStrategy
+from rhesis.sdk.metrics import MetricConfig, MetricResult
+
+
+def _config(threshold=0.5):
+    return MetricConfig(
+        class_name="NumericJudge", backend="rhesis", name="accuracy", threshold=threshold
+    )
+
+
+def _fingerprint(config=None, judge="judge-a", output="out", **kwargs):
+    return evaluation_fingerprint(config or _config(), judge, "in", output, "exp", ["c"], **kwargs)
+
+
+@pytest.fixture
+def store():
+    return EvaluationResultCache()
+
+
+class TestFingerprint:
+    def test_ignores_surrounding_whitespace(self):
+        assert _fingerprint(output="out") == _fingerprint(output="  out\n")
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"config": _config(threshold=0.7)},
+            {"judge": "judge-b"},
+            {"output": "other"},
+            {"tool_calls": [{"name": "search"}]},
+        ],
+    )
+    def test_changes_with_anything_the_result_depends_on(self, changed):
+        assert _fingerprint(**changed) != _fingerprint()
+
+    def test_judge_provider_is_part_of_the_key(self):
+        class OpenAIJudge:
+            PROVIDER = "openai"
+
+            def get_model_name(self):
+                return "gpt-4o"
+
+        class AzureJudge(OpenAIJudge):
+            PROVIDER = "azure"
+
+        assert _fingerprint(judge=OpenAIJudge()) != _fingerprint(judge=AzureJudge())
+
+
+class TestRunEvaluationCache:
+    def test_hits_after_store_and_counts_lookups(self, store):
+        run = RunEvaluationCache(store, "org-1")
+        assert run.lookup("fp") is None
+        run.store("fp", {"score": 0.9, "is_successful": True})
+
+        assert run.lookup("fp") == {"score": 0.9, "is_successful": True}
+        assert (run.stats().hits, run.stats().misses) == (1, 1)
+        assert run.stats().hit_rate == 0.5
+
+    def test_is_scoped_to_the_organisation(self, store):
+        RunEvaluationCache(store, "org-1").store("fp", {"score": 1.0})
+
+        assert RunEvaluationCache(store, "org-2").lookup("fp") is None
+
+    def test_fresh_run_skips_lookups_but_still_stores(self, store):
+        RunEvaluationCache(store, "org-1").store("fp", {"score": 0.1})
+        fresh = RunEvaluationCache(store, "org-1", fresh=True)
+
+        assert fresh.lookup("fp") is None
+        fresh.store("fp", {"score": 0.8})
+        assert RunEvaluationCache(store, "org-1").lookup("fp") == {"score": 0.8}
+
+    def test_errors_are_not_cached(self, store):
+        run = RunEvaluationCache(store, "org-1")
+        run.store("fp", {"score": None, "error": "Timeout"})
+
+        assert run.lookup("fp") is None
+
+    def test_opt_in_via_attributes_or_env(self, monkeypatch):
+        monkeypatch.delenv("EVALUATION_CACHE", raising=False)
+        assert not evaluation_cache_requested({})
+        assert evaluation_cache_requested({"evaluation_cache": True})
+        monkeypatch.setenv("EVALUATION_CACHE", "1")
+        assert evaluation_cache_requested(None)
+        assert evaluation_cache_requested({})
+
+    @pytest.mark.parametrize("value", [False, "false", "0"])
+    def test_run_opt_out_overrides_env(self, monkeypatch, value):
+        monkeypatch.setenv("EVALUATION_CACHE", "1")
+        assert not evaluation_cache_requested({"evaluation_cache": value})
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(True, True), ("true", True), ("1", True), (False, False), ("false", False), ("0", False)],
+    )
+    def test_fresh_evaluation_parses_string_flags(self, value, expected):
+        assert fresh_evaluation_requested({"fresh_evaluation": value}) is expected
+        assert not fresh_evaluation_requested(None)
+
+    def test_async_lookup_and_store_run_off_the_event_loop(self, store):
+        threads = []
+        get, set_ = store.get, store.set
+
+        def record_get(*args):
+            threads.append(threading.current_thread())
+            return get(*args)
+
+        def record_set(*args):
+            threads.append(threading.current_thread())
+            return set_(*args)
+
+        run = RunEvaluationCache(store, "org-1")
+        with (
+            patch.object(store, "get", side_effect=record_get),
+            patch.object(store, "set", side_effect=record_set),
+        ):
+
+            async def roundtrip():
+                await run.a_store("fp", {"score": 0.9})
+                return await run.a_lookup("fp")
+
+            assert asyncio.run(roundtrip()) == {"score": 0.9}
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+
+
+def test_local_strategy_evaluates_each_input_once(store):
+    metric = MagicMock(name="metric")
+    metric.requires_ground_truth = False
+    metric.model = "judge-a"
+    calls = []
+
+    async def a_evaluate(**kwargs):
+        calls.append(kwargs)
+        return MetricResult(score=0.9, details={"reason": "ok"})
+
+    metric.a_evaluate = a_evaluate
+    run = RunEvaluationCache(store, "org-1")
+    strategy = LocalStrategy(evaluation_cache=run)
+
+    with patch("rhesis.sdk.metrics.MetricFactory.create", return_value=metric):
+        first = asyncio.run(strategy.a_evaluate([_config()], "in", "out", "exp", []))
+        second = asyncio.run(strategy.a_evaluate([_config()], "in", "out", "exp", []))
+
+    assert len(calls) == 1
+    assert second == first
+    assert run.stats().hits == 1
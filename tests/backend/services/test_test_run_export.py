@@ -0,0 +1,164 @@
+"""
+Tests for the streaming test-run export (app/services/test_run_export.py).
+
+Covers the CSV / JSONL / Parquet encoders, metric rendering, and memory
+benchmarks: exporting ten times as many rows, from a generator or through
+the ``yield_per`` cursor of iter_result_rows, must not raise peak memory.
+"""
+
+import csv
+import io
+import json
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from rhesis.backend.app.services.test_run_export import (
+    BASE_COLUMNS,
+    ExportFormat,
+    encode_csv,
+    encode_jsonl,
+    encode_parquet,
+    format_metric_result,
+    iter_result_rows,
+)
+
+COLUMNS = BASE_COLUMNS + ["Safety_Toxicity"]
+
+
+def _rows(n):
+    for i in range(n):
+        yield {
+            "test_id": f"test-{i}",
+            "prompt_content": f"prompt {i} " + "x" * 200,
+            "response": f"response {i} " + "y" * 500,
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "Safety_Toxicity": "Pass (0.1/0.5) - fine",
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestEncoders:
+    def test_csv_header_then_one_chunk_per_batch(self):
+        chunks = list(encode_csv(_rows(25), COLUMNS, batch_size=10))
+
+        assert len(chunks) == 3
+        parsed = list(csv.DictReader(io.StringIO(b"".join(chunks).decode())))
+        assert len(parsed) == 25
+        assert parsed[0]["test_id"] == "test-0"
+        assert list(parsed[0]) == COLUMNS
+
+    def test_jsonl_one_object_per_line(self):
+        lines = b"".join(encode_jsonl(_rows(5), batch_size=2)).decode().splitlines()
+
+        assert [json.loads(line)["test_id"] for line in lines] == [f"test-{i}" for i in range(5)]
+
+    def test_parquet_row_group_per_batch(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        data = b"".join(encode_parquet(_rows(25), COLUMNS, batch_size=10))
+        parquet = pq.ParquetFile(io.BytesIO(data))
+
+        assert parquet.metadata.num_rows == 25
+        assert parquet.metadata.num_row_groups == 3
+        assert parquet.schema_arrow.names == COLUMNS
+        assert parquet.read().column("test_id")[24].as_py() == "test-24"
+
+    def test_parquet_streams_before_the_end(self):
+        pytest.importorskip("pyarrow.parquet")
+
+        chunks = encode_parquet(_rows(25), COLUMNS, batch_size=10)
+
+        assert next(chunks)  # first row group is emitted before the rest is read
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestFormatMetricResult:
+    def test_missing_result(self):
+        assert format_metric_result(None) == "N/A"
+
+    def test_numeric_metric(self):
+        result = {"is_successful": True, "score": 0.8, "threshold": 0.5, "reason": "ok"}
+        assert format_metric_result(result) == "Pass (0.8/0.5) - ok"
+
+    def test_categorical_metric(self):
+        result = {"is_successful": False, "score": "no", "reference_score": "yes"}
+        assert format_metric_result(result) == "Fail (no vs yes)"
+
+
+def _encode(export_format, rows):
+    if export_format == ExportFormat.JSONL:
+        return encode_jsonl(rows, batch_size=500)
+    if export_format == ExportFormat.PARQUET:
+        return encode_parquet(rows, COLUMNS, batch_size=500)
+    return encode_csv(rows, COLUMNS, batch_size=500)
+
+
+def _peak_bytes(export_format, rows):
+    tracemalloc.start()
+    try:
+        for _ in _encode(export_format, rows):
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _cursor_db(n_rows):
+    """A session whose query iterates lazily, like a ``yield_per`` cursor."""
+
+    def cursor():
+        for i in range(n_rows):
+            yield (
+                f"test-{i}",
+                {"output": f"response {i} " + "y" * 500},
+                {"metrics": {"Toxicity": {"is_successful": True, "score": 0.1}}},
+                datetime(2026, 1, 1, tzinfo=timezone.utc),
+                f"prompt {i} " + "x" * 200,
+            )
+
+    query = MagicMock()
+    query.outerjoin.return_value = query
+    query.filter.return_value = query
+    query.order_by.return_value = query
+    query.execution_options.return_value = query
+    query.__iter__.side_effect = lambda: cursor()
+    db = MagicMock()
+    db.query.return_value = query
+    return db, query
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("export_format", list(ExportFormat), ids=lambda f: f.value)
+def test_peak_memory_is_flat_in_row_count(export_format):
+    """Exporting 10x the rows must not grow peak memory (only the batch is held)."""
+    if export_format == ExportFormat.PARQUET:
+        pytest.importorskip("pyarrow.parquet")
+
+    small = _peak_bytes(export_format, _rows(2_000))
+    large = _peak_bytes(export_format, _rows(20_000))
+
+    assert large < small * 1.5
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("export_format", list(ExportFormat), ids=lambda f: f.value)
+def test_streaming_from_the_cursor_keeps_memory_flat(export_format):
+    """Rows read through iter_result_rows' cursor are encoded as they arrive."""
+    if export_format == ExportFormat.PARQUET:
+        pytest.importorskip("pyarrow.parquet")
+    metric_columns = [("Safety_Toxicity", "Toxicity")]
+
+    def peak(n_rows):
+        db, query = _cursor_db(n_rows)
+        rows = iter_result_rows(db, uuid.uuid4(), metric_columns, batch_size=500)
+        peak_bytes = _peak_bytes(export_format, rows)
+        query.execution_options.assert_called_once_with(yield_per=500)
+        return peak_bytes
+
+    assert peak(20_000) < peak(2_000) * 1.5
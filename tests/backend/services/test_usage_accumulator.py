@@ -0,0 +1,96 @@
+"""Unit tests for the per-process usage accrual buffer.
+
+No database and no broker: `accrue_usage.delay` is replaced with a
+recorder, as in test_usage.py's `TestDispatchAccrual`.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from rhesis.backend.app.quota import QuotaResource
+from rhesis.backend.app.services import usage_accumulator
+from rhesis.backend.app.services.usage import dispatch_accrual
+from rhesis.backend.app.services.usage_accumulator import UsageAccumulator
+
+JAN = date(2026, 1, 1)
+FEB = date(2026, 2, 1)
+
+
+@pytest.fixture
+def fake_delay(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(
+        "rhesis.backend.tasks.usage.accrue_usage.delay",
+        lambda *args: recorded.append(args),
+    )
+    return recorded
+
+
+@pytest.fixture
+def accumulator(monkeypatch):
+    """An accumulator whose flusher never fires on its own during a test."""
+    acc = UsageAccumulator(interval=3600)
+    monkeypatch.setattr(acc, "_ensure_flusher", lambda: None)
+    return acc
+
+
+class TestUsageAccumulator:
+    def test_sums_by_org_resource_and_period_until_flushed(self, accumulator, fake_delay):
+        for _ in range(3):
+            accumulator.add("org-1", QuotaResource.MODEL_TOKENS, 100, JAN)
+        accumulator.add("org-1", QuotaResource.MODEL_TOKENS, 5, FEB)
+        accumulator.add("org-2", QuotaResource.MODEL_TOKENS, 7, JAN)
+
+        assert fake_delay == []
+        assert accumulator.flush() == 3
+        assert sorted(fake_delay) == [
+            ("org-1", "model_tokens", 5, "2026-02-01"),
+            ("org-1", "model_tokens", 300, "2026-01-01"),
+            ("org-2", "model_tokens", 7, "2026-01-01"),
+        ]
+        assert accumulator.pending() == {}
+
+    def test_failed_publish_is_kept_for_the_next_flush(self, accumulator, monkeypatch):
+        def boom(*args):
+            raise RuntimeError("broker unreachable")
+
+        monkeypatch.setattr("rhesis.backend.tasks.usage.accrue_usage.delay", boom)
+        accumulator.add("org-1", QuotaResource.TRACING_SPANS, 10, JAN)
+
+        assert accumulator.flush() == 0  # must not raise
+        accumulator.add("org-1", QuotaResource.TRACING_SPANS, 5, JAN)
+        assert accumulator.pending() == {("org-1", "tracing_spans", JAN): 15}
+
+    def test_flush_usage_accruals_drains_the_process_buffer(
+        self, accumulator, fake_delay, monkeypatch
+    ):
+        monkeypatch.setattr(usage_accumulator, "_accumulator", accumulator)
+        accumulator.add("org-1", QuotaResource.TEST_EXECUTIONS, 2, JAN)
+
+        usage_accumulator.flush_usage_accruals()
+
+        assert fake_delay == [("org-1", "test_executions", 2, "2026-01-01")]
+
+
+class TestDispatchAccrualBuffering:
+    def test_buffers_instead_of_queueing_when_an_interval_is_set(
+        self, accumulator, fake_delay, monkeypatch
+    ):
+        monkeypatch.setenv("USAGE_ACCRUAL_FLUSH_INTERVAL", "5")
+        monkeypatch.setattr(usage_accumulator, "_accumulator", accumulator)
+
+        dispatch_accrual("org-1", QuotaResource.MODEL_TOKENS, 40)
+        dispatch_accrual("org-1", QuotaResource.MODEL_TOKENS, 2)
+
+        assert fake_delay == []
+        assert list(accumulator.pending().values()) == [42]
+
+    def test_queues_immediately_when_buffering_is_off(self, fake_delay, monkeypatch):
+        monkeypatch.setenv("USAGE_ACCRUAL_FLUSH_INTERVAL", "0")
+
+        dispatch_accrual("org-1", QuotaResource.MODEL_TOKENS, 40)
+
+        assert fake_delay == [("org-1", "model_tokens", 40)]
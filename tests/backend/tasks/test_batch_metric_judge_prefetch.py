@@ -129,3 +129,28 @@ async def test_the_batch_evaluator_receives_the_pre_resolved_judges():
 
     mock_evaluator.assert_called_once()
     assert mock_evaluator.call_args.kwargs["metric_models"] is pre_resolved
+
+
+@pytest.mark.asyncio
+async def test_the_batch_evaluator_checks_metrics_out_of_a_batch_pool():
+    ctx = _make_execution_context(
+        execution_model=None,
+        metric_configs=[_config(None)],
+        test_data={"t1": {"test": MagicMock()}},
+    )
+
+    with (
+        patch(
+            "rhesis.backend.tasks.execution.batch.runner.is_multi_turn_test",
+            return_value=False,
+        ),
+        patch("rhesis.backend.metrics.evaluator.MetricEvaluator") as mock_evaluator,
+        patch(
+            "rhesis.backend.tasks.execution.batch.runner._run_gather",
+            new=AsyncMock(return_value=[]),
+        ),
+    ):
+        await run_batch(ctx, ["t1"])
+
+    assert ctx.metric_pool is not None
+    assert mock_evaluator.call_args.kwargs["metric_pool"] is ctx.metric_pool
@@ -0,0 +1,232 @@
+"""Tests for per-phase batch profiling (tasks/execution/batch/profiling.py).
+
+Covers the log-linear latency histogram, the in-flight concurrency summary,
+the phase timers in ``_execute_single_test`` and storing the summary on the
+test run.
+"""
+
+import asyncio
+import json
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from rhesis.backend.tasks.execution.batch import _persist_batch_profile
+from rhesis.backend.tasks.execution.batch.context import ExecutionContext
+from rhesis.backend.tasks.execution.batch.profiling import BatchProfiler, LatencyHistogram
+from rhesis.backend.tasks.execution.batch.runner import _execute_single_test
+
+_RUNNER = "rhesis.backend.tasks.execution.batch.runner"
+
+
+def _make_execution_context(**overrides) -> ExecutionContext:
+    defaults = dict(
+        test_config=MagicMock(),
+        test_run=MagicMock(id="00000000-0000-0000-0000-000000000001"),
+        test_set=MagicMock(),
+        endpoint=MagicMock(),
+        organization_id="org-1",
+        user_id="user-1",
+        recovery_rounds=0,
+    )
+    defaults.update(overrides)
+    return ExecutionContext(**defaults)
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        for us in range(1, 11):
+            histogram.record(us / 1_000_000)
+
+        assert histogram.percentile(50) == 0.005
+        assert histogram.percentile(100) == 0.01
+
+    def test_percentiles_stay_within_relative_error(self):
+        histogram = LatencyHistogram()
+        values_ms = [i * 7.3 for i in range(1, 1001)]
+        for value in values_ms:
+            histogram.record(value / 1000)
+
+        for q in (50, 90, 99):
+            exact = values_ms[int(q / 100 * len(values_ms)) - 1]
+            assert abs(histogram.percentile(q) - exact) / exact < 1 / 32
+
+    def test_percentile_never_exceeds_max(self):
+        histogram = LatencyHistogram()
+        histogram.record(1.0005)
+
+        assert histogram.percentile(99) == 1000.5
+
+    def test_summary_is_compact_json(self):
+        histogram = LatencyHistogram()
+        for seconds in (0.1, 0.2, 0.3):
+            histogram.record(seconds)
+
+        summary = histogram.summary()
+
+        assert summary == {
+            "n": 3,
+            "mean_ms": 200.0,
+            "p50_ms": summary["p50_ms"],
+            "p90_ms": summary["p90_ms"],
+            "p99_ms": summary["p99_ms"],
+            "max_ms": 300.0,
+        }
+        assert abs(summary["p50_ms"] - 200) / 200 < 1 / 32
+        json.dumps(summary)
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().summary()["p99_ms"] == 0.0
+
+
+@pytest.mark.unit
+class TestBatchProfiler:
+    def test_phase_records_on_error(self):
+        profiler = BatchProfiler()
+
+        with pytest.raises(RuntimeError):
+            with profiler.phase("invoke"):
+                raise RuntimeError("boom")
+
+        assert profiler.phases["invoke"].count == 1
+
+    def test_concurrency_is_time_weighted(self):
+        profiler = BatchProfiler()
+        clock = iter([0.0, 1.0, 4.0, 5.0])
+        with patch("time.monotonic", side_effect=lambda: next(clock)):
+            profiler.test_started()  # t=0: 1 in flight
+            profiler.test_started()  # t=1: 2 in flight
+            profiler.test_finished()  # t=4: 1 in flight
+            profiler.test_finished()  # t=5: idle
+
+        summary = profiler.concurrency_summary(limit=2)
+
+        assert summary == {
+            "limit": 2,
+            "peak": 2,
+            "mean": 1.6,
+            "p50": 2,
+            "p90": 2,
+            "saturated_pct": 60.0,
+        }
+
+    def test_summary_orders_known_phases_first(self):
+        profiler = BatchProfiler()
+        for phase in ("persist", "custom", "queue", "invoke"):
+            profiler.record(phase, 0.01)
+
+        assert list(profiler.summary(limit=1)["phases"]) == [
+            "queue",
+            "invoke",
+            "persist",
+            "custom",
+        ]
+
+
+@pytest.mark.unit
+class TestExecuteSingleTestPhases:
+    @pytest.mark.asyncio
+    async def test_records_each_phase_and_in_flight_peak(self):
+        test_ids = [f"t{i}" for i in range(4)]
+        evaluator = MagicMock()
+        ctx = _make_execution_context(
+            batch_concurrency=2,
+            test_data={
+                tid: {"test": MagicMock(), "prompt_content": "p", "expected_response": ""}
+                for tid in test_ids
+            },
+            metric_configs=[MagicMock()],
+        )
+
+        async def run_test(*args, **kwargs):
+            await asyncio.sleep(0.02)
+            return {"output": {"output": "ok"}}
+
+        semaphore = asyncio.Semaphore(ctx.batch_concurrency)
+        with (
+            patch(f"{_RUNNER}.is_multi_turn_test", return_value=False),
+            patch(f"{_RUNNER}.run_test", side_effect=run_test),
+            patch(f"{_RUNNER}.evaluate_metrics", new=AsyncMock(return_value={})),
+            patch("rhesis.backend.tasks.execution.batch.persist.persist_result"),
+        ):
+            results = await asyncio.gather(
+                *(_execute_single_test(ctx, tid, semaphore, None, evaluator) for tid in test_ids)
+            )
+
+        assert {r["status"] for r in results} == {"succeeded"}
+        summary = ctx.profiler.summary(ctx.batch_concurrency)
+        assert list(summary["phases"]) == ["queue", "invoke", "evaluate", "persist", "total"]
+        assert all(stats["n"] == 4 for stats in summary["phases"].values())
+        assert summary["phases"]["invoke"]["p50_ms"] >= 20
+        # Two tests had to wait for a slot behind the first two
+        assert summary["phases"]["queue"]["max_ms"] >= 20
+        assert summary["in_flight"]["peak"] == 2
+        assert ctx.profiler.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_invocation_still_counts(self):
+        ctx = _make_execution_context(
+            test_data={"t1": {"test": MagicMock(), "prompt_content": "p", "expected_response": ""}}
+        )
+
+        with (
+            patch(f"{_RUNNER}.is_multi_turn_test", return_value=False),
+            patch(f"{_RUNNER}.run_test", new=AsyncMock(side_effect=RuntimeError("down"))),
+        ):
+            result = await _execute_single_test(ctx, "t1", asyncio.Semaphore(1))
+
+        assert result["status"] == "failed"
+        assert ctx.profiler.phases["invoke"].count == 1
+        assert ctx.profiler.phases["total"].count == 1
+        assert "persist" not in ctx.profiler.phases
+        assert ctx.profiler.in_flight == 0
+
+
+@pytest.mark.unit
+class TestPersistBatchProfile:
+    @contextmanager
+    def _db(self, test_run):
+        db = MagicMock()
+        query = db.query.return_value.filter.return_value.with_for_update.return_value
+        query.populate_existing.return_value.one.return_value = test_run
+        with (
+            patch(
+                "rhesis.backend.app.database.get_db_with_tenant_variables",
+            ) as get_db,
+            patch("sqlalchemy.orm.attributes.flag_modified"),
+        ):
+            get_db.return_value.__enter__.return_value = db
+            yield db
+
+    def test_whole_run_profile(self):
+        test_run = SimpleNamespace(attributes={"task_id": "abc"})
+        ctx = _make_execution_context()
+
+        with self._db(test_run) as db:
+            _persist_batch_profile(ctx, {"phases": {}})
+
+        assert test_run.attributes == {"task_id": "abc", "batch_profile": {"phases": {}}}
+        db.commit.assert_called_once()
+
+    def test_shard_profile_keeps_shard_status(self):
+        test_run = SimpleNamespace(attributes={"shards": {"1": {"status": "Progress"}}})
+        ctx = _make_execution_context()
+
+        with self._db(test_run):
+            _persist_batch_profile(ctx, {"phases": {}}, shard_index=1)
+
+        assert test_run.attributes["shards"]["1"] == {
+            "status": "Progress",
+            "batch_profile": {"phases": {}},
+        }
+
+    def test_failure_is_swallowed(self):
+        with patch(
+            "rhesis.backend.app.database.get_db_with_tenant_variables",
+            side_effect=RuntimeError("no db"),
+        ):
+            _persist_batch_profile(_make_execution_context(), {})
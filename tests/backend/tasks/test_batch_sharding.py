@@ -0,0 +1,100 @@
+"""
+Tests for sharded batch execution (tasks/execution/batch/sharding.py).
+
+Covers shard planning, the opt-in shard size setting, and the hand-off from
+execute_tests_as_batch to the sharded dispatcher for runs above that size.
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from rhesis.backend.tasks.execution.batch import execute_tests_as_batch
+from rhesis.backend.tasks.execution.batch.sharding import get_shard_size, plan_shards
+
+_BATCH = "rhesis.backend.tasks.execution.batch"
+
+
+class TestPlanShards:
+    def test_every_test_in_exactly_one_shard(self):
+        ids = [str(i) for i in range(103)]
+        shards = plan_shards(ids, 25)
+
+        assert len(shards) == 5
+        assert sorted(tid for shard in shards for tid in shard) == sorted(ids)
+
+    def test_shards_are_balanced(self):
+        shards = plan_shards([str(i) for i in range(103)], 25)
+
+        sizes = [len(shard) for shard in shards]
+        assert max(sizes) - min(sizes) <= 1
+        assert max(sizes) <= 25
+
+    def test_adjacent_tests_are_spread_across_shards(self):
+        """A block of consecutive (e.g. slow multi-turn) tests is not kept together."""
+        shards = plan_shards([str(i) for i in range(40)], 10)
+
+        assert [shard[0] for shard in shards] == ["0", "1", "2", "3"]
+
+    def test_no_tests(self):
+        assert plan_shards([], 10) == []
+
+
+class TestGetShardSize:
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("BATCH_SHARD_SIZE", raising=False)
+        assert get_shard_size(None) == 0
+        assert get_shard_size({}) == 0
+
+    def test_read_from_test_config_attributes(self, monkeypatch):
+        monkeypatch.delenv("BATCH_SHARD_SIZE", raising=False)
+        assert get_shard_size({"shard_size": 200}) == 200
+
+    def test_env_overrides_attributes(self, monkeypatch):
+        monkeypatch.setenv("BATCH_SHARD_SIZE", "50")
+        assert get_shard_size({"shard_size": 200}) == 50
+
+
+def _tests(n):
+    tests = []
+    for _ in range(n):
+        test = MagicMock()
+        test.id = uuid4()
+        tests.append(test)
+    return tests
+
+
+class TestExecuteTestsAsBatchSharding:
+    @pytest.fixture(autouse=True)
+    def _no_env_override(self, monkeypatch):
+        monkeypatch.delenv("BATCH_SHARD_SIZE", raising=False)
+
+    def test_runs_above_shard_size_are_dispatched_as_shards(self):
+        test_config = MagicMock(attributes={"shard_size": 10})
+        tests = _tests(25)
+
+        with (
+            patch(f"{_BATCH}.execute_tests_sharded", return_value={"sharded": True}) as sharded,
+            patch(f"{_BATCH}.run_tests") as run_tests,
+        ):
+            result = execute_tests_as_batch(MagicMock(), test_config, MagicMock(), tests)
+
+        assert result == {"sharded": True}
+        assert sharded.call_args.args[3] == tests
+        assert sharded.call_args.args[4] == 10
+        run_tests.assert_not_called()
+
+    @pytest.mark.parametrize("attributes", [{}, {"shard_size": 25}])
+    def test_runs_within_shard_size_execute_in_one_batch(self, attributes):
+        test_config = MagicMock(attributes=attributes)
+
+        with (
+            patch(f"{_BATCH}.execute_tests_sharded") as sharded,
+            patch(f"{_BATCH}.run_tests", return_value=[]) as run_tests,
+            patch("rhesis.backend.tasks.execution.shared.update_test_run_start"),
+        ):
+            execute_tests_as_batch(MagicMock(), test_config, MagicMock(), _tests(25))
+
+        sharded.assert_not_called()
+        run_tests.assert_called_once()
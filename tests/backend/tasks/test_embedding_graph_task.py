@@ -5,7 +5,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from rhesis.backend.tasks.embedding.graph import _ensure_embeddings_for_entities
+from rhesis.backend.tasks.embedding.graph import (
+    _ensure_embeddings_for_entities,
+    _run_embedding_graph,
+)
+
+_GRAPH_BUILDER = "rhesis.backend.app.services.embedding.graph_builder"
 
 
 @pytest.mark.unit
@@ -43,9 +48,8 @@ class TestEnsureEmbeddingsForEntities:
         mock_service_cls.return_value.resolve_model_id.return_value = "model-1"
 
         mock_generator = mock_generator_cls.return_value
-        mock_generator.generate.return_value = {
-            "status": "success",
-            "embedding_id": str(uuid.uuid4()),
+        mock_generator.generate_batch.return_value = {
+            str(missing_id): {"status": "success", "embedding_id": str(uuid.uuid4())}
         }
 
         _ensure_embeddings_for_entities(
@@ -55,8 +59,9 @@ class TestEnsureEmbeddingsForEntities:
             embedded_entity="Test",
         )
 
-        mock_generator.generate.assert_called_once_with(
-            entity_id=str(missing_id),
+        mock_generator.generate.assert_not_called()
+        mock_generator.generate_batch.assert_called_once_with(
+            entity_ids=[str(missing_id)],
             entity_type="Test",
             organization_id=str(user.organization_id),
             user_id=str(user.id),
@@ -86,3 +91,52 @@ class TestEnsureEmbeddingsForEntities:
                 embedded_entity="Test",
             )
             mock_generator_cls.assert_not_called()
+
+
+@pytest.mark.unit
+class TestRunEmbeddingGraph:
+    def _run(self, stored_model, refreshed_model):
+        org_id, project_id, parent_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        user = MagicMock(organization_id=org_id, id=uuid.uuid4())
+        parent = MagicMock(id=parent_id, project_id=project_id)
+        persist_graph = MagicMock()
+
+        with (
+            patch("rhesis.backend.app.crud.user.get_user_by_id", return_value=user),
+            patch("rhesis.backend.tasks.embedding.graph._ensure_embeddings_for_entities"),
+            patch(f"{_GRAPH_BUILDER}.load_graph_model", return_value=stored_model) as load,
+            patch(
+                f"{_GRAPH_BUILDER}.refresh_2d_graph", return_value=("graph", refreshed_model)
+            ) as refresh,
+            patch(f"{_GRAPH_BUILDER}.save_graph_model") as save,
+        ):
+            _run_embedding_graph(
+                MagicMock(),
+                user_id=str(user.id),
+                resolve_entity_ids=lambda *_: ["e1"],
+                embedded_entity="Test",
+                load_parent=lambda *_: parent,
+                persist_graph=persist_graph,
+                parent_name="test set",
+                parent_type="test_set",
+            )
+
+        path = f"embedding_graphs/{org_id}/{project_id}/test_set/{parent_id}.pkl"
+        load.assert_called_once_with(path)
+        assert refresh.call_args.kwargs["model"] is stored_model
+        persist_graph.assert_called_once_with(parent, "graph")
+        return save, path
+
+    def test_saves_refitted_model(self):
+        new_model = MagicMock(updated_at="later")
+
+        save, path = self._run(None, new_model)
+
+        save.assert_called_once_with(path, new_model)
+
+    def test_skips_save_when_model_unchanged(self):
+        model = MagicMock(updated_at="fitted")
+
+        save, _path = self._run(model, model)
+
+        save.assert_not_called()
@@ -0,0 +1,137 @@
+"""
+Tests for fair scheduling of test-run execution (tasks/execution/scheduling.py).
+
+Covers the priority given to runs by size and tenant load, the per-tenant
+weights, queue-wait recording, and priority passthrough in task_launcher.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from rhesis.backend.tasks import task_launcher
+from rhesis.backend.tasks.execution import scheduling
+from rhesis.backend.tasks.execution.scheduling import (
+    LOWEST_PRIORITY,
+    execution_priority,
+    load_offset,
+    record_queue_wait,
+    run_priority,
+    schedule_test_run,
+    size_offset,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_tenant_weights(monkeypatch):
+    monkeypatch.delenv("EXECUTION_TENANT_WEIGHTS", raising=False)
+    scheduling._tenant_weights.cache_clear()
+    yield
+    scheduling._tenant_weights.cache_clear()
+
+
+class TestExecutionPriority:
+    def test_smaller_runs_come_first(self):
+        assert size_offset(10) < size_offset(200) < size_offset(2000) < size_offset(50000)
+
+    def test_idle_tenant_small_run_gets_highest_priority(self):
+        assert execution_priority(10) == 0
+
+    def test_busy_tenant_is_deprioritised(self):
+        assert execution_priority(10, organization_in_flight=20) > execution_priority(10)
+
+    def test_load_offset_grows_logarithmically(self):
+        assert load_offset(0) == 0
+        assert load_offset(1) == 1
+        assert load_offset(3) == 2
+        assert load_offset(1000) == scheduling.MAX_LOAD_OFFSET
+
+    def test_priority_stays_within_celery_range(self):
+        lowest = execution_priority(10**6, organization_in_flight=10**6)
+        assert lowest == scheduling.LARGEST_SIZE_OFFSET + scheduling.MAX_LOAD_OFFSET
+        assert lowest <= LOWEST_PRIORITY
+
+    def test_weight_gives_tenant_larger_share(self, monkeypatch):
+        org = str(uuid4())
+        monkeypatch.setenv("EXECUTION_TENANT_WEIGHTS", f'{{"{org}": 4}}')
+
+        weighted = execution_priority(
+            10, organization_in_flight=3, organization_weight=scheduling.tenant_weight(org)
+        )
+        assert weighted < execution_priority(10, organization_in_flight=3)
+
+    def test_invalid_weights_are_ignored(self, monkeypatch):
+        monkeypatch.setenv("EXECUTION_TENANT_WEIGHTS", "not json")
+        assert scheduling.tenant_weight(str(uuid4())) == 1.0
+
+
+def _test_run(attributes=None):
+    test_run = MagicMock()
+    test_run.id = uuid4()
+    test_run.organization_id = uuid4()
+    test_run.project_id = uuid4()
+    test_run.attributes = attributes or {}
+    return test_run
+
+
+class TestScheduleTestRun:
+    def test_records_priority_on_run(self):
+        test_run = _test_run({"total_tests": 1000})
+
+        with patch.object(scheduling, "count_in_flight_runs", side_effect=[3, 1]):
+            priority = schedule_test_run(MagicMock(), test_run)
+
+        info = test_run.attributes["scheduling"]
+        assert priority == execution_priority(1000, 3, 1)
+        assert info["priority"] == priority
+        assert info["organization_in_flight"] == 3
+        assert info["project_in_flight"] == 1
+        assert "queued_at" in info
+        assert run_priority(test_run.attributes) == priority
+
+    def test_count_failure_does_not_block_dispatch(self):
+        test_run = _test_run({"total_tests": 10})
+
+        with patch.object(scheduling, "count_in_flight_runs", side_effect=RuntimeError("db")):
+            assert schedule_test_run(MagicMock(), test_run) == 0
+
+
+class TestRecordQueueWait:
+    def test_records_wait_since_dispatch(self):
+        queued_at = datetime.now(timezone.utc) - timedelta(seconds=30)
+        test_run = _test_run({"scheduling": {"priority": 2, "queued_at": queued_at.isoformat()}})
+
+        wait = record_queue_wait(test_run)
+
+        assert 29 < wait < 60
+        assert test_run.attributes["scheduling"]["queue_wait_seconds"] == round(wait, 3)
+        assert test_run.attributes["scheduling"]["priority"] == 2
+
+    def test_unscheduled_run_is_left_alone(self):
+        test_run = _test_run({"total_tests": 5})
+
+        assert record_queue_wait(test_run) is None
+        assert "scheduling" not in test_run.attributes
+
+    def test_run_priority_defaults_to_none(self):
+        assert run_priority(None) is None
+        assert run_priority({}) is None
+
+
+class TestTaskLauncherPriority:
+    def test_priority_is_passed_to_apply_async(self):
+        task = MagicMock()
+        task_launcher(task, "config-id", priority=3)
+
+        assert task.apply_async.call_args.kwargs["priority"] == 3
+
+    def test_no_priority_keeps_default(self):
+        task = MagicMock()
+        task_launcher(task, "config-id")
+
+        if task.apply_async.called:
+            assert "priority" not in task.apply_async.call_args.kwargs
+        else:
+            task.delay.assert_called_once_with("config-id")
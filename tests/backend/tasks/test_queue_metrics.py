@@ -0,0 +1,118 @@
+"""Tests for the Celery queue-wait/run-time histograms (rhesis.backend.celery.metrics).
+
+Tasks run on a throwaway Celery app with the in-memory broker and an embedded
+worker; the publish/prerun/postrun handlers are global signal receivers, so
+they observe these tasks exactly as they would the real app's.
+"""
+
+import time
+import urllib.request
+
+import pytest
+from celery import Celery
+from celery.contrib.testing.worker import start_worker
+
+from rhesis.backend.celery import metrics
+from rhesis.backend.celery.metrics import (
+    ENQUEUED_AT_HEADER,
+    QUEUE_WAIT,
+    RUN_TIME,
+    Histogram,
+    start_metrics_server,
+)
+
+
+@pytest.fixture
+def celery_app():
+    app = Celery("metrics-test", broker="memory://", backend="cache+memory://")
+    app.conf.task_routes = {"metrics_test.*": {"queue": "metrics-test"}}
+
+    @app.task(name="metrics_test.sleep")
+    def sleep(seconds):
+        time.sleep(seconds)
+        return seconds
+
+    @app.task(name="metrics_test.headers", bind=True)
+    def headers(self):
+        return getattr(self.request, ENQUEUED_AT_HEADER, None)
+
+    QUEUE_WAIT.clear()
+    RUN_TIME.clear()
+    yield app
+    QUEUE_WAIT.clear()
+    RUN_TIME.clear()
+
+
+@pytest.mark.unit
+class TestTaskMetrics:
+    def test_publish_stamps_enqueue_time(self, celery_app):
+        before = time.time()
+        with start_worker(
+            celery_app, pool="solo", queues=["metrics-test"], perform_ping_check=False
+        ):
+            stamped = celery_app.tasks["metrics_test.headers"].delay().get(timeout=10)
+
+        assert before <= stamped <= time.time()
+
+    def test_records_wait_and_run_time_per_queue(self, celery_app):
+        sleep = celery_app.tasks["metrics_test.sleep"]
+        # Published before the worker starts, so they wait at least this long
+        results = [sleep.delay(0.05) for _ in range(3)]
+        time.sleep(0.2)
+
+        with start_worker(
+            celery_app, pool="solo", queues=["metrics-test"], perform_ping_check=False
+        ):
+            for result in results:
+                result.get(timeout=10)
+
+        wait_count, wait_sum = QUEUE_WAIT.snapshot("metrics-test")
+        run_count, run_sum = RUN_TIME.snapshot("metrics-test")
+        assert wait_count == 3
+        assert wait_sum >= 3 * 0.2
+        assert run_count == 3
+        assert run_sum >= 3 * 0.05
+        assert metrics._running == {}
+
+    def test_eager_tasks_are_not_recorded(self, celery_app):
+        celery_app.conf.task_always_eager = True
+
+        celery_app.tasks["metrics_test.sleep"].delay(0).get()
+
+        assert QUEUE_WAIT.snapshot("metrics-test") == (0, 0.0)
+        assert RUN_TIME.snapshot("metrics-test") == (0, 0.0)
+
+
+@pytest.mark.unit
+class TestPrometheusExposition:
+    def test_histogram_renders_cumulative_buckets(self):
+        histogram = Histogram("example_seconds", "Example.", buckets=(1, 5))
+        for value in (0.5, 1, 3, 10):
+            histogram.observe("execution", value)
+
+        lines = histogram.render()
+
+        assert lines[:2] == ["# HELP example_seconds Example.", "# TYPE example_seconds histogram"]
+        assert 'example_seconds_bucket{queue="execution",le="1"} 2' in lines
+        assert 'example_seconds_bucket{queue="execution",le="5"} 3' in lines
+        assert 'example_seconds_bucket{queue="execution",le="+Inf"} 4' in lines
+        assert 'example_seconds_sum{queue="execution"} 14.5' in lines
+        assert 'example_seconds_count{queue="execution"} 4' in lines
+
+    def test_metrics_endpoint_serves_text_format(self):
+        QUEUE_WAIT.observe("telemetry", 0.2)
+        server = start_metrics_server(0, host="127.0.0.1")
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+            with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+                body = response.read().decode()
+                content_type = response.headers["Content-Type"]
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{url}/other", timeout=5)
+        finally:
+            server.shutdown()
+            QUEUE_WAIT.clear()
+
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert 'rhesis_celery_task_queue_wait_seconds_count{queue="telemetry"} 1' in body
+        assert "# TYPE rhesis_celery_task_run_seconds histogram" in body
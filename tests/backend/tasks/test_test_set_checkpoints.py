@@ -0,0 +1,93 @@
+"""
+Tests for checkpointed test-set generation (_generate_with_checkpoints).
+
+Each checkpoint's tests are saved with the generation cursor, and a retried
+task resumes after the last committed checkpoint instead of regenerating it.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rhesis.backend.tasks import test_set as test_set_tasks
+from rhesis.backend.tasks.test_set import _generate_with_checkpoints
+
+
+def _synthesizer(shortfall=0):
+    synthesizer = MagicMock()
+
+    def generate(num_tests):
+        result = MagicMock()
+        result.tests = [{"prompt": {"content": str(i)}} for i in range(num_tests - shortfall)]
+        return result
+
+    synthesizer.generate.side_effect = generate
+    return synthesizer
+
+
+def _run(synthesizer, num_tests, checkpoint_size, cursor=None):
+    with (
+        patch.object(
+            test_set_tasks, "_load_generation_checkpoint", return_value=dict(cursor or {})
+        ),
+        patch.object(test_set_tasks, "_attach_tests_to_existing_test_set") as attach,
+    ):
+        saved = _generate_with_checkpoints(
+            MagicMock(),
+            synthesizer,
+            num_tests,
+            checkpoint_size,
+            test_set_id="test-set-id",
+            org_id="org-id",
+            user_id="user-id",
+        )
+    return saved, attach
+
+
+@pytest.mark.unit
+class TestGenerateWithCheckpoints:
+    def test_generates_in_checkpoints_and_saves_cursor_with_each(self):
+        synthesizer = _synthesizer()
+
+        saved, attach = _run(synthesizer, num_tests=250, checkpoint_size=100)
+
+        assert saved == 250
+        assert [c.kwargs["num_tests"] for c in synthesizer.generate.call_args_list] == [
+            100,
+            100,
+            50,
+        ]
+        assert [c.kwargs["checkpoint"] for c in attach.call_args_list] == [
+            {"tests_requested": 100, "tests_saved": 100, "checkpoints_completed": 1},
+            {"tests_requested": 200, "tests_saved": 200, "checkpoints_completed": 2},
+            {"tests_requested": 250, "tests_saved": 250, "checkpoints_completed": 3},
+        ]
+
+    def test_retry_skips_committed_checkpoints(self):
+        synthesizer = _synthesizer()
+        cursor = {"tests_requested": 200, "tests_saved": 195, "checkpoints_completed": 2}
+
+        saved, attach = _run(synthesizer, num_tests=250, checkpoint_size=100, cursor=cursor)
+
+        synthesizer.generate.assert_called_once_with(num_tests=50)
+        assert saved == 245
+        assert attach.call_args.kwargs["checkpoint"]["checkpoints_completed"] == 3
+
+    def test_fully_checkpointed_run_generates_nothing(self):
+        synthesizer = _synthesizer()
+        cursor = {"tests_requested": 250, "tests_saved": 250, "checkpoints_completed": 3}
+
+        saved, attach = _run(synthesizer, num_tests=250, checkpoint_size=100, cursor=cursor)
+
+        synthesizer.generate.assert_not_called()
+        attach.assert_not_called()
+        assert saved == 250
+
+    def test_cursor_counts_requested_tests_not_saved(self):
+        synthesizer = _synthesizer(shortfall=5)
+
+        saved, _ = _run(synthesizer, num_tests=200, checkpoint_size=100)
+
+        # A short batch is not regenerated; the cursor moves on by what was asked
+        assert synthesizer.generate.call_count == 2
+        assert saved == 190
@@ -0,0 +1,174 @@
+"""Unit tests for the deduplicate_test_set maintenance task and the
+cross-checkpoint pass of checkpointed generation.
+
+The task body is run directly (``.run(...)``) with the duplicate search and
+the association removal mocked; the detection itself is covered by the SDK's
+deduplicator tests. ``find_duplicate_tests`` is run against a mocked query to
+check which stored embeddings it hands to the deduplicator.
+"""
+
+import uuid
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rhesis.backend.app.services.test_set import find_duplicate_tests
+from rhesis.backend.tasks.test_set import _remove_checkpoint_duplicates, deduplicate_test_set
+
+_DUPLICATES = {
+    "total_tests": 3,
+    "duplicate_test_ids": ["test-2"],
+    "duplicate_of": {"test-2": "test-1"},
+    "lexical_duplicates": 1,
+    "semantic_duplicates": 0,
+}
+_ORG_ID = "00000000-0000-0000-0000-000000000001"
+_DUPLICATE_ID = "00000000-0000-0000-0000-000000000002"
+
+
+def _run_task(removal=None, **kwargs):
+    db = MagicMock()
+
+    @contextmanager
+    def fake_session():
+        yield db
+
+    removal = removal or {"success": True, "removed_associations": 1, "message": "ok"}
+    with (
+        patch.object(
+            deduplicate_test_set,
+            "get_tenant_context",
+            return_value=("org-1", "user-1", "proj-1"),
+        ),
+        patch.object(deduplicate_test_set, "get_db_session", side_effect=fake_session),
+        patch(
+            "rhesis.backend.app.services.test_set.find_duplicate_tests",
+            return_value=dict(_DUPLICATES),
+        ) as find,
+        patch(
+            "rhesis.backend.app.services.test_set.remove_test_set_associations",
+            return_value=removal,
+        ) as remove,
+    ):
+        result = deduplicate_test_set.run("ts-1", **kwargs)
+    return result, find, remove, db
+
+
+@pytest.mark.unit
+class TestDeduplicateTestSetTask:
+    def test_removes_duplicate_associations(self):
+        result, find, remove, db = _run_task()
+
+        find.assert_called_once_with(db, "ts-1", "org-1", "user-1", use_embeddings=True)
+        remove.assert_called_once_with(db, "ts-1", ["test-2"], "org-1", "user-1")
+        assert result["removed"] == 1
+        assert result["duplicate_of"] == {"test-2": "test-1"}
+
+    def test_dry_run_only_reports(self):
+        result, _, remove, _ = _run_task(dry_run=True)
+
+        remove.assert_not_called()
+        assert result["removed"] == 0
+        assert result["duplicate_test_ids"] == ["test-2"]
+
+    def test_failed_removal_raises(self):
+        with pytest.raises(ValueError, match="not found"):
+            _run_task(removal={"success": False, "removed_associations": 0, "message": "not found"})
+
+
+def _remove_checkpoint_duplicates_with(duplicates):
+    db = MagicMock()
+    task = MagicMock()
+
+    @contextmanager
+    def fake_session():
+        yield db
+
+    task.get_db_session.side_effect = fake_session
+    with (
+        patch(
+            "rhesis.backend.app.services.test_set.find_duplicate_tests",
+            return_value=duplicates,
+        ) as find,
+        patch(
+            "rhesis.backend.app.services.test_set.remove_test_set_associations",
+            return_value={"success": True, "removed_associations": 1, "message": "ok"},
+        ) as remove,
+    ):
+        removed = _remove_checkpoint_duplicates(
+            task, test_set_id="ts-1", org_id=_ORG_ID, user_id="user-1"
+        )
+    return removed, find, remove, db
+
+
+@pytest.mark.unit
+class TestRemoveCheckpointDuplicates:
+    def test_duplicates_across_checkpoints_are_removed_and_soft_deleted(self):
+        removed, find, remove, db = _remove_checkpoint_duplicates_with(
+            {**_DUPLICATES, "duplicate_test_ids": [_DUPLICATE_ID]}
+        )
+
+        assert removed == 1
+        find.assert_called_once_with(db, "ts-1", _ORG_ID, "user-1", use_embeddings=False)
+        remove.assert_called_once_with(db, "ts-1", [_DUPLICATE_ID], _ORG_ID, "user-1")
+        update = db.query.return_value.filter.return_value.update
+        assert set(update.call_args.args[0]) == {"deleted_at", "updated_at"}
+
+    def test_nothing_is_removed_without_duplicates(self):
+        removed, _, remove, db = _remove_checkpoint_duplicates_with(
+            {**_DUPLICATES, "duplicate_test_ids": [], "duplicate_of": {}}
+        )
+
+        assert removed == 0
+        remove.assert_not_called()
+        db.query.assert_not_called()
+
+
+def _find_duplicates_with(embeddings):
+    test_ids = [uuid.uuid4(), uuid.uuid4()]
+    rows = [
+        (test_ids[0], None, "How do I reset my password?"),
+        (test_ids[1], None, "Which plans include priority support?"),
+    ]
+    db = MagicMock()
+    query = db.query.return_value.join.return_value.outerjoin.return_value
+    query.filter.return_value.order_by.return_value.all.return_value = rows
+    stored = [
+        SimpleNamespace(entity_id=test_ids[index], config_hash=config_hash, embedding=vector)
+        for index, config_hash, vector in embeddings
+    ]
+    with patch(
+        "rhesis.backend.app.services.embedding.graph_builder.fetch_embeddings",
+        return_value=stored,
+    ):
+        return find_duplicate_tests(db, str(uuid.uuid4()), _ORG_ID, "user-1")
+
+
+@pytest.mark.unit
+class TestFindDuplicateTests:
+    def test_same_config_embeddings_are_compared(self):
+        result = _find_duplicates_with([(0, "cfg-a", [1.0, 0.0]), (1, "cfg-a", [1.0, 0.0])])
+
+        assert result["semantic_duplicates"] == 1
+
+    def test_mixed_config_embeddings_are_not_compared(self):
+        # Identical vectors from unrelated embedding spaces are no evidence of
+        # a duplicate, and mixed dimensions could not be compared at all.
+        result = _find_duplicates_with([(0, "cfg-a", [1.0, 0.0]), (1, "cfg-b", [1.0, 0.0])])
+
+        assert result["duplicate_test_ids"] == []
+        assert result["semantic_duplicates"] == 0
+
+    def test_mixed_dimension_embeddings_do_not_fail(self):
+        result = _find_duplicates_with([(0, "cfg-a", [1.0, 0.0]), (1, "cfg-b", [1.0, 0.0, 0.0])])
+
+        assert result["duplicate_test_ids"] == []
+
+    def test_entity_with_two_embeddings_is_not_compared(self):
+        result = _find_duplicates_with(
+            [(0, "cfg-a", [1.0, 0.0]), (0, "cfg-a", [0.0, 1.0]), (1, "cfg-a", [1.0, 0.0])]
+        )
+
+        assert result["duplicate_test_ids"] == []
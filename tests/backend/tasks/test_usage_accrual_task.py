@@ -8,6 +8,8 @@ standard way to unit test task logic without a broker.
 
 from __future__ import annotations
 
+from datetime import date
+
 import pytest
 
 from rhesis.backend.app.quota import QuotaResource
@@ -44,7 +46,11 @@ def recorded_increments(monkeypatch):
     recorded = []
     monkeypatch.setattr(
         "rhesis.backend.tasks.usage.increment_usage",
-        lambda db, org_id, resource, amount: recorded.append((org_id, resource, amount)),
+        lambda db, org_id, resource, amount, period_start=None: recorded.append(
+            (org_id, resource, amount)
+            if period_start is None
+            else (org_id, resource, amount, period_start)
+        ),
     )
     return recorded
 
@@ -58,6 +64,15 @@ class TestAccrueUsage:
         assert fake_bind_scope == [(fake_session, "org-1")]
         assert recorded_increments == [("org-1", QuotaResource.MODEL_TOKENS, 123)]
 
+    def test_buffered_accrual_keeps_its_billing_period(
+        self, fake_session, fake_bind_scope, recorded_increments
+    ):
+        """Accruals buffered across a month boundary still land in the
+        month they happened in, not the one the task runs in."""
+        accrue_usage("org-1", QuotaResource.MODEL_TOKENS.value, 123, "2026-01-01")
+
+        assert recorded_increments == [("org-1", QuotaResource.MODEL_TOKENS, 123, date(2026, 1, 1))]
+
     @pytest.mark.parametrize("resource", list(QuotaResource))
     def test_handles_every_quota_resource(
         self, resource, fake_session, fake_bind_scope, recorded_increments
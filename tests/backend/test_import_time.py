@@ -0,0 +1,83 @@
+"""Import-time budget for the API process.
+
+``import rhesis.backend.app.main`` runs on every API start, worker reload and
+test session. These tests import it in a fresh interpreter with
+``-X importtime`` and fail when:
+
+- the cumulative import time of ``rhesis.backend.app.main`` exceeds the
+  budget (``BACKEND_IMPORT_TIME_BUDGET_SECONDS``, default 12 seconds), or
+- a heavy optional dependency that only some requests or tasks need is
+  imported at module level somewhere on the API import path.
+
+When the second test fails, move the offending import into the function that
+uses it (see ``services/embedding/graph_builder.py`` for UMAP/HDBSCAN).
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+MAIN_MODULE = "rhesis.backend.app.main"
+DEFAULT_BUDGET_SECONDS = 12.0
+
+# Imported lazily by the code that needs them; none may load with the API.
+LAZY_MODULES = (
+    "chonkie",
+    "garak",
+    "hdbscan",
+    "litellm",
+    "markitdown",
+    "mcp",
+    "umap",
+)
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.+)$")
+
+
+def _import_main(code: str = "") -> subprocess.CompletedProcess:
+    script = f"import {MAIN_MODULE}\n{code}"
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+        timeout=300,
+    )
+
+
+def _cumulative_seconds(stderr: str, module: str) -> float:
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and match.group(3).strip() == module:
+            return int(match.group(2)) / 1_000_000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+@pytest.mark.slow
+def test_api_import_time_within_budget():
+    budget = float(os.getenv("BACKEND_IMPORT_TIME_BUDGET_SECONDS", DEFAULT_BUDGET_SECONDS))
+
+    result = _import_main()
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    elapsed = _cumulative_seconds(result.stderr, MAIN_MODULE)
+    assert elapsed <= budget, (
+        f"import {MAIN_MODULE} took {elapsed:.2f}s, over the {budget:.2f}s budget "
+        "(BACKEND_IMPORT_TIME_BUDGET_SECONDS)"
+    )
+
+
+@pytest.mark.slow
+def test_heavy_dependencies_are_not_imported_with_the_api():
+    result = _import_main(
+        f"import sys\nprint(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    assert not loaded, f"imported at API startup: {', '.join(loaded)}"
@@ -0,0 +1,122 @@
+"""Tests for keyset (cursor) pagination.
+
+Categories are scoped with a unique name prefix and an explicit OData
+filter, as in test_get_items_detail_pagination_split.py, so the seeded
+test org's own categories don't interleave with the pages.
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from rhesis.backend.app import models
+from rhesis.backend.app.utils import crud_utils
+from rhesis.backend.app.utils.cursor_pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+    next_cursor,
+    sort_key,
+)
+from tests.backend.routes.fixtures.data_factories import CategoryDataFactory
+
+_PREFIX = "CursorPagTest_"
+_FILTER = f"startswith(name,'{_PREFIX}')"
+
+
+class _Row:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+def _create_categories(db: Session, org_id: str, names: list) -> list:
+    return [
+        crud_utils.create_item(
+            db,
+            models.Category,
+            {**CategoryDataFactory.sample_data(), "name": f"{_PREFIX}{name}"},
+            organization_id=org_id,
+        )
+        for name in names
+    ]
+
+
+def _page(db: Session, org_id, limit, sort_by, sort_order, cursor=None, skip=0):
+    return crud_utils.get_items_detail(
+        db,
+        models.Category,
+        skip=skip,
+        limit=limit,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        filter=_FILTER,
+        organization_id=org_id,
+        cursor=cursor,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+class TestCursorEncoding:
+    def test_round_trips_typed_values(self, test_db: Session, test_org_id):
+        (category,) = _create_categories(test_db, test_org_id, ["Only"])
+        key = sort_key("created_at", "desc")
+
+        values = decode_cursor(encode_cursor(category, key), key)
+
+        assert values == [category.created_at, category.id]
+
+    def test_rejects_cursor_issued_for_another_sort(self):
+        row = _Row(name="a", id="1")
+        cursor = encode_cursor(row, sort_key("name", "asc"))
+
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(cursor, sort_key("name", "desc"))
+        assert exc.value.status_code == 400
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "!!"])
+    def test_rejects_garbage(self, cursor):
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(cursor, sort_key("name", "asc"))
+        assert exc.value.status_code == 400
+
+    def test_no_cursor_for_short_page_or_virtual_sort(self):
+        rows = [_Row(name="a", id="1"), _Row(name="b", id="2")]
+
+        assert next_cursor(rows, 3, "name", "asc") is None
+        assert next_cursor(rows, 2, "name", "asc") is not None
+        assert next_cursor(rows, 2, "tags_count", "desc") is None
+
+    def test_filter_compiles_with_leading_key_bound(self):
+        clause = keyset_filter(models.Category, sort_key("name", "desc"), ["m", "x"])
+
+        sql = str(clause.compile(dialect=postgresql.dialect()))
+        assert "category.name <=" in sql
+
+
+@pytest.mark.unit
+@pytest.mark.utils
+class TestCursorPagination:
+    @pytest.mark.parametrize("sort_by,sort_order", [("name", "asc"), ("created_at", "desc")])
+    def test_pages_match_full_listing(self, test_db: Session, test_org_id, sort_by, sort_order):
+        _create_categories(test_db, test_org_id, ["A", "B", "C", "D", "E"])
+        full = _page(test_db, test_org_id, 10, sort_by, sort_order)
+
+        paged, cursor = [], None
+        while True:
+            page = _page(test_db, test_org_id, 2, sort_by, sort_order, cursor=cursor)
+            paged.extend(page)
+            cursor = next_cursor(page, 2, sort_by, sort_order)
+            if cursor is None:
+                break
+
+        assert [c.id for c in paged] == [c.id for c in full]
+
+    def test_cursor_with_skip_is_rejected(self, test_db: Session, test_org_id):
+        created = _create_categories(test_db, test_org_id, ["A", "B"])
+        cursor = encode_cursor(created[0], sort_key("name", "asc"))
+
+        with pytest.raises(HTTPException) as exc:
+            _page(test_db, test_org_id, 2, "name", "asc", cursor=cursor, skip=2)
+        assert exc.value.status_code == 400
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 from rhesis.sdk.agents.architect.agent import ArchitectAgent
+from rhesis.sdk.agents.architect.config import ArchitectConfig
 from rhesis.sdk.agents.base import BaseAgent, BaseTool
 from rhesis.sdk.agents.schemas import ExecutionStep, ToolResult
 from rhesis.sdk.models.base import BaseLLM
@@ -520,6 +521,37 @@ class TestArchitectWriteGuard:
 
         assert agent._mutating_tools == frozenset({"create_metric"})
 
+    @pytest.mark.asyncio
+    async def test_confirmation_and_concurrency_share_one_classification(self, mock_model):
+        """Tools needing confirmation are exactly those not run concurrently."""
+        from rhesis.sdk.agents.base import MCPTool
+
+        class FakeMCPProvider(MCPTool):
+            def __init__(self):
+                self._connected = True
+
+            async def list_tools(self):
+                return [
+                    {"name": "read", "description": "", "http_method": "GET"},
+                    {"name": "post_read", "description": "", "http_method": "POST"},
+                    {
+                        "name": "wipe",
+                        "description": "",
+                        "http_method": "GET",
+                        "destructiveHint": True,
+                    },
+                ]
+
+        agent = ArchitectAgent(
+            model=mock_model,
+            tools=[FakeMCPProvider()],
+            config=ArchitectConfig(readonly_http_methods=frozenset({"GET", "POST"})),
+        )
+        await agent.get_available_tools()
+
+        assert agent._mutating_tools == frozenset({"wipe"})
+        assert agent._readonly_tools == frozenset({"read", "post_read"})
+
     def test_base_tool_requires_confirmation_in_to_dict(self, mock_model):
         """BaseTool.to_dict() should include requires_confirmation when set."""
 
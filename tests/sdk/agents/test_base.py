@@ -1,11 +1,12 @@
 """Tests for BaseAgent class."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from rhesis.sdk.agents.base import BaseAgent, BaseTool, MCPTool
+from rhesis.sdk.agents.base import BaseAgent, BaseTool, MCPTool, is_readonly_tool
 from rhesis.sdk.agents.schemas import ExecutionStep, ToolCall, ToolResult
 from rhesis.sdk.models.base import BaseLLM
 
@@ -476,3 +477,228 @@ class TestFormatTools:
             self._tool({"test_type": {"type": "string", "enum": ["Single-Turn", "Multi-Turn"]}})
         )
         assert 'test_type: "Single-Turn" | "Multi-Turn"' in out
+
+
+class SlowTool(BaseTool):
+    """Tool that records call overlap, to observe concurrent execution."""
+
+    def __init__(self, name: str, readonly: bool, log: list):
+        self._name = name
+        self._readonly = readonly
+        self._log = log
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return self._name
+
+    @property
+    def requires_confirmation(self):
+        return not self._readonly
+
+    async def execute(self, **kwargs) -> ToolResult:
+        self._log.append(("start", self._name))
+        await asyncio.sleep(0.01)
+        self._log.append(("end", self._name))
+        return ToolResult(tool_name=self._name, success=True, content=self._name)
+
+
+@pytest.mark.unit
+class TestConcurrentToolExecution:
+    """Read-only tool calls in one step run concurrently, writes keep order."""
+
+    @pytest.fixture
+    def mock_model(self):
+        return Mock(spec=BaseLLM)
+
+    @staticmethod
+    def _calls(*names):
+        return [ToolCall(tool_name=n, arguments="{}") for n in names]
+
+    @pytest.mark.asyncio
+    async def test_readonly_calls_overlap(self, mock_model):
+        log: list = []
+        tools = [SlowTool("a", True, log), SlowTool("b", True, log)]
+        agent = _make_agent(mock_model, tools=tools)
+        await agent.get_available_tools()
+
+        results = await agent._execute_tools(self._calls("a", "b"))
+
+        assert [r.tool_name for r in results] == ["a", "b"]
+        assert log[:2] == [("start", "a"), ("start", "b")]
+
+    @pytest.mark.asyncio
+    async def test_write_waits_for_earlier_calls_and_runs_alone(self, mock_model):
+        log: list = []
+        tools = [
+            SlowTool("read1", True, log),
+            SlowTool("write", False, log),
+            SlowTool("read2", True, log),
+        ]
+        agent = _make_agent(mock_model, tools=tools)
+        await agent.get_available_tools()
+
+        results = await agent._execute_tools(self._calls("read1", "write", "read2"))
+
+        assert [r.tool_name for r in results] == ["read1", "write", "read2"]
+        assert log == [
+            ("start", "read1"),
+            ("end", "read1"),
+            ("start", "write"),
+            ("end", "write"),
+            ("start", "read2"),
+            ("end", "read2"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_can_be_disabled(self, mock_model):
+        log: list = []
+        tools = [SlowTool("a", True, log), SlowTool("b", True, log)]
+        agent = BaseAgent(model=mock_model, tools=tools, max_concurrent_tools=1)
+        await agent.get_available_tools()
+
+        await agent._execute_tools(self._calls("a", "b"))
+
+        assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+    def test_unannotated_tools_are_not_readonly(self):
+        assert not is_readonly_tool({"name": "t"})
+        assert is_readonly_tool({"name": "t", "readOnlyHint": True})
+        assert is_readonly_tool({"name": "t", "http_method": "get"})
+        assert not is_readonly_tool({"name": "t", "requires_confirmation": True})
+        assert not is_readonly_tool({"name": "t", "destructiveHint": True, "http_method": "GET"})
+        assert is_readonly_tool({"name": "t", "http_method": "POST"}, frozenset({"POST"}))
+
+
+@pytest.mark.unit
+class TestMCPToolCatalogCache:
+    """MCPTool reuses its tool list until the TTL expires or it reconnects."""
+
+    @staticmethod
+    def _mcp(ttl=300.0):
+        client = Mock()
+        client.connect = AsyncMock()
+        client.session = object()
+        client.list_tools = AsyncMock(return_value=[{"name": "t"}])
+        tool = MCPTool(client, catalog_ttl=ttl)
+        return tool, client
+
+    @pytest.mark.asyncio
+    async def test_tool_list_is_cached(self):
+        tool, client = self._mcp()
+
+        assert await tool.list_tools() == [{"name": "t"}]
+        assert await tool.list_tools() == [{"name": "t"}]
+        assert client.list_tools.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_and_invalidate_bypass_cache(self):
+        tool, client = self._mcp()
+        await tool.list_tools()
+
+        await tool.list_tools(refresh=True)
+        tool.invalidate_catalog()
+        await tool.list_tools()
+
+        assert client.list_tools.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_reconnect_refetches(self):
+        tool, client = self._mcp()
+        await tool.list_tools()
+
+        await tool.connect()
+        await tool.list_tools()
+
+        assert client.list_tools.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_connect_once(self):
+        tool, client = self._mcp()
+        client.call_tool = AsyncMock(return_value=Mock(isError=False, content=[]))
+
+        async def slow_connect():
+            await asyncio.sleep(0.01)
+
+        client.connect = AsyncMock(side_effect=slow_connect)
+
+        await asyncio.gather(*(tool.execute("t") for _ in range(3)))
+
+        assert client.connect.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failures_reconnect_once(self):
+        tool, client = self._mcp()
+        await tool.connect()
+        client.connect.reset_mock()
+        broken_connection = tool._connection_version
+
+        async def list_tools():
+            await asyncio.sleep(0)
+            if tool._connection_version == broken_connection:
+                raise ConnectionError()
+            return [{"name": "t"}]
+
+        client.list_tools = AsyncMock(side_effect=list_tools)
+
+        results = await asyncio.gather(*(tool.list_tools(refresh=True) for _ in range(3)))
+
+        assert results == [[{"name": "t"}]] * 3
+
+        assert client.connect.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self):
+        tool, client = self._mcp(ttl=0)
+        await tool.list_tools()
+        await tool.list_tools()
+
+        assert client.list_tools.await_count == 2
+
+
+@pytest.mark.unit
+class TestPromptTextCaching:
+    """Tool and history text is rendered once and reused across iterations."""
+
+    @pytest.fixture
+    def agent(self):
+        return _make_agent(Mock(spec=BaseLLM))
+
+    def test_tools_text_reused_for_same_list(self, agent):
+        tools = [{"name": "t", "description": "d"}]
+        first = agent._format_tools(tools)
+
+        agent._render_tools = Mock(side_effect=AssertionError("re-rendered"))
+        assert agent._format_tools(tools) == first
+
+    def test_tools_text_rerendered_for_new_list(self, agent):
+        agent._format_tools([{"name": "a", "description": "d"}])
+        assert "- b: d" in agent._format_tools([{"name": "b", "description": "d"}])
+
+    def test_history_steps_rendered_once(self, agent):
+        agent._format_step = Mock(wraps=agent._format_step)
+        for i in range(3):
+            agent._execution_history.append(
+                ExecutionStep(iteration=i, reasoning=f"step {i}", action="call_tool")
+            )
+            agent._format_history()
+
+        assert agent._format_step.call_count == 3
+        assert "step 2" in agent._format_history()
+
+    def test_cleared_history_is_not_reused(self, agent):
+        agent._execution_history.append(
+            ExecutionStep(iteration=1, reasoning="old", action="call_tool")
+        )
+        agent._format_history()
+        agent._execution_history.clear()
+        agent._execution_history.append(
+            ExecutionStep(iteration=1, reasoning="new", action="call_tool")
+        )
+
+        formatted = agent._format_history()
+        assert "new" in formatted
+        assert "old" not in formatted
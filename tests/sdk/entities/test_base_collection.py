@@ -100,3 +100,22 @@ def test_pull_with_name(mock_request):
         json=None,
         params={"$filter": "tolower(name) eq 'test-entity'"},
     )
+
+
+@patch("requests.request")
+def test_iter_all_pages_with_filter(mock_request):
+    """iter_all walks skip/limit pages and keeps the filter on every request."""
+    first_page = MagicMock()
+    first_page.json.return_value = [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]
+    last_page = MagicMock()
+    last_page.json.return_value = [{"id": "3", "name": "c"}]
+    mock_request.side_effect = [first_page, last_page]
+
+    entities = list(TestBaseCollection.iter_all(filter="name ne 'x'", page_size=2, prefetch=0))
+
+    assert [e.id for e in entities] == ["1", "2", "3"]
+    assert all(isinstance(e, MockEntity) for e in entities)
+    assert [c.kwargs["params"] for c in mock_request.call_args_list] == [
+        {"skip": 0, "limit": 2, "$filter": "name ne 'x'"},
+        {"skip": 2, "limit": 2, "$filter": "name ne 'x'"},
+    ]
@@ -0,0 +1,164 @@
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests.exceptions import HTTPError
+
+from rhesis.sdk.entities.pagination import PageIterator
+from rhesis.sdk.entities.test_set import TestSet
+from rhesis.sdk.errors import RhesisAPIError
+
+os.environ["RHESIS_BASE_URL"] = "http://test:8000"
+
+
+def _make_fetcher(total: int):
+    calls = []
+
+    def fetch_page(skip, limit):
+        calls.append((skip, limit))
+        return [{"n": i} for i in range(skip, min(skip + limit, total))]
+
+    return fetch_page, calls
+
+
+class TestPageIterator:
+    def test_yields_every_item_in_order(self):
+        fetch_page, _ = _make_fetcher(25)
+        items = list(PageIterator(fetch_page, lambda item: item["n"], page_size=10))
+        assert items == list(range(25))
+
+    def test_stops_after_short_page(self):
+        fetch_page, calls = _make_fetcher(25)
+        list(PageIterator(fetch_page, lambda item: item["n"], page_size=10, prefetch=0))
+        assert calls == [(0, 10), (10, 10), (20, 10)]
+
+    def test_exact_multiple_ends_on_empty_page(self):
+        fetch_page, calls = _make_fetcher(20)
+        items = list(PageIterator(fetch_page, lambda item: item["n"], page_size=10, prefetch=0))
+        assert len(items) == 20
+        assert calls[-1] == (20, 10)
+
+    def test_empty_collection(self):
+        fetch_page, _ = _make_fetcher(0)
+        assert list(PageIterator(fetch_page, lambda item: item, page_size=10)) == []
+
+    def test_max_items_limits_output_and_requests(self):
+        fetch_page, calls = _make_fetcher(1000)
+        items = list(
+            PageIterator(fetch_page, lambda item: item["n"], page_size=10, prefetch=0, max_items=15)
+        )
+        assert items == list(range(15))
+        assert len(calls) == 2
+
+    def test_parse_is_lazy(self):
+        fetch_page, _ = _make_fetcher(30)
+        parse = MagicMock(side_effect=lambda item: item["n"])
+        iterator = PageIterator(fetch_page, parse, page_size=10)
+        next(iterator)
+        assert parse.call_count == 1
+        iterator.close()
+
+    def test_prefetch_bounds_pages_in_flight(self):
+        fetch_page, calls = _make_fetcher(10_000)
+        release = threading.Event()
+
+        def blocking_fetch(skip, limit):
+            page = fetch_page(skip, limit)
+            if skip >= 20:
+                release.wait(timeout=5)
+            return page
+
+        iterator = PageIterator(blocking_fetch, lambda item: item, page_size=10, prefetch=1)
+        next(iterator)
+        # Consumer is on page 0; at most page 1 plus the page being fetched are requested.
+        assert len(calls) <= 3
+        release.set()
+        iterator.close()
+
+    def test_fetch_error_surfaces_in_consumer(self):
+        def failing_fetch(skip, limit):
+            if skip:
+                raise RuntimeError("boom")
+            return [{"n": i} for i in range(limit)]
+
+        iterator = PageIterator(failing_fetch, lambda item: item["n"], page_size=5)
+        assert [next(iterator) for _ in range(5)] == list(range(5))
+        with pytest.raises(RuntimeError, match="boom"):
+            next(iterator)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            PageIterator(lambda skip, limit: [], lambda i: i, page_size=0)
+        with pytest.raises(ValueError, match="between 1 and 100"):
+            PageIterator(lambda skip, limit: [], lambda i: i, page_size=101)
+        with pytest.raises(ValueError):
+            PageIterator(lambda skip, limit: [], lambda i: i, prefetch=-1)
+
+
+def _paged_responses(total: int, page_size: int):
+    responses = []
+    for skip in range(0, total + 1, page_size):
+        response = MagicMock()
+        response.json.return_value = [
+            {"id": f"t-{i}", "prompt": {"content": f"p{i}"}}
+            for i in range(skip, min(skip + page_size, total))
+        ]
+        responses.append(response)
+    # Trailing empty pages absorb any request prefetched past the end.
+    empty = MagicMock()
+    empty.json.return_value = []
+    return responses + [empty, empty]
+
+
+class TestTestSetIterTests:
+    @patch("requests.request")
+    def test_iter_tests_follows_pagination(self, mock_request):
+        mock_request.side_effect = _paged_responses(5, 2)
+        test_set = TestSet(id="ts-1")
+
+        tests = list(test_set.iter_tests(page_size=2, prefetch=0))
+
+        assert [t.id for t in tests] == [f"t-{i}" for i in range(5)]
+        params = [c.kwargs["params"] for c in mock_request.call_args_list]
+        assert params == [
+            {"skip": 0, "limit": 2},
+            {"skip": 2, "limit": 2},
+            {"skip": 4, "limit": 2},
+        ]
+        assert mock_request.call_args.kwargs["url"] == "http://test:8000/test_sets/ts-1/tests"
+
+    @patch("requests.request")
+    def test_iter_tests_raises_api_error_when_a_page_fails(self, mock_request):
+        response = MagicMock()
+        response.status_code = 500
+        response.content = b"server error"
+        mock_request.side_effect = HTTPError("500 Server Error", response=response)
+
+        with pytest.raises(RhesisAPIError) as exc_info:
+            list(TestSet(id="ts-1").iter_tests(page_size=2, prefetch=0))
+
+        assert exc_info.value.status_code == 500
+
+    @patch("requests.request")
+    def test_iter_tests_rejects_page_size_above_backend_limit(self, mock_request):
+        with pytest.raises(ValueError, match="between 1 and 100"):
+            TestSet(id="ts-1").iter_tests(page_size=500)
+
+        mock_request.assert_not_called()
+
+    def test_iter_tests_requires_id(self):
+        with pytest.raises(ValueError, match="Test set ID must be set"):
+            TestSet(name="no id").iter_tests()
+
+    @patch("requests.request")
+    def test_pull_fetches_all_pages(self, mock_request):
+        metadata = MagicMock()
+        metadata.json.return_value = {"id": "ts-1", "name": "Large"}
+        mock_request.side_effect = [metadata] + _paged_responses(250, 100)
+        test_set = TestSet(id="ts-1")
+
+        test_set.pull()
+
+        assert test_set.test_count == 250
+        assert len(test_set.tests) == 250
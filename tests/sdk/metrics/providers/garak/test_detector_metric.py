@@ -1,11 +1,15 @@
 """Tests for GarakDetectorMetric."""
 
+import asyncio
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from rhesis.sdk.metrics.base import MetricScope, MetricType, ScoreType
 from rhesis.sdk.metrics.providers.garak import GarakDetectorMetric
+from rhesis.sdk.metrics.providers.garak.detector_metric import _cached_detector
 
 
 class TestGarakDetectorMetricInitialization:
@@ -501,3 +505,182 @@ class TestGarakDetectorMetricEdgeCases:
         mock_message_cls.assert_called_once_with(text="", lang="*")
         assert mock_attempt.prompt == mock_message
         assert result is not None
+
+
+class _FakeMessage:
+    def __init__(self, text, lang):
+        self.text = text
+        self.lang = lang
+
+
+class _FakeAttempt:
+    """Mirrors garak.attempt.Attempt's rule that a prompt is set before outputs."""
+
+    def __init__(self):
+        self.prompt = None
+        self._outputs = []
+        self.notes = {}
+
+    @property
+    def outputs(self):
+        return self._outputs
+
+    @outputs.setter
+    def outputs(self, outputs):
+        if self.prompt is None:
+            raise TypeError("A prompt must be set before outputs are given")
+        self._outputs = outputs
+
+
+class _FakeHFDetector:
+    """Stands in for garak.detectors.base.HFDetector: one score per output."""
+
+    def __init__(self):
+        self.calls = []
+
+    def detect(self, attempt):
+        self.calls.append(list(attempt.outputs))
+        return [0.9 if "bad" in output else 0.1 for output in attempt.outputs]
+
+
+@pytest.fixture
+def fake_garak():
+    with patch.dict(
+        "sys.modules",
+        {
+            "garak": MagicMock(),
+            "garak.attempt": MagicMock(Attempt=_FakeAttempt, Message=_FakeMessage),
+            "garak.detectors": MagicMock(),
+            "garak.detectors.base": MagicMock(HFDetector=_FakeHFDetector),
+        },
+    ):
+        yield
+
+
+class TestGarakDetectorBatching:
+    """Tests for the detector instance cache and batched scoring."""
+
+    @patch("importlib.import_module")
+    def test_detector_instance_is_shared_across_metrics(self, mock_import):
+        mock_module = MagicMock()
+        mock_import.return_value = mock_module
+
+        first = GarakDetectorMetric(detector_class="garak.detectors.custom.Shared")
+        second = GarakDetectorMetric(detector_class="garak.detectors.custom.Shared")
+
+        assert first.detector is second.detector
+        mock_module.Shared.assert_called_once_with()
+
+    def test_evaluate_batch_scores_outputs_in_one_call(self, fake_garak):
+        detector = _FakeHFDetector()
+        metric = GarakDetectorMetric(detector_class="garak.detectors.misleading.Classifier")
+        metric._detector = detector
+
+        results = metric.evaluate_batch(["p1", "p2", "p3"], ["fine", "bad", "fine"])
+
+        assert detector.calls == [["fine", "bad", "fine"]]
+        assert [r.details["is_successful"] for r in results] == [True, False, True]
+
+    def test_evaluate_batch_falls_back_when_scores_do_not_line_up(self, fake_garak):
+        detector = _FakeHFDetector()
+        detector.detect = MagicMock(side_effect=[[0.9], [0.1], [0.9]])
+        metric = GarakDetectorMetric(detector_class="garak.detectors.misleading.Classifier")
+        metric._detector = detector
+
+        results = metric.evaluate_batch(["p1", "p2"], ["a", "b"])
+
+        assert [r.score for r in results] == [0.1, 0.9]
+        assert detector.detect.call_count == 3
+
+    def test_concurrent_a_evaluate_calls_share_a_detector_call(self, fake_garak):
+        detector = _FakeHFDetector()
+        metrics = []
+        for _ in range(3):
+            metric = GarakDetectorMetric(detector_class="garak.detectors.misleading.Classifier")
+            metric._detector = detector
+            metrics.append(metric)
+
+        async def run():
+            return await asyncio.gather(
+                *(m.a_evaluate(input="p", output=o) for m, o in zip(metrics, ["a", "bad", "c"]))
+            )
+
+        results = asyncio.run(run())
+
+        assert detector.calls == [["a", "bad", "c"]]
+        assert [r.score for r in results] == [0.1, 0.9, 0.1]
+
+    def test_concurrent_evaluations_do_not_call_a_shared_detector_at_once(self, fake_garak):
+        active = []
+        overlapped = []
+
+        class GuardedDetector(_FakeHFDetector):
+            def detect(self, attempt):
+                active.append(attempt)
+                overlapped.append(len(active) > 1)
+                time.sleep(0.01)
+                active.remove(attempt)
+                return super().detect(attempt)
+
+        detector = GuardedDetector()
+        metric = GarakDetectorMetric(detector_class="garak.detectors.misleading.Classifier")
+        metric._detector = detector
+
+        threads = [
+            threading.Thread(target=metric.evaluate_batch, args=(["p"], [f"out {i}"]))
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(detector.calls) == 4
+        assert not any(overlapped)
+
+    def test_non_classifier_detector_is_evaluated_per_output(self, fake_garak):
+        detector = MagicMock()
+        detector.detect.return_value = [0.2]
+        metric = GarakDetectorMetric(detector_class="garak.detectors.mitigation.MitigationBypass")
+        metric._detector = detector
+
+        results = metric.evaluate_batch(["p1", "p2"], ["a", "b"])
+
+        assert detector.detect.call_count == 2
+        assert [r.score for r in results] == [0.2, 0.2]
+
+    def test_slow_detector_construction_does_not_block_other_detectors(self):
+        release_slow = threading.Event()
+        slow_started = threading.Event()
+        built = []
+
+        class SlowDetector:
+            def __init__(self):
+                slow_started.set()
+                release_slow.wait(timeout=5)
+                built.append(self)
+
+        class FastDetector:
+            pass
+
+        slow_threads = [
+            threading.Thread(target=_cached_detector, args=(SlowDetector, {})) for _ in range(3)
+        ]
+        for thread in slow_threads:
+            thread.start()
+        assert slow_started.wait(timeout=5)
+
+        # Built while SlowDetector is still loading
+        fast = []
+        fast_thread = threading.Thread(
+            target=lambda: fast.append(_cached_detector(FastDetector, {}))
+        )
+        fast_thread.start()
+        fast_thread.join(timeout=1)
+        assert fast and isinstance(fast[0], FastDetector)
+
+        release_slow.set()
+        for thread in slow_threads:
+            thread.join(timeout=5)
+        assert len(built) == 1
+        assert _cached_detector(SlowDetector, {}) is built[0]
@@ -0,0 +1,181 @@
+"""Tests for near-duplicate detection (rhesis.sdk.synthesizers.dedup).
+
+Corpora are synthetic with a known duplicate rate: distinct random sentences
+plus lightly edited copies (lexical duplicates) or copies with unrelated
+wording but nearly identical embeddings (semantic duplicates).
+"""
+
+import os
+import random
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from rhesis.sdk.models.base import BaseEmbedder, BaseLLM
+from rhesis.sdk.synthesizers.dedup import TestDeduplicator, comparison_text
+from rhesis.sdk.synthesizers.multi_turn.base import GenerationConfig, MultiTurnSynthesizer
+from rhesis.sdk.synthesizers.prompt_synthesizer import PromptSynthesizer
+
+os.environ["RHESIS_API_KEY"] = "test"
+
+
+def _vocabulary(rng, size=3000):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(3, 9))) for _ in range(size)]
+
+
+def _sentence(rng, vocabulary, words=16):
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def _near_copy(rng, text):
+    """Replace one word and change case/whitespace: still a lexical duplicate."""
+    words = text.split()
+    words[rng.randrange(len(words))] = "changed"
+    return "  ".join(words).upper() if rng.random() < 0.5 else " ".join(words)
+
+
+def _lexical_corpus(n_distinct, duplicate_rate, seed=0):
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    texts = [_sentence(rng, vocabulary) for _ in range(n_distinct)]
+    n_duplicates = int(n_distinct * duplicate_rate)
+    duplicate_of = {}
+    for _ in range(n_duplicates):
+        original = rng.randrange(n_distinct)
+        duplicate_of[len(texts)] = original
+        texts.append(_near_copy(rng, texts[original]))
+    return texts, duplicate_of
+
+
+def test_lexical_pass_finds_known_duplicates():
+    texts, duplicate_of = _lexical_corpus(1000, duplicate_rate=0.2)
+
+    result = TestDeduplicator().find_duplicates(texts)
+
+    assert set(result.duplicates) == set(duplicate_of)
+    assert result.lexical_duplicates == 200
+    assert result.kept == list(range(1000))
+
+
+def test_each_item_is_compared_with_a_bounded_number_of_candidates():
+    texts, _ = _lexical_corpus(2000, duplicate_rate=0.1)
+    deduplicator = TestDeduplicator(max_candidates=20)
+    candidate_counts = []
+    original = deduplicator._candidates
+
+    def counting(buckets, keys):
+        candidates = original(buckets, keys)
+        candidate_counts.append(len(candidates))
+        return candidates
+
+    with patch.object(deduplicator, "_candidates", side_effect=counting):
+        deduplicator.find_duplicates(texts)
+
+    assert max(candidate_counts) <= 20
+    # Distinct random sentences rarely share a band, far from n^2 / 2 comparisons
+    assert sum(candidate_counts) < len(texts) * 5
+
+
+def test_first_occurrence_is_kept():
+    result = TestDeduplicator().find_duplicates(
+        ["What is the refund policy for orders?", "what is the refund policy for orders"]
+    )
+
+    assert result.kept == [0]
+    assert result.duplicates == {1: 0}
+
+
+class _FakeEmbedder(BaseEmbedder):
+    def __init__(self, vectors):
+        self.model_name = "fake"
+        self.vectors = vectors
+
+    def generate_batch(self, texts, **kwargs):
+        return [self.vectors[text] for text in texts]
+
+
+def test_semantic_pass_catches_paraphrases():
+    rng = random.Random(1)
+    np_rng = np.random.default_rng(1)
+    vocabulary = _vocabulary(rng)
+    texts, vectors, paraphrases = [], {}, set()
+    for i in range(300):
+        text = _sentence(rng, vocabulary)
+        vectors[text] = np_rng.standard_normal(64)
+        texts.append(text)
+    for i in range(60):
+        base = texts[i]
+        paraphrase = _sentence(rng, vocabulary)
+        vectors[paraphrase] = vectors[base] + np_rng.normal(scale=0.05, size=64)
+        paraphrases.add(len(texts))
+        texts.append(paraphrase)
+
+    lexical_only = TestDeduplicator().find_duplicates(texts)
+    result = TestDeduplicator(embedder=_FakeEmbedder(vectors)).find_duplicates(texts)
+
+    assert lexical_only.num_duplicates == 0
+    assert set(result.duplicates) == paraphrases
+    assert result.semantic_duplicates == 60
+
+
+def test_precomputed_embeddings_skip_missing_vectors():
+    texts = ["alpha beta gamma delta", "completely different words here", "third one"]
+    embeddings = [[1.0, 0.0], [0.999, 0.01], None]
+
+    result = TestDeduplicator().find_duplicates(texts, embeddings=embeddings)
+
+    assert result.duplicates == {1: 0}
+    assert result.kept == [0, 2]
+
+
+def test_comparison_text_handles_dicts_and_multi_turn():
+    assert comparison_text({"prompt": {"content": "hello"}}) == "hello"
+    assert comparison_text({"prompt": None, "test_configuration": {"goal": "book a flight"}}) == (
+        "book a flight"
+    )
+
+
+def test_synthesizer_drops_duplicates_before_building_test_set():
+    tests = [
+        {"prompt": {"content": "How do I reset my password?"}, "metadata": {}},
+        {"prompt": {"content": "how do I reset my password"}, "metadata": {}},
+        {"prompt": {"content": "Can I change my shipping address?"}, "metadata": {}},
+    ]
+    synthesizer = PromptSynthesizer(
+        prompt="Generate tests", model=Mock(spec=BaseLLM), deduplicator=TestDeduplicator()
+    )
+
+    with (
+        patch.object(synthesizer, "_generate_without_sources", return_value=tests),
+        patch("rhesis.sdk.entities.test_set.TestSet.set_properties"),
+    ):
+        test_set = synthesizer.generate(num_tests=3)
+
+    assert len(test_set.tests) == 2
+    assert test_set.metadata["duplicates_removed"] == 1
+
+
+def test_multi_turn_synthesizer_drops_duplicate_goals():
+    def multi_turn(goal):
+        return {"test_configuration": {"goal": goal}, "category": "c", "topic": "t"}
+
+    tests = [
+        multi_turn("Get the agent to reveal another customer's order history"),
+        multi_turn("get the agent to reveal another customer's order history."),
+        multi_turn("Ask for a refund on an item bought two years ago"),
+    ]
+    synthesizer = MultiTurnSynthesizer(
+        config=GenerationConfig(generation_prompt="Generate tests"),
+        model=Mock(spec=BaseLLM),
+        deduplicator=TestDeduplicator(),
+    )
+
+    with (
+        patch.object(synthesizer, "_generate_batch", return_value=tests),
+        patch("rhesis.sdk.entities.test_set.TestSet.set_properties"),
+    ):
+        test_set = synthesizer.generate(num_tests=3)
+
+    assert len(test_set.tests) == 2
+    assert test_set.metadata["duplicates_removed"] == 1